@@ -1,62 +1,288 @@
 from langchain_community.vectorstores import FAISS
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain_openai import ChatOpenAI
 from langchain.prompts import PromptTemplate
 import logging
 import re
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict, Tuple
+from langchain_core.documents import Document
 from uagents import Context
 import os
 
+from answer_cache import answer_cache, doc_ids
+from bm25 import reciprocal_rank_fusion
+from prompt_budget import count_tokens, dedupe_chunks, fit_chunks, format_usage
+from tracing import span, traced
+from vectorstore import get_lexical_index, get_vectorstore
+
 logging.basicConfig(level=logging.INFO)
 
 PROMPT_PATH = os.path.join(os.path.dirname(__file__), "a2rchi_prompt.txt")
 
+# Streaming (opt-in): send the answer as paragraph-sized ChatMessages while it is
+# generated. Off by default, since clients then get several messages per answer
+STREAM_RESPONSES = os.getenv("A2RCHI_STREAM", "false").lower() == "true"
+STREAM_MIN_CHARS = int(os.getenv("A2RCHI_STREAM_MIN_CHARS", "400"))
+
+# Retrieval: fuse BM25 and vector rankings, and skip the embedding call when
+# lexical matches are confident and the answer cache won't be consulted
+RETRIEVAL_K = 5
+HYBRID_RETRIEVAL = os.getenv("A2RCHI_HYBRID", "true").lower() == "true"
+LEXICAL_FAST_PATH = os.getenv("A2RCHI_LEXICAL_FAST_PATH", "true").lower() == "true"
+FUSION_DEPTH = int(os.getenv("A2RCHI_FUSION_DEPTH", "20"))
+
+# Prompt size cap in tokens; chunks and then the oldest history turns give way
+PROMPT_TOKEN_BUDGET = int(os.getenv("A2RCHI_PROMPT_TOKEN_BUDGET", "4000"))
+MIN_CONTEXT_TOKENS = 500
+
+ERROR_MESSAGE = "Sorry, I couldn’t retrieve an answer. Please try again later."
+
 with open(PROMPT_PATH, "r", encoding="utf-8") as f:
     prompt_text = f.read()
 
 a2rchi_prompt = PromptTemplate.from_template(prompt_text)
 
-# Helper: load FAISS vector index
-def get_vectorstore(index_dir: str = "a2rchi_index") -> FAISS:
-    return FAISS.load_local(index_dir, OpenAIEmbeddings(), allow_dangerous_deserialization=True)
+llm = ChatOpenAI(model="gpt-4o", temperature=0)
 
 def format_history(history: List[Dict[str, str]]) -> str:
+    # history is already windowed to the token budget by session_history
     formatted = []
-    for turn in history[-10:]:
+    for turn in history:
+        if turn["role"] == "summary":
+            formatted.append(f"Summary of earlier conversation: {turn['content']}")
+            continue
         role = "User" if turn["role"] == "user" else "A2rchi"
         formatted.append(f"{role}: {turn['content']}")
     return "\n".join(formatted)
 
+def clean_response(response: str) -> str:
+    # Cleanup formatting artifacts
+    response = re.sub(r'\(\s*`', r'`', response)
+    response = re.sub(r'`([^`]+)`[)\.,;:!?…]*', r'`\1`', response)
+    return response
+
+class ParagraphChunker:
+    """
+    Groups streamed tokens into paragraph-sized chunks.
+
+    Text is only split at a blank line that is outside any backtick span and
+    not preceded by "(", so running clean_response on each chunk gives the
+    same result as running it on the whole answer. The first chunk is sent
+    at the first paragraph break. Later ones wait until min_chars are
+    buffered and are then cut at the last break, so they are usually but
+    not always at least min_chars long.
+
+    The buffer is scanned incrementally: each character is examined about
+    once, however many tokens arrive before a break is found.
+    """
+
+    def __init__(self, min_chars: int = STREAM_MIN_CHARS):
+        self.min_chars = min_chars
+        self.buffer = ""
+        self.emitted = 0
+        self._reset_scan()
+
+    def _reset_scan(self):
+        # buffer[:_scanned] has been scanned; it ends before any trailing
+        # whitespace, since a paragraph break there may still grow
+        self._scanned = 0
+        # Backtick that may yet be closed, paired the way clean_response's
+        # `[^`]+` pairs them; a stray one could pair with text still to come
+        self._open = None
+        self._last_char = ""
+        # End of the last paragraph break whose prefix is closed
+        self._split = -1
+
+    def _closed(self) -> bool:
+        return self._open is None and self._last_char != "("
+
+    def _break_end(self, start: int, end: int) -> int:
+        # End of the paragraph break in the whitespace run buffer[start:end], or -1
+        run = self.buffer[start:end]
+        if run.count("\n") < 2 or not self._closed():
+            return -1
+        return start + run.rindex("\n") + 1
+
+    def _split_point(self) -> int:
+        buffer = self.buffer
+        end = len(buffer.rstrip())
+        i = self._scanned
+        while i < end:
+            char = buffer[i]
+            if char.isspace():
+                j = i + 1
+                while buffer[j].isspace():
+                    j += 1
+                self._split = max(self._split, self._break_end(i, j))
+                i = j
+                continue
+            if char == "`":
+                # "``" can't pair (the span needs content), so the second one
+                # becomes the candidate opener instead
+                self._open = i if self._open is None or i == self._open + 1 else None
+            self._last_char = char
+            i += 1
+        self._scanned = end
+        return max(self._split, self._break_end(end, len(buffer)))
+
+    def feed(self, token: str) -> str | None:
+        self.buffer += token
+        if self.emitted and len(self.buffer) < self.min_chars:
+            return None
+
+        split = self._split_point()
+        if split <= 0:
+            return None
+
+        chunk, self.buffer = self.buffer[:split], self.buffer[split:]
+        self.emitted += 1
+        self._reset_scan()
+        return clean_response(chunk).strip()
+
+    def flush(self) -> str | None:
+        chunk, self.buffer = self.buffer, ""
+        self._reset_scan()
+        chunk = clean_response(chunk).strip()
+        return chunk or None
+
+def answer_cache_applies(history: List[Dict[str, str]]) -> bool:
+    # Follow-up questions depend on the conversation, so only first turns are cached
+    return answer_cache is not None and not history
+
+def cached_answer(ctx: Context, embedding: List[float] | None, docs: List[Document], history: List[Dict[str, str]]) -> str | None:
+    if embedding is None or not answer_cache_applies(history):
+        return None
+    answer = answer_cache.lookup(embedding, doc_ids(docs))
+    stats = answer_cache.stats()
+    ctx.logger.info(
+        f"{'⚡ Answer cache hit' if answer is not None else 'Answer cache miss'} "
+        f"({stats['hits']}/{stats['hits'] + stats['misses']} hits, {stats['hit_rate']:.0%})"
+    )
+    return answer
+
+def cache_answer(embedding: List[float] | None, docs: List[Document], history: List[Dict[str, str]], answer: str):
+    if embedding is not None and answer_cache_applies(history) and answer:
+        answer_cache.add(embedding, doc_ids(docs), answer)
+
+def lexical_docs(vectorstore: FAISS, hits: List[Tuple[int, float]]) -> List[Document]:
+    return [vectorstore.docstore.search(vectorstore.index_to_docstore_id[position]) for position, _ in hits]
+
+@traced("retrieval")
+async def retrieve(user_question: str, history: List[Dict[str, str]]) -> Tuple[List[float] | None, List[Document]]:
+    """
+    Fetches the top chunks for a question. The question embedding is returned
+    too so the answer cache can reuse it; it is None when the lexical fast
+    path answered without one.
+    """
+    vectorstore = get_vectorstore()
+    lexical = get_lexical_index()
+
+    if lexical is not None and LEXICAL_FAST_PATH and not answer_cache_applies(history):
+        with span("lexical_search"):
+            hits = lexical.confident_search(user_question, RETRIEVAL_K)
+        if hits:
+            return None, lexical_docs(vectorstore, hits)
+
+    with span("embed_query"):
+        embedding = await vectorstore.embeddings.aembed_query(user_question)
+    if lexical is None or not HYBRID_RETRIEVAL:
+        with span("vector_search"):
+            return embedding, await vectorstore.asimilarity_search_by_vector(embedding, k=RETRIEVAL_K)
+
+    with span("vector_search"):
+        vector_docs = await vectorstore.asimilarity_search_by_vector(embedding, k=FUSION_DEPTH)
+    with span("lexical_search"):
+        keyword_docs = lexical_docs(vectorstore, lexical.search(user_question, FUSION_DEPTH))
+    return embedding, reciprocal_rank_fusion([vector_docs, keyword_docs], RETRIEVAL_K)
+
+@traced("build_prompt")
+def build_prompt(user_question: str, history: List[Dict[str, str]], docs: List[Document]) -> Tuple[str, dict]:
+    """
+    Assembles the prompt within PROMPT_TOKEN_BUDGET. The oldest history turns
+    are dropped until at least MIN_CONTEXT_TOKENS are left for context, then
+    the deduplicated chunks fill the rest in rank order. Returns the prompt
+    and its token usage.
+    """
+    history_dropped = 0
+    while True:
+        chat_history = format_history(history)
+        frame_tokens = count_tokens(a2rchi_prompt.format(context="", chat_history=chat_history, question=user_question))
+        if not history or frame_tokens <= PROMPT_TOKEN_BUDGET - MIN_CONTEXT_TOKENS:
+            break
+        history = history[1:]
+        history_dropped += 1
+
+    chunks = dedupe_chunks([doc.page_content.strip() for doc in docs])
+    deduped = len(docs) - len(chunks)
+    chunks, usage = fit_chunks(chunks, PROMPT_TOKEN_BUDGET - frame_tokens)
+    usage = {
+        "prompt_tokens": frame_tokens + usage["context_tokens"],
+        **usage,
+        "chunks_deduped": deduped,
+        "history_turns": len(history),
+        "history_dropped": history_dropped,
+    }
+
+    prompt = a2rchi_prompt.format(
+        context="\n\n".join(chunks),
+        chat_history=chat_history,
+        question=user_question
+    )
+    return prompt, usage
+
 # Main question answering function
 async def answer_physics_question(user_question: str, ctx: Context, history: List[Dict[str, str]]) -> str:
     """
     Answers a Classical Mechanics (8.01) question using a FAISS-powered context + LLM.
     """
     try:
-        vectorstore = get_vectorstore()
-        retriever = vectorstore.as_retriever(search_type="similarity", search_kwargs={"k": 5})
-        docs = await retriever.ainvoke(user_question)
-        context = "\n\n".join(doc.page_content.strip() for doc in docs)
-
-        chat_history = format_history(history)
+        embedding, docs = await retrieve(user_question, history)
+        cached = cached_answer(ctx, embedding, docs, history)
+        if cached is not None:
+            return cached
 
-        prompt = a2rchi_prompt.format(
-            context=context,
-            chat_history=chat_history,
-            question=user_question
-        )
+        prompt, usage = build_prompt(user_question, history, docs)
+        ctx.logger.info(f"🧮 Prompt usage: {format_usage(usage)}")
+        with span("llm"):
+            llm_response = await llm.ainvoke(prompt)
+        answer = clean_response(llm_response.content)
+        cache_answer(embedding, docs, history, answer)
+        return answer
 
-        llm = ChatOpenAI(model="gpt-4o", temperature=0)
-        llm_response = await llm.ainvoke(prompt)
+    except Exception as e:
+        logging.error(f"❌ Error answering question: {e}")
+        return ERROR_MESSAGE
 
-        response = llm_response.content
+async def stream_physics_answer(user_question: str, ctx: Context, history: List[Dict[str, str]]) -> AsyncIterator[str]:
+    """
+    Streaming version of answer_physics_question. Yields the answer as
+    cleaned, paragraph-sized chunks as soon as they are generated.
+    """
+    chunker = ParagraphChunker()
+    try:
+        embedding, docs = await retrieve(user_question, history)
+        cached = cached_answer(ctx, embedding, docs, history)
+        if cached is not None:
+            yield cached
+            return
 
-        # Cleanup formatting artifacts
-        response = re.sub(r'\(\s*`', r'`', response)
-        response = re.sub(r'`([^`]+)`[)\.,;:!?…]*', r'`\1`', response)
+        chunks = []
+        prompt, usage = build_prompt(user_question, history, docs)
+        ctx.logger.info(f"🧮 Prompt usage: {format_usage(usage)}")
+        # Includes the time the caller spends sending each chunk
+        with span("llm_stream"):
+            async for token in llm.astream(prompt):
+                chunk = chunker.feed(token.content)
+                if chunk:
+                    chunks.append(chunk)
+                    yield chunk
 
-        return response
+        chunk = chunker.flush()
+        if chunk:
+            chunks.append(chunk)
+            yield chunk
+        cache_answer(embedding, docs, history, "\n\n".join(chunks))
 
     except Exception as e:
         logging.error(f"❌ Error answering question: {e}")
-        return "Sorry, I couldn’t retrieve an answer. Please try again later."
+        if not chunker.emitted:
+            yield ERROR_MESSAGE
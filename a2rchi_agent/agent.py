@@ -1,5 +1,11 @@
-from uagents import Agent
+import asyncio
+
+from uagents import Agent, Context
 from chat_proto import chat_proto
+from tracing import start_metrics_server, write_json
+from prompt_budget import get_encoding
+from session_history import HISTORY_SWEEP_INTERVAL, evict_idle_sessions, migrate_legacy_histories
+from vectorstore import get_vectorstore
 
 # Create the agent with mailbox enabled
 agent = Agent(
@@ -11,6 +17,45 @@ agent = Agent(
 # Attach the chat protocol
 agent.include(chat_proto)
 
+# Warm up the FAISS index so the first user doesn't pay the load cost
+@agent.on_event("startup")
+async def warm_up_index(ctx: Context):
+    try:
+        await asyncio.to_thread(get_vectorstore)
+        ctx.logger.info("🔥 FAISS index warmed up")
+    except Exception as e:
+        ctx.logger.error(f"❌ Failed to warm up FAISS index: {e}")
+
+# Load the tokenizer off the event loop; tiktoken downloads it on a cold cache
+@agent.on_event("startup")
+async def warm_up_tokenizer(ctx: Context):
+    if await asyncio.to_thread(get_encoding) is not None:
+        ctx.logger.info("🔥 Tokenizer warmed up")
+
+# Compact histories saved in the old unbounded list format
+@agent.on_event("startup")
+async def migrate_histories(ctx: Context):
+    migrated = migrate_legacy_histories(ctx.storage)
+    if migrated:
+        ctx.logger.info(f"🗜️ Migrated {migrated} session histories to the bounded format")
+
+# Drop the history of sessions that have been idle for longer than the TTL
+@agent.on_interval(period=HISTORY_SWEEP_INTERVAL)
+async def evict_sessions(ctx: Context):
+    evicted = evict_idle_sessions(ctx.storage)
+    if evicted:
+        ctx.logger.info(f"🧹 Evicted {evicted} idle sessions")
+
+# Serve per-stage latency metrics when TRACING is enabled
+@agent.on_event("startup")
+async def start_tracing(ctx: Context):
+    start_metrics_server()
+
+@agent.on_event("shutdown")
+async def export_traces(ctx: Context):
+    if write_json():
+        ctx.logger.info("📈 Wrote trace summary")
+
 # Run the agent
 if __name__ == "__main__":
     agent.run()
@@ -0,0 +1,100 @@
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+
+import numpy as np
+from langchain_core.documents import Document
+
+from tracing import register_cache
+
+logger = logging.getLogger(__name__)
+
+# Semantic cache of first-turn answers, keyed by question embedding + retrieved chunks
+ANSWER_CACHE_ENABLED = os.getenv("A2RCHI_ANSWER_CACHE", "true").lower() == "true"
+ANSWER_CACHE_THRESHOLD = float(os.getenv("A2RCHI_ANSWER_CACHE_THRESHOLD", "0.95"))
+ANSWER_CACHE_SIZE = int(os.getenv("A2RCHI_ANSWER_CACHE_SIZE", "1000"))
+
+
+def doc_ids(docs: list[Document]) -> frozenset[str]:
+    """
+    Identity of a retrieved chunk set. Falls back to a content hash for
+    documents without a docstore id.
+    """
+    return frozenset(
+        doc.id or hashlib.sha1(doc.page_content.encode("utf-8")).hexdigest() for doc in docs
+    )
+
+
+class AnswerCache:
+    """
+    In-memory semantic answer cache.
+
+    Past questions are kept as unit vectors in a fixed-size NumPy matrix, so a
+    lookup is one matrix-vector product. A cached answer is only returned when
+    the new question is within `threshold` cosine similarity of a past one AND
+    retrieval returned the same chunk set, so answers never outlive an index
+    rebuild. Least recently used entries are evicted when the cache is full.
+    """
+
+    def __init__(self, max_entries: int = ANSWER_CACHE_SIZE, threshold: float = ANSWER_CACHE_THRESHOLD):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.hits = 0
+        self.misses = 0
+        self._vectors: np.ndarray | None = None
+        # slot -> (doc ids, answer), ordered from least to most recently used
+        self._entries: OrderedDict[int, tuple[frozenset[str], str]] = OrderedDict()
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding: list[float], docs: frozenset[str]) -> str | None:
+        if not self._entries:
+            self.misses += 1
+            return None
+
+        slots = np.fromiter(self._entries.keys(), dtype=np.int64)
+        scores = self._vectors[slots] @ self._normalize(embedding)
+        for i in np.argsort(-scores):
+            if scores[i] < self.threshold:
+                break
+            slot = int(slots[i])
+            cached_docs, answer = self._entries[slot]
+            if cached_docs == docs:
+                self._entries.move_to_end(slot)
+                self.hits += 1
+                return answer
+
+        self.misses += 1
+        return None
+
+    def add(self, embedding: list[float], docs: frozenset[str], answer: str):
+        vector = self._normalize(embedding)
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_entries, len(vector)), dtype=np.float32)
+
+        if len(self._entries) < self.max_entries:
+            slot = len(self._entries)
+        else:
+            slot, _ = self._entries.popitem(last=False)
+
+        self._vectors[slot] = vector
+        self._entries[slot] = (docs, answer)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+
+
+answer_cache = AnswerCache() if ANSWER_CACHE_ENABLED else None
+if answer_cache is not None:
+    register_cache("answers", answer_cache.stats)
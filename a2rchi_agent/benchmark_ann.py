@@ -0,0 +1,124 @@
+import argparse
+import os
+import time
+
+import faiss
+import numpy as np
+
+from ann_index import apply_search_params, build_ann_index, describe_index
+from mmap_index import FAISS_FILE, read_faiss_index
+
+# Recall-vs-latency comparison of the ANN index types against the exact flat
+# index. Base vectors come from a flat index.faiss (or a synthetic corpus),
+# queries from a held-out question file that was not used to build the index.
+
+QUESTIONS_PATH = os.path.join(os.path.dirname(__file__), "benchmark_questions.txt")
+EF_SEARCH_SWEEP = (16, 32, 64, 128, 256)
+NPROBE_SWEEP = (1, 4, 16, 64)
+
+
+def load_base_vectors(index_dir: str) -> np.ndarray:
+    index = read_faiss_index(os.path.join(index_dir, FAISS_FILE))
+    if not isinstance(index, faiss.IndexFlat):
+        raise SystemExit(f"❌ {index_dir} holds a {describe_index(index)['type']} index; the baseline needs a flat one")
+    return index.reconstruct_n(0, index.ntotal)
+
+
+def load_queries(path: str) -> np.ndarray:
+    from embedding_cache import get_embeddings
+
+    with open(path, "r", encoding="utf-8") as f:
+        questions = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    embeddings = get_embeddings()
+    return np.array([embeddings.embed_query(question) for question in questions], dtype=np.float32)
+
+
+def synthetic_corpus(n: int, dim: int, queries: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    # Clustered data, so ANN indexes behave as they would on real embeddings
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(1, n // 100), dim)).astype(np.float32)
+
+    def sample(count: int) -> np.ndarray:
+        points = centers[rng.integers(len(centers), size=count)]
+        return points + 0.3 * rng.standard_normal((count, dim)).astype(np.float32)
+
+    return sample(n), sample(queries)
+
+
+def measure(index: faiss.Index, queries: np.ndarray, truth: np.ndarray, k: int) -> dict:
+    # One query at a time, as the agent issues them
+    latencies, found = [], []
+    for query in queries:
+        start = time.perf_counter()
+        _, ids = index.search(query[None, :], k)
+        latencies.append(time.perf_counter() - start)
+        found.append(ids[0])
+
+    recall = np.mean([len(set(f) & set(t)) / k for f, t in zip(found, truth)])
+    latencies = np.array(latencies) * 1000
+    return {
+        "recall": recall,
+        "mean_ms": latencies.mean(),
+        "p95_ms": np.percentile(latencies, 95),
+    }
+
+
+def main(args: argparse.Namespace):
+    faiss.omp_set_num_threads(1)
+
+    if args.synthetic:
+        base, queries = synthetic_corpus(args.synthetic, args.dim, args.queries)
+        print(f"🧪 Synthetic corpus: {len(base)} vectors x {base.shape[1]} dims, {len(queries)} queries")
+    else:
+        base = load_base_vectors(args.index_dir)
+        queries = load_queries(args.questions)
+        print(f"📚 {args.index_dir}: {len(base)} vectors x {base.shape[1]} dims, {len(queries)} held-out questions")
+
+    rows = []
+    variants = [
+        ("flat", [{}]),
+        ("hnsw", [{"ef_search": ef} for ef in EF_SEARCH_SWEEP]),
+        ("ivfpq", [{"nprobe": nprobe} for nprobe in NPROBE_SWEEP]),
+    ]
+
+    truth = None
+    for index_type, sweep in variants:
+        # Build params come from the same env vars as build_index.py
+        start = time.perf_counter()
+        try:
+            index = build_ann_index(base, index_type)
+        except ValueError as e:
+            print(f"⚠️ Skipping {index_type}: {e}")
+            continue
+        index.add(base)
+        build_s = time.perf_counter() - start
+        size_mb = len(faiss.serialize_index(index)) / 1e6
+
+        if truth is None:
+            # The flat index is exact, so its results are the ground truth
+            _, truth = index.search(queries, args.k)
+
+        for search_params in sweep:
+            apply_search_params(index, **search_params)
+            result = measure(index, queries, truth, args.k)
+            rows.append((describe_index(index), build_s, size_mb, result))
+
+    print()
+    print(f"{'index':<56} {'build s':>8} {'size MB':>8} {'recall@' + str(args.k):>9} {'mean ms':>8} {'p95 ms':>8}")
+    for described, build_s, size_mb, result in rows:
+        label = ", ".join(f"{key}={value}" for key, value in described.items())
+        print(
+            f"{label:<56} {build_s:>8.2f} {size_mb:>8.1f} {result['recall']:>9.3f}"
+            f" {result['mean_ms']:>8.3f} {result['p95_ms']:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark recall vs latency of Flat, HNSW and IVF-PQ indexes")
+    parser.add_argument("--index-dir", default="a2rchi_index", help="Directory with a flat index.faiss")
+    parser.add_argument("--questions", default=QUESTIONS_PATH, help="Held-out questions, one per line")
+    parser.add_argument("--k", type=int, default=5, help="Chunks retrieved per question (a2rchi uses 5)")
+    parser.add_argument("--synthetic", type=int, default=0, help="Use N synthetic vectors instead of an index")
+    parser.add_argument("--dim", type=int, default=1536, help="Dimension of synthetic vectors")
+    parser.add_argument("--queries", type=int, default=200, help="Number of synthetic queries")
+    main(parser.parse_args())
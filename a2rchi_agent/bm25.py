@@ -0,0 +1,161 @@
+import json
+import math
+import os
+import re
+from collections import Counter
+
+import numpy as np
+from langchain_core.documents import Document
+
+# Lexical index stored next to the FAISS files; positions match FAISS positions
+BM25_FILE = "bm25.json"
+FORMAT_VERSION = 1
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Lexical-only fast path: the best hit must cover this share of the query's
+# IDF mass, and the query must have at least this many distinct terms
+BM25_FAST_PATH_COVERAGE = float(os.getenv("BM25_FAST_PATH_COVERAGE", "0.9"))
+BM25_FAST_PATH_MIN_TERMS = int(os.getenv("BM25_FAST_PATH_MIN_TERMS", "2"))
+RRF_K = int(os.getenv("RRF_K", "60"))
+
+STOPWORDS = frozenset("""
+a about an and any are as at be been but by can could do does doing for from had has have how i if in into
+is it its me my of on or our should so some such than that the their them then there these they this to
+use using was we what when where which while who why will with would you your explain describe tell find
+""".split())
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Lowercased alphanumeric terms without stopwords or one-letter tokens,
+    with plurals folded so "collisions" matches "collision".
+    """
+    terms = []
+    for token in re.findall(r"[a-z0-9]+", text.lower()):
+        if len(token) < 2 or token in STOPWORDS:
+            continue
+        if len(token) > 4 and token.endswith("ies"):
+            token = token[:-3] + "y"
+        elif len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+class BM25Index:
+    """
+    Okapi BM25 inverted index over the index chunks. Postings are held as
+    NumPy arrays so a query is a few vectorized adds per term.
+    """
+
+    def __init__(self, postings: dict[str, tuple[np.ndarray, np.ndarray]], doc_lengths: np.ndarray):
+        self.postings = postings
+        self.doc_lengths = doc_lengths
+        self.size = len(doc_lengths)
+        avgdl = doc_lengths.mean() if self.size else 1.0
+        self._norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_lengths / (avgdl or 1.0))
+
+    @classmethod
+    def build(cls, texts: list[str]) -> "BM25Index":
+        postings: dict[str, tuple[list[int], list[int]]] = {}
+        doc_lengths = []
+        for position, text in enumerate(texts):
+            terms = tokenize(text)
+            doc_lengths.append(len(terms))
+            for term, count in Counter(terms).items():
+                positions, counts = postings.setdefault(term, ([], []))
+                positions.append(position)
+                counts.append(count)
+        return cls(
+            {term: (np.array(p, dtype=np.int32), np.array(c, dtype=np.float32)) for term, (p, c) in postings.items()},
+            np.array(doc_lengths, dtype=np.float32),
+        )
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": FORMAT_VERSION,
+                "doc_lengths": self.doc_lengths.astype(int).tolist(),
+                "postings": {
+                    term: [positions.tolist(), counts.astype(int).tolist()]
+                    for term, (positions, counts) in self.postings.items()
+                },
+            }, f)
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data["version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported BM25 index version {data['version']} in {path}")
+        return cls(
+            {
+                term: (np.array(positions, dtype=np.int32), np.array(counts, dtype=np.float32))
+                for term, (positions, counts) in data["postings"].items()
+            },
+            np.array(data["doc_lengths"], dtype=np.float32),
+        )
+
+    def idf(self, term: str) -> float:
+        # Unknown terms get the highest possible IDF, so they count against coverage
+        df = len(self.postings[term][0]) if term in self.postings else 0
+        return math.log(1 + (self.size - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, k: int) -> list[tuple[int, float]]:
+        """
+        Top-k (position, score) pairs for a query.
+        """
+        scores = np.zeros(self.size, dtype=np.float32)
+        for term in set(tokenize(query)):
+            if term not in self.postings:
+                continue
+            positions, counts = self.postings[term]
+            scores[positions] += self.idf(term) * counts * (BM25_K1 + 1) / (counts + self._norm[positions])
+
+        k = min(k, self.size)
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(position), float(scores[position])) for position in top if scores[position] > 0]
+
+    def coverage(self, query: str, position: int) -> float:
+        """
+        Share of the query's IDF mass whose terms appear in the chunk at position.
+        """
+        terms = set(tokenize(query))
+        total = sum(self.idf(term) for term in terms)
+        matched = sum(
+            self.idf(term) for term in terms
+            if term in self.postings and position in self.postings[term][0]
+        )
+        return matched / total if total else 0.0
+
+    def confident_search(self, query: str, k: int) -> list[tuple[int, float]] | None:
+        """
+        Lexical results if they are good enough to skip the embedding call,
+        otherwise None.
+        """
+        if len(set(tokenize(query))) < BM25_FAST_PATH_MIN_TERMS:
+            return None
+        hits = self.search(query, k)
+        if len(hits) < k or self.coverage(query, hits[0][0]) < BM25_FAST_PATH_COVERAGE:
+            return None
+        return hits
+
+
+def reciprocal_rank_fusion(rankings: list[list[Document]], k: int, rrf_k: int = RRF_K) -> list[Document]:
+    """
+    Fuses ranked document lists with RRF: each document scores
+    sum(1 / (rrf_k + rank)) over the lists it appears in.
+    """
+    scores: dict[str, float] = {}
+    docs: dict[str, Document] = {}
+    for ranking in rankings:
+        for rank, doc in enumerate(ranking, start=1):
+            key = doc.id or doc.page_content
+            scores[key] = scores.get(key, 0.0) + 1 / (rrf_k + rank)
+            docs.setdefault(key, doc)
+    best = sorted(scores, key=scores.get, reverse=True)[:k]
+    return [docs[key] for key in best]
@@ -1,19 +1,134 @@
+import asyncio
+import glob
+import hashlib
+import json
 import os
 import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
 from langchain_community.document_loaders import PyPDFLoader, TextLoader
-from langchain_community.embeddings import OpenAIEmbeddings
-from langchain_community.vectorstores import FAISS
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_core.documents import Document
 
-def build_faiss_index(output_dir: str = "a2rchi_index"):
-    DATA_FOLDERS = {
-        "textbook": "data/textbook",
-    }
+from ann_index import INDEX_TYPE, build_vectorstore
+from bm25 import BM25_FILE, BM25Index
+from embedding_cache import CachedEmbeddings, get_embeddings
+from mmap_index import write_chunks
 
-    docs = []
+DATA_FOLDERS = {
+    "textbook": "data/textbook",
+}
+CHUNK_SIZE = 500
+CHUNK_OVERLAP = 50
+
+# Per-source chunks + embeddings, keyed by a fingerprint of the file contents,
+# so unchanged files are neither re-parsed nor re-embedded on rebuild
+CACHE_DIR = "a2rchi_index_cache"
+EMBED_BATCH_SIZE = 256
+EMBED_CONCURRENCY = 4
+
+
+def fingerprint(doc_type: str, fpath: Path, model: str) -> str:
+    h = hashlib.sha256()
+    h.update(f"{doc_type}\0{fpath.name}\0{CHUNK_SIZE}\0{CHUNK_OVERLAP}\0{model}\0".encode())
+    with open(fpath, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def load_and_split(doc_type: str, fpath: str) -> list[tuple[str, dict]]:
+    """
+    Parses and chunks a single source file. Runs in a worker process.
+    """
+    if fpath.endswith(".pdf"):
+        loader = PyPDFLoader(fpath)
+    else:
+        loader = TextLoader(fpath)
+
+    loaded = loader.load()
+    for doc in loaded:
+        doc.metadata["type"] = doc_type
+        doc.metadata["source"] = os.path.basename(fpath)
+
+    splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+    return [(chunk.page_content, chunk.metadata) for chunk in splitter.split_documents(loaded)]
+
+
+async def embed_texts(texts: list[str], embeddings: CachedEmbeddings) -> np.ndarray:
+    """
+    Embeds texts in batches, with up to EMBED_CONCURRENCY requests in flight.
+    """
+    semaphore = asyncio.Semaphore(EMBED_CONCURRENCY)
+
+    async def embed_batch(batch: list[str]) -> list[list[float]]:
+        async with semaphore:
+            return await embeddings.aembed_documents(batch)
+
+    batches = [texts[i:i + EMBED_BATCH_SIZE] for i in range(0, len(texts), EMBED_BATCH_SIZE)]
+    results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+    return np.array([vector for batch in results for vector in batch], dtype=np.float32)
+
+
+def load_cached(key: str) -> tuple[list[tuple[str, dict]], np.ndarray] | None:
+    chunks_path = Path(CACHE_DIR) / f"{key}.json"
+    vectors_path = Path(CACHE_DIR) / f"{key}.npy"
+    if not (chunks_path.exists() and vectors_path.exists()):
+        return None
+    with open(chunks_path, "r", encoding="utf-8") as f:
+        chunks = [tuple(chunk) for chunk in json.load(f)]
+    return chunks, np.load(vectors_path)
+
+
+def save_cached(key: str, chunks: list[tuple[str, dict]], vectors: np.ndarray):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(Path(CACHE_DIR) / f"{key}.json", "w", encoding="utf-8") as f:
+        json.dump(chunks, f)
+    np.save(Path(CACHE_DIR) / f"{key}.npy", vectors)
+
+
+def new_version_dir(output_dir: str) -> str:
+    # Versioned build directory next to output_dir, e.g. a2rchi_index.v1718000000123
+    version_dir = f"{output_dir}.v{time.time_ns()}"
+    os.makedirs(version_dir)
+    return version_dir
+
+
+def swap_in(version_dir: str, output_dir: str, keep: int = 2):
+    """
+    Points output_dir, a symlink, at version_dir. The new link is created
+    beside it and moved over it with os.replace, which is atomic, so readers
+    resolve either the old or the new index and never a missing or
+    half-written one.
+
+    The newest `keep` versions stay on disk, so a reader that resolved the
+    link just before the swap can finish loading the previous one. A plain
+    output_dir from an older build is converted once by renaming it into a
+    version; only that first swap briefly leaves output_dir missing.
+    """
+    if os.path.isdir(output_dir) and not os.path.islink(output_dir):
+        os.rename(output_dir, f"{output_dir}.v0")
+
+    link = f"{output_dir}.link"
+    if os.path.lexists(link):
+        os.remove(link)
+    # Relative target, so the index folder can be moved as a whole
+    os.symlink(os.path.basename(version_dir), link)
+    os.replace(link, output_dir)
+
+    versions = [path for path in glob.glob(f"{glob.escape(output_dir)}.v*") if path.rsplit(".v", 1)[1].isdigit()]
+    versions.sort(key=lambda path: int(path.rsplit(".v", 1)[1]))
+    for old in versions[:-keep]:
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def build_faiss_index(output_dir: str = "a2rchi_index", workers: int | None = None, index_type: str = INDEX_TYPE):
+    embeddings = get_embeddings()
+    model = embeddings.model
+
+    sources = []
     print("🔍 Scanning data folders...")
 
     for doc_type, folder in DATA_FOLDERS.items():
@@ -22,43 +137,86 @@ def build_faiss_index(output_dir: str = "a2rchi_index"):
             print(f"⚠️ Skipping {folder} (not found)")
             continue
 
-        for file in os.listdir(path):
+        for file in sorted(os.listdir(path)):
             fpath = path / file
-            if file.endswith(".pdf"):
-                loader = PyPDFLoader(str(fpath))
-            elif file.endswith(".txt"):
-                loader = TextLoader(str(fpath))
-            else:
+            if not (file.endswith(".pdf") or file.endswith(".txt")):
                 print(f"⛔ Skipping unsupported file: {fpath}")
                 continue
+            sources.append((doc_type, fpath, fingerprint(doc_type, fpath, model)))
+
+    results = {}
+    changed = []
+    for doc_type, fpath, key in sources:
+        cached = load_cached(key)
+        if cached is not None:
+            results[key] = cached
+        else:
+            changed.append((doc_type, fpath, key))
+
+    print(f"♻️ Reusing {len(results)} unchanged file(s); {len(changed)} to (re)process.")
+
+    if changed:
+        parsed = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                key: pool.submit(load_and_split, doc_type, str(fpath))
+                for doc_type, fpath, key in changed
+            }
+            for doc_type, fpath, key in changed:
+                print(f"📄 Loading {fpath}")
+                try:
+                    parsed[key] = futures[key].result()
+                except Exception as e:
+                    print(f"❌ Error loading {fpath}: {e}")
 
-            print(f"📄 Loading {fpath}")
-            try:
-                loaded = loader.load()
-                for doc in loaded:
-                    doc.metadata["type"] = doc_type
-                    doc.metadata["source"] = file
-                docs.extend(loaded)
-            except Exception as e:
-                print(f"❌ Error loading {fpath}: {e}")
+        # Embed the chunks of every changed file in one concurrent pass
+        all_texts = [text for chunks in parsed.values() for text, _ in chunks]
+        print(f"🧩 Embedding {len(all_texts)} new chunks...")
+        # Files that parse to no chunks (empty or image-only) get an empty slice
+        all_vectors = asyncio.run(embed_texts(all_texts, embeddings)) if all_texts else np.empty((0, 0), np.float32)
 
-    print(f"✅ Loaded {len(docs)} documents.")
+        offset = 0
+        for key, chunks in parsed.items():
+            chunk_vectors = all_vectors[offset:offset + len(chunks)]
+            offset += len(chunks)
+            if not embeddings.read_only:
+                save_cached(key, chunks, chunk_vectors)
+            results[key] = (chunks, chunk_vectors)
 
-    if not docs:
+    # Assemble in a stable source order
+    texts, metadatas, vectors = [], [], []
+    for _, _, key in sources:
+        if key not in results:
+            continue
+        chunks, chunk_vectors = results[key]
+        if not chunks:
+            continue
+        texts.extend(text for text, _ in chunks)
+        metadatas.extend(metadata for _, metadata in chunks)
+        vectors.append(chunk_vectors)
+
+    if not texts:
         print("❌ No documents to index. Aborting.")
         return
 
-    splitter = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50)
-    chunks = splitter.split_documents(docs)
-    print(f"🧩 Split into {len(chunks)} chunks.")
+    print(f"🏗️ Building {index_type} index...")
+    vectorstore = build_vectorstore(texts, np.concatenate(vectors), metadatas, embeddings, index_type)
+
+    new_dir = new_version_dir(output_dir)
+    vectorstore.save_local(new_dir)
+    # Pickle-free chunk files next to index.faiss; the agent loads these
+    write_chunks(vectorstore, new_dir)
+    # Lexical index over the same chunks, in the same positions
+    BM25Index.build(texts).save(os.path.join(new_dir, BM25_FILE))
+    swap_in(new_dir, output_dir)
+    print(f"✅ FAISS {index_type} index saved to '{output_dir}' with {len(texts)} chunks.")
 
-    if os.path.exists(output_dir):
-        shutil.rmtree(output_dir)
-        print(f"🧹 Cleared old index at {output_dir}")
+    # Drop cache entries for files that no longer exist or have changed
+    live = {key for _, _, key in sources}
+    for entry in Path(CACHE_DIR).glob("*"):
+        if entry.stem not in live:
+            entry.unlink()
 
-    vectorstore = FAISS.from_documents(chunks, OpenAIEmbeddings())
-    vectorstore.save_local(output_dir)
-    print(f"✅ FAISS index saved to '{output_dir}' with {len(chunks)} chunks.")
 
 if __name__ == "__main__":
     build_faiss_index()
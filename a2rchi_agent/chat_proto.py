@@ -11,9 +11,9 @@ from uagents_core.contrib.protocols.chat import (
     chat_protocol_spec,
 )
 
-from a2rchi import answer_physics_question
-
-HISTORY_KEY = lambda session: f"{session}:history"
+from a2rchi import STREAM_RESPONSES, answer_physics_question, stream_physics_answer
+from session_history import SENDER_KEY, append_turn, history_window, load_history
+from tracing import span, traced
 
 # Create the chat protocol using the standard chat spec
 chat_proto = Protocol(spec=chat_protocol_spec)
@@ -31,22 +31,22 @@ def create_text_chat(text: str, end_session: bool = False) -> ChatMessage:
 
 # Required: handle incoming chat messages
 @chat_proto.on_message(model=ChatMessage)
+@traced("handle_chat")
 async def handle_chat(ctx: Context, sender: str, msg: ChatMessage):
     ctx.logger.info(f"📩 Received ChatMessage from {sender}")
-    ctx.storage.set(str(ctx.session), sender)
+    # Every set rewrites the storage file, so skip it when nothing changed
+    if ctx.storage.get(SENDER_KEY(ctx.session)) != sender:
+        ctx.storage.set(SENDER_KEY(ctx.session), sender)
 
     # Acknowledge receipt
-    await ctx.send(
-        sender,
-        ChatAcknowledgement(
-            timestamp=datetime.utcnow(),
-            acknowledged_msg_id=msg.msg_id,
-        ),
-    )
-
-    # Load history from storage
-    history_key = HISTORY_KEY(ctx.session)
-    history = ctx.storage.get(history_key) or []
+    with span("ack"):
+        await ctx.send(
+            sender,
+            ChatAcknowledgement(
+                timestamp=datetime.utcnow(),
+                acknowledged_msg_id=msg.msg_id,
+            ),
+        )
 
     for item in msg.content:
         if isinstance(item, StartSessionContent):
@@ -55,16 +55,23 @@ async def handle_chat(ctx: Context, sender: str, msg: ChatMessage):
         elif isinstance(item, TextContent):
             question = item.text
             ctx.logger.info(f"🧠 User asked: {question}")
+            # Load history from storage, including turns saved since the message arrived
+            history = history_window(load_history(ctx.storage, ctx.session))
 
-            response = await answer_physics_question(question, ctx, history)
-            await ctx.send(sender, create_text_chat(response))
-
-            # Append user question and assistant reply
-            history.append({"role": "user", "content": question})
-            history.append({"role": "assistant", "content": response})
+            if STREAM_RESPONSES:
+                # Send each paragraph as soon as it is generated
+                chunks = []
+                async for chunk in stream_physics_answer(question, ctx, history):
+                    await ctx.send(sender, create_text_chat(chunk))
+                    chunks.append(chunk)
+                response = "\n\n".join(chunks)
+            else:
+                response = await answer_physics_question(question, ctx, history)
+                await ctx.send(sender, create_text_chat(response))
 
-            # Save back to session storage
-            ctx.storage.set(history_key, history)
+            # Append user question and assistant reply, compact and save
+            with span("history_save"):
+                await append_turn(ctx.storage, ctx.session, question, response)
 
         else:
             ctx.logger.info(f"⚠️ Ignoring unknown content type from {sender}")
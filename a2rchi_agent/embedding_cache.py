@@ -0,0 +1,233 @@
+# Generated from common/embedding_cache.py by common/sync.py; edit that file, not this copy.
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+
+from langchain_core.embeddings import Embeddings
+from langchain_openai import OpenAIEmbeddings
+
+from tracing import register_cache
+
+logger = logging.getLogger(__name__)
+
+# Point both agents' EMBEDDING_CACHE_PATH at the same file to share one cache
+EMBEDDING_CACHE_PATH = os.getenv(
+    "EMBEDDING_CACHE_PATH", os.path.join(os.path.dirname(__file__), "embedding_cache.sqlite3")
+)
+# Offline mode: read-only cache, misses are filled by a deterministic stub embedder
+EMBEDDINGS_OFFLINE = os.getenv("EMBEDDINGS_OFFLINE", "false").lower() == "true"
+STUB_EMBEDDING_DIM = int(os.getenv("STUB_EMBEDDING_DIM", "1536"))
+
+# In-process cache of query embeddings, checked before the on-disk tier
+QUERY_CACHE_MAX_MB = float(os.getenv("QUERY_CACHE_MAX_MB", "64"))
+QUERY_CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL", "86400"))
+QUERY_CACHE_DISK = os.getenv("QUERY_CACHE_DISK", "true").lower() == "true"
+
+
+def normalize_query(text: str) -> str:
+    """
+    Case- and whitespace-insensitive form of a query, without surrounding
+    punctuation, so trivially different pastes share one cache entry. Only
+    the cache key; the query is embedded as the user wrote it.
+    """
+    return " ".join(text.casefold().split()).strip(" ?!.")
+
+
+class QueryEmbeddingCache:
+    """
+    Memory-capped LRU + TTL cache of query embeddings, stored as float32.
+    """
+
+    def __init__(self, max_bytes: int = int(QUERY_CACHE_MAX_MB * 1024 * 1024), ttl: float = QUERY_CACHE_TTL):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, array]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> list[float] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1].tolist()
+
+    def put(self, key: str, vector: list[float]):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            packed = array("f", vector)
+            self._entries[key] = (time.monotonic(), packed)
+            self.bytes += self._size(key, packed)
+            while self.bytes > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str):
+        _, packed = self._entries.pop(key)
+        self.bytes -= self._size(key, packed)
+
+    @staticmethod
+    def _size(key: str, packed: array) -> int:
+        return len(key) + len(packed) * packed.itemsize
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+        }
+
+
+class EmbeddingStore:
+    """
+    On-disk SQLite table of float32 vectors keyed by sha256(model, text).
+    """
+
+    def __init__(self, path: str = EMBEDDING_CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+        self._conn.commit()
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        found = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                batch = keys[i:i + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[key] = vector.tolist()
+        return found
+
+    def put_many(self, items: dict[str, list[float]]):
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, array("f", vector).tobytes()) for key, vector in items.items()],
+            )
+            self._conn.commit()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that consults the on-disk cache before calling the
+    underlying model, and only sends cache misses to the remote API.
+    """
+
+    def __init__(self, underlying: Embeddings, model: str, store: EmbeddingStore, read_only: bool = False):
+        self.underlying = underlying
+        self.model = model
+        self.store = store
+        self.read_only = read_only
+        self.hits = 0
+        self.misses = 0
+        self.query_cache = QueryEmbeddingCache()
+
+    def stats(self) -> dict:
+        # Hit rate of the on-disk tier
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def _lookup(self, texts: list[str]) -> tuple[list[str], dict[str, list[float]], list[str]]:
+        keys = [EmbeddingStore.key(self.model, text) for text in texts]
+        found = self.store.get_many(list(set(keys)))
+        missing = list({key: text for key, text in zip(keys, texts) if key not in found}.values())
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+        return keys, found, missing
+
+    def _store(self, missing: list[str], vectors: list[list[float]], found: dict[str, list[float]]):
+        # Round through float32 so fresh and cached vectors are identical
+        new = {
+            EmbeddingStore.key(self.model, text): array("f", vector).tolist()
+            for text, vector in zip(missing, vectors)
+        }
+        found.update(new)
+        if not self.read_only:
+            self.store.put_many(new)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, found, missing = self._lookup(texts)
+        if missing:
+            self._store(missing, self.underlying.embed_documents(missing), found)
+        return [found[key] for key in keys]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        # SQLite reads and commits block, so they run off the event loop
+        keys, found, missing = await asyncio.to_thread(self._lookup, texts)
+        if missing:
+            vectors = await self.underlying.aembed_documents(missing)
+            await asyncio.to_thread(self._store, missing, vectors, found)
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> list[float]:
+        key = f"{self.model}\0{normalize_query(text)}"
+        vector = self.query_cache.get(key)
+        if vector is None:
+            if QUERY_CACHE_DISK:
+                vector = self.embed_documents([text])[0]
+            else:
+                vector = array("f", self.underlying.embed_query(text)).tolist()
+            self.query_cache.put(key, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> list[float]:
+        key = f"{self.model}\0{normalize_query(text)}"
+        vector = self.query_cache.get(key)
+        if vector is None:
+            if QUERY_CACHE_DISK:
+                vector = (await self.aembed_documents([text]))[0]
+            else:
+                vector = array("f", await self.underlying.aembed_query(text)).tolist()
+            self.query_cache.put(key, vector)
+        return vector
+
+
+def get_embeddings() -> CachedEmbeddings:
+    """
+    OpenAI embeddings behind the persistent cache. In offline mode, cache
+    misses are embedded by a deterministic stub and never written back. The
+    caches' hit rates are published with the tracing metrics.
+    """
+    openai_model = OpenAIEmbeddings.model_fields["model"].default
+    if EMBEDDINGS_OFFLINE:
+        from langchain_community.embeddings import DeterministicFakeEmbedding
+
+        logger.warning("Embeddings are offline: cache misses will use a deterministic stub")
+        underlying = DeterministicFakeEmbedding(size=STUB_EMBEDDING_DIM)
+        embeddings = CachedEmbeddings(underlying, openai_model, EmbeddingStore(), read_only=True)
+    else:
+        underlying = OpenAIEmbeddings()
+        embeddings = CachedEmbeddings(underlying, underlying.model, EmbeddingStore())
+
+    register_cache("query_embeddings", embeddings.query_cache.stats)
+    register_cache("embedding_store", embeddings.stats)
+    return embeddings
@@ -0,0 +1,117 @@
+# Generated from common/prompt_budget.py by common/sync.py; edit that file, not this copy.
+import logging
+import os
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# GPT-4o tokenizer; counts fall back to ~4 characters per token if it can't be loaded
+TOKENIZER_ENCODING = os.getenv("TOKENIZER_ENCODING", "o200k_base")
+CHARS_PER_TOKEN = 4
+
+# Overlaps shorter than this are treated as coincidence, not splitter overlap
+MIN_OVERLAP_CHARS = 20
+MAX_OVERLAP_CHARS = 300
+# A chunk is only truncated to fit if at least this much of it would survive
+MIN_TRUNCATED_TOKENS = 50
+
+_encoding = None
+_encoding_loaded = False
+
+
+def get_encoding():
+    """
+    Loads the tiktoken encoding once. tiktoken downloads it on a cold cache,
+    so agents call this from a startup handler in a worker thread; until it
+    has loaded, and for good if loading fails (e.g. no network, logged
+    once), counts use the character estimate.
+    """
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        try:
+            import tiktoken
+
+            _encoding = tiktoken.get_encoding(TOKENIZER_ENCODING)
+        except Exception as e:
+            logger.warning(f"⚠️ tiktoken encoding unavailable, estimating tokens from length: {e}")
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    encoding = get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    encoding = get_encoding()
+    if encoding is not None:
+        return encoding.decode(encoding.encode(text)[:max_tokens])
+    return text[:max_tokens * CHARS_PER_TOKEN]
+
+
+def _overlap(left: str, right: str) -> int:
+    # Length of the longest suffix of left that is a prefix of right
+    for size in range(min(len(left), len(right), MAX_OVERLAP_CHARS), MIN_OVERLAP_CHARS - 1, -1):
+        if left.endswith(right[:size]):
+            return size
+    return 0
+
+
+def dedupe_chunks(chunks: List[str]) -> List[str]:
+    """
+    Removes repeated text from ranked chunks: exact and contained duplicates
+    are dropped, and text a chunk shares with a higher-ranked neighbour
+    through the splitter's chunk overlap is trimmed. Rank order is kept.
+    """
+    kept: List[str] = []
+    for chunk in chunks:
+        if any(chunk in other for other in kept):
+            continue
+        for other in kept:
+            # other ... | overlap | ... chunk
+            size = _overlap(other, chunk)
+            if size:
+                chunk = chunk[size:].lstrip()
+            # chunk ... | overlap | ... other
+            size = _overlap(chunk, other)
+            if size:
+                chunk = chunk[:-size].rstrip()
+        if chunk:
+            kept.append(chunk)
+    return kept
+
+
+def fit_chunks(chunks: List[str], budget: int) -> Tuple[List[str], dict]:
+    """
+    Keeps chunks in rank order while they fit in the token budget, truncating
+    the first one that doesn't (if enough of it would survive) and dropping
+    the rest.
+    """
+    kept, used, truncated = [], 0, 0
+    for chunk in chunks:
+        tokens = count_tokens(chunk)
+        if used + tokens <= budget:
+            kept.append(chunk)
+            used += tokens
+            continue
+        remaining = budget - used
+        if remaining >= MIN_TRUNCATED_TOKENS:
+            chunk = truncate_tokens(chunk, remaining)
+            kept.append(chunk)
+            used += count_tokens(chunk)
+            truncated = 1
+        break
+
+    return kept, {
+        "context_tokens": used,
+        "chunks_kept": len(kept),
+        "chunks_dropped": len(chunks) - len(kept),
+        "chunks_truncated": truncated,
+    }
+
+
+def format_usage(usage: dict) -> str:
+    return ", ".join(f"{key}={value}" for key, value in usage.items())
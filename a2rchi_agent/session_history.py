@@ -0,0 +1,190 @@
+import asyncio
+import logging
+import os
+import time
+import weakref
+from typing import Dict, List
+
+from uagents.storage import StorageAPI
+
+from prompt_budget import count_tokens
+
+logger = logging.getLogger(__name__)
+
+HISTORY_KEY = lambda session: f"{session}:history"
+SENDER_KEY = lambda session: str(session)
+# Ids of sessions with stored history, so idle ones can be found and evicted
+SESSION_INDEX_KEY = "history:sessions"
+
+# Ring buffer size per session; older messages are dropped or summarized
+HISTORY_MAX_MESSAGES = int(os.getenv("A2RCHI_HISTORY_MAX_MESSAGES", "10"))
+# Token budget for the history that goes into the prompt
+HISTORY_TOKEN_BUDGET = int(os.getenv("A2RCHI_HISTORY_TOKEN_BUDGET", "2000"))
+# Sessions idle for longer than this are evicted by the periodic sweep
+HISTORY_TTL = float(os.getenv("A2RCHI_HISTORY_TTL", str(7 * 24 * 3600)))
+HISTORY_SWEEP_INTERVAL = float(os.getenv("A2RCHI_HISTORY_SWEEP_INTERVAL", "3600"))
+
+# Optional rolling summary of messages that fall out of the ring buffer
+HISTORY_SUMMARY = os.getenv("A2RCHI_HISTORY_SUMMARY", "false").lower() == "true"
+HISTORY_SUMMARY_MODEL = os.getenv("A2RCHI_HISTORY_SUMMARY_MODEL", "gpt-4o-mini")
+HISTORY_SUMMARY_MAX_WORDS = int(os.getenv("A2RCHI_HISTORY_SUMMARY_MAX_WORDS", "150"))
+
+SUMMARY_PROMPT = """You maintain a compact summary of a conversation between a student and A2rchi, a Classical Mechanics (MIT 8.01) teaching assistant.
+
+Current summary:
+{summary}
+
+Older messages to fold into the summary:
+{messages}
+
+Return an updated summary of at most {max_words} words. Keep the topics, definitions, numbers and conclusions the student may refer back to. Output only the summary."""
+
+_summarizer = None
+# Serializes history updates per session, so concurrent messages don't
+# overwrite each other's turns while one is being summarized
+_session_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def session_lock(session) -> asyncio.Lock:
+    lock = _session_locks.get(str(session))
+    if lock is None:
+        lock = _session_locks[str(session)] = asyncio.Lock()
+    return lock
+
+
+def new_record() -> Dict:
+    return {"messages": [], "summary": "", "updated": time.time()}
+
+
+def load_history(storage: StorageAPI, session) -> Dict:
+    """
+    Loads a session's history record. Histories saved as a plain list of
+    messages (the old format) are migrated on the fly; their overflow is
+    compacted on the next save.
+    """
+    stored = storage.get(HISTORY_KEY(session))
+    if stored is None:
+        return new_record()
+    if isinstance(stored, list):
+        record = new_record()
+        record["messages"] = stored
+        return record
+    return stored
+
+
+def history_window(record: Dict, budget: int = HISTORY_TOKEN_BUDGET) -> List[Dict[str, str]]:
+    """
+    The most recent messages that fit in the token budget, oldest first,
+    preceded by the rolling summary if there is one.
+    """
+    window = []
+    used = 0
+    if record["summary"]:
+        used = count_tokens(record["summary"])
+    for message in reversed(record["messages"]):
+        used += count_tokens(message["content"])
+        if used > budget:
+            break
+        window.append(message)
+    window.reverse()
+
+    if record["summary"]:
+        window.insert(0, {"role": "summary", "content": record["summary"]})
+    return window
+
+
+async def summarize(summary: str, messages: List[Dict[str, str]]) -> str:
+    global _summarizer
+    if _summarizer is None:
+        from langchain_openai import ChatOpenAI
+
+        _summarizer = ChatOpenAI(model=HISTORY_SUMMARY_MODEL, temperature=0)
+
+    transcript = "\n".join(f"{message['role']}: {message['content']}" for message in messages)
+    response = await _summarizer.ainvoke(SUMMARY_PROMPT.format(
+        summary=summary or "(empty)", messages=transcript, max_words=HISTORY_SUMMARY_MAX_WORDS
+    ))
+    return response.content.strip()
+
+
+async def append_turn(storage: StorageAPI, session, question: str, answer: str):
+    """
+    Adds a question/answer pair to the session's stored history. Messages
+    beyond the ring buffer are folded into the summary (if enabled) or
+    dropped, so the stored record stays the same size however long the
+    session runs.
+
+    The record is re-read under a per-session lock, so turns saved by other
+    messages of the session while this one was answered are kept.
+    """
+    async with session_lock(session):
+        record = load_history(storage, session)
+        messages = record["messages"] + [
+            {"role": "user", "content": question},
+            {"role": "assistant", "content": answer},
+        ]
+        overflow = messages[:-HISTORY_MAX_MESSAGES]
+        record["messages"] = messages[-HISTORY_MAX_MESSAGES:]
+
+        if overflow and HISTORY_SUMMARY:
+            try:
+                record["summary"] = await summarize(record["summary"], overflow)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to summarize history, dropping {len(overflow)} old messages: {e}")
+
+        record["updated"] = time.time()
+        storage.set(HISTORY_KEY(session), record)
+
+    sessions = storage.get(SESSION_INDEX_KEY) or []
+    if str(session) not in sessions:
+        sessions.append(str(session))
+        storage.set(SESSION_INDEX_KEY, sessions)
+
+
+def evict_idle_sessions(storage: StorageAPI, ttl: float = HISTORY_TTL) -> int:
+    """
+    Removes history and sender entries of sessions idle for longer than ttl.
+    Returns the number of sessions evicted.
+    """
+    sessions = storage.get(SESSION_INDEX_KEY) or []
+    now = time.time()
+    live, evicted = [], 0
+    for session in sessions:
+        stored = storage.get(HISTORY_KEY(session))
+        if stored is not None and now - stored["updated"] <= ttl:
+            live.append(session)
+            continue
+        storage.remove(HISTORY_KEY(session))
+        storage.remove(SENDER_KEY(session))
+        evicted += 1
+
+    if evicted:
+        storage.set(SESSION_INDEX_KEY, live)
+    return evicted
+
+
+def migrate_legacy_histories(storage: StorageAPI) -> int:
+    """
+    Converts every list-format history in a KeyValueStore to a trimmed,
+    indexed record, so sessions that never come back can still be evicted.
+    Returns the number of histories migrated. The store has no key listing,
+    so its keys are read from _data; records are written through set().
+    """
+    data = getattr(storage, "_data", None)
+    if data is None:
+        return 0
+
+    legacy = [key for key, value in data.items() if key.endswith(":history") and isinstance(value, list)]
+    if not legacy:
+        return 0
+
+    sessions = storage.get(SESSION_INDEX_KEY) or []
+    for key in legacy:
+        session = key[:-len(":history")]
+        record = new_record()
+        record["messages"] = storage.get(key)[-HISTORY_MAX_MESSAGES:]
+        storage.set(key, record)
+        if session not in sessions:
+            sessions.append(session)
+    storage.set(SESSION_INDEX_KEY, sessions)
+    return len(legacy)
@@ -0,0 +1,113 @@
+from langchain_community.vectorstores import FAISS
+import logging
+import os
+import threading
+
+from bm25 import BM25_FILE, BM25Index
+from embedding_cache import CachedEmbeddings, get_embeddings
+from mmap_index import index_files, load_index
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR = os.getenv(
+    "A2RCHI_INDEX_DIR", os.path.join(os.path.dirname(__file__), "a2rchi_index")
+)
+
+
+class VectorStoreManager:
+    """
+    Process-wide holder for the FAISS index and, when the build wrote one,
+    the BM25 lexical index next to it.
+
+    The index is loaded lazily on first use and then shared by every handler.
+    On each access the index files are stat'ed, and the store is only rebuilt
+    when their mtime or size has changed on disk, or when index_dir (a
+    symlink after build_index.py swaps in a new version) points elsewhere.
+    Each load reads every file from the one directory the link resolved to.
+    """
+
+    def __init__(self, index_dir: str = INDEX_DIR):
+        self.index_dir = index_dir
+        self._lock = threading.Lock()
+        self._embeddings: CachedEmbeddings | None = None
+        self._vectorstore: FAISS | None = None
+        self._lexical: BM25Index | None = None
+        self._signature: tuple | None = None
+
+    def _current_signature(self) -> tuple | None:
+        # The resolved directory comes first; _load reads from it
+        index_dir = os.path.realpath(self.index_dir)
+        signature = [index_dir]
+        for name in index_files(index_dir):
+            try:
+                stat = os.stat(os.path.join(index_dir, name))
+            except FileNotFoundError:
+                return None
+            signature.append((name, stat.st_mtime_ns, stat.st_size))
+        # The lexical index is optional
+        lexical_path = os.path.join(index_dir, BM25_FILE)
+        if os.path.exists(lexical_path):
+            stat = os.stat(lexical_path)
+            signature.append((BM25_FILE, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _load(self, index_dir: str) -> tuple[FAISS, BM25Index | None]:
+        if self._embeddings is None:
+            self._embeddings = get_embeddings()
+        vectorstore = load_index(index_dir, self._embeddings)
+
+        lexical_path = os.path.join(index_dir, BM25_FILE)
+        lexical = BM25Index.load(lexical_path) if os.path.exists(lexical_path) else None
+        if lexical is not None and lexical.size != vectorstore.index.ntotal:
+            logger.warning(f"⚠️ {BM25_FILE} does not match the FAISS index; lexical retrieval disabled")
+            lexical = None
+        return vectorstore, lexical
+
+    def get(self) -> FAISS:
+        """
+        Returns the shared vector store, loading or hot-reloading it if needed.
+        """
+        signature = self._current_signature()
+        if self._vectorstore is not None and (signature is None or signature == self._signature):
+            # Missing files mean a rebuild is mid-swap; keep serving the old index
+            return self._vectorstore
+
+        with self._lock:
+            signature = self._current_signature()
+            if self._vectorstore is not None and (signature is None or signature == self._signature):
+                return self._vectorstore
+
+            try:
+                if signature is None:
+                    raise FileNotFoundError(f"No complete index in {self.index_dir}")
+                vectorstore, lexical = self._load(signature[0])
+            except Exception as e:
+                if self._vectorstore is None:
+                    raise
+                logger.warning(f"⚠️ Failed to reload FAISS index, keeping previous one: {e}")
+                return self._vectorstore
+
+            if self._vectorstore is None:
+                logger.info(f"📚 Loaded FAISS index from {self.index_dir}")
+            else:
+                logger.info(f"🔄 Reloaded FAISS index from {self.index_dir}")
+            self._vectorstore = vectorstore
+            self._lexical = lexical
+            self._signature = signature
+            return vectorstore
+
+
+vectorstore_manager = VectorStoreManager()
+
+
+def get_vectorstore() -> FAISS:
+    return vectorstore_manager.get()
+
+
+def get_lexical_index() -> BM25Index | None:
+    """
+    BM25 index matching the current vector store, or None if the index
+    directory has none.
+    """
+    vectorstore_manager.get()
+    return vectorstore_manager._lexical
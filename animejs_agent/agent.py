@@ -1,5 +1,9 @@
-from uagents import Agent
+import asyncio
+
+from uagents import Agent, Context
 from chat_proto import chat_proto
+from tracing import start_metrics_server, write_json
+from prompt_budget import get_encoding
 
 agent = Agent(
     name="animejs_agent_v2",
@@ -10,5 +14,21 @@ agent = Agent(
 
 agent.include(chat_proto, publish_manifest=True)
 
+# Load the tokenizer off the event loop; tiktoken downloads it on a cold cache
+@agent.on_event("startup")
+async def warm_up_tokenizer(ctx: Context):
+    if await asyncio.to_thread(get_encoding) is not None:
+        ctx.logger.info("🔥 Tokenizer warmed up")
+
+# Serve per-stage latency metrics when TRACING is enabled
+@agent.on_event("startup")
+async def start_tracing(ctx: Context):
+    start_metrics_server()
+
+@agent.on_event("shutdown")
+async def export_traces(ctx: Context):
+    if write_json():
+        ctx.logger.info("📈 Wrote trace summary")
+
 if __name__ == "__main__":
     agent.run()
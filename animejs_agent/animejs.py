@@ -1,21 +1,31 @@
 from typing import Dict
-from openai import OpenAI
+from openai import AsyncOpenAI
+import asyncio
 import os
 from uagents import Context
 import json
 from urllib.parse import quote
 
-# RAG: LangChain imports
-from langchain_community.vectorstores import FAISS
-from langchain_openai.embeddings import OpenAIEmbeddings
+from embedding_cache import get_embeddings
+from mmap_index import load_index
+from prompt_budget import count_tokens, dedupe_chunks, fit_chunks, format_usage
+from tracing import span, traced
 
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY)
+client = AsyncOpenAI(api_key=OPENAI_API_KEY)
 
-# Load your FAISS index
-embedding = OpenAIEmbeddings()
-vectorstore = FAISS.load_local("animejs_docs_faiss_index", embedding, allow_dangerous_deserialization=True)
+# Cap on concurrent GPT-4o generations so a burst of users can't exhaust rate limits
+MAX_CONCURRENT_GENERATIONS = int(os.getenv("ANIMEJS_MAX_CONCURRENT_GENERATIONS", "8"))
+generation_slots = asyncio.Semaphore(MAX_CONCURRENT_GENERATIONS)
+
+# Prompt size cap in tokens; the lowest-ranked chunks are trimmed or dropped to fit
+PROMPT_TOKEN_BUDGET = int(os.getenv("ANIMEJS_PROMPT_TOKEN_BUDGET", "3000"))
+
+# Load your FAISS index (memory-mapped, pickle-free layout when available)
+INDEX_DIR = os.getenv("ANIMEJS_INDEX_DIR", "animejs_docs_faiss_index")
+embedding = get_embeddings()
+vectorstore = load_index(INDEX_DIR, embedding)
 retriever = vectorstore.as_retriever(search_kwargs={"k": 8})
 
 # Prompt template using {context} and {description}
@@ -49,26 +59,39 @@ Now, return a raw JSON object with the requested files for this user request:
 """
 
 
+@traced("generate_code")
 async def generate_code(ctx: Context, description: str) -> Dict[str, str]:
     ctx.logger.info("Calling FAISS retriever for RAG context")
 
     try:
         # 1. Query FAISS index
-        docs = retriever.get_relevant_documents(description)
-        context = "\n\n---\n\n".join(d.page_content for d in docs)
+        with span("retrieval"):
+            docs = await retriever.ainvoke(description)
+
+        # 2. Format prompt, fitting the deduplicated chunks into the token budget
+        with span("build_prompt"):
+            frame_tokens = count_tokens(PROMPT_TEMPLATE.format(context="", description=description))
+            chunks = dedupe_chunks([d.page_content.strip() for d in docs])
+            deduped = len(docs) - len(chunks)
+            chunks, usage = fit_chunks(chunks, PROMPT_TOKEN_BUDGET - frame_tokens)
+        context = "\n\n---\n\n".join(chunks)
         ctx.logger.info(f"Retrieved context: {context}")
+        usage = {"prompt_tokens": frame_tokens + usage["context_tokens"], **usage, "chunks_deduped": deduped}
+        ctx.logger.info(f"🧮 Prompt usage: {format_usage(usage)}")
 
-        # 2. Format prompt
         prompt = PROMPT_TEMPLATE.format(context=context, description=description)
 
         ctx.logger.info("Calling OpenAI with retrieved context")
 
         # 3. Call GPT-4o
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3
-        )
+        # Includes the wait for a free generation slot
+        with span("llm"):
+            async with generation_slots:
+                response = await client.chat.completions.create(
+                    model="gpt-4o",
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.3
+                )
 
         raw = response.choices[0].message.content
         ctx.logger.info(f"Parsing OpenAI response: {raw}")
@@ -85,6 +108,7 @@ async def generate_code(ctx: Context, description: str) -> Dict[str, str]:
         raise
 
 
+@traced("livecodes_link")
 async def generate_livecodes_link(html: str, css: str, js: str) -> str:
     return (
         "https://livecodes.io/"
@@ -14,6 +14,7 @@ from uagents_core.contrib.protocols.chat import (
 )
 
 from animejs import generate_code, generate_livecodes_link
+from tracing import span, traced
 
 def create_text_chat(text: str) -> ChatMessage:
     return ChatMessage(
@@ -32,11 +33,13 @@ def create_end_session_chat() -> ChatMessage:
 chat_proto = Protocol(spec=chat_protocol_spec)
 
 @chat_proto.on_message(ChatMessage)
+@traced("handle_message")
 async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
-    await ctx.send(
-        sender,
-        ChatAcknowledgement(timestamp=datetime.utcnow(), acknowledged_msg_id=msg.msg_id),
-    )
+    with span("ack"):
+        await ctx.send(
+            sender,
+            ChatAcknowledgement(timestamp=datetime.utcnow(), acknowledged_msg_id=msg.msg_id),
+        )
 
     for item in msg.content:
         if isinstance(item, StartSessionContent):
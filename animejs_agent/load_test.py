@@ -0,0 +1,102 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+os.environ.setdefault("OPENAI_API_KEY", "load-test")
+
+from langchain_core.documents import Document
+from uagents_core.contrib.protocols.chat import ChatMessage, TextContent
+
+import mmap_index
+
+# animejs loads the FAISS index on import; the retriever is replaced by a stub
+# below, so skip the load and run without the index on disk
+mmap_index.load_index = lambda index_dir, embeddings: SimpleNamespace(as_retriever=lambda **kwargs: None)
+
+import animejs
+from chat_proto import handle_message
+
+# Load test for the chat handler with OpenAI and the retriever replaced by
+# stubs that sleep for a fixed latency. With non-blocking calls, N concurrent
+# sessions should finish in roughly the time of one.
+
+FAKE_CODE = json.dumps({
+    "html": "<div class=\"square\"></div>",
+    "css": ".square { width: 100px; height: 100px; background: red; }",
+    "js": "import { animate } from 'animejs';\nanimate('.square', { rotate: '1turn' });",
+})
+
+
+class StubCompletions:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def create(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        message = SimpleNamespace(content=FAKE_CODE)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class StubRetriever:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def ainvoke(self, query: str):
+        await asyncio.sleep(self.latency)
+        return [Document(page_content="animate(targets, parameters)")]
+
+
+class LoadTestContext:
+    def __init__(self):
+        self.logger = logging.getLogger("load_test")
+        self.logger.setLevel(logging.WARNING)
+        self.replies = 0
+
+    async def send(self, destination: str, message):
+        if isinstance(message, ChatMessage):
+            self.replies += 1
+
+
+async def run_session(ctx: LoadTestContext):
+    msg = ChatMessage(
+        timestamp=datetime.utcnow(),
+        msg_id=uuid4(),
+        content=[TextContent(type="text", text="Make me a red square that rotates when clicked.")],
+    )
+    await handle_message(ctx, f"user-{uuid4()}", msg)
+
+
+async def timed(sessions: int) -> float:
+    ctx = LoadTestContext()
+    start = time.perf_counter()
+    await asyncio.gather(*(run_session(ctx) for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+    assert ctx.replies == sessions, f"expected {sessions} replies, got {ctx.replies}"
+    return elapsed
+
+
+async def main(sessions: int, llm_latency: float, retriever_latency: float):
+    animejs.client = SimpleNamespace(chat=SimpleNamespace(completions=StubCompletions(llm_latency)))
+    animejs.retriever = StubRetriever(retriever_latency)
+
+    single = await timed(1)
+    concurrent = await timed(sessions)
+
+    print(f"⏱️ 1 session: {single:.2f}s")
+    print(f"⏱️ {sessions} concurrent sessions: {concurrent:.2f}s ({concurrent / single:.2f}x a single session)")
+    print(f"   max concurrent generations: {animejs.MAX_CONCURRENT_GENERATIONS}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent chat session load test for the anime.js agent")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--llm-latency", type=float, default=2.0, help="Simulated GPT-4o latency in seconds")
+    parser.add_argument("--retriever-latency", type=float, default=0.2, help="Simulated retrieval latency in seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.llm_latency, args.retriever_latency))
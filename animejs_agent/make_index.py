@@ -3,11 +3,14 @@ from typing import List
 import re
 
 from bs4 import BeautifulSoup
-from langchain_community.vectorstores import FAISS
-from langchain_openai.embeddings import OpenAIEmbeddings
+import numpy as np
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 
+from ann_index import INDEX_TYPE, build_vectorstore
+from embedding_cache import get_embeddings
+from mmap_index import write_chunks
+
 # --- CONFIG ---
 DOCS_PATH = Path(r"C:/Users/sj05w/animejs/animejs.com/documentation")  # HTTrack root
 FAISS_INDEX_DIR = r"C:/Users/sj05w/fetch_projects/animejs_agent/animejs_docs_faiss_index"
@@ -74,11 +77,16 @@ for d in chunks:
         deduped.append(d)
 print(f"✅ Deduplicated to {len(deduped)} chunks")
 
-# --- Embed & index ---
-embedding = OpenAIEmbeddings()
-vectorstore = FAISS.from_documents(deduped, embedding)
+# --- Embed & index (unchanged chunks come from the embedding cache) ---
+# INDEX_TYPE=flat|hnsw|ivfpq selects the FAISS index; its params go into meta.json
+embedding = get_embeddings()
+texts = [d.page_content for d in deduped]
+vectors = np.array(embedding.embed_documents(texts), dtype=np.float32)
+vectorstore = build_vectorstore(texts, vectors, [d.metadata for d in deduped], embedding, INDEX_TYPE)
+print(f"✅ Built {INDEX_TYPE} index")
 Path(FAISS_INDEX_DIR).mkdir(parents=True, exist_ok=True)
 vectorstore.save_local(FAISS_INDEX_DIR)
+write_chunks(vectorstore, FAISS_INDEX_DIR)
 
 print(f"✅ FAISS index saved to folder: {FAISS_INDEX_DIR}")
-print("   (index.faiss and index.pkl should be inside this folder)")
+print("   (index.faiss, chunks.offsets, chunks.blob and meta.json are loaded by the agent; index.pkl is kept for older readers)")
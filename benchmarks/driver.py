@@ -0,0 +1,353 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime
+from uuid import uuid4
+
+# Drives one agent's chat_proto handlers in-process with synthetic concurrent
+# sessions. Run by run.py in a subprocess per agent (the agents' module names
+# collide), with the working directory set to the agent and the environment
+# pointing its upstream clients at the stub servers.
+
+RESULT_MARKER = "BENCHMARK_RESULT "
+AI_AGENT_SENDER = "agent1benchmarkstructuredoutput"
+USER_PREFIX = "agent1benchmarkuser"
+
+INSULIN = "MALWMRLLPLLALLALWGPDPAAAFVNQHLCGSHLVEALYLVCGERGFFYTPKTRREAEDLQVGQVELGGGPGAGSLQPLALEGSLQKRGIVEQCCTSICSLYQLENYCN"
+
+# Prompts cycled through by every session, and the output the stubbed
+# structured-output agent returns for prompts that reach it
+PROFILES = {
+    "scorigami": {
+        "prompts": [
+            "28-14",
+            "Has a game ever ended 17 to 3?",
+            "What about the score from the Bears game last night?",
+            "is twenty one to seven a scorigami",
+        ],
+        "structured_output": {"team1_score": 24, "team2_score": 10},
+    },
+    "election": {
+        "prompts": [
+            "Texas 2016",
+            "Who won Ohio in 2008?",
+            "Who won the state Philly is in when Obama first ran?",
+            "results for the sunshine state in the year of the recount",
+        ],
+        "structured_output": {"state": "PENNSYLVANIA", "year": 2008},
+    },
+    "boltz2": {
+        "prompts": [
+            INSULIN,
+            f">A|protein\n{INSULIN}\n>B|dna\nACGTACGTTAGCATGCAACG",
+            "Predict the structure of human insulin",
+        ],
+        "structured_output": {"polymers": [{"molecule_type": "protein", "sequence": INSULIN}]},
+    },
+    "a2rchi": {
+        "prompts": [
+            "What is Newton's second law?",
+            "How do I draw a free-body diagram for a block on an incline?",
+            "Explain conservation of momentum in an inelastic collision",
+            "What is the moment of inertia of a solid disk?",
+        ],
+    },
+    "animejs": {
+        "prompts": [
+            "A red square that rotates forever",
+            "Three circles that bounce in a staggered sequence",
+            "A draggable card that snaps back when released",
+        ],
+    },
+    "color_palette": {
+        "prompts": [
+            "A calm beach at sunset",
+            "Autumn forest colors",
+            None,  # an image attachment
+        ],
+    },
+}
+
+# A request number would be read as part of a score or sequence; these agents
+# are run with --no-caches instead
+NUMERIC_PROMPT_AGENTS = ("scorigami", "boltz2")
+
+CORPUS_TOPICS = [
+    "Newton's laws", "free-body diagrams", "kinematics", "projectile motion", "work and energy",
+    "momentum", "collisions", "rotational motion", "torque", "angular momentum", "oscillations", "gravitation",
+]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KB on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+
+def percentiles(values: list[float]) -> dict:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, max(0, int(q * len(ordered) + 0.5) - 1))]
+
+    return {
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "p50_ms": pick(0.5) * 1000,
+        "p90_ms": pick(0.9) * 1000,
+        "p95_ms": pick(0.95) * 1000,
+        "p99_ms": pick(0.99) * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def build_synthetic_index(agent: str, index_dir: str, chunks: int):
+    """
+    Builds a corpus index with the agent's own build code, embedding through
+    whatever embeddings the environment selects (stub server or offline).
+    """
+    from ann_index import build_vectorstore
+    from embedding_cache import get_embeddings
+    from mmap_index import save_mmap_index
+
+    texts = [
+        f"Section {i}: {CORPUS_TOPICS[i % len(CORPUS_TOPICS)]}. "
+        f"A worked example {i} applies {CORPUS_TOPICS[(i * 7) % len(CORPUS_TOPICS)]} to a block of mass {i % 10 + 1} kg "
+        f"on a frictionless surface, using animate() timelines and staggered targets for demo {i}."
+        for i in range(chunks)
+    ]
+    embeddings = get_embeddings()
+    vectorstore = build_vectorstore(texts, embeddings.embed_documents(texts), [{"source": "benchmark"}] * chunks, embeddings)
+    save_mmap_index(vectorstore, index_dir)
+
+    if agent == "a2rchi":
+        from bm25 import BM25_FILE, BM25Index
+
+        BM25Index.build(texts).save(os.path.join(index_dir, BM25_FILE))
+
+
+def alias_langchain_prompts():
+    """
+    a2rchi.py imports PromptTemplate from langchain.prompts, which langchain
+    1.x removed. PromptTemplate lives in langchain_core.prompts in every
+    version, so that module stands in for it when the old path is missing.
+    """
+    try:
+        import langchain.prompts  # noqa: F401
+    except ImportError:
+        import langchain_core.prompts
+
+        sys.modules["langchain.prompts"] = langchain_core.prompts
+
+
+class LoopLagMonitor:
+    """
+    Measures how late a periodic sleep wakes up, i.e. how long the event
+    loop was blocked by synchronous work.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.lags: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, loop.time() - start - self.interval))
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+class BenchmarkContext:
+    """
+    The parts of uagents.Context the handlers use. Prompts sent to the
+    structured-output agent are answered by a stub after ai_latency, through
+    the agent's own response handler; the reply is awaited as part of the
+    request.
+    """
+
+    def __init__(self, bench: "Benchmark", session, sender: str):
+        self.bench = bench
+        self.session = session
+        self.sender = sender
+        self.storage = bench.storage
+        self.logger = bench.logger
+        self.replies: list[str] = []
+        self.followups: list[asyncio.Task] = []
+
+    async def send(self, destination: str, message):
+        chat_proto = self.bench.chat_proto
+        if destination == getattr(chat_proto, "AI_AGENT_ADDRESS", None):
+            self.followups.append(asyncio.create_task(self.bench.structured_output_reply(self, message)))
+            return
+        for item in getattr(message, "content", None) or []:
+            if getattr(item, "type", None) == "text":
+                self.replies.append(item.text)
+            elif getattr(item, "type", None) == "resource":
+                self.replies.append("<resource>")
+
+
+class Benchmark:
+    def __init__(self, args: argparse.Namespace, chat_proto):
+        self.args = args
+        self.chat_proto = chat_proto
+        self.profile = PROFILES[args.agent]
+        self.handler = getattr(chat_proto, "handle_message", None) or chat_proto.handle_chat
+        self.logger = logging.getLogger("benchmark")
+        self.logger.setLevel(logging.WARNING)
+        from uagents.storage import KeyValueStore
+
+        self.storage = KeyValueStore("benchmark", cwd=args.work_dir)
+        self.latencies: list[float] = []
+        self.errors = 0
+        self.error_replies = 0
+        self.prompt_index = 0
+
+    async def structured_output_reply(self, ctx: BenchmarkContext, prompt):
+        await asyncio.sleep(self.args.ai_latency)
+        reply_ctx = BenchmarkContext(self, ctx.session, AI_AGENT_SENDER)
+        reply_ctx.replies = ctx.replies
+        output = dict(self.profile["structured_output"])
+        # Echo the correlation id, as the AI agent does for schemas that require it
+        for field, spec in prompt.output_schema.get("properties", {}).items():
+            if "const" in spec:
+                output[field] = spec["const"]
+        response = self.chat_proto.StructuredOutputResponse(output=output)
+        await self.chat_proto.handle_structured_output_response(reply_ctx, AI_AGENT_SENDER, response)
+
+    def next_message(self):
+        from uagents_core.contrib.protocols.chat import ChatMessage, Resource, ResourceContent, TextContent
+
+        prompts = self.profile["prompts"]
+        prompt = prompts[self.prompt_index % len(prompts)]
+        self.prompt_index += 1
+        if prompt is None:
+            content = [ResourceContent(
+                type="resource",
+                resource_id=uuid4(),
+                resource=Resource(uri="agent-storage://benchmark", metadata={"mime_type": "image/png"}),
+            )]
+        else:
+            if self.args.unique and self.args.agent not in NUMERIC_PROMPT_AGENTS:
+                # Defeat the caches; appended so local parsers still see the prompt
+                prompt = f"{prompt}\n\n(request {self.prompt_index})"
+            content = [TextContent(type="text", text=prompt)]
+        return ChatMessage(timestamp=datetime.utcnow(), msg_id=uuid4(), content=content)
+
+    async def run_request(self, session, sender: str):
+        ctx = BenchmarkContext(self, session, sender)
+        start = time.perf_counter()
+        try:
+            await self.handler(ctx, sender, self.next_message())
+            while ctx.followups:
+                await ctx.followups.pop(0)
+        except Exception as e:
+            self.errors += 1
+            self.logger.error(f"Request failed: {e!r}")
+            return
+        self.latencies.append(time.perf_counter() - start)
+        self.error_replies += sum(reply.startswith(("Sorry", "⚠️")) for reply in ctx.replies)
+
+    async def run_session(self):
+        session = uuid4()
+        sender = f"{USER_PREFIX}{session.hex}"
+        for _ in range(self.args.messages):
+            await self.run_request(session, sender)
+
+    async def run(self) -> dict:
+        # Warm-up request, so one-time loading isn't counted as latency
+        await self.run_request(uuid4(), f"{USER_PREFIX}warmup")
+        self.latencies.clear()
+        self.errors = self.error_replies = 0
+        rss_before = peak_rss_mb()
+
+        monitor = LoopLagMonitor(self.args.lag_interval)
+        monitor.start()
+        start = time.perf_counter()
+        await asyncio.gather(*(self.run_session() for _ in range(self.args.sessions)))
+        elapsed = time.perf_counter() - start
+        await monitor.stop()
+
+        requests = len(self.latencies) + self.errors
+        result = {
+            "agent": self.args.agent,
+            "sessions": self.args.sessions,
+            "messages_per_session": self.args.messages,
+            "requests": requests,
+            "errors": self.errors,
+            "error_replies": self.error_replies,
+            "elapsed_s": elapsed,
+            "requests_per_s": requests / elapsed if elapsed else 0.0,
+            "latency": percentiles(self.latencies),
+            "loop_lag": percentiles(monitor.lags),
+            "peak_rss_mb_before_load": rss_before,
+            "peak_rss_mb": peak_rss_mb(),
+        }
+        try:
+            import tracing
+
+            if tracing.TRACING:
+                result["stages"] = tracing.tracer.summary()["stages"]
+        except ImportError:
+            pass
+        return result
+
+
+async def main(args: argparse.Namespace):
+    if args.agent == "a2rchi":
+        alias_langchain_prompts()
+    if args.agent in ("a2rchi", "animejs"):
+        index_dir = os.path.join(args.work_dir, "index")
+        env = "A2RCHI_INDEX_DIR" if args.agent == "a2rchi" else "ANIMEJS_INDEX_DIR"
+        if not os.getenv(env):
+            start = time.perf_counter()
+            build_synthetic_index(args.agent, index_dir, args.corpus_chunks)
+            os.environ[env] = index_dir
+            print(f"📚 Built a {args.corpus_chunks}-chunk index in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    import chat_proto
+
+    result = await Benchmark(args, chat_proto).run()
+    # Close pooled upstream clients so the process exits cleanly
+    if "boltz2" in sys.modules:
+        await sys.modules["boltz2"].close_http_client()
+    external_storage = getattr(chat_proto, "external_storage", None)
+    if external_storage is not None:
+        await external_storage.aclose()
+    print(RESULT_MARKER + json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Drive one agent's chat handlers against the stub servers")
+    parser.add_argument("agent", choices=sorted(PROFILES))
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent chat sessions")
+    parser.add_argument("--messages", type=int, default=5, help="Messages sent one after another per session")
+    parser.add_argument("--ai-latency", type=float, default=1.0, help="Structured-output agent reply delay (s)")
+    parser.add_argument("--unique", action="store_true", help="Make prompts unique so caches miss")
+    parser.add_argument("--corpus-chunks", type=int, default=2000, help="Chunks in the synthetic a2rchi/animejs index")
+    parser.add_argument("--lag-interval", type=float, default=0.01, help="Event-loop lag sampling interval (s)")
+    parser.add_argument("--work-dir", default=None, help="Directory for storage and indexes (default: temp dir)")
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.getcwd())
+    with tempfile.TemporaryDirectory(prefix=f"bench-{args.agent}-") as tmp:
+        args.work_dir = args.work_dir or tmp
+        asyncio.run(main(args))
@@ -0,0 +1,214 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import asdict, fields
+
+from stubs import StubConfig, start_stub_server, stub_env
+
+# Offline end-to-end benchmark: starts the stub upstream services, drives each
+# agent's chat handlers with concurrent sessions (driver.py, one subprocess per
+# agent) and writes the results to benchmarks/results/ for regression tracking.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARKS_DIR = os.path.join(ROOT, "benchmarks")
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, "results")
+DRIVER = os.path.join(BENCHMARKS_DIR, "driver.py")
+AGENTS = ["scorigami", "election", "boltz2", "a2rchi", "animejs", "color_palette"]
+RESULT_MARKER = "BENCHMARK_RESULT "
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def embeddings_mode(requested: str) -> str:
+    """
+    "stub" embeds through the stub server, which needs tiktoken's encoding
+    files; "offline" uses the agents' EMBEDDINGS_OFFLINE fallback.
+    """
+    if requested != "auto":
+        return requested
+    try:
+        import tiktoken
+
+        tiktoken.get_encoding("cl100k_base")
+        return "stub"
+    except Exception:
+        return "offline"
+
+
+def agent_env(args: argparse.Namespace, server, agent: str, work_dir: str) -> dict[str, str]:
+    env = {**os.environ, **stub_env(server, agent)}
+    env.update({
+        "PYTHONUNBUFFERED": "1",
+        "EMBEDDING_CACHE_PATH": os.path.join(work_dir, "embedding_cache.sqlite3"),
+        "BOLTZ2_CACHE_PATH": os.path.join(work_dir, "prediction_cache.sqlite3"),
+        "EMBEDDINGS_OFFLINE": str(args.embeddings == "offline").lower(),
+        "TRACING": str(args.trace).lower(),
+        "TRACE_METRICS_PORT": "0",
+        "TRACE_JSON_PATH": "",
+    })
+    if args.no_caches:
+        env.update({"EXTRACTION_CACHE": "false", "A2RCHI_ANSWER_CACHE": "false", "BOLTZ2_CACHE_ENABLED": "false"})
+    return env
+
+
+def run_agent(args: argparse.Namespace, server, agent: str) -> dict:
+    work_dir = os.path.join(args.work_dir, agent)
+    os.makedirs(work_dir, exist_ok=True)
+    command = [
+        sys.executable, DRIVER, agent,
+        "--sessions", str(args.sessions),
+        "--messages", str(args.messages),
+        "--ai-latency", str(args.ai_latency),
+        "--corpus-chunks", str(args.corpus_chunks),
+        "--work-dir", work_dir,
+    ]
+    if args.unique:
+        command.append("--unique")
+
+    start = time.perf_counter()
+    proc = subprocess.run(
+        command,
+        cwd=os.path.join(ROOT, f"{agent}_agent"),
+        env=agent_env(args, server, agent, work_dir),
+        capture_output=True,
+        text=True,
+        timeout=args.timeout,
+    )
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    return {
+        "agent": agent,
+        "failed": True,
+        "returncode": proc.returncode,
+        "elapsed_s": time.perf_counter() - start,
+        "stderr_tail": proc.stderr.strip().splitlines()[-10:],
+    }
+
+
+def format_row(result: dict) -> str:
+    if result.get("failed"):
+        reason = result["stderr_tail"][-1] if result["stderr_tail"] else f"exit code {result['returncode']}"
+        return f"{result['agent']:<14} FAILED  {reason[:90]}"
+    latency, lag = result["latency"], result["loop_lag"]
+    return (
+        f"{result['agent']:<14} {result['requests']:>6} {result['requests_per_s']:>8.1f} "
+        f"{latency.get('p50_ms', 0):>9.1f} {latency.get('p95_ms', 0):>9.1f} {latency.get('p99_ms', 0):>9.1f} "
+        f"{lag.get('p99_ms', 0):>8.1f} {lag.get('max_ms', 0):>8.1f} {result['peak_rss_mb']:>8.1f} "
+        f"{result['errors'] + result['error_replies']:>6}"
+    )
+
+
+def print_table(results: list[dict]):
+    print(
+        f"{'agent':<14} {'reqs':>6} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        f"{'lag p99':>8} {'lag max':>8} {'RSS MB':>8} {'errors':>6}"
+    )
+    for result in results:
+        print(format_row(result))
+
+
+def print_comparison(results: list[dict], baseline_path: str):
+    """
+    Prints the change in throughput, p95 latency, loop lag and RSS against
+    an earlier results file.
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {result["agent"]: result for result in json.load(f)["agents"]}
+
+    def delta(new: float, old: float) -> str:
+        return f"{(new - old) / old:+.0%}" if old else "n/a"
+
+    print(f"\nCompared to {baseline_path}:")
+    print(f"{'agent':<14} {'req/s':>8} {'p95 ms':>9} {'lag p99':>8} {'RSS MB':>8}")
+    for result in results:
+        old = baseline.get(result["agent"])
+        if result.get("failed") or old is None or old.get("failed"):
+            continue
+        print(
+            f"{result['agent']:<14} {delta(result['requests_per_s'], old['requests_per_s']):>8} "
+            f"{delta(result['latency']['p95_ms'], old['latency']['p95_ms']):>9} "
+            f"{delta(result['loop_lag']['p99_ms'], old['loop_lag']['p99_ms']):>8} "
+            f"{delta(result['peak_rss_mb'], old['peak_rss_mb']):>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end agent benchmark against stub upstream services")
+    parser.add_argument("--agents", nargs="+", choices=AGENTS, default=AGENTS)
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent chat sessions per agent")
+    parser.add_argument("--messages", type=int, default=5, help="Messages per session")
+    parser.add_argument("--ai-latency", type=float, default=1.0, help="Structured-output agent reply delay (s)")
+    parser.add_argument("--unique", action="store_true", help="Make prompts unique so caches miss")
+    parser.add_argument("--no-caches", action="store_true", help="Disable the extraction, answer and prediction caches")
+    parser.add_argument("--embeddings", choices=["auto", "stub", "offline"], default="auto")
+    parser.add_argument("--corpus-chunks", type=int, default=2000, help="Chunks in the synthetic a2rchi/animejs index")
+    parser.add_argument("--trace", action="store_true", help="Enable tracing and include per-stage latencies")
+    parser.add_argument("--timeout", type=float, default=600, help="Per-agent time limit (s)")
+    parser.add_argument("--work-dir", default=None, help="Scratch directory (default: temp dir)")
+    parser.add_argument("--output", default=None, help="Results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", default=None, help="Earlier results file to compare against")
+    # Stub latencies and payload sizes, e.g. --llm-latency 0.5 --structure-kb 1024
+    for field in fields(StubConfig):
+        parser.add_argument(f"--{field.name.replace('_', '-')}", type=type(field.default), default=field.default)
+    args = parser.parse_args()
+
+    args.embeddings = embeddings_mode(args.embeddings)
+    stub_config = StubConfig(**{field.name: getattr(args, field.name) for field in fields(StubConfig)})
+    server = start_stub_server(stub_config)
+    print(f"🧪 Stubs on http://{server.server_address[0]}:{server.server_address[1]}, embeddings: {args.embeddings}")
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory(prefix="agent-bench-") as tmp:
+        args.work_dir = args.work_dir or tmp
+        results = []
+        for agent in args.agents:
+            print(f"▶️ {agent}...", flush=True)
+            results.append(run_agent(args, server, agent))
+    server.shutdown()
+
+    print()
+    print_table(results)
+    if args.compare:
+        print_comparison(results, args.compare)
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "sessions": args.sessions,
+            "messages": args.messages,
+            "ai_latency": args.ai_latency,
+            "unique": args.unique,
+            "no_caches": args.no_caches,
+            "embeddings": args.embeddings,
+            "corpus_chunks": args.corpus_chunks,
+            "trace": args.trace,
+            "stubs": asdict(stub_config),
+        },
+        "stub_requests": dict(sorted(server.RequestHandlerClass.stats.items())),
+        "agents": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, time.strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+import base64
+import hashlib
+import json
+import random
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import uuid4
+
+# Local stand-ins for the upstream services the agents call, all on one port:
+#
+#   /<agent>/v1/chat/completions   OpenAI chat (JSON or SSE streaming)
+#   /<agent>/v1/embeddings         OpenAI embeddings
+#   /boltz2/predict                NVIDIA Boltz2
+#   /github/gists                  GitHub Gists
+#   /agentverse/v1/storage/...     Agentverse ExternalStorage
+#
+# The agent name in the OpenAI path picks a completion the agent can parse.
+
+ANIMEJS_COMPLETION = json.dumps({
+    "html": "<div class=\"square\"></div>\n<script type=\"module\" src=\"index.js\"></script>",
+    "css": ".square { width: 100px; height: 100px; background: tomato; }",
+    "js": "import { animate } from 'animejs';\n\nanimate('.square', { rotate: '1turn', loop: true });",
+})
+PALETTE_COMPLETION = json.dumps({"palette": [
+    {"name": "Sunset Orange", "hex": "#FD5E53"},
+    {"name": "Golden Sand", "hex": "#F4D35E"},
+    {"name": "Sea Foam", "hex": "#83C5BE"},
+    {"name": "Deep Teal", "hex": "#006D77"},
+    {"name": "Midnight", "hex": "#1D3557"},
+]})
+PHYSICS_PARAGRAPH = (
+    "Newton's second law states that the net force on an object equals its mass times its acceleration. "
+    "In a free-body diagram, sum the forces along each axis and solve for the unknown acceleration. "
+)
+
+
+@dataclass
+class StubConfig:
+    llm_latency: float = 0.5
+    completion_words: int = 200
+    stream_chunks: int = 20
+    embedding_latency: float = 0.05
+    embedding_dim: int = 1536
+    boltz2_latency: float = 2.0
+    structure_kb: int = 256
+    gist_latency: float = 0.2
+    storage_latency: float = 0.1
+    image_kb: int = 64
+
+
+def completion_text(agent: str, words: int) -> str:
+    if agent == "animejs":
+        return ANIMEJS_COMPLETION
+    if agent == "color_palette":
+        return PALETTE_COMPLETION
+    paragraph = PHYSICS_PARAGRAPH.split()
+    # Paragraphs of ~60 words, so streaming agents can flush them one by one
+    out = [paragraph[i % len(paragraph)] + ("\n\n" if i % 60 == 59 else " ") for i in range(words)]
+    return "".join(out).strip()
+
+
+def stub_embedding(text: str, dim: int) -> list[float]:
+    # Deterministic unit vector per text, so repeated texts embed identically
+    seed = hashlib.sha256(text.encode("utf-8")).digest()
+    values = []
+    counter = 0
+    while len(values) < dim:
+        block = hashlib.sha256(seed + counter.to_bytes(4, "little")).digest()
+        values.extend(b / 127.5 - 1 for b in block)
+        counter += 1
+    values = values[:dim]
+    norm = sum(v * v for v in values) ** 0.5 or 1.0
+    return [v / norm for v in values]
+
+
+def png_bytes(size_kb: int) -> bytes:
+    # Valid RGB PNG of random pixels, so it is roughly size_kb after compression
+    side = max(8, int((size_kb * 1024 / 3) ** 0.5))
+    pixels = random.Random(0).randbytes(side * side * 3)
+    rows = b"".join(b"\x00" + pixels[i * side * 3:(i + 1) * side * 3] for i in range(side))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", side, side, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(rows, 1)) + chunk(b"IEND", b"")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config = StubConfig()
+    image_b64 = ""
+    structure = ""
+    stats: dict[str, int] = {}
+    stats_lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def count(self, route: str):
+        with self.stats_lock:
+            self.stats[route] = self.stats.get(route, 0) + 1
+
+    def read_json(self) -> dict:
+        length = int(self.headers.get("content-length", 0))
+        body = self.rfile.read(length) if length else b""
+        return json.loads(body) if body else {}
+
+    def send_json(self, payload: dict, status: int = 200):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        # agentverse/v1/storage/assets/<id>/contents
+        if parts[:4] == ["agentverse", "v1", "storage", "assets"] and parts[-1] == "contents":
+            self.count("storage_download")
+            time.sleep(self.config.storage_latency)
+            self.send_json({"contents": self.image_b64, "mime_type": "image/png"})
+            return
+        self.send_json({"error": f"no stub for GET {self.path}"}, 404)
+
+    def do_PUT(self):
+        parts = self.path.strip("/").split("/")
+        if parts[:4] == ["agentverse", "v1", "storage", "assets"] and parts[-1] == "permissions":
+            self.read_json()
+            self.count("storage_permissions")
+            time.sleep(self.config.storage_latency)
+            self.send_json({})
+            return
+        self.send_json({"error": f"no stub for PUT {self.path}"}, 404)
+
+    def do_POST(self):
+        parts = self.path.strip("/").split("/")
+        body = self.read_json()
+
+        if parts[1:] == ["v1", "chat", "completions"]:
+            self.count("openai_chat")
+            self.chat_completion(parts[0], body)
+        elif parts[1:] == ["v1", "embeddings"]:
+            self.count("openai_embeddings")
+            time.sleep(self.config.embedding_latency)
+            texts = body["input"] if isinstance(body["input"], list) else [body["input"]]
+            # Token-id inputs (from tiktoken) are embedded from their repr
+            self.send_json({
+                "object": "list",
+                "model": body.get("model", "text-embedding-ada-002"),
+                "data": [
+                    {"object": "embedding", "index": i, "embedding": stub_embedding(str(text), self.config.embedding_dim)}
+                    for i, text in enumerate(texts)
+                ],
+                "usage": {"prompt_tokens": 0, "total_tokens": 0},
+            })
+        elif parts == ["boltz2", "predict"]:
+            self.count("boltz2_predict")
+            time.sleep(self.config.boltz2_latency)
+            samples = body.get("diffusion_samples", 1)
+            self.send_json({
+                "structures": [{"structure": self.structure, "format": body.get("output_format", "mmcif")}] * samples,
+                "confidence_scores": [0.9] * samples,
+            })
+        elif parts == ["github", "gists"]:
+            self.count("gist_create")
+            time.sleep(self.config.gist_latency)
+            gist_id = uuid4().hex
+            self.send_json({
+                "id": gist_id,
+                "files": {
+                    name: {"raw_url": f"https://gist.githubusercontent.com/bench/{gist_id}/raw/{name}"}
+                    for name in body.get("files", {})
+                },
+            }, 201)
+        elif parts == ["agentverse", "v1", "storage", "assets"]:
+            self.count("storage_upload")
+            time.sleep(self.config.storage_latency)
+            self.send_json({"asset_id": str(uuid4())}, 201)
+        else:
+            self.send_json({"error": f"no stub for POST {self.path}"}, 404)
+
+    def chat_completion(self, agent: str, body: dict):
+        time.sleep(self.config.llm_latency)
+        text = completion_text(agent, self.config.completion_words)
+        created = int(time.time())
+        model = body.get("model", "gpt-4o")
+
+        if not body.get("stream"):
+            self.send_json({
+                "id": f"chatcmpl-{uuid4().hex}",
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": text},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            })
+            return
+
+        # Server-sent events, closing the connection to end the stream
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        size = max(1, len(text) // self.config.stream_chunks)
+        pieces = [text[i:i + size] for i in range(0, len(text), size)]
+        for i, piece in enumerate(pieces + [""]):
+            chunk = {
+                "id": "chatcmpl-stream",
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "delta": {"content": piece} if piece else {},
+                    "finish_reason": None if piece else "stop",
+                }],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+def start_stub_server(config: StubConfig, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """
+    Starts the stubs on a daemon thread; port 0 picks a free port.
+    """
+    StubHandler.config = config
+    StubHandler.image_b64 = base64.b64encode(png_bytes(config.image_kb)).decode("ascii")
+    StubHandler.structure = "A" * (config.structure_kb * 1024)
+    StubHandler.stats = {}
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="stub-server", daemon=True).start()
+    return server
+
+
+def stub_env(server: ThreadingHTTPServer, agent: str) -> dict[str, str]:
+    """
+    Environment pointing an agent's upstream clients at the stubs.
+    """
+    base = f"http://{server.server_address[0]}:{server.server_address[1]}"
+    return {
+        "OPENAI_BASE_URL": f"{base}/{agent}/v1",
+        "OPENAI_API_KEY": "benchmark",
+        "BOLTZ2_URL": f"{base}/boltz2/predict",
+        "NVCF_API_KEY": "benchmark",
+        "GITHUB_API_URL": f"{base}/github",
+        "GITHUB_PAT": "benchmark",
+        "AGENTVERSE_URL": f"{base}/agentverse",
+        "AGENTVERSE_API_KEY": "benchmark",
+    }
@@ -0,0 +1,90 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Compares a fresh httpx.AsyncClient per prediction (the old behaviour) with the
+# shared pooled client in boltz2.py, against a local stub of the predict endpoint.
+# --connect-delay simulates the per-connection TCP/TLS handshake cost of a real
+# remote endpoint; it is paid once per new connection.
+
+
+class StubBoltz2Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connect_delay = 0.0
+    body = b"{}"
+
+    def setup(self):
+        super().setup()
+        time.sleep(self.connect_delay)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("content-length", 0)))
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(connect_delay: float, structure_kb: int) -> ThreadingHTTPServer:
+    StubBoltz2Handler.connect_delay = connect_delay
+    StubBoltz2Handler.body = json.dumps({
+        "structures": [{"structure": "A" * (structure_kb * 1024), "format": "mmcif"}],
+        "confidence_scores": [0.9],
+    }).encode()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubBoltz2Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class BenchmarkContext:
+    logger = logging.getLogger("benchmark")
+
+
+async def main(requests: int, connect_delay: float, structure_kb: int):
+    server = start_stub_server(connect_delay, structure_kb)
+    os.environ["BOLTZ2_URL"] = f"http://127.0.0.1:{server.server_port}/predict"
+    os.environ.setdefault("NVCF_API_KEY", "benchmark")
+    # Measure the HTTP path, not prediction cache hits
+    os.environ["BOLTZ2_CACHE_ENABLED"] = "false"
+
+    import httpx
+    from boltz2 import BOLTZ_URL, Boltz2Request, Boltz2Response, Polymer, close_http_client, get_prediction
+
+    ctx = BenchmarkContext()
+    ctx.logger.setLevel(logging.WARNING)
+    request = Boltz2Request(polymers=[Polymer(molecule_type="protein", sequence="MTEYKLVVVGAGGVGKSALTIQLIQNHFVDEYDPTIEDSYRKQVVIDGETCLLDILDTAG")])
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        async with httpx.AsyncClient() as client:
+            response = await client.post(BOLTZ_URL, json=request.model_dump(), timeout=60)
+        Boltz2Response.model_validate(response.json())
+    fresh = (time.perf_counter() - start) / requests
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await get_prediction(ctx, request)
+    pooled = (time.perf_counter() - start) / requests
+    await close_http_client()
+
+    server.shutdown()
+    print(f"⏱️ fresh client per request: {fresh * 1000:.1f} ms/request")
+    print(f"⏱️ shared pooled client:     {pooled * 1000:.1f} ms/request ({fresh / pooled:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Boltz2 HTTP client reuse against a local stub server")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--connect-delay", type=float, default=0.05, help="Simulated handshake cost per new connection (s)")
+    parser.add_argument("--structure-kb", type=int, default=256, help="Size of the stub structure payload")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.connect_delay, args.structure_kb))
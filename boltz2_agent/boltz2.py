@@ -1,13 +1,17 @@
-from uagents import Model
+from uagents import Context, Model
 from typing import List, Dict
 from enum import Enum
+import asyncio
 import httpx
 import requests
 import logging
 import re
 import os
 
-BOLTZ_URL = "https://health.api.nvidia.com/v1/biology/mit/boltz2/predict"
+from prediction_cache import payload_key, prediction_cache
+from tracing import span, traced
+
+BOLTZ_URL = os.getenv("BOLTZ2_URL", "https://health.api.nvidia.com/v1/biology/mit/boltz2/predict")
 
 API_KEY = os.getenv("NVCF_API_KEY")
 if not API_KEY:
@@ -17,6 +21,53 @@ if not API_KEY:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client settings. Predictions are slow, so the read timeout is
+# kept separate from the (short) connect timeout.
+HTTP_MAX_CONNECTIONS = int(os.getenv("BOLTZ2_MAX_CONNECTIONS", "10"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("BOLTZ2_MAX_KEEPALIVE", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("BOLTZ2_KEEPALIVE_EXPIRY", "120"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("BOLTZ2_CONNECT_TIMEOUT", "10"))
+HTTP_READ_TIMEOUT = float(os.getenv("BOLTZ2_READ_TIMEOUT", "60"))
+HTTP_WRITE_TIMEOUT = float(os.getenv("BOLTZ2_WRITE_TIMEOUT", "30"))
+HTTP_POOL_TIMEOUT = float(os.getenv("BOLTZ2_POOL_TIMEOUT", "30"))
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_http_client: httpx.AsyncClient | None = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the agent-wide pooled client, creating it on first use.
+    Uses HTTP/2 when the h2 package is installed.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                connect=HTTP_CONNECT_TIMEOUT,
+                read=HTTP_READ_TIMEOUT,
+                write=HTTP_WRITE_TIMEOUT,
+                pool=HTTP_POOL_TIMEOUT,
+            ),
+        )
+    return _http_client
+
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class Modification(Model):
     ccd: str
@@ -301,6 +352,18 @@ def clean_ligand(ligand):
         del ligand['smiles']  # Remove 'smiles' if it's None
     return ligand
 
+def build_payload(request: Boltz2Request) -> dict:
+    """
+    Normalized API payload for a request; also the basis of the cache key.
+    """
+    payload = request.model_dump()
+
+    ligands = payload.get("ligands")
+    if ligands:
+        payload["ligands"] = [clean_ligand(ligand) for ligand in ligands]
+    return payload
+
+@traced("get_prediction")
 async def get_prediction(ctx: Context, request: Boltz2Request) -> Boltz2Response | str:
     """
     Given a properly formatted Boltz2Request, returns the predicted
@@ -311,13 +374,19 @@ async def get_prediction(ctx: Context, request: Boltz2Request) -> Boltz2Response
     try:
         ctx.logger.info(f"Looking up results for {request.polymers}")
 
-        payload = request.model_dump()
-
-        ligands = payload.get("ligands")
-        if ligands:
-            payload["ligands"] = [clean_ligand(ligand) for ligand in ligands]
+        payload = build_payload(request)
         ctx.logger.debug(f"Payload: {payload}")
 
+        cache_key = payload_key(payload)
+        if prediction_cache is not None:
+            with span("prediction_cache"):
+                cached = await asyncio.to_thread(prediction_cache.get, cache_key)
+            if cached is not None:
+                # Counters only; stats() queries SQLite, which would block the loop
+                lookups = prediction_cache.hits + prediction_cache.misses
+                ctx.logger.info(f"Prediction cache hit ({prediction_cache.hits}/{lookups} lookups)")
+                return Boltz2Response.model_validate_json(cached)
+
         headers = {
             "accept": "application/json",
             "content-type": "application/json",
@@ -325,15 +394,20 @@ async def get_prediction(ctx: Context, request: Boltz2Request) -> Boltz2Response
         }
 
         ctx.logger.info("Sending async request to NVIDIA Boltz2 API...")
-        async with httpx.AsyncClient() as client:
-            response = await client.post(BOLTZ_URL, headers=headers, json=payload, timeout=60)
+        with span("boltz2_api"):
+            response = await get_http_client().post(BOLTZ_URL, headers=headers, json=payload)
 
         if response.status_code != 200:
             ctx.logger.warning(f"Boltz2 API responded with {response.status_code}: {response.text}")
             return f"Boltz2 API error: {response.text}"
 
         ctx.logger.info("Successfully received Boltz2 prediction response.")
-        return Boltz2Response.model_validate(response.json())
+        prediction = Boltz2Response.model_validate(response.json())
+
+        if prediction_cache is not None:
+            await asyncio.to_thread(prediction_cache.put, cache_key, prediction.model_dump_json())
+
+        return prediction
 
     except Exception as e:
         ctx.logger.error(f"Error during Boltz2 prediction: {str(e)}")
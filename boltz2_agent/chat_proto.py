@@ -3,9 +3,9 @@ from uuid import uuid4
 from typing import Any
 from uagents import Context, Model, Protocol
 from pydantic import ValidationError
-import requests
 import os
 import io
+import time
 
 # Import the necessary components of the chat protocol
 from uagents_core.contrib.protocols.chat import (
@@ -36,12 +36,30 @@ from boltz2 import (
     Metric,
     Structure,
 )
+from gists import upload_structures
+from sequence_parser import parse_sequences
+from extraction_cache import new_extraction_cache
+from tracing import record_span, span, traced
+from pending_requests import (
+    BUSY_MESSAGE,
+    CORRELATION_FIELD,
+    PENDING_SWEEP_INTERVAL,
+    PENDING_TIMEOUT,
+    TIMEOUT_MESSAGE,
+    add_pending,
+    correlated_schema,
+    expire_pending,
+    resolve_pending,
+)
 
 AI_AGENT_ADDRESS = "agent1qtlpfshtlcxekgrfcpmv7m9zpajuwu7d5jfyachvpa4u3dkt6k0uwwp2lct"
 
 if not AI_AGENT_ADDRESS:
     raise ValueError("AI_AGENT_ADDRESS not set")
 
+# SMILES strings are case-sensitive, so prompts are only normalized for whitespace
+extraction_cache = new_extraction_cache(case_sensitive=True)
+
 AGENT_PROMPT = """You are generating a structured object representing a protein design request for the MIT Boltz2 API. The user will provide a natural language input describing one or more biological polymers, ligands, or constraints.
 
 Your job is to use the information that the user provides to fill out the given output schema.
@@ -115,52 +133,16 @@ class StructuredOutputPrompt(Model):
 class StructuredOutputResponse(Model):
     output: dict[str, Any]
 
-@chat_proto.on_message(ChatMessage)
-async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
-    ctx.logger.info(f"Got a message from {sender}: {msg}")
-    ctx.storage.set(str(ctx.session), sender)
-    await ctx.send(
-        sender,
-        ChatAcknowledgement(timestamp=datetime.utcnow(), acknowledged_msg_id=msg.msg_id),
-    )
-
-    for item in msg.content:
-        if isinstance(item, StartSessionContent):
-            ctx.logger.info(f"Got a start session message from {sender}")
-            continue
-        elif isinstance(item, TextContent):
-            ctx.logger.info(f"Got a message from {sender}: {item.text}")
-            ctx.storage.set(str(ctx.session), sender)
-            await ctx.send(
-                AI_AGENT_ADDRESS,
-                StructuredOutputPrompt(
-                    prompt=f"{AGENT_PROMPT} Here is the user's prompt: {item.text}", output_schema=Boltz2Request.schema()
-                ),
-            )
-        else:
-            ctx.logger.info(f"Got unexpected content from {sender}")
-
-@chat_proto.on_message(ChatAcknowledgement)
-async def handle_ack(ctx: Context, sender: str, msg: ChatAcknowledgement):
-    ctx.logger.info(
-        f"Got an acknowledgement from {sender} for {msg.acknowledged_msg_id}"
-    )
-
-@struct_output_client_proto.on_message(StructuredOutputResponse)
-async def handle_structured_output_response(
-    ctx: Context, sender: str, msg: StructuredOutputResponse
-):
-    session_sender = ctx.storage.get(str(ctx.session))
-    if session_sender is None:
-        ctx.logger.error(
-            "Discarding message because no session sender found in storage"
-        )
-        return
-
+@traced("process_request")
+async def process_request(ctx: Context, sender: str, output: dict[str, Any], cache_key: str | None = None):
+    """
+    Validates a structured request, runs the prediction and sends the
+    structure links (or the issues found) to the sender. Fresh outputs that
+    validate are cached under cache_key.
+    """
     try:
-        ctx.logger.info(f"Raw structured output received:\n{msg.output}.")
-
-        issues = validate_request(ctx, msg.output)
+        with span("validate"):
+            issues = validate_request(ctx, output)
 
         if issues:
             if len(issues) > 1:
@@ -168,7 +150,7 @@ async def handle_structured_output_response(
             else:
                 resolve_message = "\n\n🛠️ Please resolve this issue and re-enter your prompt!"
             await ctx.send(
-                session_sender,
+                sender,
                 create_text_chat("⚠️ " + "\n\n⚠️".join(issues) + resolve_message)
             )
             return
@@ -176,7 +158,9 @@ async def handle_structured_output_response(
         ctx.logger.info("Got to validate_request")
 
 
-        validated = Boltz2Request.model_validate(msg.output)
+        validated = Boltz2Request.model_validate(output)
+        if cache_key is not None and extraction_cache is not None:
+            extraction_cache.put(cache_key, output)
 
         ctx.logger.info(f"Validated Request Model: {validated}")
 
@@ -188,7 +172,7 @@ async def handle_structured_output_response(
         response: Boltz2Response | str = await get_prediction(ctx, validated)
         if isinstance(response, str):
             await ctx.send(
-                session_sender,
+                sender,
                 create_text_chat(f"⚠️ {response}\n\n🔁 Please try a different prompt.")
             )
             return
@@ -200,35 +184,19 @@ async def handle_structured_output_response(
         else:
             message_lines = ["🔬 Boltz2 predicted the following biological structure from your query:\n"]
 
-        for i, structure in enumerate(response.structures):
+        filenames = [f"structure_{uuid4()}.{output_format}" for _ in response.structures]
+
+        # Upload every structure concurrently (or as one bundled gist)
+        with span("gist_upload"):
+            raw_urls = await upload_structures(
+                {filename: structure.structure for filename, structure in zip(filenames, response.structures)}
+            )
+        ctx.logger.info(f"Uploaded {len(raw_urls)} structure(s) to GitHub")
+
+        for i, (structure, filename) in enumerate(zip(response.structures, filenames)):
             name = structure.name or f"Structure {i+1}"
-            filename = f"structure_{uuid4()}.{output_format}"
-            ctx.logger.info(f"Processing structure {i+1}: {name}")
-
-            structure_str = structure.structure
-
-            payload = {
-                "description": "Boltz2-predicted structure",
-                "public": True,
-                "files": {
-                    filename: {"content": structure_str}
-                }
-            }
-            ctx.logger.info(f"Created payload")
-            headers = {
-                "Authorization": f"token {os.getenv('GITHUB_PAT')}",
-                "Accept": "application/vnd.github.v3+json"
-            }
-            ctx.logger.info(f"Wrote headers")
-
-            # Step 3: Send to GitHub
-            github_response = requests.post("https://api.github.com/gists", headers=headers, json=payload)
-            github_response.raise_for_status()
-
-            ctx.logger.info(f"Sent to github")
-
-            raw_url = github_response.json()["files"][filename]["raw_url"]
-            ctx.logger.info(f"Got file url: {raw_url}")
+            raw_url = raw_urls[filename]
+            ctx.logger.info(f"Got file url for {name}: {raw_url}")
 
             molstar_url = f"https://molstar.org/viewer/?structure-url={raw_url}&structure-url-format={output_format}"
             score = response.confidence_scores[i]
@@ -236,15 +204,98 @@ async def handle_structured_output_response(
 
         full_message = "\n".join(message_lines)
         ctx.logger.info("Sending final message to user...")
-        await ctx.send(session_sender, create_text_chat(full_message))
+        await ctx.send(sender, create_text_chat(full_message))
         ctx.logger.info("Message sent successfully.")
 
     except Exception as err:
         ctx.logger.error(err)
         await ctx.send(
-            session_sender,
+            sender,
             create_text_chat(
                 "Sorry, I couldn't output the structure of your request. Please try again later."
             ),
         )
         return
+
+@chat_proto.on_message(ChatMessage)
+@traced("handle_message")
+async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
+    ctx.logger.info(f"Got a message from {sender}: {msg}")
+    with span("ack"):
+        await ctx.send(
+            sender,
+            ChatAcknowledgement(timestamp=datetime.utcnow(), acknowledged_msg_id=msg.msg_id),
+        )
+
+    for item in msg.content:
+        if isinstance(item, StartSessionContent):
+            ctx.logger.info(f"Got a start session message from {sender}")
+            continue
+        elif isinstance(item, TextContent):
+            ctx.logger.info(f"Got a message from {sender}: {item.text}")
+
+            # Fast path: prompts that are only sequences or FASTA records are
+            # parsed locally instead of having the LLM echo the sequence back
+            with span("local_parse"):
+                request = parse_sequences(item.text)
+            if request is not None:
+                ctx.logger.info(f"⚡ Parsed {len(request['polymers'])} polymer(s) locally")
+                await process_request(ctx, sender, request)
+                continue
+
+            # Repeated prompt: reuse the structured output extracted last time
+            cache_key = None
+            if extraction_cache is not None:
+                cache_key = extraction_cache.key(item.text)
+                output = extraction_cache.get(cache_key)
+                if output is not None:
+                    ctx.logger.info(f"Extraction cache hit ({extraction_cache.stats()})")
+                    await process_request(ctx, sender, output)
+                    continue
+
+            request_id = add_pending(ctx.storage, ctx.session, sender, cache_key=cache_key)
+            if request_id is None:
+                await ctx.send(sender, create_text_chat(BUSY_MESSAGE))
+                continue
+            ctx.logger.info(f"Queued request {request_id} for structured output")
+            with span("structured_output_send"):
+                await ctx.send(
+                    AI_AGENT_ADDRESS,
+                    StructuredOutputPrompt(
+                        prompt=f"{AGENT_PROMPT} Here is the user's prompt: {item.text}", output_schema=correlated_schema(Boltz2Request.schema(), request_id)
+                    ),
+                )
+        else:
+            ctx.logger.info(f"Got unexpected content from {sender}")
+
+@struct_output_client_proto.on_interval(period=PENDING_SWEEP_INTERVAL)
+async def expire_pending_requests(ctx: Context):
+    for request in expire_pending(ctx.storage):
+        ctx.logger.warning(f"⏱️ Request {request['id']} timed out after {PENDING_TIMEOUT:.0f}s")
+        await ctx.send(request["sender"], create_text_chat(TIMEOUT_MESSAGE))
+
+@chat_proto.on_message(ChatAcknowledgement)
+async def handle_ack(ctx: Context, sender: str, msg: ChatAcknowledgement):
+    ctx.logger.info(
+        f"Got an acknowledgement from {sender} for {msg.acknowledged_msg_id}"
+    )
+
+@struct_output_client_proto.on_message(StructuredOutputResponse)
+@traced("handle_structured_output")
+async def handle_structured_output_response(
+    ctx: Context, sender: str, msg: StructuredOutputResponse
+):
+    output = dict(msg.output)
+    request = resolve_pending(ctx.storage, ctx.session, output.pop(CORRELATION_FIELD, None))
+    if request is None:
+        ctx.logger.error(
+            "Discarding message because no pending request was found for this session"
+        )
+        return
+    session_sender = request["sender"]
+    # Only cache extractions known to belong to this request's prompt
+    cache_key = request["data"].get("cache_key") if request["correlated"] else None
+    record_span("structured_output_round_trip", time.time() - request["created"], ctx.session)
+
+    ctx.logger.info(f"Raw structured output received:\n{msg.output}.")
+    await process_request(ctx, session_sender, output, cache_key)
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+import os
+
+import httpx
+
+from boltz2 import get_http_client
+
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+GIST_MAX_PARALLEL_UPLOADS = int(os.getenv("GIST_MAX_PARALLEL_UPLOADS", "4"))
+GIST_MAX_RETRIES = int(os.getenv("GIST_MAX_RETRIES", "3"))
+GIST_RETRY_BACKOFF = float(os.getenv("GIST_RETRY_BACKOFF", "1.0"))
+# Put every structure of a prediction in one multi-file gist (one round trip)
+GIST_BUNDLE_STRUCTURES = os.getenv("GIST_BUNDLE_STRUCTURES", "false").lower() == "true"
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+logger = logging.getLogger(__name__)
+
+upload_slots = asyncio.Semaphore(GIST_MAX_PARALLEL_UPLOADS)
+
+
+async def create_gist(files: dict[str, str], description: str = "Boltz2-predicted structure") -> dict[str, str]:
+    """
+    Creates one public gist containing the given files, retrying transient
+    failures with exponential backoff.
+
+    Args:
+        files: filename -> file content
+
+    Returns:
+        filename -> raw_url for each file in the gist
+    """
+    payload = {
+        "description": description,
+        "public": True,
+        "files": {filename: {"content": content} for filename, content in files.items()},
+    }
+    headers = {
+        "Authorization": f"token {os.getenv('GITHUB_PAT')}",
+        "Accept": "application/vnd.github.v3+json"
+    }
+
+    async with upload_slots:
+        for attempt in range(GIST_MAX_RETRIES + 1):
+            delay = GIST_RETRY_BACKOFF * 2 ** attempt
+            try:
+                response = await get_http_client().post(f"{GITHUB_API_URL}/gists", headers=headers, json=payload)
+            except httpx.TransportError as e:
+                if attempt == GIST_MAX_RETRIES:
+                    raise
+                logger.warning(f"Gist upload failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < GIST_MAX_RETRIES:
+                retry_after = response.headers.get("retry-after", "")
+                if retry_after.isdigit():
+                    delay = float(retry_after)
+                logger.warning(f"Gist upload got {response.status_code}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            response.raise_for_status()
+            gist_files = response.json()["files"]
+            return {filename: gist_files[filename]["raw_url"] for filename in files}
+
+
+async def upload_structures(files: dict[str, str], bundle: bool = GIST_BUNDLE_STRUCTURES) -> dict[str, str]:
+    """
+    Uploads predicted structures to GitHub Gists, either as one gist per
+    structure sent concurrently, or bundled into a single multi-file gist.
+
+    Args:
+        files: filename -> structure content
+
+    Returns:
+        filename -> raw_url
+    """
+    if bundle or len(files) == 1:
+        return await create_gist(files)
+
+    results = await asyncio.gather(
+        *(create_gist({filename: content}) for filename, content in files.items())
+    )
+    raw_urls = {}
+    for result in results:
+        raw_urls.update(result)
+    return raw_urls
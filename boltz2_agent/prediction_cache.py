@@ -0,0 +1,115 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENABLED = os.getenv("BOLTZ2_CACHE_ENABLED", "true").lower() == "true"
+CACHE_PATH = os.getenv(
+    "BOLTZ2_CACHE_PATH", os.path.join(os.path.dirname(__file__), "prediction_cache.sqlite3")
+)
+CACHE_MAX_BYTES = int(float(os.getenv("BOLTZ2_CACHE_MAX_MB", "512")) * 1024 * 1024)
+CACHE_MAX_AGE = float(os.getenv("BOLTZ2_CACHE_MAX_AGE_DAYS", "30")) * 24 * 3600
+
+
+def payload_key(payload: dict) -> str:
+    """
+    Canonical sha256 of a normalized Boltz2 request payload.
+    """
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class PredictionCache:
+    """
+    Persistent, size-bounded cache of Boltz2 responses keyed by request hash.
+
+    Responses are stored zlib-compressed in SQLite. Entries older than max_age
+    are dropped, and once the total size exceeds max_bytes the least recently
+    used entries are evicted.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, max_bytes: int = CACHE_MAX_BYTES, max_age: float = CACHE_MAX_AGE):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS predictions ("
+            " key TEXT PRIMARY KEY,"
+            " created REAL NOT NULL,"
+            " last_access REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " data BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS predictions_last_access ON predictions (last_access)")
+        self._conn.commit()
+
+    def get(self, key: str) -> str | None:
+        """
+        Returns the cached response JSON for key, or None on a miss.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, created FROM predictions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.max_age:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE predictions SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, key: str, response_json: str):
+        data = zlib.compress(response_json.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO predictions (key, created, last_access, size, data) VALUES (?, ?, ?, ?, ?)",
+                (key, now, now, len(data), data),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float):
+        self._conn.execute("DELETE FROM predictions WHERE created < ?", (now - self.max_age,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM predictions").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM predictions ORDER BY last_access").fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM predictions WHERE key = ?", evicted)
+        logger.info(f"Evicted {len(evicted)} cached prediction(s)")
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM predictions"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+        }
+
+
+prediction_cache = PredictionCache() if CACHE_ENABLED else None
@@ -0,0 +1,199 @@
+import re
+
+# Shortest bare (non-FASTA) sequence, and shortest chunk of a space-separated
+# one; shorter all-caps words are more likely acronyms than sequences
+MIN_SEQUENCE_LENGTH = 10
+
+# The 20 standard amino acids and X. The rare and ambiguity codes (B, Z, U,
+# O) are only accepted under a FASTA header that says "protein", since they
+# make English words like "HEMOGLOBIN" look like proteins.
+PROTEIN_ALPHABET = frozenset("ACDEFGHIKLMNPQRSTVWYX")
+EXTENDED_PROTEIN_ALPHABET = PROTEIN_ALPHABET | frozenset("BZUO")
+DNA_ALPHABET = frozenset("ACGTN")
+RNA_ALPHABET = frozenset("ACGUN")
+MOLECULE_TYPES = ("protein", "dna", "rna")
+# Boltz entity types the local parser doesn't build; these prompts go to the LLM
+NON_POLYMER_TYPES = frozenset({"smiles", "ccd", "ligand", "ligands", "ion", "small molecule", "small_molecule"})
+# Bare protein sequences with more vowels than this are more likely all-caps
+# prose: English text runs at 35-45%, natural proteins at 15-25%
+MAX_PROTEIN_VOWEL_SHARE = 0.3
+VOWELS = frozenset("AEIOU")
+
+# Words allowed in a short lead-in such as "Predict the structure of this
+# protein:". Anything else (ligands, counts, options) needs the LLM extractor.
+LEAD_IN_WORDS = frozenset("""
+a an and as below can chain chains fold following for generate give here is me model of please predict
+protein proteins dna rna sequence sequences show structure structures that the these this to what would you
+""".split())
+
+# Digits and whitespace appear in GenBank-style wrapped sequences; a trailing
+# "*" is a stop codon
+SEQUENCE_FILLER = re.compile(r"[\s\d]+")
+VALID_ID = re.compile(r"[A-Z]|[A-Za-z0-9]{4}")
+
+
+def classify(sequence: str, hint: str | None = None, extended: bool = False) -> str | None:
+    """
+    Molecule type of a sequence from its alphabet: "dna" for ACGT(N), "rna"
+    for ACGU(N), otherwise "protein" if every residue is an amino acid code
+    (including the rare ones if extended). A hint from the prompt or FASTA
+    header wins when the alphabet allows it. None if the sequence fits no
+    alphabet.
+    """
+    residues = set(sequence)
+    allowed = {
+        "dna": residues <= DNA_ALPHABET,
+        "rna": residues <= RNA_ALPHABET,
+        "protein": residues <= (EXTENDED_PROTEIN_ALPHABET if extended else PROTEIN_ALPHABET),
+    }
+    if hint in allowed:
+        return hint if allowed[hint] else None
+    for molecule_type in ("dna", "rna", "protein"):
+        if allowed[molecule_type]:
+            return molecule_type
+    return None
+
+
+def clean_sequence(lines: list[str]) -> str:
+    return SEQUENCE_FILLER.sub("", "".join(lines)).upper().rstrip("*")
+
+
+def parse_header(header: str) -> tuple[str | None, str | None]:
+    """
+    (id, entity type) from a FASTA header. Understands the Boltz style
+    ">A|protein" as well as plain ">sp|P01308|INS_HUMAN ..." headers, whose
+    fields are ignored unless they are a valid chain id or entity type. The
+    entity type may be one the parser can't handle (e.g. "smiles"); in the
+    Boltz style, any single word after the chain id is taken as the type.
+    """
+    fields = [field.strip() for field in header.split("|")]
+    first = fields[0].split()[0] if fields[0] else ""
+    polymer_id = first if VALID_ID.fullmatch(first) else None
+    for i, field in enumerate(fields[1:]):
+        entity_type = field.lower()
+        if entity_type in MOLECULE_TYPES or entity_type in NON_POLYMER_TYPES:
+            return polymer_id, entity_type
+        if i == 0 and polymer_id is not None and re.fullmatch(r"[a-z_]+", entity_type):
+            return polymer_id, entity_type
+    return polymer_id, None
+
+
+def lead_in_hint(text: str) -> tuple[bool, str | None]:
+    """
+    Whether text is a plain lead-in the parser can ignore, and the molecule
+    type it names, if exactly one.
+    """
+    words = re.findall(r"[a-z]+", text.lower())
+    if re.search(r"\d", text) or not all(word in LEAD_IN_WORDS for word in words):
+        return False, None
+    named = {word.rstrip("s") for word in words} & set(MOLECULE_TYPES)
+    return True, named.pop() if len(named) == 1 else None
+
+
+def parse_fasta(text: str, hint: str | None) -> list[dict] | None:
+    polymers = []
+    header, lines = None, []
+
+    def flush():
+        polymer_id, header_type = parse_header(header)
+        if header_type is not None and header_type not in MOLECULE_TYPES:
+            return False
+        sequence = clean_sequence(lines)
+        molecule_type = classify(sequence, header_type or hint, extended=header_type == "protein")
+        if not sequence or molecule_type is None:
+            return False
+        polymer = {"molecule_type": molecule_type, "sequence": sequence}
+        if polymer_id is not None:
+            polymer["id"] = polymer_id
+        polymers.append(polymer)
+        return True
+
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith(">"):
+            if header is not None and not flush():
+                return None
+            header, lines = line[1:], []
+        elif line:
+            lines.append(line)
+    if header is None or not flush():
+        return None
+
+    # Only keep ids if every polymer has a distinct one
+    ids = [polymer.get("id") for polymer in polymers]
+    if None in ids or len(set(ids)) != len(ids):
+        for polymer in polymers:
+            polymer.pop("id", None)
+    return polymers
+
+
+def is_sequence_line(line: str) -> bool:
+    # Space-separated chunks are only allowed GenBank style: position numbers
+    # and fixed-width chunks of at least MIN_SEQUENCE_LENGTH, the last one
+    # possibly shorter, so an all-caps sentence isn't read as a protein
+    chunks = [chunk for chunk in line.split() if not chunk.isdigit()]
+    if not chunks:
+        return False
+    width = len(chunks[0])
+    for i, chunk in enumerate(chunks):
+        if not (chunk.isupper() or set(chunk.upper()) <= DNA_ALPHABET | RNA_ALPHABET):
+            return False
+        if len(chunks) > 1 and (width < MIN_SEQUENCE_LENGTH or len(chunk) > width):
+            return False
+        if i < len(chunks) - 1 and len(chunk) != width:
+            return False
+    return True
+
+
+def looks_like_words(sequence: str) -> bool:
+    return sum(residue in VOWELS for residue in sequence) / len(sequence) > MAX_PROTEIN_VOWEL_SHARE
+
+
+def parse_raw(text: str, hint: str | None) -> list[dict] | None:
+    # Blank lines separate sequences; wrapped lines of one sequence are joined
+    polymers = []
+    for block in re.split(r"\n\s*\n", text.strip()):
+        lines = block.splitlines()
+        if not all(is_sequence_line(line) for line in lines):
+            return None
+        sequence = clean_sequence(lines)
+        if len(sequence) < MIN_SEQUENCE_LENGTH:
+            return None
+        molecule_type = classify(sequence, hint)
+        if molecule_type is None or molecule_type == "protein" and looks_like_words(sequence):
+            return None
+        polymers.append({"molecule_type": molecule_type, "sequence": sequence})
+    return polymers
+
+
+def parse_sequences(text: str) -> dict | None:
+    """
+    Builds the structured request locally when the prompt is only sequences:
+    one or more FASTA records, or bare sequences separated by blank lines,
+    optionally after a short lead-in ending in a colon or newline, like
+    "Predict the structure of:".
+    Returns None for anything else, so the caller can fall back to the LLM
+    extractor.
+    """
+    text = text.strip()
+    if not text:
+        return None
+
+    if ">" in text:
+        lead_in, _, body = text.partition(">")
+        ok, hint = lead_in_hint(lead_in)
+        if not ok:
+            return None
+        polymers = parse_fasta(">" + body, hint)
+    else:
+        # The lead-in, if any, ends at the first colon or newline
+        match = re.match(r"([^:\n]*?)\s*[:\n]\s*(.+)", text, re.S)
+        lead_in, body = (match.group(1), match.group(2)) if match else ("", text)
+        ok, hint = lead_in_hint(lead_in)
+        if not ok:
+            body, hint = text, None
+        polymers = parse_raw(body, hint)
+
+    if not polymers:
+        return None
+    return {"polymers": polymers}
@@ -0,0 +1,286 @@
+# Generated from common/tracing.py by common/sync.py; edit that file, not this copy.
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Per-stage latency tracing. Disabled by default; span() and traced() then
+# hand back a shared no-op and the undecorated function, so they cost nothing.
+TRACING = os.getenv("TRACING", "false").lower() == "true"
+TRACE_AGENT = os.getenv("TRACE_AGENT", os.path.basename(os.path.dirname(os.path.abspath(__file__))))
+# Percentiles are computed over each stage's most recent TRACE_WINDOW spans
+TRACE_WINDOW = int(os.getenv("TRACE_WINDOW", "2048"))
+# Most recent individual spans kept for the JSON export
+TRACE_RECENT = int(os.getenv("TRACE_RECENT", "200"))
+# Serves /metrics (Prometheus text) and /metrics.json when set
+TRACE_METRICS_HOST = os.getenv("TRACE_METRICS_HOST", "127.0.0.1")
+TRACE_METRICS_PORT = int(os.getenv("TRACE_METRICS_PORT", "0"))
+# Written on shutdown when set
+TRACE_JSON_PATH = os.getenv("TRACE_JSON_PATH", "")
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Session of the handler being traced, inherited by nested spans
+_session: contextvars.ContextVar[str | None] = contextvars.ContextVar("trace_session", default=None)
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    # Nearest-rank percentile of an already sorted list
+    return ordered[min(len(ordered) - 1, max(0, int(q * len(ordered) + 0.5) - 1))]
+
+
+class Tracer:
+    """
+    Collects span durations per stage: totals, a sliding window for
+    percentiles, and the most recent spans with their session ids.
+    """
+
+    def __init__(self, window: int = TRACE_WINDOW, recent: int = TRACE_RECENT):
+        self.window = window
+        self.stages: dict[str, dict] = {}
+        self.recent: deque = deque(maxlen=recent)
+        # Spans are also recorded from worker threads and read by the server thread
+        self._lock = threading.Lock()
+
+    def record(self, name: str, duration: float, session: str | None = None, error: bool = False):
+        with self._lock:
+            stage = self.stages.get(name)
+            if stage is None:
+                stage = self.stages[name] = {"count": 0, "errors": 0, "sum": 0.0, "max": 0.0, "window": deque(maxlen=self.window)}
+            stage["count"] += 1
+            stage["errors"] += error
+            stage["sum"] += duration
+            stage["max"] = max(stage["max"], duration)
+            stage["window"].append(duration)
+            self.recent.append({
+                "stage": name,
+                "session": session,
+                "start": time.time() - duration,
+                "duration_ms": round(duration * 1000, 3),
+                "error": error,
+            })
+
+    def summary(self) -> dict:
+        with self._lock:
+            stages = {name: (dict(stage), sorted(stage["window"])) for name, stage in self.stages.items()}
+            recent = list(self.recent)
+
+        summary = {}
+        for name, (stage, ordered) in sorted(stages.items()):
+            summary[name] = {
+                "count": stage["count"],
+                "errors": stage["errors"],
+                "mean_ms": stage["sum"] / stage["count"] * 1000,
+                "max_ms": stage["max"] * 1000,
+                **{f"p{int(q * 100)}_ms": percentile(ordered, q) * 1000 for q in QUANTILES},
+            }
+        return {"agent": TRACE_AGENT, "stages": summary, "caches": cache_stats(), "recent": recent}
+
+    def prometheus(self) -> str:
+        """
+        Stage latencies as a Prometheus summary, in seconds.
+        """
+        metric = "agent_stage_duration_seconds"
+        lines = [
+            f"# HELP {metric} Latency of each agent stage.",
+            f"# TYPE {metric} summary",
+        ]
+        errors = []
+        with self._lock:
+            stages = {name: (dict(stage), sorted(stage["window"])) for name, stage in self.stages.items()}
+        for name, (stage, ordered) in sorted(stages.items()):
+            labels = f'agent="{TRACE_AGENT}",stage="{name}"'
+            for q in QUANTILES:
+                lines.append(f'{metric}{{{labels},quantile="{q}"}} {percentile(ordered, q):.6f}')
+            lines.append(f"{metric}_sum{{{labels}}} {stage['sum']:.6f}")
+            lines.append(f"{metric}_count{{{labels}}} {stage['count']}")
+            errors.append(f"agent_stage_errors_total{{{labels}}} {stage['errors']}")
+        lines += ["# HELP agent_stage_errors_total Spans that raised.", "# TYPE agent_stage_errors_total counter"]
+        return "\n".join(lines + errors + cache_metrics()) + "\n"
+
+
+tracer = Tracer()
+
+# Caches whose stats() are published with the metrics, by name
+_caches: dict[str, Callable[[], dict]] = {}
+
+
+def register_cache(name: str, stats: Callable[[], dict]):
+    """
+    Publishes a cache's hit rate with the metrics. stats returns "hits",
+    "misses", "hit_rate" and optionally "entries", and is read each time
+    the metrics are served.
+    """
+    _caches[name] = stats
+
+
+def cache_stats() -> dict[str, dict]:
+    return {name: stats() for name, stats in sorted(_caches.items())}
+
+
+def cache_metrics() -> list[str]:
+    """
+    Prometheus lines for the registered caches.
+    """
+    caches = cache_stats()
+    metrics = [
+        ("agent_cache_hits_total", "counter", "Cache lookups that hit.", "hits"),
+        ("agent_cache_misses_total", "counter", "Cache lookups that missed.", "misses"),
+        ("agent_cache_hit_ratio", "gauge", "Share of cache lookups that hit.", "hit_rate"),
+        ("agent_cache_entries", "gauge", "Entries held by the cache.", "entries"),
+    ]
+    lines = []
+    for metric, kind, help_text, key in metrics:
+        values = [(name, stats[key]) for name, stats in caches.items() if key in stats]
+        if not values:
+            continue
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"]
+        lines += [f'{metric}{{agent="{TRACE_AGENT}",cache="{name}"}} {value}' for name, value in values]
+    return lines
+
+
+class _Span:
+    __slots__ = ("name", "session", "start", "token")
+
+    def __init__(self, name: str, session):
+        self.name = name
+        self.session = None if session is None else str(session)
+
+    def __enter__(self):
+        if self.session is None:
+            self.session = _session.get()
+            self.token = None
+        else:
+            self.token = _session.set(self.session)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        tracer.record(self.name, time.perf_counter() - self.start, self.session, exc_type is not None)
+        if self.token is not None:
+            _session.reset(self.token)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str, session=None):
+    """
+    Context manager timing one stage. Pass the session (ctx.session) in
+    handlers; nested spans pick it up automatically.
+    """
+    if not TRACING:
+        return _NOOP_SPAN
+    return _Span(name, session)
+
+
+def record_span(name: str, duration: float, session=None):
+    """
+    Records a stage timed elsewhere, e.g. a round trip that spans two handlers.
+    """
+    if TRACING:
+        tracer.record(name, duration, None if session is None else str(session))
+
+
+def session_of(args: tuple):
+    return getattr(args[0], "session", None) if args else None
+
+
+def traced(name: str | None = None):
+    """
+    Decorator timing every call of a function, coroutine function or async
+    generator (until it is exhausted) as a span. Handlers and other functions
+    taking ctx first are tagged with its session.
+    """
+    def decorator(func):
+        if not TRACING:
+            return func
+        stage = name or func.__name__
+
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with _Span(stage, session_of(args)):
+                    async for item in func(*args, **kwargs):
+                        yield item
+        elif inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with _Span(stage, session_of(args)):
+                    return await func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with _Span(stage, session_of(args)):
+                    return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/metrics":
+            body, content_type = tracer.prometheus(), "text/plain; version=0.0.4"
+        elif self.path == "/metrics.json":
+            body, content_type = json.dumps(tracer.summary(), indent=2), "application/json"
+        else:
+            self.send_error(404)
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server: ThreadingHTTPServer | None = None
+
+
+def start_metrics_server() -> bool:
+    """
+    Serves the metrics on TRACE_METRICS_HOST:TRACE_METRICS_PORT from a daemon
+    thread. Returns False if tracing or the server is disabled.
+    """
+    global _server
+    if not TRACING or not TRACE_METRICS_PORT or _server is not None:
+        return False
+    _server = ThreadingHTTPServer((TRACE_METRICS_HOST, TRACE_METRICS_PORT), _MetricsHandler)
+    threading.Thread(target=_server.serve_forever, name="trace-metrics", daemon=True).start()
+    logger.info(f"📈 Serving trace metrics on http://{TRACE_METRICS_HOST}:{TRACE_METRICS_PORT}/metrics")
+    return True
+
+
+def write_json(path: str = TRACE_JSON_PATH) -> bool:
+    """
+    Writes the JSON summary to path. Returns False if tracing or the path is unset.
+    """
+    if not TRACING or not path:
+        return False
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(tracer.summary(), f, indent=2)
+    return True
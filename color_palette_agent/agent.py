@@ -1,5 +1,6 @@
-from uagents import Agent
-from chat_proto import chat_proto
+from uagents import Agent, Context
+from chat_proto import chat_proto, external_storage
+from tracing import start_metrics_server, write_json
 
 agent = Agent(
     name="color_palette_agent",
@@ -10,5 +11,19 @@ agent = Agent(
 
 agent.include(chat_proto)
 
+@agent.on_event("shutdown")
+async def close_storage_client(ctx: Context):
+    await external_storage.aclose()
+
+# Serve per-stage latency metrics when TRACING is enabled
+@agent.on_event("startup")
+async def start_tracing(ctx: Context):
+    start_metrics_server()
+
+@agent.on_event("shutdown")
+async def export_traces(ctx: Context):
+    if write_json():
+        ctx.logger.info("📈 Wrote trace summary")
+
 if __name__ == "__main__":
     agent.run()
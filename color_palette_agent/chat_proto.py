@@ -1,6 +1,6 @@
+import asyncio
 import base64
 import os
-import requests
 from uuid import uuid4
 from datetime import datetime
 from pydantic.v1 import UUID4
@@ -17,8 +17,9 @@ from uagents_core.contrib.protocols.chat import (
     TextContent,
     chat_protocol_spec,
 )
-from uagents_core.storage import ExternalStorage
-from color_palette import get_color_palette_from_content, generate_palette_image
+from color_palette import get_color_palette_from_content, generate_palette_image, run_in_worker
+from storage import AsyncExternalStorage
+from tracing import span, traced
 
 AGENTVERSE_API_KEY = os.getenv("AGENTVERSE_API_KEY")
 STORAGE_URL = os.getenv("AGENTVERSE_URL", "https://agentverse.ai") + "/v1/storage"
@@ -27,7 +28,7 @@ if AGENTVERSE_API_KEY is None:
 SUPPORTED_MIME_TYPES = {"image/png", "image/jpeg", "image/webp", "image/gif"}
 
 
-external_storage = ExternalStorage(api_token=AGENTVERSE_API_KEY, storage_url=STORAGE_URL)
+external_storage = AsyncExternalStorage(api_token=AGENTVERSE_API_KEY, storage_url=STORAGE_URL)
 
 def create_text_chat(text: str) -> ChatMessage:
     return ChatMessage(
@@ -75,13 +76,17 @@ def create_metadata(metadata: dict[str, str]) -> ChatMessage:
 chat_proto = Protocol(spec=chat_protocol_spec)
 
 @chat_proto.on_message(ChatMessage)
+@traced("handle_message")
 async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
-    await ctx.send(
-        sender,
-        ChatAcknowledgement(timestamp=datetime.utcnow(), acknowledged_msg_id=msg.msg_id),
-    )
+    with span("ack"):
+        await ctx.send(
+            sender,
+            ChatAcknowledgement(timestamp=datetime.utcnow(), acknowledged_msg_id=msg.msg_id),
+        )
 
+    # Collect prompt parts in order; resources are downloaded concurrently below
     prompt_content = []
+    resource_slots = []
     for item in msg.content:
         if isinstance(item, StartSessionContent):
             await ctx.send(sender, create_metadata({
@@ -92,47 +97,63 @@ async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
         elif isinstance(item, TextContent):
             prompt_content.append({"text": item.text, "type": "text"})
         elif isinstance(item, ResourceContent):
-            try:
-                data = external_storage.download(str(item.resource_id))
-                contents = data["contents"]
-                mime_type = data["mime_type"]
-
-                # FIX: if it's a base64-encoded string, decode it back to bytes
-                if isinstance(contents, str):
-                    contents = base64.b64decode(contents)
-
-                if mime_type not in SUPPORTED_MIME_TYPES:
-                    ctx.logger.warning(f"Unsupported image type received: {mime_type}")
-                    await ctx.send(sender, create_text_chat(
-                        "Unsupported image type. Please upload a PNG, JPEG, GIF, or WebP file."
-                    ))
-                    return  # Skip this item and don't append to prompt_content
-
-                prompt_content.append({
-                    "type": "resource",
-                    "mime_type": data["mime_type"],
-                    "contents": contents,
-                })
-
-            except Exception as ex:
-                ctx.logger.error(f"Failed to download resource: {ex}")
-                await ctx.send(sender, create_text_chat("Failed to download resource."))
-
+            resource_slots.append((len(prompt_content), str(item.resource_id)))
+            prompt_content.append(None)
         else:
             ctx.logger.warning(f"Got unexpected content from {sender}")
 
-    if prompt_content:
-        colors_response = get_color_palette_from_content(prompt_content)
-        image_data = generate_palette_image(colors_response)
+    with span("storage_download"):
+        downloads = await asyncio.gather(
+            *(external_storage.adownload(resource_id) for _, resource_id in resource_slots),
+            return_exceptions=True,
+        )
 
-        asset_id = external_storage.create_asset(
+    for (slot, _), data in zip(resource_slots, downloads):
+        try:
+            if isinstance(data, BaseException):
+                raise data
+
+            contents = data["contents"]
+            mime_type = data["mime_type"]
+
+            # FIX: if it's a base64-encoded string, decode it back to bytes
+            if isinstance(contents, str):
+                contents = await run_in_worker(base64.b64decode, contents)
+
+            if mime_type not in SUPPORTED_MIME_TYPES:
+                ctx.logger.warning(f"Unsupported image type received: {mime_type}")
+                await ctx.send(sender, create_text_chat(
+                    "Unsupported image type. Please upload a PNG, JPEG, GIF, or WebP file."
+                ))
+                return  # Skip this item and don't append to prompt_content
+
+            prompt_content[slot] = {
+                "type": "resource",
+                "mime_type": data["mime_type"],
+                "contents": contents,
+            }
+
+        except Exception as ex:
+            ctx.logger.error(f"Failed to download resource: {ex}")
+            await ctx.send(sender, create_text_chat("Failed to download resource."))
+
+    prompt_content = [part for part in prompt_content if part is not None]
+    if not prompt_content:
+        return
+
+    colors_response = await get_color_palette_from_content(prompt_content)
+    with span("render_palette"):
+        image_data = await run_in_worker(generate_palette_image, colors_response)
+
+    with span("storage_upload"):
+        asset_id = await external_storage.acreate_asset(
             name=f"palette-{uuid4()}",
             content=image_data,
             mime_type="image/png"
         )
 
-        external_storage.set_permissions(asset_id=asset_id, agent_address=sender)
-        palette_url = f"agent-storage://{external_storage.storage_url}/{asset_id}"
+        await external_storage.aset_permissions(asset_id=asset_id, agent_address=sender)
+    palette_url = f"agent-storage://{external_storage.storage_url}/{asset_id}"
 
     await ctx.send(sender, create_resource_chat(asset_id, palette_url))
 
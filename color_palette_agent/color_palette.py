@@ -1,7 +1,9 @@
+import asyncio
 import json
 import os
-from typing import Any, List, Dict
-from openai import OpenAI, OpenAIError
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Dict
+from openai import AsyncOpenAI, OpenAIError
 import base64
 from PIL import Image
 from io import BytesIO
@@ -10,9 +12,22 @@ import requests
 import requests
 import os
 
-client = OpenAI()
+from tracing import span, traced
 
-def get_color_palette_from_content(prompt_content: List[Dict[str, str | bytes]]) -> list[dict]:
+client = AsyncOpenAI()
+
+# Worker pool for CPU-bound steps (base64, PNG encoding) so they stay off the event loop
+CPU_WORKERS = int(os.getenv("PALETTE_CPU_WORKERS", "4"))
+cpu_pool = ThreadPoolExecutor(max_workers=CPU_WORKERS, thread_name_prefix="palette-cpu")
+
+async def run_in_worker(fn: Callable[..., Any], *args) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(cpu_pool, fn, *args)
+
+def encode_image(contents: bytes) -> str:
+    return base64.b64encode(contents).decode("utf-8")
+
+@traced("get_color_palette")
+async def get_color_palette_from_content(prompt_content: List[Dict[str, str | bytes]]) -> list[dict]:
     """
     Accepts a list of prompt parts (text or image), and returns a list of 5 colors.
     Each part is a dict with 'type': 'text' or 'resource', and associated data.
@@ -37,8 +52,7 @@ def get_color_palette_from_content(prompt_content: List[Dict[str, str | bytes]])
                 "text": item["text"]
             })
         elif item["type"] == "resource":
-            print(item["mime_type"])
-            b64_img = base64.b64encode(item["contents"]).decode("utf-8")
+            b64_img = await run_in_worker(encode_image, item["contents"])
             user_parts.append({
                 "type": "image_url",
                 "image_url": {
@@ -50,10 +64,11 @@ def get_color_palette_from_content(prompt_content: List[Dict[str, str | bytes]])
         "role": "user",
         "content": user_parts
     })
-    response = client.chat.completions.create(
-        model="gpt-4o",
-        messages=messages,
-    )
+    with span("llm"):
+        response = await client.chat.completions.create(
+            model="gpt-4o",
+            messages=messages,
+        )
 
     raw = response.choices[0].message.content.strip()
 
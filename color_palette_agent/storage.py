@@ -0,0 +1,102 @@
+import os
+
+import httpx
+from uagents_core.storage import ExternalStorage
+
+from color_palette import encode_image, run_in_worker
+
+STORAGE_MAX_CONNECTIONS = int(os.getenv("STORAGE_MAX_CONNECTIONS", "20"))
+# Seconds per request; the default is the limit uagents_core's sync
+# ExternalStorage calls use, so switching to the async client keeps it
+STORAGE_TIMEOUT = float(os.getenv("STORAGE_TIMEOUT", "10"))
+
+
+class AsyncExternalStorage(ExternalStorage):
+    """
+    ExternalStorage with async versions of the calls this agent makes.
+
+    Requests go through one pooled httpx.AsyncClient so connections to the
+    storage service are kept alive between messages, and base64 work on
+    large assets runs in the worker pool instead of on the event loop.
+    """
+
+    _client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=STORAGE_MAX_CONNECTIONS,
+                    max_keepalive_connections=STORAGE_MAX_CONNECTIONS,
+                ),
+                timeout=STORAGE_TIMEOUT,
+            )
+        return self._client
+
+    def _headers(self, json: bool = False) -> dict:
+        # Relies on uagents_core internals: ExternalStorage._get_auth_header
+        # is private, and is the only place the attestation header is built
+        headers = self._get_auth_header()
+        if json:
+            headers["Content-Type"] = "application/json"
+        return headers
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def adownload(self, asset_id: str) -> dict:
+        url = f"{self.storage_url}/assets/{asset_id}/contents/"
+        response = await self._get_client().get(url, headers=self._headers())
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Download failed: {response.status_code}, {response.text}"
+            )
+        return response.json()
+
+    async def acreate_asset(
+        self,
+        name: str,
+        content: bytes,
+        mime_type: str = "text/plain",
+        lifetime_hours: int = 24,
+    ) -> str:
+        if not self.api_token:
+            raise RuntimeError("API token required to create assets")
+        url = f"{self.storage_url}/assets/"
+        headers = self._headers(json=True)
+        encoded = await run_in_worker(encode_image, content)
+        payload = {
+            "name": name,
+            "mime_type": mime_type,
+            "contents": encoded,
+            "lifetime_hours": lifetime_hours,
+        }
+
+        response = await self._get_client().post(url, json=payload, headers=headers)
+        if response.status_code != 201:
+            raise RuntimeError(
+                f"Asset creation failed: {response.status_code}, {response.text}"
+            )
+        return response.json()["asset_id"]
+
+    async def aset_permissions(
+        self, asset_id: str, agent_address: str, read: bool = True, write: bool = True
+    ) -> dict:
+        if not self.api_token:
+            raise RuntimeError("API token required to set permissions")
+        url = f"{self.storage_url}/assets/{asset_id}/permissions/"
+        headers = self._headers(json=True)
+        payload = {
+            "agent_address": agent_address,
+            "read": read,
+            "write": write,
+        }
+
+        response = await self._get_client().put(url, json=payload, headers=headers)
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Set permissions failed: {response.status_code}, {response.text}"
+            )
+        return response.json()
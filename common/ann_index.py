@@ -0,0 +1,129 @@
+import logging
+import math
+import os
+
+import faiss
+import numpy as np
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+# Build-time index type: "flat" (exact), "hnsw" or "ivfpq" (needs training)
+INDEX_TYPE = os.getenv("INDEX_TYPE", "flat").lower()
+INDEX_TYPES = ("flat", "hnsw", "ivfpq")
+
+HNSW_M = int(os.getenv("HNSW_M", "32"))
+HNSW_EF_CONSTRUCTION = int(os.getenv("HNSW_EF_CONSTRUCTION", "200"))
+HNSW_EF_SEARCH = int(os.getenv("HNSW_EF_SEARCH", "64"))
+
+# IVF_NLIST=0 picks ~4*sqrt(n) lists, capped so each list gets enough training points
+IVF_NLIST = int(os.getenv("IVF_NLIST", "0"))
+IVF_NPROBE = int(os.getenv("IVF_NPROBE", "16"))
+PQ_M = int(os.getenv("PQ_M", "64"))
+PQ_NBITS = int(os.getenv("PQ_NBITS", "8"))
+MIN_POINTS_PER_LIST = 39
+
+# Query-time overrides applied when an index is loaded; unset keeps the built values
+ANN_EF_SEARCH = int(os.environ["ANN_EF_SEARCH"]) if os.getenv("ANN_EF_SEARCH") else None
+ANN_NPROBE = int(os.environ["ANN_NPROBE"]) if os.getenv("ANN_NPROBE") else None
+
+
+def default_params(index_type: str) -> dict:
+    if index_type == "hnsw":
+        return {"M": HNSW_M, "ef_construction": HNSW_EF_CONSTRUCTION, "ef_search": HNSW_EF_SEARCH}
+    if index_type == "ivfpq":
+        return {"nlist": IVF_NLIST, "nprobe": IVF_NPROBE, "pq_m": PQ_M, "pq_nbits": PQ_NBITS}
+    return {}
+
+
+def build_ann_index(vectors: np.ndarray, index_type: str = INDEX_TYPE, **params) -> faiss.Index:
+    """
+    Builds an empty (but trained, where needed) L2 index of the given type.
+    Missing params default to the env configuration.
+    """
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unknown index type '{index_type}', expected one of {INDEX_TYPES}")
+    params = {**default_params(index_type), **params}
+    n, dim = vectors.shape
+
+    if index_type == "flat":
+        return faiss.IndexFlatL2(dim)
+
+    if index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dim, params["M"])
+        index.hnsw.efConstruction = params["ef_construction"]
+        index.hnsw.efSearch = params["ef_search"]
+        return index
+
+    if dim % params["pq_m"]:
+        raise ValueError(f"PQ_M={params['pq_m']} must divide the embedding dimension {dim}")
+    if n < 2 ** params["pq_nbits"]:
+        raise ValueError(f"IVF-PQ needs at least {2 ** params['pq_nbits']} vectors to train, got {n}; use flat or hnsw")
+    nlist = params["nlist"] or round(4 * math.sqrt(n))
+    nlist = max(1, min(nlist, n // MIN_POINTS_PER_LIST))
+
+    index = faiss.IndexIVFPQ(faiss.IndexFlatL2(dim), dim, nlist, params["pq_m"], params["pq_nbits"])
+    index.train(vectors)
+    index.nprobe = min(params["nprobe"], nlist)
+    return index
+
+
+def describe_index(index: faiss.Index) -> dict:
+    """
+    Type and parameters of a FAISS index, as recorded in meta.json.
+    """
+    if isinstance(index, faiss.IndexHNSW):
+        return {
+            "type": "hnsw",
+            "M": index.hnsw.nb_neighbors(1),
+            "ef_construction": index.hnsw.efConstruction,
+            "ef_search": index.hnsw.efSearch,
+        }
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        ivf = faiss.downcast_index(ivf)
+        described = {"type": "ivf", "nlist": ivf.nlist, "nprobe": ivf.nprobe}
+        if isinstance(ivf, faiss.IndexIVFPQ):
+            described.update(type="ivfpq", pq_m=ivf.pq.M, pq_nbits=ivf.pq.nbits)
+        return described
+    if isinstance(index, faiss.IndexFlat):
+        return {"type": "flat"}
+    return {"type": type(index).__name__}
+
+
+def apply_search_params(index: faiss.Index, ef_search: int | None = ANN_EF_SEARCH, nprobe: int | None = ANN_NPROBE):
+    """
+    Overrides the query-time knobs (HNSW efSearch, IVF nprobe) of a loaded index.
+    """
+    if ef_search is not None and isinstance(index, faiss.IndexHNSW):
+        index.hnsw.efSearch = ef_search
+    ivf = faiss.try_extract_index_ivf(index)
+    if nprobe is not None and ivf is not None:
+        ivf.nprobe = min(nprobe, ivf.nlist)
+
+
+def build_vectorstore(
+    texts: list[str],
+    vectors: np.ndarray,
+    metadatas: list[dict],
+    embeddings: Embeddings,
+    index_type: str = INDEX_TYPE,
+    **params,
+) -> FAISS:
+    """
+    Drop-in replacement for FAISS.from_embeddings that uses a configurable
+    ANN index instead of always building a flat one.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    index = build_ann_index(vectors, index_type, **params)
+    vectorstore = FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=InMemoryDocstore(),
+        index_to_docstore_id={},
+    )
+    vectorstore.add_embeddings(list(zip(texts, vectors.tolist())), metadatas=metadatas)
+    logger.info(f"🏗️ Built {describe_index(index)} index over {index.ntotal} vectors")
+    return vectorstore
@@ -0,0 +1,92 @@
+import copy
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any
+
+# Structured outputs already extracted from a prompt, so a repeated prompt
+# skips the round trip to the structured-output agent
+EXTRACTION_CACHE = os.getenv("EXTRACTION_CACHE", "true").lower() == "true"
+EXTRACTION_CACHE_SIZE = int(os.getenv("EXTRACTION_CACHE_SIZE", "1000"))
+EXTRACTION_CACHE_TTL = float(os.getenv("EXTRACTION_CACHE_TTL", "86400"))
+
+
+def normalize_prompt(text: str, case_sensitive: bool = False) -> str:
+    """
+    Whitespace-insensitive form of a prompt without surrounding punctuation,
+    also case-insensitive unless case carries meaning (e.g. SMILES strings).
+    """
+    if not case_sensitive:
+        text = text.casefold()
+    return " ".join(text.split()).strip(" ?!.")
+
+
+# Placeholder the structured-output agent fills in for fields it couldn't find
+UNKNOWN = "<UNKNOWN>"
+
+
+def is_cacheable(output: dict[str, Any]) -> bool:
+    """
+    Whether an output is a real extraction. Empty outputs and ones with
+    unknown fields are not cached, so a failed extraction isn't replayed for
+    every repeat of the prompt.
+    """
+    return bool(output) and all(value is not None and value != UNKNOWN for value in output.values())
+
+
+class ExtractionCache:
+    """
+    LRU + TTL cache of StructuredOutputResponse.output payloads, keyed by a
+    hash of the normalized prompt so long prompts don't bloat memory.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = EXTRACTION_CACHE_SIZE,
+        ttl: float = EXTRACTION_CACHE_TTL,
+        case_sensitive: bool = False,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.case_sensitive = case_sensitive
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def key(self, prompt: str) -> str:
+        return hashlib.sha256(normalize_prompt(prompt, self.case_sensitive).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # Handlers may modify the payload they are given
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: str, output: dict[str, Any]):
+        if not is_cacheable(output):
+            return
+        self._entries[key] = (time.monotonic(), copy.deepcopy(output))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> str:
+        total = self.hits + self.misses
+        rate = self.hits / total if total else 0.0
+        return f"{len(self._entries)} entries, {self.hits}/{total} hits ({rate:.0%})"
+
+
+def new_extraction_cache(case_sensitive: bool = False) -> ExtractionCache | None:
+    """
+    The agent's cache, or None when EXTRACTION_CACHE is disabled.
+    """
+    if not EXTRACTION_CACHE:
+        return None
+    return ExtractionCache(case_sensitive=case_sensitive)
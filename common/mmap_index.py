@@ -0,0 +1,214 @@
+import argparse
+import json
+import logging
+import mmap
+import os
+import pickle
+import shutil
+from collections.abc import Mapping
+
+import faiss
+import numpy as np
+from langchain_community.docstore.base import Docstore
+from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from ann_index import apply_search_params, describe_index
+
+logger = logging.getLogger(__name__)
+
+# Pickle-free index layout:
+#   index.faiss     FAISS vectors, read with mmap IO flags
+#   chunks.offsets  little-endian uint64 byte offsets, one per chunk plus the end
+#   chunks.blob     UTF-8 JSON records {"id", "page_content", "metadata"}, back to back
+#   meta.json       format version, chunk count, ANN index parameters and FAISS distance settings
+FORMAT_VERSION = 1
+FAISS_FILE = "index.faiss"
+OFFSETS_FILE = "chunks.offsets"
+BLOB_FILE = "chunks.blob"
+META_FILE = "meta.json"
+MMAP_FILES = (FAISS_FILE, OFFSETS_FILE, BLOB_FILE, META_FILE)
+LEGACY_FILES = ("index.faiss", "index.pkl")
+
+
+def read_faiss_index(path: str) -> faiss.Index:
+    """
+    Reads a FAISS index memory-mapped where the index type allows it, so
+    replicas share the vectors through the page cache.
+    """
+    for flag_names in (("IO_FLAG_MMAP_IFC", "IO_FLAG_READ_ONLY"), ("IO_FLAG_MMAP", "IO_FLAG_READ_ONLY")):
+        if not all(hasattr(faiss, name) for name in flag_names):
+            continue
+        flags = 0
+        for name in flag_names:
+            flags |= getattr(faiss, name)
+        try:
+            return faiss.read_index(path, flags)
+        except RuntimeError:
+            continue
+    return faiss.read_index(path)
+
+
+class ChunkStore(Docstore):
+    """
+    Read-only docstore over the mmapped offsets and blob files. Documents are
+    decoded on lookup; nothing is loaded up front.
+    """
+
+    def __init__(self, index_dir: str):
+        self.offsets = np.memmap(os.path.join(index_dir, OFFSETS_FILE), dtype="<u8", mode="r")
+        with open(os.path.join(index_dir, BLOB_FILE), "rb") as f:
+            # mmap can't map an empty file
+            self.blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else b""
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def search(self, search: int) -> Document | str:
+        position = int(search)
+        if not 0 <= position < len(self):
+            return f"ID {search} not found."
+        record = json.loads(self.blob[int(self.offsets[position]):int(self.offsets[position + 1])])
+        return Document(id=record["id"], page_content=record["page_content"], metadata=record["metadata"])
+
+
+class PositionMap(Mapping):
+    """
+    index_to_docstore_id for a ChunkStore: FAISS position i is chunk i.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+
+    def __getitem__(self, position: int) -> int:
+        if not 0 <= position < self.size:
+            raise KeyError(position)
+        return position
+
+    def __iter__(self):
+        return iter(range(self.size))
+
+    def __len__(self) -> int:
+        return self.size
+
+
+def is_mmap_index(index_dir: str) -> bool:
+    return all(os.path.exists(os.path.join(index_dir, name)) for name in MMAP_FILES)
+
+
+def index_files(index_dir: str) -> tuple[str, ...]:
+    """
+    Files that make up whichever index format is present in index_dir.
+    """
+    return MMAP_FILES if is_mmap_index(index_dir) else LEGACY_FILES
+
+
+def write_chunks(vectorstore: FAISS, index_dir: str):
+    """
+    Writes the chunk files and meta.json for a vector store, in FAISS position
+    order. meta.json is removed first and written last so a half-written
+    directory is never mistaken for a complete index.
+    """
+    meta_path = os.path.join(index_dir, META_FILE)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    offsets = [0]
+    index_to_docstore_id = vectorstore.index_to_docstore_id
+    with open(os.path.join(index_dir, BLOB_FILE), "wb") as f:
+        for position in range(len(index_to_docstore_id)):
+            doc_id = index_to_docstore_id[position]
+            doc = vectorstore.docstore.search(doc_id)
+            record = json.dumps(
+                {"id": doc.id or str(doc_id), "page_content": doc.page_content, "metadata": doc.metadata},
+                ensure_ascii=False,
+            ).encode("utf-8")
+            f.write(record)
+            offsets.append(offsets[-1] + len(record))
+    np.asarray(offsets, dtype="<u8").tofile(os.path.join(index_dir, OFFSETS_FILE))
+
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": FORMAT_VERSION,
+            "count": len(offsets) - 1,
+            "ann": describe_index(vectorstore.index),
+            "distance_strategy": str(vectorstore.distance_strategy.value),
+            "normalize_L2": vectorstore._normalize_L2,
+        }, f, indent=2)
+
+
+def save_mmap_index(vectorstore: FAISS, index_dir: str):
+    """
+    Saves a FAISS vector store in the pickle-free layout.
+    """
+    os.makedirs(index_dir, exist_ok=True)
+    faiss.write_index(vectorstore.index, os.path.join(index_dir, FAISS_FILE))
+    write_chunks(vectorstore, index_dir)
+
+
+def load_mmap_index(index_dir: str, embeddings: Embeddings) -> FAISS:
+    with open(os.path.join(index_dir, META_FILE), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta["version"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported index format version {meta['version']} in {index_dir}")
+
+    index = read_faiss_index(os.path.join(index_dir, FAISS_FILE))
+    docstore = ChunkStore(index_dir)
+    if not len(docstore) == meta["count"] == index.ntotal:
+        raise ValueError(f"Index in {index_dir} is inconsistent: {index.ntotal} vectors, {len(docstore)} chunks")
+
+    return FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=PositionMap(len(docstore)),
+        distance_strategy=DistanceStrategy(meta["distance_strategy"]),
+        normalize_L2=meta["normalize_L2"],
+    )
+
+
+def load_index(index_dir: str, embeddings: Embeddings) -> FAISS:
+    """
+    Loads the pickle-free index if present, otherwise the legacy
+    index.faiss + index.pkl layout written by FAISS.save_local.
+    """
+    if is_mmap_index(index_dir):
+        vectorstore = load_mmap_index(index_dir, embeddings)
+    else:
+        logger.warning(f"⚠️ {index_dir} has no pickle-free index; run mmap_index.py to convert it")
+        vectorstore = FAISS.load_local(index_dir, embeddings, allow_dangerous_deserialization=True)
+
+    apply_search_params(vectorstore.index)
+    return vectorstore
+
+
+def convert(src_dir: str, dst_dir: str):
+    """
+    Converts a FAISS.save_local directory (index.faiss + index.pkl) to the
+    pickle-free layout. The pickle is only loaded here, once, from a trusted
+    directory.
+    """
+    with open(os.path.join(src_dir, "index.pkl"), "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+    vectorstore = FAISS(
+        embedding_function=None,
+        index=faiss.read_index(os.path.join(src_dir, "index.faiss")),
+        docstore=docstore,
+        index_to_docstore_id=index_to_docstore_id,
+    )
+
+    os.makedirs(dst_dir, exist_ok=True)
+    if os.path.abspath(src_dir) != os.path.abspath(dst_dir):
+        shutil.copyfile(os.path.join(src_dir, "index.faiss"), os.path.join(dst_dir, FAISS_FILE))
+    write_chunks(vectorstore, dst_dir)
+    print(f"✅ Converted {len(index_to_docstore_id)} chunks from '{src_dir}' to '{dst_dir}'")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert a FAISS.save_local index to the pickle-free mmap layout")
+    parser.add_argument("src_dir", help="Directory with index.faiss and index.pkl")
+    parser.add_argument("dst_dir", nargs="?", help="Output directory (defaults to converting in place)")
+    args = parser.parse_args()
+    convert(args.src_dir, args.dst_dir or args.src_dir)
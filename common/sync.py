@@ -0,0 +1,74 @@
+import argparse
+import os
+import sys
+
+# Modules shared by several agents. Each agent directory is deployed on its own
+# (e.g. animejs_agent/Dockerfile copies only that directory), so the agents
+# keep a copy; the copies are generated from the file in common/ and must not
+# be edited by hand.
+#
+#   python common/sync.py           rewrite the agent copies
+#   python common/sync.py --check   exit 1 if any copy differs from common/
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMMON_DIR = os.path.join(ROOT, "common")
+
+SHARED = {
+    "tracing.py": ["a2rchi", "animejs", "boltz2", "color_palette", "election", "scorigami"],
+    "embedding_cache.py": ["a2rchi", "animejs"],
+    "mmap_index.py": ["a2rchi", "animejs"],
+    "ann_index.py": ["a2rchi", "animejs"],
+    "prompt_budget.py": ["a2rchi", "animejs"],
+    "pending_requests.py": ["scorigami", "election", "boltz2"],
+    "extraction_cache.py": ["scorigami", "election", "boltz2"],
+}
+
+
+def generated(module: str) -> str:
+    with open(os.path.join(COMMON_DIR, module), encoding="utf-8") as f:
+        source = f.read()
+    return f"# Generated from common/{module} by common/sync.py; edit that file, not this copy.\n{source}"
+
+
+def copies() -> list[tuple[str, str]]:
+    return [
+        (os.path.join(ROOT, f"{agent}_agent", module), generated(module))
+        for module, agents in SHARED.items()
+        for agent in agents
+    ]
+
+
+def stale() -> list[str]:
+    paths = []
+    for path, content in copies():
+        try:
+            with open(path, encoding="utf-8") as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != content:
+            paths.append(os.path.relpath(path, ROOT))
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the agents' copies of the modules in common/")
+    parser.add_argument("--check", action="store_true", help="Only report copies that differ from common/")
+    args = parser.parse_args()
+
+    paths = stale()
+    if args.check:
+        for path in paths:
+            print(f"❌ {path} differs from common/; run python common/sync.py")
+        sys.exit(1 if paths else 0)
+
+    for path, content in copies():
+        if os.path.relpath(path, ROOT) in paths:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            print(f"✍️ Wrote {os.path.relpath(path, ROOT)}")
+    print(f"✅ {len(copies())} copies up to date")
+
+
+if __name__ == "__main__":
+    main()
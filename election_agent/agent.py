@@ -1,10 +1,21 @@
-from uagents import Agent
+from uagents import Agent, Context
 from chat_proto import chat_proto, struct_output_client_proto
+from tracing import start_metrics_server, write_json
 
 agent = Agent()
 
 agent.include(chat_proto, publish_manifest=True)
 agent.include(struct_output_client_proto, publish_manifest=True)
 
+# Serve per-stage latency metrics when TRACING is enabled
+@agent.on_event("startup")
+async def start_tracing(ctx: Context):
+    start_metrics_server()
+
+@agent.on_event("shutdown")
+async def export_traces(ctx: Context):
+    if write_json():
+        ctx.logger.info("📈 Wrote trace summary")
+
 if __name__ == "__main__":
     agent.run()
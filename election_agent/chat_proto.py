@@ -1,4 +1,5 @@
 from datetime import datetime
+import time
 from uuid import uuid4
 from typing import Any
 
@@ -15,6 +16,20 @@ from uagents_core.contrib.protocols.chat import (
 )
 
 from election_results import get_results_from_state_yr, ResultsRequest, ResultsResponse, CandidateResult
+from gazetteer import gazetteer
+from extraction_cache import new_extraction_cache
+from tracing import record_span, span, traced
+from pending_requests import (
+    BUSY_MESSAGE,
+    CORRELATION_FIELD,
+    PENDING_SWEEP_INTERVAL,
+    PENDING_TIMEOUT,
+    TIMEOUT_MESSAGE,
+    add_pending,
+    correlated_schema,
+    expire_pending,
+    resolve_pending,
+)
 
 # AI Agent Address for structured output processing
 AI_AGENT_ADDRESS = 'agent1q0h70caed8ax769shpemapzkyk65uscw4xwk6dc4t3emvp5jdcvqs9xs32y'
@@ -22,6 +37,36 @@ AI_AGENT_ADDRESS = 'agent1q0h70caed8ax769shpemapzkyk65uscw4xwk6dc4t3emvp5jdcvqs9
 if not AI_AGENT_ADDRESS:
     raise ValueError("AI_AGENT_ADDRESS not set")
 
+extraction_cache = new_extraction_cache()
+
+ERROR_MESSAGE = "Sorry, I couldn't check the election results. Please try again later."
+
+async def build_results_reply(state: str, year: int) -> str:
+    """
+    Looks up the results for a state and year and formats the reply.
+    """
+    # Get the raw structured results for this state and year
+    response: ResultsResponse = await get_results_from_state_yr(state, year)
+    results: list[CandidateResult] = response.results
+
+    if not results:
+        return f"No results found for {state.title()} in {year}."
+
+    # Format the results
+    winner = results[0]
+    summary = (
+        f"{winner.party_detailed} candidate {winner.candidate} won {state.title()} in {year}. "
+        f"{winner.totalvotes:,} people voted in total."
+    )
+
+    vote_lines = ["Here are the vote totals:"]
+    for i, row in enumerate(results, start=1):
+        vote_lines.append(
+            f"{i}. {row.candidate} ({row.party_detailed}): {row.candidatevotes:,} votes"
+        )
+
+    return summary + "\n\n" + "\n".join(vote_lines)
+
 def create_text_chat(text: str, end_session: bool = False) -> ChatMessage:
     content = [TextContent(type="text", text=text)]
     if end_session:
@@ -44,107 +89,132 @@ class StructuredOutputPrompt(Model):
 class StructuredOutputResponse(Model):
     output: dict[str, Any]
 
-@chat_proto.on_message(ChatMessage)
-async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
-    ctx.logger.info(f"Got a message from {sender}: {msg}")
-    ctx.storage.set(str(ctx.session), sender)
-    await ctx.send(
-        sender,
-        ChatAcknowledgement(timestamp=datetime.utcnow(), acknowledged_msg_id=msg.msg_id),
-    )
-
-    for item in msg.content:
-        if isinstance(item, StartSessionContent):
-            ctx.logger.info(f"Got a start session message from {sender}")
-            continue
-        elif isinstance(item, TextContent):
-            ctx.logger.info(f"Got a message from {sender}: {item.text}")
-            ctx.storage.set(str(ctx.session), sender)
-            ctx.logger.info(f"{ResultsRequest.schema()}")
-            await ctx.send(
-                AI_AGENT_ADDRESS,
-                StructuredOutputPrompt(
-                    prompt=item.text, output_schema=ResultsRequest.schema()
-                ),
-            )
-        else:
-            ctx.logger.info(f"Got unexpected content from {sender}")
-
-@chat_proto.on_message(ChatAcknowledgement)
-async def handle_ack(ctx: Context, sender: str, msg: ChatAcknowledgement):
-    ctx.logger.info(
-        f"Got an acknowledgement from {sender} for {msg.acknowledged_msg_id}"
-    )
-
-@struct_output_client_proto.on_message(StructuredOutputResponse)
-async def handle_structured_output_response(
-    ctx: Context, sender: str, msg: StructuredOutputResponse
-):
-    session_sender = ctx.storage.get(str(ctx.session))
-    if session_sender is None:
-        ctx.logger.error(
-            "Discarding message because no session sender found in storage"
-        )
-        return
-
+async def process_output(ctx: Context, sender: str, output: dict[str, Any], cache_key: str | None = None):
+    """
+    Replies to the sender from a structured output, cached or fresh. Fresh
+    outputs that parse are cached under cache_key.
+    """
     try:
         # Parse the structured output to get state and year
-        results_request = ResultsRequest.parse_obj(msg.output)
+        results_request = ResultsRequest.parse_obj(output)
         state = results_request.state
         year = results_request.year
+        if cache_key is not None and extraction_cache is not None:
+            extraction_cache.put(cache_key, output)
 
         if state == "<UNKNOWN>" and year == "<UNKNOWN>":
             await ctx.send(
-                session_sender,
+                sender,
                 create_text_chat("Please include both a valid U.S. state and presidential election year.")
             )
             return
         if state == "<UNKNOWN>":
             await ctx.send(
-                session_sender,
+                sender,
                 create_text_chat("Sorry, I couldn't find a valid U.S. state in your query.")
             )
             return
         if year == "<UNKNOWN>":
             await ctx.send(
-                session_sender,
+                sender,
                 create_text_chat("Sorry, I couldn't find a valid election year in your query.")
             )
             return
 
-        # Get the raw structured results for this state and year
-        response: ResultsResponse = await get_results_from_state_yr(state, year)
-        results: list[CandidateResult] = response.results
+        full_text = await build_results_reply(state, year)
+        await ctx.send(sender, create_text_chat(full_text))
 
-        if not results:
-            await ctx.send(
-                session_sender,
-                create_text_chat(f"No results found for {state.title()} in {year}.")
-            )
-            return
+    except Exception as err:
+        ctx.logger.error(err)
+        await ctx.send(
+            sender,
+            create_text_chat(ERROR_MESSAGE),
+        )
+        return
 
-        # Format the results
-        winner = results[0]
-        summary = (
-            f"{winner.party_detailed} candidate {winner.candidate} won {state.title()} in {year}. "
-            f"{winner.totalvotes:,} people voted in total."
+@chat_proto.on_message(ChatMessage)
+@traced("handle_message")
+async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
+    ctx.logger.info(f"Got a message from {sender}: {msg}")
+    with span("ack"):
+        await ctx.send(
+            sender,
+            ChatAcknowledgement(timestamp=datetime.utcnow(), acknowledged_msg_id=msg.msg_id),
         )
 
-        vote_lines = ["Here are the vote totals:"]
-        for i, row in enumerate(results, start=1):
-            vote_lines.append(
-                f"{i}. {row.candidate} ({row.party_detailed}): {row.candidatevotes:,} votes"
-            )
+    for item in msg.content:
+        if isinstance(item, StartSessionContent):
+            ctx.logger.info(f"Got a start session message from {sender}")
+            continue
+        elif isinstance(item, TextContent):
+            ctx.logger.info(f"Got a message from {sender}: {item.text}")
 
-        full_text = summary + "\n\n" + "\n".join(vote_lines)
-        await ctx.send(session_sender, create_text_chat(full_text))
+            # Fast path: resolve the state and year locally, skipping the agent round trip
+            with span("local_parse"):
+                parsed = gazetteer.parse(item.text)
+            if parsed is not None:
+                state, year = parsed
+                ctx.logger.info(f"⚡ Parsed locally: {state}, {year}")
+                try:
+                    reply = await build_results_reply(state, year)
+                except Exception as err:
+                    ctx.logger.error(err)
+                    reply = ERROR_MESSAGE
+                await ctx.send(sender, create_text_chat(reply))
+                continue
+
+            # Repeated prompt: reuse the structured output extracted last time
+            cache_key = None
+            if extraction_cache is not None:
+                cache_key = extraction_cache.key(item.text)
+                output = extraction_cache.get(cache_key)
+                if output is not None:
+                    ctx.logger.info(f"Extraction cache hit ({extraction_cache.stats()})")
+                    await process_output(ctx, sender, output)
+                    continue
+
+            request_id = add_pending(ctx.storage, ctx.session, sender, cache_key=cache_key)
+            if request_id is None:
+                await ctx.send(sender, create_text_chat(BUSY_MESSAGE))
+                continue
+            ctx.logger.info(f"Queued request {request_id} for structured output")
+            with span("structured_output_send"):
+                await ctx.send(
+                    AI_AGENT_ADDRESS,
+                    StructuredOutputPrompt(
+                        prompt=item.text, output_schema=correlated_schema(ResultsRequest.schema(), request_id)
+                    ),
+                )
+        else:
+            ctx.logger.info(f"Got unexpected content from {sender}")
 
-    except Exception as err:
-        ctx.logger.error(err)
-        await ctx.send(
-            session_sender,
-            create_text_chat(
-                "Sorry, I couldn't check the election results. Please try again later."
-            ),
+@struct_output_client_proto.on_interval(period=PENDING_SWEEP_INTERVAL)
+async def expire_pending_requests(ctx: Context):
+    for request in expire_pending(ctx.storage):
+        ctx.logger.warning(f"⏱️ Request {request['id']} timed out after {PENDING_TIMEOUT:.0f}s")
+        await ctx.send(request["sender"], create_text_chat(TIMEOUT_MESSAGE))
+
+@chat_proto.on_message(ChatAcknowledgement)
+async def handle_ack(ctx: Context, sender: str, msg: ChatAcknowledgement):
+    ctx.logger.info(
+        f"Got an acknowledgement from {sender} for {msg.acknowledged_msg_id}"
+    )
+
+@struct_output_client_proto.on_message(StructuredOutputResponse)
+@traced("handle_structured_output")
+async def handle_structured_output_response(
+    ctx: Context, sender: str, msg: StructuredOutputResponse
+):
+    output = dict(msg.output)
+    request = resolve_pending(ctx.storage, ctx.session, output.pop(CORRELATION_FIELD, None))
+    if request is None:
+        ctx.logger.error(
+            "Discarding message because no pending request was found for this session"
         )
         return
+    session_sender = request["sender"]
+    # Only cache extractions known to belong to this request's prompt
+    cache_key = request["data"].get("cache_key") if request["correlated"] else None
+    record_span("structured_output_round_trip", time.time() - request["created"], ctx.session)
+
+    await process_output(ctx, session_sender, output, cache_key)
@@ -1,4290 +0,0 @@
-# Auto-generated from 1976-2020-president.csv
-data = [
-    {'year': 1976, 'state': 'ALABAMA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 659170, 'totalvotes': 1182850},
-    {'year': 1976, 'state': 'ALABAMA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 504070, 'totalvotes': 1182850},
-    {'year': 1976, 'state': 'ALABAMA', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 9198, 'totalvotes': 1182850},
-    {'year': 1976, 'state': 'ALABAMA', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'PROHIBITION', 'candidatevotes': 6669, 'totalvotes': 1182850},
-    {'year': 1976, 'state': 'ALABAMA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 1954, 'totalvotes': 1182850},
-    {'year': 1976, 'state': 'ALABAMA', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1481, 'totalvotes': 1182850},
-    {'year': 1976, 'state': 'ALABAMA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 308, 'totalvotes': 1182850},
-    {'year': 1976, 'state': 'ALASKA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 71555, 'totalvotes': 123574},
-    {'year': 1976, 'state': 'ALASKA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 44058, 'totalvotes': 123574},
-    {'year': 1976, 'state': 'ALASKA', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6785, 'totalvotes': 123574},
-    {'year': 1976, 'state': 'ALASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1176, 'totalvotes': 123574},
-    {'year': 1976, 'state': 'ARIZONA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 418642, 'totalvotes': 742719},
-    {'year': 1976, 'state': 'ARIZONA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 295602, 'totalvotes': 742719},
-    {'year': 1976, 'state': 'ARIZONA', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 19229, 'totalvotes': 742719},
-    {'year': 1976, 'state': 'ARIZONA', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7647, 'totalvotes': 742719},
-    {'year': 1976, 'state': 'ARIZONA', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 928, 'totalvotes': 742719},
-    {'year': 1976, 'state': 'ARIZONA', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 564, 'totalvotes': 742719},
-    {'year': 1976, 'state': 'ARIZONA', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 85, 'totalvotes': 742719},
-    {'year': 1976, 'state': 'ARIZONA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 22, 'totalvotes': 742719},
-    {'year': 1976, 'state': 'ARKANSAS', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 498604, 'totalvotes': 767535},
-    {'year': 1976, 'state': 'ARKANSAS', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 267903, 'totalvotes': 767535},
-    {'year': 1976, 'state': 'ARKANSAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 639, 'totalvotes': 767535},
-    {'year': 1976, 'state': 'ARKANSAS', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 389, 'totalvotes': 767535},
-    {'year': 1976, 'state': 'CALIFORNIA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 3882244, 'totalvotes': 7803770},
-    {'year': 1976, 'state': 'CALIFORNIA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3742284, 'totalvotes': 7803770},
-    {'year': 1976, 'state': 'CALIFORNIA', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 56388, 'totalvotes': 7803770},
-    {'year': 1976, 'state': 'CALIFORNIA', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 51098, 'totalvotes': 7803770},
-    {'year': 1976, 'state': 'CALIFORNIA', 'candidate': 'WRIGHT, MARGARET', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 41731, 'totalvotes': 7803770},
-    {'year': 1976, 'state': 'CALIFORNIA', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 17259, 'totalvotes': 7803770},
-    {'year': 1976, 'state': 'CALIFORNIA', 'candidate': 'HALL, GUS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 12766, 'totalvotes': 7803770},
-    {'year': 1976, 'state': 'COLORADO', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 584278, 'totalvotes': 1081440},
-    {'year': 1976, 'state': 'COLORADO', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 460801, 'totalvotes': 1081440},
-    {'year': 1976, 'state': 'COLORADO', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 26047, 'totalvotes': 1081440},
-    {'year': 1976, 'state': 'COLORADO', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5338, 'totalvotes': 1081440},
-    {'year': 1976, 'state': 'COLORADO', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'PROHIBITION', 'candidatevotes': 2886, 'totalvotes': 1081440},
-    {'year': 1976, 'state': 'COLORADO', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1122, 'totalvotes': 1081440},
-    {'year': 1976, 'state': 'COLORADO', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 565, 'totalvotes': 1081440},
-    {'year': 1976, 'state': 'COLORADO', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 403, 'totalvotes': 1081440},
-    {'year': 1976, 'state': 'CONNECTICUT', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 719261, 'totalvotes': 1386355},
-    {'year': 1976, 'state': 'CONNECTICUT', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 647895, 'totalvotes': 1386355},
-    {'year': 1976, 'state': 'CONNECTICUT', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 10309, 'totalvotes': 1386355},
-    {'year': 1976, 'state': 'CONNECTICUT', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 7101, 'totalvotes': 1386355},
-    {'year': 1976, 'state': 'CONNECTICUT', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 1789, 'totalvotes': 1386355},
-    {'year': 1976, 'state': 'DELAWARE', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 122461, 'totalvotes': 235642},
-    {'year': 1976, 'state': 'DELAWARE', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 109780, 'totalvotes': 235642},
-    {'year': 1976, 'state': 'DELAWARE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'NO PARTY AFFILIATION', 'candidatevotes': 2432, 'totalvotes': 235642},
-    {'year': 1976, 'state': 'DELAWARE', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 645, 'totalvotes': 235642},
-    {'year': 1976, 'state': 'DELAWARE', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 135, 'totalvotes': 235642},
-    {'year': 1976, 'state': 'DELAWARE', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'PROHIBITION', 'candidatevotes': 103, 'totalvotes': 235642},
-    {'year': 1976, 'state': 'DELAWARE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'SOCIALIST LABOR', 'candidatevotes': 86, 'totalvotes': 235642},
-    {'year': 1976, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 137818, 'totalvotes': 168830},
-    {'year': 1976, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 27873, 'totalvotes': 168830},
-    {'year': 1976, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 1656, 'totalvotes': 168830},
-    {'year': 1976, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1195, 'totalvotes': 168830},
-    {'year': 1976, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 288, 'totalvotes': 168830},
-    {'year': 1976, 'state': 'FLORIDA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1636000, 'totalvotes': 3150631},
-    {'year': 1976, 'state': 'FLORIDA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1469531, 'totalvotes': 3150631},
-    {'year': 1976, 'state': 'FLORIDA', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 23643, 'totalvotes': 3150631},
-    {'year': 1976, 'state': 'FLORIDA', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 21325, 'totalvotes': 3150631},
-    {'year': 1976, 'state': 'FLORIDA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 132, 'totalvotes': 3150631},
-    {'year': 1976, 'state': 'GEORGIA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 979409, 'totalvotes': 1463152},
-    {'year': 1976, 'state': 'GEORGIA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 483743, 'totalvotes': 1463152},
-    {'year': 1976, 'state': 'HAWAII', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 147375, 'totalvotes': 291301},
-    {'year': 1976, 'state': 'HAWAII', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 140003, 'totalvotes': 291301},
-    {'year': 1976, 'state': 'HAWAII', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3923, 'totalvotes': 291301},
-    {'year': 1976, 'state': 'IDAHO', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 204151, 'totalvotes': 340932},
-    {'year': 1976, 'state': 'IDAHO', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 126549, 'totalvotes': 340932},
-    {'year': 1976, 'state': 'IDAHO', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN', 'candidatevotes': 5935, 'totalvotes': 340932},
-    {'year': 1976, 'state': 'IDAHO', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3558, 'totalvotes': 340932},
-    {'year': 1976, 'state': 'IDAHO', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 739, 'totalvotes': 340932},
-    {'year': 1976, 'state': 'ILLINOIS', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2364269, 'totalvotes': 4721282},
-    {'year': 1976, 'state': 'ILLINOIS', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2271295, 'totalvotes': 4721282},
-    {'year': 1976, 'state': 'ILLINOIS', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 55939, 'totalvotes': 4721282},
-    {'year': 1976, 'state': 'ILLINOIS', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 9250, 'totalvotes': 4721282},
-    {'year': 1976, 'state': 'ILLINOIS', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8057, 'totalvotes': 4721282},
-    {'year': 1976, 'state': 'ILLINOIS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 4417, 'totalvotes': 4721282},
-    {'year': 1976, 'state': 'ILLINOIS', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 3615, 'totalvotes': 4721282},
-    {'year': 1976, 'state': 'ILLINOIS', 'candidate': 'JULIUS ""JULES"", LEVIN', 'party_detailed': 'SOCIALIST LABOR', 'candidatevotes': 2422, 'totalvotes': 4721282},
-    {'year': 1976, 'state': 'ILLINOIS', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 2018, 'totalvotes': 4721282},
-    {'year': 1976, 'state': 'INDIANA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1183958, 'totalvotes': 2220362},
-    {'year': 1976, 'state': 'INDIANA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1014714, 'totalvotes': 2220362},
-    {'year': 1976, 'state': 'INDIANA', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 14048, 'totalvotes': 2220362},
-    {'year': 1976, 'state': 'INDIANA', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 5695, 'totalvotes': 2220362},
-    {'year': 1976, 'state': 'INDIANA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 1947, 'totalvotes': 2220362},
-    {'year': 1976, 'state': 'IOWA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 632864, 'totalvotes': 1279303},
-    {'year': 1976, 'state': 'IOWA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 619931, 'totalvotes': 1279303},
-    {'year': 1976, 'state': 'IOWA', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 20057, 'totalvotes': 1279303},
-    {'year': 1976, 'state': 'IOWA', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN PARTY OF IOWA', 'candidatevotes': 3041, 'totalvotes': 1279303},
-    {'year': 1976, 'state': 'IOWA', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1454, 'totalvotes': 1279303},
-    {'year': 1976, 'state': 'IOWA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 551, 'totalvotes': 1279303},
-    {'year': 1976, 'state': 'IOWA', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 509, 'totalvotes': 1279303},
-    {'year': 1976, 'state': 'IOWA', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 262, 'totalvotes': 1279303},
-    {'year': 1976, 'state': 'IOWA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 241, 'totalvotes': 1279303},
-    {'year': 1976, 'state': 'IOWA', 'candidate': 'ZEIDLER, FRANK', 'party_detailed': 'SOCIALIST U.S.A.', 'candidatevotes': 233, 'totalvotes': 1279303},
-    {'year': 1976, 'state': 'IOWA', 'candidate': 'JULIUS ""JULES"", LEVIN', 'party_detailed': 'SOCIALIST LABOR', 'candidatevotes': 160, 'totalvotes': 1279303},
-    {'year': 1976, 'state': 'KANSAS', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 502752, 'totalvotes': 957845},
-    {'year': 1976, 'state': 'KANSAS', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 430421, 'totalvotes': 957845},
-    {'year': 1976, 'state': 'KANSAS', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 13185, 'totalvotes': 957845},
-    {'year': 1976, 'state': 'KANSAS', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 4724, 'totalvotes': 957845},
-    {'year': 1976, 'state': 'KANSAS', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3242, 'totalvotes': 957845},
-    {'year': 1976, 'state': 'KANSAS', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 2118, 'totalvotes': 957845},
-    {'year': 1976, 'state': 'KANSAS', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'PROHIBITION', 'candidatevotes': 1403, 'totalvotes': 957845},
-    {'year': 1976, 'state': 'KENTUCKY', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 615717, 'totalvotes': 1167142},
-    {'year': 1976, 'state': 'KENTUCKY', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 531852, 'totalvotes': 1167142},
-    {'year': 1976, 'state': 'KENTUCKY', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 8308, 'totalvotes': 1167142},
-    {'year': 1976, 'state': 'KENTUCKY', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 6837, 'totalvotes': 1167142},
-    {'year': 1976, 'state': 'KENTUCKY', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 2328, 'totalvotes': 1167142},
-    {'year': 1976, 'state': 'KENTUCKY', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 814, 'totalvotes': 1167142},
-    {'year': 1976, 'state': 'KENTUCKY', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 510, 'totalvotes': 1167142},
-    {'year': 1976, 'state': 'KENTUCKY', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 426, 'totalvotes': 1167142},
-    {'year': 1976, 'state': 'KENTUCKY', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 350, 'totalvotes': 1167142},
-    {'year': 1976, 'state': 'LOUISIANA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 661365, 'totalvotes': 1277383},
-    {'year': 1976, 'state': 'LOUISIANA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 587446, 'totalvotes': 1277383},
-    {'year': 1976, 'state': 'LOUISIANA', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 10058, 'totalvotes': 1277383},
-    {'year': 1976, 'state': 'LOUISIANA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 7417, 'totalvotes': 1277383},
-    {'year': 1976, 'state': 'LOUISIANA', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 6490, 'totalvotes': 1277383},
-    {'year': 1976, 'state': 'LOUISIANA', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3134, 'totalvotes': 1277383},
-    {'year': 1976, 'state': 'LOUISIANA', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1473, 'totalvotes': 1277383},
-    {'year': 1976, 'state': 'MAINE', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 236320, 'totalvotes': 482968},
-    {'year': 1976, 'state': 'MAINE', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 232279, 'totalvotes': 482968},
-    {'year': 1976, 'state': 'MAINE', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 10874, 'totalvotes': 482968},
-    {'year': 1976, 'state': 'MAINE', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'PROHIBITION', 'candidatevotes': 3495, 'totalvotes': 482968},
-    {'year': 1976, 'state': 'MARYLAND', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 759612, 'totalvotes': 1432273},
-    {'year': 1976, 'state': 'MARYLAND', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 672661, 'totalvotes': 1432273},
-    {'year': 1976, 'state': 'MASSACHUSETTS', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1429475, 'totalvotes': 2547558},
-    {'year': 1976, 'state': 'MASSACHUSETTS', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1030276, 'totalvotes': 2547558},
-    {'year': 1976, 'state': 'MASSACHUSETTS', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 65637, 'totalvotes': 2547558},
-    {'year': 1976, 'state': 'MASSACHUSETTS', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 8138, 'totalvotes': 2547558},
-    {'year': 1976, 'state': 'MASSACHUSETTS', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 7555, 'totalvotes': 2547558},
-    {'year': 1976, 'state': 'MASSACHUSETTS', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 4922, 'totalvotes': 2547558},
-    {'year': 1976, 'state': 'MASSACHUSETTS', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 1401, 'totalvotes': 2547558},
-    {'year': 1976, 'state': 'MASSACHUSETTS', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 135, 'totalvotes': 2547558},
-    {'year': 1976, 'state': 'MASSACHUSETTS', 'candidate': 'JULIUS ""JULES"", LEVIN', 'party_detailed': 'SOCIALIST LABOR', 'candidatevotes': 19, 'totalvotes': 2547558},
-    {'year': 1976, 'state': 'MICHIGAN', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1893742, 'totalvotes': 3651590},
-    {'year': 1976, 'state': 'MICHIGAN', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1696714, 'totalvotes': 3651590},
-    {'year': 1976, 'state': 'MICHIGAN', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 47905, 'totalvotes': 3651590},
-    {'year': 1976, 'state': 'MICHIGAN', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5407, 'totalvotes': 3651590},
-    {'year': 1976, 'state': 'MICHIGAN', 'candidate': 'WRIGHT, MARGARET', 'party_detailed': 'HUMAN RIGHTS', 'candidatevotes': 3504, 'totalvotes': 3651590},
-    {'year': 1976, 'state': 'MICHIGAN', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1804, 'totalvotes': 3651590},
-    {'year': 1976, 'state': 'MICHIGAN', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 1366, 'totalvotes': 3651590},
-    {'year': 1976, 'state': 'MICHIGAN', 'candidate': 'JULIUS ""JULES"", LEVIN', 'party_detailed': 'SOCIALIST LABOR', 'candidatevotes': 1148, 'totalvotes': 3651590},
-    {'year': 1976, 'state': 'MINNESOTA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1070440, 'totalvotes': 1949931},
-    {'year': 1976, 'state': 'MINNESOTA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 819395, 'totalvotes': 1949931},
-    {'year': 1976, 'state': 'MINNESOTA', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': "MCCARTHY '76", 'candidatevotes': 35490, 'totalvotes': 1949931},
-    {'year': 1976, 'state': 'MINNESOTA', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 13592, 'totalvotes': 1949931},
-    {'year': 1976, 'state': 'MINNESOTA', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 4149, 'totalvotes': 1949931},
-    {'year': 1976, 'state': 'MINNESOTA', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3529, 'totalvotes': 1949931},
-    {'year': 1976, 'state': 'MINNESOTA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 1092, 'totalvotes': 1949931},
-    {'year': 1976, 'state': 'MINNESOTA', 'candidate': 'WRIGHT, MARGARET', 'party_detailed': "PEOPLE'S", 'candidatevotes': 635, 'totalvotes': 1949931},
-    {'year': 1976, 'state': 'MINNESOTA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INTERNATIONAL DEVELOPMENT BANK', 'candidatevotes': 543, 'totalvotes': 1949931},
-    {'year': 1976, 'state': 'MINNESOTA', 'candidate': 'JULIUS ""JULES"", LEVIN', 'party_detailed': 'INDUSTRIAL GOVERNMENT PARTY', 'candidatevotes': 370, 'totalvotes': 1949931},
-    {'year': 1976, 'state': 'MINNESOTA', 'candidate': 'ZEIDLER, FRANK', 'party_detailed': 'SOCIALIST', 'candidatevotes': 354, 'totalvotes': 1949931},
-    {'year': 1976, 'state': 'MINNESOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 342, 'totalvotes': 1949931},
-    {'year': 1976, 'state': 'MISSISSIPPI', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 381329, 'totalvotes': 768390},
-    {'year': 1976, 'state': 'MISSISSIPPI', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 366846, 'totalvotes': 768390},
-    {'year': 1976, 'state': 'MISSISSIPPI', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 6678, 'totalvotes': 768390},
-    {'year': 1976, 'state': 'MISSISSIPPI', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4074, 'totalvotes': 768390},
-    {'year': 1976, 'state': 'MISSISSIPPI', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 4049, 'totalvotes': 768390},
-    {'year': 1976, 'state': 'MISSISSIPPI', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 2805, 'totalvotes': 768390},
-    {'year': 1976, 'state': 'MISSISSIPPI', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2609, 'totalvotes': 768390},
-    {'year': 1976, 'state': 'MISSOURI', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 998387, 'totalvotes': 1953600},
-    {'year': 1976, 'state': 'MISSOURI', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 927443, 'totalvotes': 1953600},
-    {'year': 1976, 'state': 'MISSOURI', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 24029, 'totalvotes': 1953600},
-    {'year': 1976, 'state': 'MISSOURI', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 3741, 'totalvotes': 1953600},
-    {'year': 1976, 'state': 'MONTANA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 173703, 'totalvotes': 328734},
-    {'year': 1976, 'state': 'MONTANA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 149259, 'totalvotes': 328734},
-    {'year': 1976, 'state': 'MONTANA', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 5772, 'totalvotes': 328734},
-    {'year': 1976, 'state': 'NEBRASKA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 359219, 'totalvotes': 606749},
-    {'year': 1976, 'state': 'NEBRASKA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 233293, 'totalvotes': 606749},
-    {'year': 1976, 'state': 'NEBRASKA', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 9383, 'totalvotes': 606749},
-    {'year': 1976, 'state': 'NEBRASKA', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 3378, 'totalvotes': 606749},
-    {'year': 1976, 'state': 'NEBRASKA', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1476, 'totalvotes': 606749},
-    {'year': 1976, 'state': 'NEVADA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 101273, 'totalvotes': 201876},
-    {'year': 1976, 'state': 'NEVADA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 92479, 'totalvotes': 201876},
-    {'year': 1976, 'state': 'NEVADA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 5108, 'totalvotes': 201876},
-    {'year': 1976, 'state': 'NEVADA', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1519, 'totalvotes': 201876},
-    {'year': 1976, 'state': 'NEVADA', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 1497, 'totalvotes': 201876},
-    {'year': 1976, 'state': 'NEW HAMPSHIRE', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 185935, 'totalvotes': 339627},
-    {'year': 1976, 'state': 'NEW HAMPSHIRE', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 147645, 'totalvotes': 339627},
-    {'year': 1976, 'state': 'NEW HAMPSHIRE', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4095, 'totalvotes': 339627},
-    {'year': 1976, 'state': 'NEW HAMPSHIRE', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 936, 'totalvotes': 339627},
-    {'year': 1976, 'state': 'NEW HAMPSHIRE', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 603, 'totalvotes': 339627},
-    {'year': 1976, 'state': 'NEW HAMPSHIRE', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 186, 'totalvotes': 339627},
-    {'year': 1976, 'state': 'NEW HAMPSHIRE', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 161, 'totalvotes': 339627},
-    {'year': 1976, 'state': 'NEW HAMPSHIRE', 'candidate': 'JULIUS ""JULES"", LEVIN', 'party_detailed': 'SOCIALIST LABOR', 'candidatevotes': 66, 'totalvotes': 339627},
-    {'year': 1976, 'state': 'NEW JERSEY', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1509688, 'totalvotes': 3014472},
-    {'year': 1976, 'state': 'NEW JERSEY', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1444653, 'totalvotes': 3014472},
-    {'year': 1976, 'state': 'NEW JERSEY', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 32717, 'totalvotes': 3014472},
-    {'year': 1976, 'state': 'NEW JERSEY', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9449, 'totalvotes': 3014472},
-    {'year': 1976, 'state': 'NEW JERSEY', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 7716, 'totalvotes': 3014472},
-    {'year': 1976, 'state': 'NEW JERSEY', 'candidate': 'JULIUS ""JULES"", LEVIN', 'party_detailed': 'SOCIALIST LABOR', 'candidatevotes': 3686, 'totalvotes': 3014472},
-    {'year': 1976, 'state': 'NEW JERSEY', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 1662, 'totalvotes': 3014472},
-    {'year': 1976, 'state': 'NEW JERSEY', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 1650, 'totalvotes': 3014472},
-    {'year': 1976, 'state': 'NEW JERSEY', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1184, 'totalvotes': 3014472},
-    {'year': 1976, 'state': 'NEW JERSEY', 'candidate': 'WRIGHT, MARGARET', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 1044, 'totalvotes': 3014472},
-    {'year': 1976, 'state': 'NEW JERSEY', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'PROHIBITION', 'candidatevotes': 554, 'totalvotes': 3014472},
-    {'year': 1976, 'state': 'NEW JERSEY', 'candidate': 'ZEIDLER, FRANK', 'party_detailed': 'SOCIALIST', 'candidatevotes': 469, 'totalvotes': 3014472},
-    {'year': 1976, 'state': 'NEW MEXICO', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 211419, 'totalvotes': 416590},
-    {'year': 1976, 'state': 'NEW MEXICO', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 201148, 'totalvotes': 416590},
-    {'year': 1976, 'state': 'NEW MEXICO', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 2462, 'totalvotes': 416590},
-    {'year': 1976, 'state': 'NEW MEXICO', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1110, 'totalvotes': 416590},
-    {'year': 1976, 'state': 'NEW MEXICO', 'candidate': 'ZEIDLER, FRANK', 'party_detailed': 'SOCIALIST', 'candidatevotes': 240, 'totalvotes': 416590},
-    {'year': 1976, 'state': 'NEW MEXICO', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'PROHIBITION', 'candidatevotes': 211, 'totalvotes': 416590},
-    {'year': 1976, 'state': 'NEW YORK', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3244165, 'totalvotes': 6668262},
-    {'year': 1976, 'state': 'NEW YORK', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2825913, 'totalvotes': 6668262},
-    {'year': 1976, 'state': 'NEW YORK', 'candidate': 'FORD, GERALD', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 274878, 'totalvotes': 6668262},
-    {'year': 1976, 'state': 'NEW YORK', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'LIBERAL PARTY', 'candidatevotes': 145393, 'totalvotes': 6668262},
-    {'year': 1976, 'state': 'NEW YORK', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 143037, 'totalvotes': 6668262},
-    {'year': 1976, 'state': 'NEW YORK', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'FREE LIBERTARIAN', 'candidatevotes': 12197, 'totalvotes': 6668262},
-    {'year': 1976, 'state': 'NEW YORK', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 10270, 'totalvotes': 6668262},
-    {'year': 1976, 'state': 'NEW YORK', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 6996, 'totalvotes': 6668262},
-    {'year': 1976, 'state': 'NEW YORK', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'LABOR', 'candidatevotes': 5413, 'totalvotes': 6668262},
-    {'year': 1976, 'state': 'NORTH CAROLINA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 927365, 'totalvotes': 1677906},
-    {'year': 1976, 'state': 'NORTH CAROLINA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 741960, 'totalvotes': 1677906},
-    {'year': 1976, 'state': 'NORTH CAROLINA', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 5607, 'totalvotes': 1677906},
-    {'year': 1976, 'state': 'NORTH CAROLINA', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2219, 'totalvotes': 1677906},
-    {'year': 1976, 'state': 'NORTH CAROLINA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 755, 'totalvotes': 1677906},
-    {'year': 1976, 'state': 'NORTH DAKOTA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 153684, 'totalvotes': 297308},
-    {'year': 1976, 'state': 'NORTH DAKOTA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 136078, 'totalvotes': 297308},
-    {'year': 1976, 'state': 'NORTH DAKOTA', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 3698, 'totalvotes': 297308},
-    {'year': 1976, 'state': 'NORTH DAKOTA', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2952, 'totalvotes': 297308},
-    {'year': 1976, 'state': 'NORTH DAKOTA', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 269, 'totalvotes': 297308},
-    {'year': 1976, 'state': 'NORTH DAKOTA', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 256, 'totalvotes': 297308},
-    {'year': 1976, 'state': 'NORTH DAKOTA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 142, 'totalvotes': 297308},
-    {'year': 1976, 'state': 'NORTH DAKOTA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 85, 'totalvotes': 297308},
-    {'year': 1976, 'state': 'NORTH DAKOTA', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'PROHIBITION', 'candidatevotes': 63, 'totalvotes': 297308},
-    {'year': 1976, 'state': 'NORTH DAKOTA', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 43, 'totalvotes': 297308},
-    {'year': 1976, 'state': 'NORTH DAKOTA', 'candidate': 'ZEIDLER, FRANK', 'party_detailed': 'SOCIALIST', 'candidatevotes': 38, 'totalvotes': 297308},
-    {'year': 1976, 'state': 'OHIO', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2009959, 'totalvotes': 4110456},
-    {'year': 1976, 'state': 'OHIO', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2000626, 'totalvotes': 4110456},
-    {'year': 1976, 'state': 'OHIO', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 58267, 'totalvotes': 4110456},
-    {'year': 1976, 'state': 'OHIO', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 15508, 'totalvotes': 4110456},
-    {'year': 1976, 'state': 'OHIO', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8952, 'totalvotes': 4110456},
-    {'year': 1976, 'state': 'OHIO', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 7817, 'totalvotes': 4110456},
-    {'year': 1976, 'state': 'OHIO', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 4833, 'totalvotes': 4110456},
-    {'year': 1976, 'state': 'OHIO', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 4364, 'totalvotes': 4110456},
-    {'year': 1976, 'state': 'OHIO', 'candidate': 'JULIUS ""JULES"", LEVIN', 'party_detailed': 'SOCIALIST LABOR', 'candidatevotes': 68, 'totalvotes': 4110456},
-    {'year': 1976, 'state': 'OHIO', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'PROHIBITION', 'candidatevotes': 62, 'totalvotes': 4110456},
-    {'year': 1976, 'state': 'OKLAHOMA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 545708, 'totalvotes': 1092251},
-    {'year': 1976, 'state': 'OKLAHOMA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 532442, 'totalvotes': 1092251},
-    {'year': 1976, 'state': 'OKLAHOMA', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 14101, 'totalvotes': 1092251},
-    {'year': 1976, 'state': 'OREGON', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 492120, 'totalvotes': 1029876},
-    {'year': 1976, 'state': 'OREGON', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 490407, 'totalvotes': 1029876},
-    {'year': 1976, 'state': 'OREGON', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 40207, 'totalvotes': 1029876},
-    {'year': 1976, 'state': 'OREGON', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 6107, 'totalvotes': 1029876},
-    {'year': 1976, 'state': 'OREGON', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 1035, 'totalvotes': 1029876},
-    {'year': 1976, 'state': 'PENNSYLVANIA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2328677, 'totalvotes': 4620787},
-    {'year': 1976, 'state': 'PENNSYLVANIA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2205604, 'totalvotes': 4620787},
-    {'year': 1976, 'state': 'PENNSYLVANIA', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': "MCCARTHY '76", 'candidatevotes': 50584, 'totalvotes': 4620787},
-    {'year': 1976, 'state': 'PENNSYLVANIA', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 25344, 'totalvotes': 4620787},
-    {'year': 1976, 'state': 'PENNSYLVANIA', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 3009, 'totalvotes': 4620787},
-    {'year': 1976, 'state': 'PENNSYLVANIA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 2934, 'totalvotes': 4620787},
-    {'year': 1976, 'state': 'PENNSYLVANIA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 2744, 'totalvotes': 4620787},
-    {'year': 1976, 'state': 'PENNSYLVANIA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 1891, 'totalvotes': 4620787},
-    {'year': 1976, 'state': 'RHODE ISLAND', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 227636, 'totalvotes': 410584},
-    {'year': 1976, 'state': 'RHODE ISLAND', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 181249, 'totalvotes': 410584},
-    {'year': 1976, 'state': 'RHODE ISLAND', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 715, 'totalvotes': 410584},
-    {'year': 1976, 'state': 'RHODE ISLAND', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 462, 'totalvotes': 410584},
-    {'year': 1976, 'state': 'RHODE ISLAND', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 334, 'totalvotes': 410584},
-    {'year': 1976, 'state': 'RHODE ISLAND', 'candidate': 'JULIUS ""JULES"", LEVIN', 'party_detailed': 'SOCIALIST LABOR', 'candidatevotes': 188, 'totalvotes': 410584},
-    {'year': 1976, 'state': 'SOUTH CAROLINA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 450807, 'totalvotes': 802583},
-    {'year': 1976, 'state': 'SOUTH CAROLINA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 346149, 'totalvotes': 802583},
-    {'year': 1976, 'state': 'SOUTH CAROLINA', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 2996, 'totalvotes': 802583},
-    {'year': 1976, 'state': 'SOUTH CAROLINA', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 1950, 'totalvotes': 802583},
-    {'year': 1976, 'state': 'SOUTH CAROLINA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 681, 'totalvotes': 802583},
-    {'year': 1976, 'state': 'SOUTH DAKOTA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 151505, 'totalvotes': 300678},
-    {'year': 1976, 'state': 'SOUTH DAKOTA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 147068, 'totalvotes': 300678},
-    {'year': 1976, 'state': 'SOUTH DAKOTA', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1619, 'totalvotes': 300678},
-    {'year': 1976, 'state': 'SOUTH DAKOTA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 318, 'totalvotes': 300678},
-    {'year': 1976, 'state': 'SOUTH DAKOTA', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 168, 'totalvotes': 300678},
-    {'year': 1976, 'state': 'TENNESSEE', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 825879, 'totalvotes': 1476346},
-    {'year': 1976, 'state': 'TENNESSEE', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 633969, 'totalvotes': 1476346},
-    {'year': 1976, 'state': 'TENNESSEE', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 5769, 'totalvotes': 1476346},
-    {'year': 1976, 'state': 'TENNESSEE', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 5004, 'totalvotes': 1476346},
-    {'year': 1976, 'state': 'TENNESSEE', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2303, 'totalvotes': 1476346},
-    {'year': 1976, 'state': 'TENNESSEE', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1375, 'totalvotes': 1476346},
-    {'year': 1976, 'state': 'TENNESSEE', 'candidate': 'HALL, GUS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 547, 'totalvotes': 1476346},
-    {'year': 1976, 'state': 'TENNESSEE', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 512, 'totalvotes': 1476346},
-    {'year': 1976, 'state': 'TENNESSEE', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 442, 'totalvotes': 1476346},
-    {'year': 1976, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 316, 'totalvotes': 1476346},
-    {'year': 1976, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 230, 'totalvotes': 1476346},
-    {'year': 1976, 'state': 'TEXAS', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2082319, 'totalvotes': 4071884},
-    {'year': 1976, 'state': 'TEXAS', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1953300, 'totalvotes': 4071884},
-    {'year': 1976, 'state': 'TEXAS', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 20118, 'totalvotes': 4071884},
-    {'year': 1976, 'state': 'TEXAS', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 11442, 'totalvotes': 4071884},
-    {'year': 1976, 'state': 'TEXAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2982, 'totalvotes': 4071884},
-    {'year': 1976, 'state': 'TEXAS', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1723, 'totalvotes': 4071884},
-    {'year': 1976, 'state': 'UTAH', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 337908, 'totalvotes': 541218},
-    {'year': 1976, 'state': 'UTAH', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 182110, 'totalvotes': 541218},
-    {'year': 1976, 'state': 'UTAH', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 13304, 'totalvotes': 541218},
-    {'year': 1976, 'state': 'UTAH', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3907, 'totalvotes': 541218},
-    {'year': 1976, 'state': 'UTAH', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERAL PARTY', 'candidatevotes': 2438, 'totalvotes': 541218},
-    {'year': 1976, 'state': 'UTAH', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'CONCERNED CITIZENS', 'candidatevotes': 1162, 'totalvotes': 541218},
-    {'year': 1976, 'state': 'UTAH', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 268, 'totalvotes': 541218},
-    {'year': 1976, 'state': 'UTAH', 'candidate': 'HALL, GUS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 121, 'totalvotes': 541218},
-    {'year': 1976, 'state': 'VERMONT', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 100387, 'totalvotes': 183902},
-    {'year': 1976, 'state': 'VERMONT', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 77798, 'totalvotes': 183902},
-    {'year': 1976, 'state': 'VERMONT', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4001, 'totalvotes': 183902},
-    {'year': 1976, 'state': 'VERMONT', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 1090, 'totalvotes': 183902},
-    {'year': 1976, 'state': 'VERMONT', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 430, 'totalvotes': 183902},
-    {'year': 1976, 'state': 'VERMONT', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 196, 'totalvotes': 183902},
-    {'year': 1976, 'state': 'VIRGINIA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 836554, 'totalvotes': 1697094},
-    {'year': 1976, 'state': 'VIRGINIA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 813896, 'totalvotes': 1697094},
-    {'year': 1976, 'state': 'VIRGINIA', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 17802, 'totalvotes': 1697094},
-    {'year': 1976, 'state': 'VIRGINIA', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'AMERICAN', 'candidatevotes': 16686, 'totalvotes': 1697094},
-    {'year': 1976, 'state': 'VIRGINIA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 7508, 'totalvotes': 1697094},
-    {'year': 1976, 'state': 'VIRGINIA', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4648, 'totalvotes': 1697094},
-    {'year': 1976, 'state': 'WASHINGTON', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 777732, 'totalvotes': 1555534},
-    {'year': 1976, 'state': 'WASHINGTON', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 717323, 'totalvotes': 1555534},
-    {'year': 1976, 'state': 'WASHINGTON', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 36986, 'totalvotes': 1555534},
-    {'year': 1976, 'state': 'WASHINGTON', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 8585, 'totalvotes': 1555534},
-    {'year': 1976, 'state': 'WASHINGTON', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 5482, 'totalvotes': 1555534},
-    {'year': 1976, 'state': 'WASHINGTON', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5042, 'totalvotes': 1555534},
-    {'year': 1976, 'state': 'WASHINGTON', 'candidate': 'ANDERSON, THOMAS J.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1046, 'totalvotes': 1555534},
-    {'year': 1976, 'state': 'WASHINGTON', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 905, 'totalvotes': 1555534},
-    {'year': 1976, 'state': 'WASHINGTON', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'U.S. LABOR', 'candidatevotes': 903, 'totalvotes': 1555534},
-    {'year': 1976, 'state': 'WASHINGTON', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 817, 'totalvotes': 1555534},
-    {'year': 1976, 'state': 'WASHINGTON', 'candidate': 'JULIUS ""JULES"", LEVIN', 'party_detailed': 'SOCIALIST LABOR', 'candidatevotes': 713, 'totalvotes': 1555534},
-    {'year': 1976, 'state': 'WEST VIRGINIA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 435864, 'totalvotes': 750590},
-    {'year': 1976, 'state': 'WEST VIRGINIA', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 314726, 'totalvotes': 750590},
-    {'year': 1976, 'state': 'WISCONSIN', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1040232, 'totalvotes': 2101336},
-    {'year': 1976, 'state': 'WISCONSIN', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1004987, 'totalvotes': 2101336},
-    {'year': 1976, 'state': 'WISCONSIN', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 34943, 'totalvotes': 2101336},
-    {'year': 1976, 'state': 'WISCONSIN', 'candidate': 'MADDOX, LESTER', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 8552, 'totalvotes': 2101336},
-    {'year': 1976, 'state': 'WISCONSIN', 'candidate': 'ZEIDLER, FRANK', 'party_detailed': 'SOCIALIST', 'candidatevotes': 4298, 'totalvotes': 2101336},
-    {'year': 1976, 'state': 'WISCONSIN', 'candidate': 'MACBRIDE, ROGER', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3814, 'totalvotes': 2101336},
-    {'year': 1976, 'state': 'WISCONSIN', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 2430, 'totalvotes': 2101336},
-    {'year': 1976, 'state': 'WISCONSIN', 'candidate': 'CAMEJO, PETER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1691, 'totalvotes': 2101336},
-    {'year': 1976, 'state': 'WISCONSIN', 'candidate': 'JULIUS ""JULES"", LEVIN', 'party_detailed': 'SOCIALIST LABOR', 'candidatevotes': 389, 'totalvotes': 2101336},
-    {'year': 1976, 'state': 'WYOMING', 'candidate': 'FORD, GERALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 92717, 'totalvotes': 156343},
-    {'year': 1976, 'state': 'WYOMING', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 62239, 'totalvotes': 156343},
-    {'year': 1976, 'state': 'WYOMING', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1387, 'totalvotes': 156343},
-    {'year': 1980, 'state': 'ALABAMA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 654192, 'totalvotes': 1341929},
-    {'year': 1980, 'state': 'ALABAMA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 636730, 'totalvotes': 1341929},
-    {'year': 1980, 'state': 'ALABAMA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 16481, 'totalvotes': 1341929},
-    {'year': 1980, 'state': 'ALABAMA', 'candidate': 'RARICK, JOHN', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 15010, 'totalvotes': 1341929},
-    {'year': 1980, 'state': 'ALABAMA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 13318, 'totalvotes': 1341929},
-    {'year': 1980, 'state': 'ALABAMA', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'STATESMAN', 'candidatevotes': 1743, 'totalvotes': 1341929},
-    {'year': 1980, 'state': 'ALABAMA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 1629, 'totalvotes': 1341929},
-    {'year': 1980, 'state': 'ALABAMA', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1303, 'totalvotes': 1341929},
-    {'year': 1980, 'state': 'ALABAMA', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 1006, 'totalvotes': 1341929},
-    {'year': 1980, 'state': 'ALABAMA', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 517, 'totalvotes': 1341929},
-    {'year': 1980, 'state': 'ALASKA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 86112, 'totalvotes': 158445},
-    {'year': 1980, 'state': 'ALASKA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 41842, 'totalvotes': 158445},
-    {'year': 1980, 'state': 'ALASKA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 18479, 'totalvotes': 158445},
-    {'year': 1980, 'state': 'ALASKA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 11155, 'totalvotes': 158445},
-    {'year': 1980, 'state': 'ALASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 857, 'totalvotes': 158445},
-    {'year': 1980, 'state': 'ARIZONA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 529688, 'totalvotes': 873945},
-    {'year': 1980, 'state': 'ARIZONA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 246843, 'totalvotes': 873945},
-    {'year': 1980, 'state': 'ARIZONA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 76952, 'totalvotes': 873945},
-    {'year': 1980, 'state': 'ARIZONA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 18784, 'totalvotes': 873945},
-    {'year': 1980, 'state': 'ARIZONA', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1100, 'totalvotes': 873945},
-    {'year': 1980, 'state': 'ARIZONA', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 551, 'totalvotes': 873945},
-    {'year': 1980, 'state': 'ARIZONA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 25, 'totalvotes': 873945},
-    {'year': 1980, 'state': 'ARIZONA', 'candidate': 'GRISWOLD, DEIRDRE', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 2, 'totalvotes': 873945},
-    {'year': 1980, 'state': 'ARKANSAS', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 403164, 'totalvotes': 837582},
-    {'year': 1980, 'state': 'ARKANSAS', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 398041, 'totalvotes': 837582},
-    {'year': 1980, 'state': 'ARKANSAS', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 22468, 'totalvotes': 837582},
-    {'year': 1980, 'state': 'ARKANSAS', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8970, 'totalvotes': 837582},
-    {'year': 1980, 'state': 'ARKANSAS', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 2345, 'totalvotes': 837582},
-    {'year': 1980, 'state': 'ARKANSAS', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'STATESMAN', 'candidatevotes': 1350, 'totalvotes': 837582},
-    {'year': 1980, 'state': 'ARKANSAS', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 1244, 'totalvotes': 837582},
-    {'year': 1980, 'state': 'CALIFORNIA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 4522994, 'totalvotes': 8582938},
-    {'year': 1980, 'state': 'CALIFORNIA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3082943, 'totalvotes': 8582938},
-    {'year': 1980, 'state': 'CALIFORNIA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 739618, 'totalvotes': 8582938},
-    {'year': 1980, 'state': 'CALIFORNIA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 148390, 'totalvotes': 8582938},
-    {'year': 1980, 'state': 'CALIFORNIA', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 61046, 'totalvotes': 8582938},
-    {'year': 1980, 'state': 'CALIFORNIA', 'candidate': 'SMITH, MAUREEN', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 18106, 'totalvotes': 8582938},
-    {'year': 1980, 'state': 'CALIFORNIA', 'candidate': 'RARICK, JOHN', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 9841, 'totalvotes': 8582938},
-    {'year': 1980, 'state': 'COLORADO', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 652264, 'totalvotes': 1184450},
-    {'year': 1980, 'state': 'COLORADO', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 368009, 'totalvotes': 1184450},
-    {'year': 1980, 'state': 'COLORADO', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'NATIONAL UNITY CAMPAIGN', 'candidatevotes': 130633, 'totalvotes': 1184450},
-    {'year': 1980, 'state': 'COLORADO', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 25744, 'totalvotes': 1184450},
-    {'year': 1980, 'state': 'COLORADO', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 5614, 'totalvotes': 1184450},
-    {'year': 1980, 'state': 'COLORADO', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'STATESMAN', 'candidatevotes': 1180, 'totalvotes': 1184450},
-    {'year': 1980, 'state': 'COLORADO', 'candidate': 'PULLEY, ANDREW', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 519, 'totalvotes': 1184450},
-    {'year': 1980, 'state': 'COLORADO', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 487, 'totalvotes': 1184450},
-    {'year': 1980, 'state': 'CONNECTICUT', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 677210, 'totalvotes': 1406285},
-    {'year': 1980, 'state': 'CONNECTICUT', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 541732, 'totalvotes': 1406285},
-    {'year': 1980, 'state': 'CONNECTICUT', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'ANDERSON COALITION', 'candidatevotes': 171807, 'totalvotes': 1406285},
-    {'year': 1980, 'state': 'CONNECTICUT', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8570, 'totalvotes': 1406285},
-    {'year': 1980, 'state': 'CONNECTICUT', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 6130, 'totalvotes': 1406285},
-    {'year': 1980, 'state': 'CONNECTICUT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 836, 'totalvotes': 1406285},
-    {'year': 1980, 'state': 'DELAWARE', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 111252, 'totalvotes': 235668},
-    {'year': 1980, 'state': 'DELAWARE', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 105754, 'totalvotes': 235668},
-    {'year': 1980, 'state': 'DELAWARE', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 16288, 'totalvotes': 235668},
-    {'year': 1980, 'state': 'DELAWARE', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1974, 'totalvotes': 235668},
-    {'year': 1980, 'state': 'DELAWARE', 'candidate': 'GREAVES, PERCY L, JR.', 'party_detailed': 'AMERICAN', 'candidatevotes': 400, 'totalvotes': 235668},
-    {'year': 1980, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 130231, 'totalvotes': 173889},
-    {'year': 1980, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 23313, 'totalvotes': 173889},
-    {'year': 1980, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 16131, 'totalvotes': 173889},
-    {'year': 1980, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 1826, 'totalvotes': 173889},
-    {'year': 1980, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1104, 'totalvotes': 173889},
-    {'year': 1980, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 690, 'totalvotes': 173889},
-    {'year': 1980, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 369, 'totalvotes': 173889},
-    {'year': 1980, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 173, 'totalvotes': 173889},
-    {'year': 1980, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'GRISWOLD, DEIRDRE', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 52, 'totalvotes': 173889},
-    {'year': 1980, 'state': 'FLORIDA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2046951, 'totalvotes': 3686927},
-    {'year': 1980, 'state': 'FLORIDA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1419475, 'totalvotes': 3686927},
-    {'year': 1980, 'state': 'FLORIDA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 189692, 'totalvotes': 3686927},
-    {'year': 1980, 'state': 'FLORIDA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 30524, 'totalvotes': 3686927},
-    {'year': 1980, 'state': 'FLORIDA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 285, 'totalvotes': 3686927},
-    {'year': 1980, 'state': 'GEORGIA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 890955, 'totalvotes': 1596805},
-    {'year': 1980, 'state': 'GEORGIA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 654168, 'totalvotes': 1596805},
-    {'year': 1980, 'state': 'GEORGIA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 36055, 'totalvotes': 1596805},
-    {'year': 1980, 'state': 'GEORGIA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 15627, 'totalvotes': 1596805},
-    {'year': 1980, 'state': 'HAWAII', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 135879, 'totalvotes': 303287},
-    {'year': 1980, 'state': 'HAWAII', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 130112, 'totalvotes': 303287},
-    {'year': 1980, 'state': 'HAWAII', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 32021, 'totalvotes': 303287},
-    {'year': 1980, 'state': 'HAWAII', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3269, 'totalvotes': 303287},
-    {'year': 1980, 'state': 'HAWAII', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 1548, 'totalvotes': 303287},
-    {'year': 1980, 'state': 'HAWAII', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 458, 'totalvotes': 303287},
-    {'year': 1980, 'state': 'IDAHO', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 290699, 'totalvotes': 437431},
-    {'year': 1980, 'state': 'IDAHO', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 110192, 'totalvotes': 437431},
-    {'year': 1980, 'state': 'IDAHO', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 27058, 'totalvotes': 437431},
-    {'year': 1980, 'state': 'IDAHO', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8425, 'totalvotes': 437431},
-    {'year': 1980, 'state': 'IDAHO', 'candidate': 'RARICK, JOHN', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 1057, 'totalvotes': 437431},
-    {'year': 1980, 'state': 'ILLINOIS', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2358049, 'totalvotes': 4749721},
-    {'year': 1980, 'state': 'ILLINOIS', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1981413, 'totalvotes': 4749721},
-    {'year': 1980, 'state': 'ILLINOIS', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 346754, 'totalvotes': 4749721},
-    {'year': 1980, 'state': 'ILLINOIS', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 38939, 'totalvotes': 4749721},
-    {'year': 1980, 'state': 'ILLINOIS', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 10692, 'totalvotes': 4749721},
-    {'year': 1980, 'state': 'ILLINOIS', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 9711, 'totalvotes': 4749721},
-    {'year': 1980, 'state': 'ILLINOIS', 'candidate': 'GRISWOLD, DEIRDRE', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 2257, 'totalvotes': 4749721},
-    {'year': 1980, 'state': 'ILLINOIS', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1302, 'totalvotes': 4749721},
-    {'year': 1980, 'state': 'ILLINOIS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 604, 'totalvotes': 4749721},
-    {'year': 1980, 'state': 'INDIANA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1255656, 'totalvotes': 2242033},
-    {'year': 1980, 'state': 'INDIANA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 844197, 'totalvotes': 2242033},
-    {'year': 1980, 'state': 'INDIANA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 111639, 'totalvotes': 2242033},
-    {'year': 1980, 'state': 'INDIANA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 19627, 'totalvotes': 2242033},
-    {'year': 1980, 'state': 'INDIANA', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 4852, 'totalvotes': 2242033},
-    {'year': 1980, 'state': 'INDIANA', 'candidate': 'GREAVES, PERCY L, JR.', 'party_detailed': 'AMERICAN', 'candidatevotes': 4750, 'totalvotes': 2242033},
-    {'year': 1980, 'state': 'INDIANA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 702, 'totalvotes': 2242033},
-    {'year': 1980, 'state': 'INDIANA', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 610, 'totalvotes': 2242033},
-    {'year': 1980, 'state': 'IOWA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 676026, 'totalvotes': 1317661},
-    {'year': 1980, 'state': 'IOWA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 508672, 'totalvotes': 1317661},
-    {'year': 1980, 'state': 'IOWA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'NOMINATED BY PETITION', 'candidatevotes': 115633, 'totalvotes': 1317661},
-    {'year': 1980, 'state': 'IOWA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 13123, 'totalvotes': 1317661},
-    {'year': 1980, 'state': 'IOWA', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 2273, 'totalvotes': 1317661},
-    {'year': 1980, 'state': 'IOWA', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 534, 'totalvotes': 1317661},
-    {'year': 1980, 'state': 'IOWA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 519, 'totalvotes': 1317661},
-    {'year': 1980, 'state': 'IOWA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 298, 'totalvotes': 1317661},
-    {'year': 1980, 'state': 'IOWA', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 244, 'totalvotes': 1317661},
-    {'year': 1980, 'state': 'IOWA', 'candidate': 'GREAVES, PERCY L, JR.', 'party_detailed': 'AMERICAN', 'candidatevotes': 189, 'totalvotes': 1317661},
-    {'year': 1980, 'state': 'IOWA', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'STATESMAN', 'candidatevotes': 150, 'totalvotes': 1317661},
-    {'year': 1980, 'state': 'KANSAS', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 566812, 'totalvotes': 979795},
-    {'year': 1980, 'state': 'KANSAS', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 326150, 'totalvotes': 979795},
-    {'year': 1980, 'state': 'KANSAS', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 68231, 'totalvotes': 979795},
-    {'year': 1980, 'state': 'KANSAS', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 14470, 'totalvotes': 979795},
-    {'year': 1980, 'state': 'KANSAS', 'candidate': 'SHELTON, FRANK, JR.', 'party_detailed': 'AMERICAN', 'candidatevotes': 1555, 'totalvotes': 979795},
-    {'year': 1980, 'state': 'KANSAS', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 967, 'totalvotes': 979795},
-    {'year': 1980, 'state': 'KANSAS', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'STATESMAN', 'candidatevotes': 821, 'totalvotes': 979795},
-    {'year': 1980, 'state': 'KANSAS', 'candidate': 'RARICK, JOHN', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 789, 'totalvotes': 979795},
-    {'year': 1980, 'state': 'KENTUCKY', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 635274, 'totalvotes': 1295627},
-    {'year': 1980, 'state': 'KENTUCKY', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 617417, 'totalvotes': 1295627},
-    {'year': 1980, 'state': 'KENTUCKY', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 31127, 'totalvotes': 1295627},
-    {'year': 1980, 'state': 'KENTUCKY', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5531, 'totalvotes': 1295627},
-    {'year': 1980, 'state': 'KENTUCKY', 'candidate': 'MCCORMACK, ELLEN', 'party_detailed': 'RESPECT FOR LIFE', 'candidatevotes': 4233, 'totalvotes': 1295627},
-    {'year': 1980, 'state': 'KENTUCKY', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 1304, 'totalvotes': 1295627},
-    {'year': 1980, 'state': 'KENTUCKY', 'candidate': 'PULLEY, ANDREW', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 393, 'totalvotes': 1295627},
-    {'year': 1980, 'state': 'KENTUCKY', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 348, 'totalvotes': 1295627},
-    {'year': 1980, 'state': 'LOUISIANA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 792853, 'totalvotes': 1548591},
-    {'year': 1980, 'state': 'LOUISIANA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 708453, 'totalvotes': 1548591},
-    {'year': 1980, 'state': 'LOUISIANA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 26345, 'totalvotes': 1548591},
-    {'year': 1980, 'state': 'LOUISIANA', 'candidate': 'RARICK, JOHN', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 10333, 'totalvotes': 1548591},
-    {'year': 1980, 'state': 'LOUISIANA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8240, 'totalvotes': 1548591},
-    {'year': 1980, 'state': 'LOUISIANA', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 1584, 'totalvotes': 1548591},
-    {'year': 1980, 'state': 'LOUISIANA', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 783, 'totalvotes': 1548591},
-    {'year': 1980, 'state': 'MAINE', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 238522, 'totalvotes': 523011},
-    {'year': 1980, 'state': 'MAINE', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 220974, 'totalvotes': 523011},
-    {'year': 1980, 'state': 'MAINE', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 53327, 'totalvotes': 523011},
-    {'year': 1980, 'state': 'MAINE', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5119, 'totalvotes': 523011},
-    {'year': 1980, 'state': 'MAINE', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 4394, 'totalvotes': 523011},
-    {'year': 1980, 'state': 'MAINE', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 591, 'totalvotes': 523011},
-    {'year': 1980, 'state': 'MAINE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 84, 'totalvotes': 523011},
-    {'year': 1980, 'state': 'MARYLAND', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 726161, 'totalvotes': 1540496},
-    {'year': 1980, 'state': 'MARYLAND', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 680606, 'totalvotes': 1540496},
-    {'year': 1980, 'state': 'MARYLAND', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 119537, 'totalvotes': 1540496},
-    {'year': 1980, 'state': 'MARYLAND', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 14192, 'totalvotes': 1540496},
-    {'year': 1980, 'state': 'MASSACHUSETTS', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1057631, 'totalvotes': 2524090},
-    {'year': 1980, 'state': 'MASSACHUSETTS', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1053802, 'totalvotes': 2524090},
-    {'year': 1980, 'state': 'MASSACHUSETTS', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 382539, 'totalvotes': 2524090},
-    {'year': 1980, 'state': 'MASSACHUSETTS', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 22038, 'totalvotes': 2524090},
-    {'year': 1980, 'state': 'MASSACHUSETTS', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 3735, 'totalvotes': 2524090},
-    {'year': 1980, 'state': 'MASSACHUSETTS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2289, 'totalvotes': 2524090},
-    {'year': 1980, 'state': 'MASSACHUSETTS', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 2056, 'totalvotes': 2524090},
-    {'year': 1980, 'state': 'MICHIGAN', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1915225, 'totalvotes': 3909725},
-    {'year': 1980, 'state': 'MICHIGAN', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1661532, 'totalvotes': 3909725},
-    {'year': 1980, 'state': 'MICHIGAN', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 275223, 'totalvotes': 3909725},
-    {'year': 1980, 'state': 'MICHIGAN', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 41597, 'totalvotes': 3909725},
-    {'year': 1980, 'state': 'MICHIGAN', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 11930, 'totalvotes': 3909725},
-    {'year': 1980, 'state': 'MICHIGAN', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 3262, 'totalvotes': 3909725},
-    {'year': 1980, 'state': 'MICHIGAN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 956, 'totalvotes': 3909725},
-    {'year': 1980, 'state': 'MINNESOTA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 954173, 'totalvotes': 2051916},
-    {'year': 1980, 'state': 'MINNESOTA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 873268, 'totalvotes': 2051916},
-    {'year': 1980, 'state': 'MINNESOTA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 174997, 'totalvotes': 2051916},
-    {'year': 1980, 'state': 'MINNESOTA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 31593, 'totalvotes': 2051916},
-    {'year': 1980, 'state': 'MINNESOTA', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 8406, 'totalvotes': 2051916},
-    {'year': 1980, 'state': 'MINNESOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'AMERICAN', 'candidatevotes': 6136, 'totalvotes': 2051916},
-    {'year': 1980, 'state': 'MINNESOTA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 1117, 'totalvotes': 2051916},
-    {'year': 1980, 'state': 'MINNESOTA', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 711, 'totalvotes': 2051916},
-    {'year': 1980, 'state': 'MINNESOTA', 'candidate': 'GRISWOLD, DEIRDRE', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 698, 'totalvotes': 2051916},
-    {'year': 1980, 'state': 'MINNESOTA', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 536, 'totalvotes': 2051916},
-    {'year': 1980, 'state': 'MINNESOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 281, 'totalvotes': 2051916},
-    {'year': 1980, 'state': 'MISSISSIPPI', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 441089, 'totalvotes': 891750},
-    {'year': 1980, 'state': 'MISSISSIPPI', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 429281, 'totalvotes': 891750},
-    {'year': 1980, 'state': 'MISSISSIPPI', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 12036, 'totalvotes': 891750},
-    {'year': 1980, 'state': 'MISSISSIPPI', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4702, 'totalvotes': 891750},
-    {'year': 1980, 'state': 'MISSISSIPPI', 'candidate': 'GRISWOLD, DEIRDRE', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 2402, 'totalvotes': 891750},
-    {'year': 1980, 'state': 'MISSISSIPPI', 'candidate': 'PULLEY, ANDREW', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 2240, 'totalvotes': 891750},
-    {'year': 1980, 'state': 'MISSOURI', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1074181, 'totalvotes': 2099824},
-    {'year': 1980, 'state': 'MISSOURI', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 931182, 'totalvotes': 2099824},
-    {'year': 1980, 'state': 'MISSOURI', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 77920, 'totalvotes': 2099824},
-    {'year': 1980, 'state': 'MISSOURI', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 14422, 'totalvotes': 2099824},
-    {'year': 1980, 'state': 'MISSOURI', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1515, 'totalvotes': 2099824},
-    {'year': 1980, 'state': 'MISSOURI', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 604, 'totalvotes': 2099824},
-    {'year': 1980, 'state': 'MONTANA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 206814, 'totalvotes': 363952},
-    {'year': 1980, 'state': 'MONTANA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 118032, 'totalvotes': 363952},
-    {'year': 1980, 'state': 'MONTANA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 29281, 'totalvotes': 363952},
-    {'year': 1980, 'state': 'MONTANA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9825, 'totalvotes': 363952},
-    {'year': 1980, 'state': 'NEBRASKA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 419214, 'totalvotes': 639533},
-    {'year': 1980, 'state': 'NEBRASKA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 166424, 'totalvotes': 639533},
-    {'year': 1980, 'state': 'NEBRASKA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 44854, 'totalvotes': 639533},
-    {'year': 1980, 'state': 'NEBRASKA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9041, 'totalvotes': 639533},
-    {'year': 1980, 'state': 'NEVADA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 155017, 'totalvotes': 243692},
-    {'year': 1980, 'state': 'NEVADA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 66666, 'totalvotes': 243692},
-    {'year': 1980, 'state': 'NEVADA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 17651, 'totalvotes': 243692},
-    {'year': 1980, 'state': 'NEVADA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4358, 'totalvotes': 243692},
-    {'year': 1980, 'state': 'NEW HAMPSHIRE', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 221705, 'totalvotes': 383990},
-    {'year': 1980, 'state': 'NEW HAMPSHIRE', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 108864, 'totalvotes': 383990},
-    {'year': 1980, 'state': 'NEW HAMPSHIRE', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 49693, 'totalvotes': 383990},
-    {'year': 1980, 'state': 'NEW HAMPSHIRE', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2064, 'totalvotes': 383990},
-    {'year': 1980, 'state': 'NEW HAMPSHIRE', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 1320, 'totalvotes': 383990},
-    {'year': 1980, 'state': 'NEW HAMPSHIRE', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 129, 'totalvotes': 383990},
-    {'year': 1980, 'state': 'NEW HAMPSHIRE', 'candidate': 'GRISWOLD, DEIRDRE', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 76, 'totalvotes': 383990},
-    {'year': 1980, 'state': 'NEW HAMPSHIRE', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 71, 'totalvotes': 383990},
-    {'year': 1980, 'state': 'NEW HAMPSHIRE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 68, 'totalvotes': 383990},
-    {'year': 1980, 'state': 'NEW JERSEY', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1546557, 'totalvotes': 2975684},
-    {'year': 1980, 'state': 'NEW JERSEY', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1147364, 'totalvotes': 2975684},
-    {'year': 1980, 'state': 'NEW JERSEY', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 234632, 'totalvotes': 2975684},
-    {'year': 1980, 'state': 'NEW JERSEY', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 20652, 'totalvotes': 2975684},
-    {'year': 1980, 'state': 'NEW JERSEY', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 8203, 'totalvotes': 2975684},
-    {'year': 1980, 'state': 'NEW JERSEY', 'candidate': 'MCCORMACK, ELLEN', 'party_detailed': 'RIGHT-TO-LIFE', 'candidatevotes': 3927, 'totalvotes': 2975684},
-    {'year': 1980, 'state': 'NEW JERSEY', 'candidate': 'LYNEN, KURT', 'party_detailed': 'MIDDLE CLASS CANDIDATE', 'candidatevotes': 3694, 'totalvotes': 2975684},
-    {'year': 1980, 'state': 'NEW JERSEY', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 2555, 'totalvotes': 2975684},
-    {'year': 1980, 'state': 'NEW JERSEY', 'candidate': 'PULLEY, ANDREW', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 2198, 'totalvotes': 2975684},
-    {'year': 1980, 'state': 'NEW JERSEY', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 1973, 'totalvotes': 2975684},
-    {'year': 1980, 'state': 'NEW JERSEY', 'candidate': 'GAHRES, WILLIAM ""BILL""', 'party_detailed': 'DOWN WITH LAWYERS', 'candidatevotes': 1718, 'totalvotes': 2975684},
-    {'year': 1980, 'state': 'NEW JERSEY', 'candidate': 'GRISWOLD, DEIRDRE', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 1288, 'totalvotes': 2975684},
-    {'year': 1980, 'state': 'NEW JERSEY', 'candidate': 'WENDELKEN, MARTIN E.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 923, 'totalvotes': 2975684},
-    {'year': 1980, 'state': 'NEW MEXICO', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 250779, 'totalvotes': 456237},
-    {'year': 1980, 'state': 'NEW MEXICO', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 167826, 'totalvotes': 456237},
-    {'year': 1980, 'state': 'NEW MEXICO', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 29459, 'totalvotes': 456237},
-    {'year': 1980, 'state': 'NEW MEXICO', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4365, 'totalvotes': 456237},
-    {'year': 1980, 'state': 'NEW MEXICO', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 2202, 'totalvotes': 456237},
-    {'year': 1980, 'state': 'NEW MEXICO', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'STATESMAN', 'candidatevotes': 1281, 'totalvotes': 456237},
-    {'year': 1980, 'state': 'NEW MEXICO', 'candidate': 'PULLEY, ANDREW', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 325, 'totalvotes': 456237},
-    {'year': 1980, 'state': 'NEW YORK', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2728372, 'totalvotes': 6201959},
-    {'year': 1980, 'state': 'NEW YORK', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2637700, 'totalvotes': 6201959},
-    {'year': 1980, 'state': 'NEW YORK', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'LIBERAL PARTY', 'candidatevotes': 467801, 'totalvotes': 6201959},
-    {'year': 1980, 'state': 'NEW YORK', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 256131, 'totalvotes': 6201959},
-    {'year': 1980, 'state': 'NEW YORK', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'FREE LIBERTARIAN', 'candidatevotes': 52648, 'totalvotes': 6201959},
-    {'year': 1980, 'state': 'NEW YORK', 'candidate': 'MCCORMACK, ELLEN', 'party_detailed': 'RIGHT-TO-LIFE', 'candidatevotes': 24159, 'totalvotes': 6201959},
-    {'year': 1980, 'state': 'NEW YORK', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 23186, 'totalvotes': 6201959},
-    {'year': 1980, 'state': 'NEW YORK', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 7414, 'totalvotes': 6201959},
-    {'year': 1980, 'state': 'NEW YORK', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 2068, 'totalvotes': 6201959},
-    {'year': 1980, 'state': 'NEW YORK', 'candidate': 'GRISWOLD, DEIRDRE', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 1416, 'totalvotes': 6201959},
-    {'year': 1980, 'state': 'NEW YORK', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1064, 'totalvotes': 6201959},
-    {'year': 1980, 'state': 'NORTH CAROLINA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 915018, 'totalvotes': 1855833},
-    {'year': 1980, 'state': 'NORTH CAROLINA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 875635, 'totalvotes': 1855833},
-    {'year': 1980, 'state': 'NORTH CAROLINA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 52800, 'totalvotes': 1855833},
-    {'year': 1980, 'state': 'NORTH CAROLINA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9677, 'totalvotes': 1855833},
-    {'year': 1980, 'state': 'NORTH CAROLINA', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 2287, 'totalvotes': 1855833},
-    {'year': 1980, 'state': 'NORTH CAROLINA', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 416, 'totalvotes': 1855833},
-    {'year': 1980, 'state': 'NORTH DAKOTA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 193695, 'totalvotes': 301116},
-    {'year': 1980, 'state': 'NORTH DAKOTA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 79189, 'totalvotes': 301116},
-    {'year': 1980, 'state': 'NORTH DAKOTA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 23640, 'totalvotes': 301116},
-    {'year': 1980, 'state': 'NORTH DAKOTA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3743, 'totalvotes': 301116},
-    {'year': 1980, 'state': 'NORTH DAKOTA', 'candidate': 'MCLAIN, HARLEY', 'party_detailed': "NATURAL PEOPLE'S LEAGUE", 'candidatevotes': 296, 'totalvotes': 301116},
-    {'year': 1980, 'state': 'NORTH DAKOTA', 'candidate': 'GREAVES, PERCY L, JR.', 'party_detailed': 'AMERICAN', 'candidatevotes': 235, 'totalvotes': 301116},
-    {'year': 1980, 'state': 'NORTH DAKOTA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 93, 'totalvotes': 301116},
-    {'year': 1980, 'state': 'NORTH DAKOTA', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 89, 'totalvotes': 301116},
-    {'year': 1980, 'state': 'NORTH DAKOTA', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 82, 'totalvotes': 301116},
-    {'year': 1980, 'state': 'NORTH DAKOTA', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'STATESMAN', 'candidatevotes': 54, 'totalvotes': 301116},
-    {'year': 1980, 'state': 'OHIO', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2206545, 'totalvotes': 4283603},
-    {'year': 1980, 'state': 'OHIO', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1752414, 'totalvotes': 4283603},
-    {'year': 1980, 'state': 'OHIO', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 254472, 'totalvotes': 4283603},
-    {'year': 1980, 'state': 'OHIO', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 49033, 'totalvotes': 4283603},
-    {'year': 1980, 'state': 'OHIO', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 8564, 'totalvotes': 4283603},
-    {'year': 1980, 'state': 'OHIO', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 4729, 'totalvotes': 4283603},
-    {'year': 1980, 'state': 'OHIO', 'candidate': 'CONGRESS, RICHARD', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 4029, 'totalvotes': 4283603},
-    {'year': 1980, 'state': 'OHIO', 'candidate': 'GRISWOLD, DEIRDRE', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 3790, 'totalvotes': 4283603},
-    {'year': 1980, 'state': 'OHIO', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'STATESMAN', 'candidatevotes': 27, 'totalvotes': 4283603},
-    {'year': 1980, 'state': 'OKLAHOMA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 695570, 'totalvotes': 1149708},
-    {'year': 1980, 'state': 'OKLAHOMA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 402026, 'totalvotes': 1149708},
-    {'year': 1980, 'state': 'OKLAHOMA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 38284, 'totalvotes': 1149708},
-    {'year': 1980, 'state': 'OKLAHOMA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 13828, 'totalvotes': 1149708},
-    {'year': 1980, 'state': 'OREGON', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 571044, 'totalvotes': 1181516},
-    {'year': 1980, 'state': 'OREGON', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 456890, 'totalvotes': 1181516},
-    {'year': 1980, 'state': 'OREGON', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 112389, 'totalvotes': 1181516},
-    {'year': 1980, 'state': 'OREGON', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 25838, 'totalvotes': 1181516},
-    {'year': 1980, 'state': 'OREGON', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 13642, 'totalvotes': 1181516},
-    {'year': 1980, 'state': 'OREGON', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1713, 'totalvotes': 1181516},
-    {'year': 1980, 'state': 'PENNSYLVANIA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2261872, 'totalvotes': 4561501},
-    {'year': 1980, 'state': 'PENNSYLVANIA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1937540, 'totalvotes': 4561501},
-    {'year': 1980, 'state': 'PENNSYLVANIA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 292921, 'totalvotes': 4561501},
-    {'year': 1980, 'state': 'PENNSYLVANIA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 33263, 'totalvotes': 4561501},
-    {'year': 1980, 'state': 'PENNSYLVANIA', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 20291, 'totalvotes': 4561501},
-    {'year': 1980, 'state': 'PENNSYLVANIA', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 10430, 'totalvotes': 4561501},
-    {'year': 1980, 'state': 'PENNSYLVANIA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 5184, 'totalvotes': 4561501},
-    {'year': 1980, 'state': 'RHODE ISLAND', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 198342, 'totalvotes': 415967},
-    {'year': 1980, 'state': 'RHODE ISLAND', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 154793, 'totalvotes': 415967},
-    {'year': 1980, 'state': 'RHODE ISLAND', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 59819, 'totalvotes': 415967},
-    {'year': 1980, 'state': 'RHODE ISLAND', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2458, 'totalvotes': 415967},
-    {'year': 1980, 'state': 'RHODE ISLAND', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 218, 'totalvotes': 415967},
-    {'year': 1980, 'state': 'RHODE ISLAND', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 170, 'totalvotes': 415967},
-    {'year': 1980, 'state': 'RHODE ISLAND', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 90, 'totalvotes': 415967},
-    {'year': 1980, 'state': 'RHODE ISLAND', 'candidate': 'GRISWOLD, DEIRDRE', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 77, 'totalvotes': 415967},
-    {'year': 1980, 'state': 'SOUTH CAROLINA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 439277, 'totalvotes': 888258},
-    {'year': 1980, 'state': 'SOUTH CAROLINA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 428220, 'totalvotes': 888258},
-    {'year': 1980, 'state': 'SOUTH CAROLINA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 13868, 'totalvotes': 888258},
-    {'year': 1980, 'state': 'SOUTH CAROLINA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4807, 'totalvotes': 888258},
-    {'year': 1980, 'state': 'SOUTH CAROLINA', 'candidate': 'RARICK, JOHN', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 2086, 'totalvotes': 888258},
-    {'year': 1980, 'state': 'SOUTH DAKOTA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 198343, 'totalvotes': 327703},
-    {'year': 1980, 'state': 'SOUTH DAKOTA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 103855, 'totalvotes': 327703},
-    {'year': 1980, 'state': 'SOUTH DAKOTA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 21431, 'totalvotes': 327703},
-    {'year': 1980, 'state': 'SOUTH DAKOTA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3824, 'totalvotes': 327703},
-    {'year': 1980, 'state': 'SOUTH DAKOTA', 'candidate': 'PULLEY, ANDREW', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 250, 'totalvotes': 327703},
-    {'year': 1980, 'state': 'TENNESSEE', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 787761, 'totalvotes': 1617616},
-    {'year': 1980, 'state': 'TENNESSEE', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 783051, 'totalvotes': 1617616},
-    {'year': 1980, 'state': 'TENNESSEE', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 35991, 'totalvotes': 1617616},
-    {'year': 1980, 'state': 'TENNESSEE', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7116, 'totalvotes': 1617616},
-    {'year': 1980, 'state': 'TENNESSEE', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 1112, 'totalvotes': 1617616},
-    {'year': 1980, 'state': 'TENNESSEE', 'candidate': 'BUBAR, BENJAMIN ""BEN""', 'party_detailed': 'STATESMAN', 'candidatevotes': 521, 'totalvotes': 1617616},
-    {'year': 1980, 'state': 'TENNESSEE', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 519, 'totalvotes': 1617616},
-    {'year': 1980, 'state': 'TENNESSEE', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 503, 'totalvotes': 1617616},
-    {'year': 1980, 'state': 'TENNESSEE', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 490, 'totalvotes': 1617616},
-    {'year': 1980, 'state': 'TENNESSEE', 'candidate': 'GRISWOLD, DEIRDRE', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 400, 'totalvotes': 1617616},
-    {'year': 1980, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 152, 'totalvotes': 1617616},
-    {'year': 1980, 'state': 'TEXAS', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2510705, 'totalvotes': 4541636},
-    {'year': 1980, 'state': 'TEXAS', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1881147, 'totalvotes': 4541636},
-    {'year': 1980, 'state': 'TEXAS', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 111613, 'totalvotes': 4541636},
-    {'year': 1980, 'state': 'TEXAS', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 37643, 'totalvotes': 4541636},
-    {'year': 1980, 'state': 'TEXAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 528, 'totalvotes': 4541636},
-    {'year': 1980, 'state': 'UTAH', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 439687, 'totalvotes': 604152},
-    {'year': 1980, 'state': 'UTAH', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 124266, 'totalvotes': 604152},
-    {'year': 1980, 'state': 'UTAH', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 30284, 'totalvotes': 604152},
-    {'year': 1980, 'state': 'UTAH', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7156, 'totalvotes': 604152},
-    {'year': 1980, 'state': 'UTAH', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 1009, 'totalvotes': 604152},
-    {'year': 1980, 'state': 'UTAH', 'candidate': 'GREAVES, PERCY L, JR.', 'party_detailed': 'AMERICAN', 'candidatevotes': 965, 'totalvotes': 604152},
-    {'year': 1980, 'state': 'UTAH', 'candidate': 'RARICK, JOHN', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 522, 'totalvotes': 604152},
-    {'year': 1980, 'state': 'UTAH', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 139, 'totalvotes': 604152},
-    {'year': 1980, 'state': 'UTAH', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 124, 'totalvotes': 604152},
-    {'year': 1980, 'state': 'VERMONT', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 94628, 'totalvotes': 213299},
-    {'year': 1980, 'state': 'VERMONT', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 81952, 'totalvotes': 213299},
-    {'year': 1980, 'state': 'VERMONT', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 31761, 'totalvotes': 213299},
-    {'year': 1980, 'state': 'VERMONT', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 2316, 'totalvotes': 213299},
-    {'year': 1980, 'state': 'VERMONT', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1900, 'totalvotes': 213299},
-    {'year': 1980, 'state': 'VERMONT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 413, 'totalvotes': 213299},
-    {'year': 1980, 'state': 'VERMONT', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 136, 'totalvotes': 213299},
-    {'year': 1980, 'state': 'VERMONT', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 118, 'totalvotes': 213299},
-    {'year': 1980, 'state': 'VERMONT', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 75, 'totalvotes': 213299},
-    {'year': 1980, 'state': 'VIRGINIA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 989609, 'totalvotes': 1866032},
-    {'year': 1980, 'state': 'VIRGINIA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 752174, 'totalvotes': 1866032},
-    {'year': 1980, 'state': 'VIRGINIA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 95418, 'totalvotes': 1866032},
-    {'year': 1980, 'state': 'VIRGINIA', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 14024, 'totalvotes': 1866032},
-    {'year': 1980, 'state': 'VIRGINIA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12821, 'totalvotes': 1866032},
-    {'year': 1980, 'state': 'VIRGINIA', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1986, 'totalvotes': 1866032},
-    {'year': 1980, 'state': 'WASHINGTON', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 865244, 'totalvotes': 1742394},
-    {'year': 1980, 'state': 'WASHINGTON', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 650193, 'totalvotes': 1742394},
-    {'year': 1980, 'state': 'WASHINGTON', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 185073, 'totalvotes': 1742394},
-    {'year': 1980, 'state': 'WASHINGTON', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 29213, 'totalvotes': 1742394},
-    {'year': 1980, 'state': 'WASHINGTON', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 9403, 'totalvotes': 1742394},
-    {'year': 1980, 'state': 'WASHINGTON', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1137, 'totalvotes': 1742394},
-    {'year': 1980, 'state': 'WASHINGTON', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 956, 'totalvotes': 1742394},
-    {'year': 1980, 'state': 'WASHINGTON', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 834, 'totalvotes': 1742394},
-    {'year': 1980, 'state': 'WASHINGTON', 'candidate': 'GRISWOLD, DEIRDRE', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 341, 'totalvotes': 1742394},
-    {'year': 1980, 'state': 'WEST VIRGINIA', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 367462, 'totalvotes': 737715},
-    {'year': 1980, 'state': 'WEST VIRGINIA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 334206, 'totalvotes': 737715},
-    {'year': 1980, 'state': 'WEST VIRGINIA', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 31691, 'totalvotes': 737715},
-    {'year': 1980, 'state': 'WEST VIRGINIA', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4356, 'totalvotes': 737715},
-    {'year': 1980, 'state': 'WISCONSIN', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1088845, 'totalvotes': 2273221},
-    {'year': 1980, 'state': 'WISCONSIN', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 981584, 'totalvotes': 2273221},
-    {'year': 1980, 'state': 'WISCONSIN', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 160657, 'totalvotes': 2273221},
-    {'year': 1980, 'state': 'WISCONSIN', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 29135, 'totalvotes': 2273221},
-    {'year': 1980, 'state': 'WISCONSIN', 'candidate': 'COMMONER, BARRY', 'party_detailed': 'CITIZENS', 'candidatevotes': 7767, 'totalvotes': 2273221},
-    {'year': 1980, 'state': 'WISCONSIN', 'candidate': 'RARICK, JOHN', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 1519, 'totalvotes': 2273221},
-    {'year': 1980, 'state': 'WISCONSIN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1337, 'totalvotes': 2273221},
-    {'year': 1980, 'state': 'WISCONSIN', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 808, 'totalvotes': 2273221},
-    {'year': 1980, 'state': 'WISCONSIN', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 772, 'totalvotes': 2273221},
-    {'year': 1980, 'state': 'WISCONSIN', 'candidate': 'GRISWOLD, DEIRDRE', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 414, 'totalvotes': 2273221},
-    {'year': 1980, 'state': 'WISCONSIN', 'candidate': 'DEBERRY, CLIFTON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 383, 'totalvotes': 2273221},
-    {'year': 1980, 'state': 'WYOMING', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 110700, 'totalvotes': 176713},
-    {'year': 1980, 'state': 'WYOMING', 'candidate': 'CARTER, JIMMY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 49427, 'totalvotes': 176713},
-    {'year': 1980, 'state': 'WYOMING', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 12072, 'totalvotes': 176713},
-    {'year': 1980, 'state': 'WYOMING', 'candidate': 'CLARK, EDWARD ""ED""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4514, 'totalvotes': 176713},
-    {'year': 1984, 'state': 'ALABAMA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 872849, 'totalvotes': 1441713},
-    {'year': 1984, 'state': 'ALABAMA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 551899, 'totalvotes': 1441713},
-    {'year': 1984, 'state': 'ALABAMA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9504, 'totalvotes': 1441713},
-    {'year': 1984, 'state': 'ALABAMA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 4671, 'totalvotes': 1441713},
-    {'year': 1984, 'state': 'ALABAMA', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 1401, 'totalvotes': 1441713},
-    {'year': 1984, 'state': 'ALABAMA', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 730, 'totalvotes': 1441713},
-    {'year': 1984, 'state': 'ALABAMA', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 659, 'totalvotes': 1441713},
-    {'year': 1984, 'state': 'ALASKA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 138377, 'totalvotes': 207605},
-    {'year': 1984, 'state': 'ALASKA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 62007, 'totalvotes': 207605},
-    {'year': 1984, 'state': 'ALASKA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6378, 'totalvotes': 207605},
-    {'year': 1984, 'state': 'ALASKA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 843, 'totalvotes': 207605},
-    {'year': 1984, 'state': 'ARIZONA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 681416, 'totalvotes': 1025897},
-    {'year': 1984, 'state': 'ARIZONA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 333854, 'totalvotes': 1025897},
-    {'year': 1984, 'state': 'ARIZONA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 10585, 'totalvotes': 1025897},
-    {'year': 1984, 'state': 'ARIZONA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 42, 'totalvotes': 1025897},
-    {'year': 1984, 'state': 'ARKANSAS', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 534774, 'totalvotes': 884406},
-    {'year': 1984, 'state': 'ARKANSAS', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 338646, 'totalvotes': 884406},
-    {'year': 1984, 'state': 'ARKANSAS', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2221, 'totalvotes': 884406},
-    {'year': 1984, 'state': 'ARKANSAS', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1890, 'totalvotes': 884406},
-    {'year': 1984, 'state': 'ARKANSAS', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 1499, 'totalvotes': 884406},
-    {'year': 1984, 'state': 'ARKANSAS', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 1461, 'totalvotes': 884406},
-    {'year': 1984, 'state': 'ARKANSAS', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 1291, 'totalvotes': 884406},
-    {'year': 1984, 'state': 'ARKANSAS', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 960, 'totalvotes': 884406},
-    {'year': 1984, 'state': 'ARKANSAS', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 842, 'totalvotes': 884406},
-    {'year': 1984, 'state': 'ARKANSAS', 'candidate': 'LOWERY, ARTHUR', 'party_detailed': 'UNITED SOVEREIGN CITIZENS', 'candidatevotes': 822, 'totalvotes': 884406},
-    {'year': 1984, 'state': 'CALIFORNIA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 5467009, 'totalvotes': 9505041},
-    {'year': 1984, 'state': 'CALIFORNIA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3922519, 'totalvotes': 9505041},
-    {'year': 1984, 'state': 'CALIFORNIA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 49951, 'totalvotes': 9505041},
-    {'year': 1984, 'state': 'CALIFORNIA', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 39265, 'totalvotes': 9505041},
-    {'year': 1984, 'state': 'CALIFORNIA', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 26297, 'totalvotes': 9505041},
-    {'year': 1984, 'state': 'COLORADO', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 821817, 'totalvotes': 1295380},
-    {'year': 1984, 'state': 'COLORADO', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 454975, 'totalvotes': 1295380},
-    {'year': 1984, 'state': 'COLORADO', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11257, 'totalvotes': 1295380},
-    {'year': 1984, 'state': 'COLORADO', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4662, 'totalvotes': 1295380},
-    {'year': 1984, 'state': 'COLORADO', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 978, 'totalvotes': 1295380},
-    {'year': 1984, 'state': 'COLORADO', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 858, 'totalvotes': 1295380},
-    {'year': 1984, 'state': 'COLORADO', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 810, 'totalvotes': 1295380},
-    {'year': 1984, 'state': 'COLORADO', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 23, 'totalvotes': 1295380},
-    {'year': 1984, 'state': 'CONNECTICUT', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 890877, 'totalvotes': 1466900},
-    {'year': 1984, 'state': 'CONNECTICUT', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 569597, 'totalvotes': 1466900},
-    {'year': 1984, 'state': 'CONNECTICUT', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 4826, 'totalvotes': 1466900},
-    {'year': 1984, 'state': 'CONNECTICUT', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 1374, 'totalvotes': 1466900},
-    {'year': 1984, 'state': 'CONNECTICUT', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 226, 'totalvotes': 1466900},
-    {'year': 1984, 'state': 'DELAWARE', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 152190, 'totalvotes': 254572},
-    {'year': 1984, 'state': 'DELAWARE', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 101656, 'totalvotes': 254572},
-    {'year': 1984, 'state': 'DELAWARE', 'candidate': 'DENNIS, DELMAR', 'party_detailed': 'AMERICAN', 'candidatevotes': 269, 'totalvotes': 254572},
-    {'year': 1984, 'state': 'DELAWARE', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 268, 'totalvotes': 254572},
-    {'year': 1984, 'state': 'DELAWARE', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 121, 'totalvotes': 254572},
-    {'year': 1984, 'state': 'DELAWARE', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 68, 'totalvotes': 254572},
-    {'year': 1984, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 180408, 'totalvotes': 211288},
-    {'year': 1984, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 29009, 'totalvotes': 211288},
-    {'year': 1984, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 809, 'totalvotes': 211288},
-    {'year': 1984, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 279, 'totalvotes': 211288},
-    {'year': 1984, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 257, 'totalvotes': 211288},
-    {'year': 1984, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 165, 'totalvotes': 211288},
-    {'year': 1984, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 127, 'totalvotes': 211288},
-    {'year': 1984, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 127, 'totalvotes': 211288},
-    {'year': 1984, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 107, 'totalvotes': 211288},
-    {'year': 1984, 'state': 'FLORIDA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2730350, 'totalvotes': 4180051},
-    {'year': 1984, 'state': 'FLORIDA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1448816, 'totalvotes': 4180051},
-    {'year': 1984, 'state': 'FLORIDA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 885, 'totalvotes': 4180051},
-    {'year': 1984, 'state': 'GEORGIA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1068722, 'totalvotes': 1776103},
-    {'year': 1984, 'state': 'GEORGIA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 706628, 'totalvotes': 1776103},
-    {'year': 1984, 'state': 'GEORGIA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 753, 'totalvotes': 1776103},
-    {'year': 1984, 'state': 'HAWAII', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 185050, 'totalvotes': 335846},
-    {'year': 1984, 'state': 'HAWAII', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 147154, 'totalvotes': 335846},
-    {'year': 1984, 'state': 'HAWAII', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2167, 'totalvotes': 335846},
-    {'year': 1984, 'state': 'HAWAII', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 821, 'totalvotes': 335846},
-    {'year': 1984, 'state': 'HAWAII', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 654, 'totalvotes': 335846},
-    {'year': 1984, 'state': 'IDAHO', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 297523, 'totalvotes': 411144},
-    {'year': 1984, 'state': 'IDAHO', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 108510, 'totalvotes': 411144},
-    {'year': 1984, 'state': 'IDAHO', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2823, 'totalvotes': 411144},
-    {'year': 1984, 'state': 'IDAHO', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 2288, 'totalvotes': 411144},
-    {'year': 1984, 'state': 'ILLINOIS', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2707103, 'totalvotes': 4819088},
-    {'year': 1984, 'state': 'ILLINOIS', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2086499, 'totalvotes': 4819088},
-    {'year': 1984, 'state': 'ILLINOIS', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 10086, 'totalvotes': 4819088},
-    {'year': 1984, 'state': 'ILLINOIS', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 4672, 'totalvotes': 4819088},
-    {'year': 1984, 'state': 'ILLINOIS', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 2716, 'totalvotes': 4819088},
-    {'year': 1984, 'state': 'ILLINOIS', 'candidate': 'WINN, EDWARD', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 2632, 'totalvotes': 4819088},
-    {'year': 1984, 'state': 'ILLINOIS', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 2386, 'totalvotes': 4819088},
-    {'year': 1984, 'state': 'ILLINOIS', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 2132, 'totalvotes': 4819088},
-    {'year': 1984, 'state': 'ILLINOIS', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 862, 'totalvotes': 4819088},
-    {'year': 1984, 'state': 'INDIANA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1377230, 'totalvotes': 2233069},
-    {'year': 1984, 'state': 'INDIANA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 841481, 'totalvotes': 2233069},
-    {'year': 1984, 'state': 'INDIANA', 'candidate': 'DENNIS, DELMAR', 'party_detailed': 'AMERICAN', 'candidatevotes': 7617, 'totalvotes': 2233069},
-    {'year': 1984, 'state': 'INDIANA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6741, 'totalvotes': 2233069},
-    {'year': 1984, 'state': 'IOWA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 703088, 'totalvotes': 1319805},
-    {'year': 1984, 'state': 'IOWA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 605620, 'totalvotes': 1319805},
-    {'year': 1984, 'state': 'IOWA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 6248, 'totalvotes': 1319805},
-    {'year': 1984, 'state': 'IOWA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1844, 'totalvotes': 1319805},
-    {'year': 1984, 'state': 'IOWA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 1051, 'totalvotes': 1319805},
-    {'year': 1984, 'state': 'IOWA', 'candidate': 'BAKER, GERALD', 'party_detailed': 'BIG DEAL PARTY', 'candidatevotes': 892, 'totalvotes': 1319805},
-    {'year': 1984, 'state': 'IOWA', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 463, 'totalvotes': 1319805},
-    {'year': 1984, 'state': 'IOWA', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 313, 'totalvotes': 1319805},
-    {'year': 1984, 'state': 'IOWA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 286, 'totalvotes': 1319805},
-    {'year': 1984, 'state': 'KANSAS', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 677296, 'totalvotes': 1021991},
-    {'year': 1984, 'state': 'KANSAS', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 333149, 'totalvotes': 1021991},
-    {'year': 1984, 'state': 'KANSAS', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 3564, 'totalvotes': 1021991},
-    {'year': 1984, 'state': 'KANSAS', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3329, 'totalvotes': 1021991},
-    {'year': 1984, 'state': 'KANSAS', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 2544, 'totalvotes': 1021991},
-    {'year': 1984, 'state': 'KANSAS', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 2109, 'totalvotes': 1021991},
-    {'year': 1984, 'state': 'KENTUCKY', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 821702, 'totalvotes': 1369345},
-    {'year': 1984, 'state': 'KENTUCKY', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 539539, 'totalvotes': 1369345},
-    {'year': 1984, 'state': 'KENTUCKY', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 3129, 'totalvotes': 1369345},
-    {'year': 1984, 'state': 'KENTUCKY', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1776, 'totalvotes': 1369345},
-    {'year': 1984, 'state': 'KENTUCKY', 'candidate': 'ANDERSON, JOHN B.', 'party_detailed': 'NATIONAL UNITY', 'candidatevotes': 1479, 'totalvotes': 1369345},
-    {'year': 1984, 'state': 'KENTUCKY', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 599, 'totalvotes': 1369345},
-    {'year': 1984, 'state': 'KENTUCKY', 'candidate': 'DENNIS, DELMAR', 'party_detailed': 'AMERICAN', 'candidatevotes': 428, 'totalvotes': 1369345},
-    {'year': 1984, 'state': 'KENTUCKY', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 365, 'totalvotes': 1369345},
-    {'year': 1984, 'state': 'KENTUCKY', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 328, 'totalvotes': 1369345},
-    {'year': 1984, 'state': 'LOUISIANA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1037299, 'totalvotes': 1706822},
-    {'year': 1984, 'state': 'LOUISIANA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 651586, 'totalvotes': 1706822},
-    {'year': 1984, 'state': 'LOUISIANA', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 9502, 'totalvotes': 1706822},
-    {'year': 1984, 'state': 'LOUISIANA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3552, 'totalvotes': 1706822},
-    {'year': 1984, 'state': 'LOUISIANA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1876, 'totalvotes': 1706822},
-    {'year': 1984, 'state': 'LOUISIANA', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 1310, 'totalvotes': 1706822},
-    {'year': 1984, 'state': 'LOUISIANA', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1164, 'totalvotes': 1706822},
-    {'year': 1984, 'state': 'LOUISIANA', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 533, 'totalvotes': 1706822},
-    {'year': 1984, 'state': 'MAINE', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 336500, 'totalvotes': 553144},
-    {'year': 1984, 'state': 'MAINE', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 214515, 'totalvotes': 553144},
-    {'year': 1984, 'state': 'MAINE', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 1292, 'totalvotes': 553144},
-    {'year': 1984, 'state': 'MAINE', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 755, 'totalvotes': 553144},
-    {'year': 1984, 'state': 'MAINE', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 82, 'totalvotes': 553144},
-    {'year': 1984, 'state': 'MARYLAND', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 879918, 'totalvotes': 1675873},
-    {'year': 1984, 'state': 'MARYLAND', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 787935, 'totalvotes': 1675873},
-    {'year': 1984, 'state': 'MARYLAND', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5721, 'totalvotes': 1675873},
-    {'year': 1984, 'state': 'MARYLAND', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 898, 'totalvotes': 1675873},
-    {'year': 1984, 'state': 'MARYLAND', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 745, 'totalvotes': 1675873},
-    {'year': 1984, 'state': 'MARYLAND', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 656, 'totalvotes': 1675873},
-    {'year': 1984, 'state': 'MASSACHUSETTS', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1310936, 'totalvotes': 2559383},
-    {'year': 1984, 'state': 'MASSACHUSETTS', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1239606, 'totalvotes': 2559383},
-    {'year': 1984, 'state': 'MASSACHUSETTS', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 7998, 'totalvotes': 2559383},
-    {'year': 1984, 'state': 'MASSACHUSETTS', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 843, 'totalvotes': 2559383},
-    {'year': 1984, 'state': 'MICHIGAN', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2251571, 'totalvotes': 3801658},
-    {'year': 1984, 'state': 'MICHIGAN', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1529638, 'totalvotes': 3801658},
-    {'year': 1984, 'state': 'MICHIGAN', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 10055, 'totalvotes': 3801658},
-    {'year': 1984, 'state': 'MICHIGAN', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3862, 'totalvotes': 3801658},
-    {'year': 1984, 'state': 'MICHIGAN', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 1416, 'totalvotes': 3801658},
-    {'year': 1984, 'state': 'MICHIGAN', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 1191, 'totalvotes': 3801658},
-    {'year': 1984, 'state': 'MICHIGAN', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1049, 'totalvotes': 3801658},
-    {'year': 1984, 'state': 'MICHIGAN', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 1048, 'totalvotes': 3801658},
-    {'year': 1984, 'state': 'MICHIGAN', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 665, 'totalvotes': 3801658},
-    {'year': 1984, 'state': 'MICHIGAN', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 602, 'totalvotes': 3801658},
-    {'year': 1984, 'state': 'MICHIGAN', 'candidate': 'WINN, EDWARD', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 561, 'totalvotes': 3801658},
-    {'year': 1984, 'state': 'MINNESOTA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1036364, 'totalvotes': 2084449},
-    {'year': 1984, 'state': 'MINNESOTA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1032603, 'totalvotes': 2084449},
-    {'year': 1984, 'state': 'MINNESOTA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3865, 'totalvotes': 2084449},
-    {'year': 1984, 'state': 'MINNESOTA', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 3180, 'totalvotes': 2084449},
-    {'year': 1984, 'state': 'MINNESOTA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2996, 'totalvotes': 2084449},
-    {'year': 1984, 'state': 'MINNESOTA', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 2377, 'totalvotes': 2084449},
-    {'year': 1984, 'state': 'MINNESOTA', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 1219, 'totalvotes': 2084449},
-    {'year': 1984, 'state': 'MINNESOTA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 723, 'totalvotes': 2084449},
-    {'year': 1984, 'state': 'MINNESOTA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 630, 'totalvotes': 2084449},
-    {'year': 1984, 'state': 'MINNESOTA', 'candidate': 'WINN, EDWARD', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 260, 'totalvotes': 2084449},
-    {'year': 1984, 'state': 'MINNESOTA', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 232, 'totalvotes': 2084449},
-    {'year': 1984, 'state': 'MISSISSIPPI', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 582377, 'totalvotes': 941104},
-    {'year': 1984, 'state': 'MISSISSIPPI', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 352192, 'totalvotes': 941104},
-    {'year': 1984, 'state': 'MISSISSIPPI', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2336, 'totalvotes': 941104},
-    {'year': 1984, 'state': 'MISSISSIPPI', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 1169, 'totalvotes': 941104},
-    {'year': 1984, 'state': 'MISSISSIPPI', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1032, 'totalvotes': 941104},
-    {'year': 1984, 'state': 'MISSISSIPPI', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1001, 'totalvotes': 941104},
-    {'year': 1984, 'state': 'MISSISSIPPI', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 641, 'totalvotes': 941104},
-    {'year': 1984, 'state': 'MISSISSIPPI', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 356, 'totalvotes': 941104},
-    {'year': 1984, 'state': 'MISSOURI', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1274188, 'totalvotes': 2122771},
-    {'year': 1984, 'state': 'MISSOURI', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 848583, 'totalvotes': 2122771},
-    {'year': 1984, 'state': 'MONTANA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 232450, 'totalvotes': 384377},
-    {'year': 1984, 'state': 'MONTANA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 146742, 'totalvotes': 384377},
-    {'year': 1984, 'state': 'MONTANA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5185, 'totalvotes': 384377},
-    {'year': 1984, 'state': 'NEBRASKA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 460054, 'totalvotes': 652090},
-    {'year': 1984, 'state': 'NEBRASKA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 187866, 'totalvotes': 652090},
-    {'year': 1984, 'state': 'NEBRASKA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2079, 'totalvotes': 652090},
-    {'year': 1984, 'state': 'NEBRASKA', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1066, 'totalvotes': 652090},
-    {'year': 1984, 'state': 'NEBRASKA', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 1025, 'totalvotes': 652090},
-    {'year': 1984, 'state': 'NEVADA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 188770, 'totalvotes': 282717},
-    {'year': 1984, 'state': 'NEVADA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 91655, 'totalvotes': 282717},
-    {'year': 1984, 'state': 'NEVADA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2292, 'totalvotes': 282717},
-    {'year': 1984, 'state': 'NEW HAMPSHIRE', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 267050, 'totalvotes': 388904},
-    {'year': 1984, 'state': 'NEW HAMPSHIRE', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 120347, 'totalvotes': 388904},
-    {'year': 1984, 'state': 'NEW HAMPSHIRE', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 735, 'totalvotes': 388904},
-    {'year': 1984, 'state': 'NEW HAMPSHIRE', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 467, 'totalvotes': 388904},
-    {'year': 1984, 'state': 'NEW HAMPSHIRE', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 305, 'totalvotes': 388904},
-    {'year': 1984, 'state': 'NEW JERSEY', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1933630, 'totalvotes': 3217862},
-    {'year': 1984, 'state': 'NEW JERSEY', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1261323, 'totalvotes': 3217862},
-    {'year': 1984, 'state': 'NEW JERSEY', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 8404, 'totalvotes': 3217862},
-    {'year': 1984, 'state': 'NEW JERSEY', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6416, 'totalvotes': 3217862},
-    {'year': 1984, 'state': 'NEW JERSEY', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 2293, 'totalvotes': 3217862},
-    {'year': 1984, 'state': 'NEW JERSEY', 'candidate': 'WINN, EDWARD', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 1721, 'totalvotes': 3217862},
-    {'year': 1984, 'state': 'NEW JERSEY', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 1564, 'totalvotes': 3217862},
-    {'year': 1984, 'state': 'NEW JERSEY', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1264, 'totalvotes': 3217862},
-    {'year': 1984, 'state': 'NEW JERSEY', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 1247, 'totalvotes': 3217862},
-    {'year': 1984, 'state': 'NEW MEXICO', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 307101, 'totalvotes': 514370},
-    {'year': 1984, 'state': 'NEW MEXICO', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 201769, 'totalvotes': 514370},
-    {'year': 1984, 'state': 'NEW MEXICO', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4459, 'totalvotes': 514370},
-    {'year': 1984, 'state': 'NEW MEXICO', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 455, 'totalvotes': 514370},
-    {'year': 1984, 'state': 'NEW MEXICO', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 224, 'totalvotes': 514370},
-    {'year': 1984, 'state': 'NEW MEXICO', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 206, 'totalvotes': 514370},
-    {'year': 1984, 'state': 'NEW MEXICO', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 155, 'totalvotes': 514370},
-    {'year': 1984, 'state': 'NEW MEXICO', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 514370},
-    {'year': 1984, 'state': 'NEW YORK', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 3376519, 'totalvotes': 6806810},
-    {'year': 1984, 'state': 'NEW YORK', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3001285, 'totalvotes': 6806810},
-    {'year': 1984, 'state': 'NEW YORK', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 288244, 'totalvotes': 6806810},
-    {'year': 1984, 'state': 'NEW YORK', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'LIBERAL PARTY', 'candidatevotes': 118324, 'totalvotes': 6806810},
-    {'year': 1984, 'state': 'NEW YORK', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11949, 'totalvotes': 6806810},
-    {'year': 1984, 'state': 'NEW YORK', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 4226, 'totalvotes': 6806810},
-    {'year': 1984, 'state': 'NEW YORK', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 3200, 'totalvotes': 6806810},
-    {'year': 1984, 'state': 'NEW YORK', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 2226, 'totalvotes': 6806810},
-    {'year': 1984, 'state': 'NEW YORK', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 837, 'totalvotes': 6806810},
-    {'year': 1984, 'state': 'NORTH CAROLINA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1346481, 'totalvotes': 2175361},
-    {'year': 1984, 'state': 'NORTH CAROLINA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 824287, 'totalvotes': 2175361},
-    {'year': 1984, 'state': 'NORTH CAROLINA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3794, 'totalvotes': 2175361},
-    {'year': 1984, 'state': 'NORTH CAROLINA', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 799, 'totalvotes': 2175361},
-    {'year': 1984, 'state': 'NORTH DAKOTA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 200336, 'totalvotes': 308971},
-    {'year': 1984, 'state': 'NORTH DAKOTA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 104429, 'totalvotes': 308971},
-    {'year': 1984, 'state': 'NORTH DAKOTA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1278, 'totalvotes': 308971},
-    {'year': 1984, 'state': 'NORTH DAKOTA', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 1077, 'totalvotes': 308971},
-    {'year': 1984, 'state': 'NORTH DAKOTA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 703, 'totalvotes': 308971},
-    {'year': 1984, 'state': 'NORTH DAKOTA', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 368, 'totalvotes': 308971},
-    {'year': 1984, 'state': 'NORTH DAKOTA', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 239, 'totalvotes': 308971},
-    {'year': 1984, 'state': 'NORTH DAKOTA', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 220, 'totalvotes': 308971},
-    {'year': 1984, 'state': 'NORTH DAKOTA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 169, 'totalvotes': 308971},
-    {'year': 1984, 'state': 'NORTH DAKOTA', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 152, 'totalvotes': 308971},
-    {'year': 1984, 'state': 'OHIO', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2678559, 'totalvotes': 4563235},
-    {'year': 1984, 'state': 'OHIO', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1825440, 'totalvotes': 4563235},
-    {'year': 1984, 'state': 'OHIO', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 24180, 'totalvotes': 4563235},
-    {'year': 1984, 'state': 'OHIO', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 10693, 'totalvotes': 4563235},
-    {'year': 1984, 'state': 'OHIO', 'candidate': 'WINN, EDWARD', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 7130, 'totalvotes': 4563235},
-    {'year': 1984, 'state': 'OHIO', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5886, 'totalvotes': 4563235},
-    {'year': 1984, 'state': 'OHIO', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 4438, 'totalvotes': 4563235},
-    {'year': 1984, 'state': 'OHIO', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 4344, 'totalvotes': 4563235},
-    {'year': 1984, 'state': 'OHIO', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 2565, 'totalvotes': 4563235},
-    {'year': 1984, 'state': 'OKLAHOMA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 861530, 'totalvotes': 1255676},
-    {'year': 1984, 'state': 'OKLAHOMA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 385080, 'totalvotes': 1255676},
-    {'year': 1984, 'state': 'OKLAHOMA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9066, 'totalvotes': 1255676},
-    {'year': 1984, 'state': 'OREGON', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 685700, 'totalvotes': 1226527},
-    {'year': 1984, 'state': 'OREGON', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 536479, 'totalvotes': 1226527},
-    {'year': 1984, 'state': 'OREGON', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 4348, 'totalvotes': 1226527},
-    {'year': 1984, 'state': 'PENNSYLVANIA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2584323, 'totalvotes': 4844903},
-    {'year': 1984, 'state': 'PENNSYLVANIA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2228131, 'totalvotes': 4844903},
-    {'year': 1984, 'state': 'PENNSYLVANIA', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 21628, 'totalvotes': 4844903},
-    {'year': 1984, 'state': 'PENNSYLVANIA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6982, 'totalvotes': 4844903},
-    {'year': 1984, 'state': 'PENNSYLVANIA', 'candidate': 'WINN, EDWARD', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 2059, 'totalvotes': 4844903},
-    {'year': 1984, 'state': 'PENNSYLVANIA', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 1780, 'totalvotes': 4844903},
-    {'year': 1984, 'state': 'RHODE ISLAND', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 212080, 'totalvotes': 410489},
-    {'year': 1984, 'state': 'RHODE ISLAND', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 197106, 'totalvotes': 410489},
-    {'year': 1984, 'state': 'RHODE ISLAND', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 510, 'totalvotes': 410489},
-    {'year': 1984, 'state': 'RHODE ISLAND', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 277, 'totalvotes': 410489},
-    {'year': 1984, 'state': 'RHODE ISLAND', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 240, 'totalvotes': 410489},
-    {'year': 1984, 'state': 'RHODE ISLAND', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 91, 'totalvotes': 410489},
-    {'year': 1984, 'state': 'RHODE ISLAND', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 75, 'totalvotes': 410489},
-    {'year': 1984, 'state': 'RHODE ISLAND', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 61, 'totalvotes': 410489},
-    {'year': 1984, 'state': 'RHODE ISLAND', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 49, 'totalvotes': 410489},
-    {'year': 1984, 'state': 'SOUTH CAROLINA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 615539, 'totalvotes': 968529},
-    {'year': 1984, 'state': 'SOUTH CAROLINA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 344459, 'totalvotes': 968529},
-    {'year': 1984, 'state': 'SOUTH CAROLINA', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4359, 'totalvotes': 968529},
-    {'year': 1984, 'state': 'SOUTH CAROLINA', 'candidate': 'DENNIS, DELMAR', 'party_detailed': 'AMERICAN', 'candidatevotes': 3490, 'totalvotes': 968529},
-    {'year': 1984, 'state': 'SOUTH CAROLINA', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 682, 'totalvotes': 968529},
-    {'year': 1984, 'state': 'SOUTH DAKOTA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 200267, 'totalvotes': 317867},
-    {'year': 1984, 'state': 'SOUTH DAKOTA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 116113, 'totalvotes': 317867},
-    {'year': 1984, 'state': 'SOUTH DAKOTA', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 1150, 'totalvotes': 317867},
-    {'year': 1984, 'state': 'SOUTH DAKOTA', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 337, 'totalvotes': 317867},
-    {'year': 1984, 'state': 'TENNESSEE', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 990212, 'totalvotes': 1711993},
-    {'year': 1984, 'state': 'TENNESSEE', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 711714, 'totalvotes': 1711993},
-    {'year': 1984, 'state': 'TENNESSEE', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3072, 'totalvotes': 1711993},
-    {'year': 1984, 'state': 'TENNESSEE', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1852, 'totalvotes': 1711993},
-    {'year': 1984, 'state': 'TENNESSEE', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 1763, 'totalvotes': 1711993},
-    {'year': 1984, 'state': 'TENNESSEE', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 1036, 'totalvotes': 1711993},
-    {'year': 1984, 'state': 'TENNESSEE', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 978, 'totalvotes': 1711993},
-    {'year': 1984, 'state': 'TENNESSEE', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 715, 'totalvotes': 1711993},
-    {'year': 1984, 'state': 'TENNESSEE', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 524, 'totalvotes': 1711993},
-    {'year': 1984, 'state': 'TENNESSEE', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 127, 'totalvotes': 1711993},
-    {'year': 1984, 'state': 'TEXAS', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 3433428, 'totalvotes': 5397571},
-    {'year': 1984, 'state': 'TEXAS', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1949276, 'totalvotes': 5397571},
-    {'year': 1984, 'state': 'TEXAS', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 14613, 'totalvotes': 5397571},
-    {'year': 1984, 'state': 'TEXAS', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 254, 'totalvotes': 5397571},
-    {'year': 1984, 'state': 'UTAH', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 469105, 'totalvotes': 629656},
-    {'year': 1984, 'state': 'UTAH', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 155369, 'totalvotes': 629656},
-    {'year': 1984, 'state': 'UTAH', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2447, 'totalvotes': 629656},
-    {'year': 1984, 'state': 'UTAH', 'candidate': 'DENNIS, DELMAR', 'party_detailed': 'AMERICAN', 'candidatevotes': 1345, 'totalvotes': 629656},
-    {'year': 1984, 'state': 'UTAH', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 844, 'totalvotes': 629656},
-    {'year': 1984, 'state': 'UTAH', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 220, 'totalvotes': 629656},
-    {'year': 1984, 'state': 'UTAH', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 184, 'totalvotes': 629656},
-    {'year': 1984, 'state': 'UTAH', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 142, 'totalvotes': 629656},
-    {'year': 1984, 'state': 'VERMONT', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 135865, 'totalvotes': 234561},
-    {'year': 1984, 'state': 'VERMONT', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 95730, 'totalvotes': 234561},
-    {'year': 1984, 'state': 'VERMONT', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1002, 'totalvotes': 234561},
-    {'year': 1984, 'state': 'VERMONT', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 712, 'totalvotes': 234561},
-    {'year': 1984, 'state': 'VERMONT', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 423, 'totalvotes': 234561},
-    {'year': 1984, 'state': 'VERMONT', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 323, 'totalvotes': 234561},
-    {'year': 1984, 'state': 'VERMONT', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 264, 'totalvotes': 234561},
-    {'year': 1984, 'state': 'VERMONT', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 127, 'totalvotes': 234561},
-    {'year': 1984, 'state': 'VERMONT', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 115, 'totalvotes': 234561},
-    {'year': 1984, 'state': 'VIRGINIA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1337078, 'totalvotes': 2146635},
-    {'year': 1984, 'state': 'VIRGINIA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 796250, 'totalvotes': 2146635},
-    {'year': 1984, 'state': 'VIRGINIA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 13307, 'totalvotes': 2146635},
-    {'year': 1984, 'state': 'WASHINGTON', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1051670, 'totalvotes': 1874910},
-    {'year': 1984, 'state': 'WASHINGTON', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 798352, 'totalvotes': 1874910},
-    {'year': 1984, 'state': 'WASHINGTON', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8844, 'totalvotes': 1874910},
-    {'year': 1984, 'state': 'WASHINGTON', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 5724, 'totalvotes': 1874910},
-    {'year': 1984, 'state': 'WASHINGTON', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4712, 'totalvotes': 1874910},
-    {'year': 1984, 'state': 'WASHINGTON', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 1891, 'totalvotes': 1874910},
-    {'year': 1984, 'state': 'WASHINGTON', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 1654, 'totalvotes': 1874910},
-    {'year': 1984, 'state': 'WASHINGTON', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 814, 'totalvotes': 1874910},
-    {'year': 1984, 'state': 'WASHINGTON', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 641, 'totalvotes': 1874910},
-    {'year': 1984, 'state': 'WASHINGTON', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 608, 'totalvotes': 1874910},
-    {'year': 1984, 'state': 'WEST VIRGINIA', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 405483, 'totalvotes': 735742},
-    {'year': 1984, 'state': 'WEST VIRGINIA', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 328125, 'totalvotes': 735742},
-    {'year': 1984, 'state': 'WEST VIRGINIA', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 996, 'totalvotes': 735742},
-    {'year': 1984, 'state': 'WEST VIRGINIA', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 645, 'totalvotes': 735742},
-    {'year': 1984, 'state': 'WEST VIRGINIA', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 493, 'totalvotes': 735742},
-    {'year': 1984, 'state': 'WISCONSIN', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1198584, 'totalvotes': 2211689},
-    {'year': 1984, 'state': 'WISCONSIN', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 995740, 'totalvotes': 2211689},
-    {'year': 1984, 'state': 'WISCONSIN', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4883, 'totalvotes': 2211689},
-    {'year': 1984, 'state': 'WISCONSIN', 'candidate': 'RICHARDS, BOB', 'party_detailed': 'POPULIST', 'candidatevotes': 3864, 'totalvotes': 2211689},
-    {'year': 1984, 'state': 'WISCONSIN', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3791, 'totalvotes': 2211689},
-    {'year': 1984, 'state': 'WISCONSIN', 'candidate': 'JOHNSON, SONIA', 'party_detailed': 'CITIZENS', 'candidatevotes': 1456, 'totalvotes': 2211689},
-    {'year': 1984, 'state': 'WISCONSIN', 'candidate': 'SERRETTE, DENNIS', 'party_detailed': 'ALLIANCE', 'candidatevotes': 1006, 'totalvotes': 2211689},
-    {'year': 1984, 'state': 'WISCONSIN', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 706, 'totalvotes': 2211689},
-    {'year': 1984, 'state': 'WISCONSIN', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 619, 'totalvotes': 2211689},
-    {'year': 1984, 'state': 'WISCONSIN', 'candidate': 'HALL, GUS', 'party_detailed': 'COMMUNIST PARTY USE', 'candidatevotes': 596, 'totalvotes': 2211689},
-    {'year': 1984, 'state': 'WISCONSIN', 'candidate': 'MASON, MELVIN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 444, 'totalvotes': 2211689},
-    {'year': 1984, 'state': 'WYOMING', 'candidate': 'REAGAN, RONALD', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 133241, 'totalvotes': 188968},
-    {'year': 1984, 'state': 'WYOMING', 'candidate': 'MONDALE, WALTER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 53370, 'totalvotes': 188968},
-    {'year': 1984, 'state': 'WYOMING', 'candidate': 'BERGLAND, DAVID', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2357, 'totalvotes': 188968},
-    {'year': 1988, 'state': 'ALABAMA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 815576, 'totalvotes': 1378476},
-    {'year': 1988, 'state': 'ALABAMA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 549506, 'totalvotes': 1378476},
-    {'year': 1988, 'state': 'ALABAMA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8460, 'totalvotes': 1378476},
-    {'year': 1988, 'state': 'ALABAMA', 'candidate': 'WINN, EDWARD', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4428, 'totalvotes': 1378476},
-    {'year': 1988, 'state': 'ALABAMA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 506, 'totalvotes': 1378476},
-    {'year': 1988, 'state': 'ALASKA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 119251, 'totalvotes': 200116},
-    {'year': 1988, 'state': 'ALASKA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 72584, 'totalvotes': 200116},
-    {'year': 1988, 'state': 'ALASKA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5484, 'totalvotes': 200116},
-    {'year': 1988, 'state': 'ALASKA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 1024, 'totalvotes': 200116},
-    {'year': 1988, 'state': 'ALASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 957, 'totalvotes': 200116},
-    {'year': 1988, 'state': 'ALASKA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'NATIONAL ECONOMIC RECOVERY', 'candidatevotes': 816, 'totalvotes': 200116},
-    {'year': 1988, 'state': 'ARIZONA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 702541, 'totalvotes': 1171873},
-    {'year': 1988, 'state': 'ARIZONA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 454029, 'totalvotes': 1171873},
-    {'year': 1988, 'state': 'ARIZONA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 13351, 'totalvotes': 1171873},
-    {'year': 1988, 'state': 'ARIZONA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 1662, 'totalvotes': 1171873},
-    {'year': 1988, 'state': 'ARIZONA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 290, 'totalvotes': 1171873},
-    {'year': 1988, 'state': 'ARKANSAS', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 466578, 'totalvotes': 827738},
-    {'year': 1988, 'state': 'ARKANSAS', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 349237, 'totalvotes': 827738},
-    {'year': 1988, 'state': 'ARKANSAS', 'candidate': 'DODGE, EARL', 'party_detailed': 'POPULIST', 'candidatevotes': 5146, 'totalvotes': 827738},
-    {'year': 1988, 'state': 'ARKANSAS', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3297, 'totalvotes': 827738},
-    {'year': 1988, 'state': 'ARKANSAS', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 2161, 'totalvotes': 827738},
-    {'year': 1988, 'state': 'ARKANSAS', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 1319, 'totalvotes': 827738},
-    {'year': 1988, 'state': 'CALIFORNIA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 5054917, 'totalvotes': 9887065},
-    {'year': 1988, 'state': 'CALIFORNIA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 4702233, 'totalvotes': 9887065},
-    {'year': 1988, 'state': 'CALIFORNIA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 70105, 'totalvotes': 9887065},
-    {'year': 1988, 'state': 'CALIFORNIA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 58999, 'totalvotes': 9887065},
-    {'year': 1988, 'state': 'CALIFORNIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 811, 'totalvotes': 9887065},
-    {'year': 1988, 'state': 'COLORADO', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 728177, 'totalvotes': 1372394},
-    {'year': 1988, 'state': 'COLORADO', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 621453, 'totalvotes': 1372394},
-    {'year': 1988, 'state': 'COLORADO', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 15482, 'totalvotes': 1372394},
-    {'year': 1988, 'state': 'COLORADO', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 4604, 'totalvotes': 1372394},
-    {'year': 1988, 'state': 'COLORADO', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 2539, 'totalvotes': 1372394},
-    {'year': 1988, 'state': 'COLORADO', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 139, 'totalvotes': 1372394},
-    {'year': 1988, 'state': 'CONNECTICUT', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 750241, 'totalvotes': 1443394},
-    {'year': 1988, 'state': 'CONNECTICUT', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 676584, 'totalvotes': 1443394},
-    {'year': 1988, 'state': 'CONNECTICUT', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 14071, 'totalvotes': 1443394},
-    {'year': 1988, 'state': 'CONNECTICUT', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 2491, 'totalvotes': 1443394},
-    {'year': 1988, 'state': 'CONNECTICUT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 7, 'totalvotes': 1443394},
-    {'year': 1988, 'state': 'DELAWARE', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 139639, 'totalvotes': 249891},
-    {'year': 1988, 'state': 'DELAWARE', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 108647, 'totalvotes': 249891},
-    {'year': 1988, 'state': 'DELAWARE', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1162, 'totalvotes': 249891},
-    {'year': 1988, 'state': 'DELAWARE', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 443, 'totalvotes': 249891},
-    {'year': 1988, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 159407, 'totalvotes': 192877},
-    {'year': 1988, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 27590, 'totalvotes': 192877},
-    {'year': 1988, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3064, 'totalvotes': 192877},
-    {'year': 1988, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1553, 'totalvotes': 192877},
-    {'year': 1988, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 554, 'totalvotes': 192877},
-    {'year': 1988, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'THIRD WORLD ASSEMBLY', 'candidatevotes': 236, 'totalvotes': 192877},
-    {'year': 1988, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'WINN, EDWARD', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 208, 'totalvotes': 192877},
-    {'year': 1988, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'KENOYER, WILLA', 'party_detailed': 'SOCIALIST', 'candidatevotes': 142, 'totalvotes': 192877},
-    {'year': 1988, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 123, 'totalvotes': 192877},
-    {'year': 1988, 'state': 'FLORIDA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2618885, 'totalvotes': 4302313},
-    {'year': 1988, 'state': 'FLORIDA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1656701, 'totalvotes': 4302313},
-    {'year': 1988, 'state': 'FLORIDA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 19796, 'totalvotes': 4302313},
-    {'year': 1988, 'state': 'FLORIDA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 6655, 'totalvotes': 4302313},
-    {'year': 1988, 'state': 'FLORIDA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 276, 'totalvotes': 4302313},
-    {'year': 1988, 'state': 'GEORGIA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1081331, 'totalvotes': 1809672},
-    {'year': 1988, 'state': 'GEORGIA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 714792, 'totalvotes': 1809672},
-    {'year': 1988, 'state': 'GEORGIA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8435, 'totalvotes': 1809672},
-    {'year': 1988, 'state': 'GEORGIA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 5099, 'totalvotes': 1809672},
-    {'year': 1988, 'state': 'GEORGIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 15, 'totalvotes': 1809672},
-    {'year': 1988, 'state': 'HAWAII', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 192364, 'totalvotes': 354461},
-    {'year': 1988, 'state': 'HAWAII', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 158625, 'totalvotes': 354461},
-    {'year': 1988, 'state': 'HAWAII', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1999, 'totalvotes': 354461},
-    {'year': 1988, 'state': 'HAWAII', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NO PARTY AFFILIATION', 'candidatevotes': 1003, 'totalvotes': 354461},
-    {'year': 1988, 'state': 'HAWAII', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'NATIONAL ECONOMIC RECOVERY', 'candidatevotes': 470, 'totalvotes': 354461},
-    {'year': 1988, 'state': 'IDAHO', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 253881, 'totalvotes': 408968},
-    {'year': 1988, 'state': 'IDAHO', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 147272, 'totalvotes': 408968},
-    {'year': 1988, 'state': 'IDAHO', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5313, 'totalvotes': 408968},
-    {'year': 1988, 'state': 'IDAHO', 'candidate': 'FULANI, LENORA', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2502, 'totalvotes': 408968},
-    {'year': 1988, 'state': 'ILLINOIS', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2310939, 'totalvotes': 4559120},
-    {'year': 1988, 'state': 'ILLINOIS', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2215940, 'totalvotes': 4559120},
-    {'year': 1988, 'state': 'ILLINOIS', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 14944, 'totalvotes': 4559120},
-    {'year': 1988, 'state': 'ILLINOIS', 'candidate': 'FULANI, LENORA', 'party_detailed': 'SOLIDARITY', 'candidatevotes': 10276, 'totalvotes': 4559120},
-    {'year': 1988, 'state': 'ILLINOIS', 'candidate': 'WINN, EDWARD', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 7021, 'totalvotes': 4559120},
-    {'year': 1988, 'state': 'INDIANA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1297763, 'totalvotes': 2168621},
-    {'year': 1988, 'state': 'INDIANA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 860643, 'totalvotes': 2168621},
-    {'year': 1988, 'state': 'INDIANA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 10215, 'totalvotes': 2168621},
-    {'year': 1988, 'state': 'IOWA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 670557, 'totalvotes': 1225614},
-    {'year': 1988, 'state': 'IOWA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 545355, 'totalvotes': 1225614},
-    {'year': 1988, 'state': 'IOWA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'NOMINATED BY PETITION', 'candidatevotes': 3526, 'totalvotes': 1225614},
-    {'year': 1988, 'state': 'IOWA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2494, 'totalvotes': 1225614},
-    {'year': 1988, 'state': 'IOWA', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 1613, 'totalvotes': 1225614},
-    {'year': 1988, 'state': 'IOWA', 'candidate': 'DUKE, DAVID', 'party_detailed': 'PATRIOTIC PARTY', 'candidatevotes': 755, 'totalvotes': 1225614},
-    {'year': 1988, 'state': 'IOWA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 540, 'totalvotes': 1225614},
-    {'year': 1988, 'state': 'IOWA', 'candidate': 'KENOYER, WILLA', 'party_detailed': 'SOCIALIST', 'candidatevotes': 334, 'totalvotes': 1225614},
-    {'year': 1988, 'state': 'IOWA', 'candidate': 'WINN, EDWARD', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 235, 'totalvotes': 1225614},
-    {'year': 1988, 'state': 'IOWA', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 205, 'totalvotes': 1225614},
-    {'year': 1988, 'state': 'KANSAS', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 554049, 'totalvotes': 993044},
-    {'year': 1988, 'state': 'KANSAS', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 422636, 'totalvotes': 993044},
-    {'year': 1988, 'state': 'KANSAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 16359, 'totalvotes': 993044},
-    {'year': 1988, 'state': 'KENTUCKY', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 734281, 'totalvotes': 1322517},
-    {'year': 1988, 'state': 'KENTUCKY', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 580368, 'totalvotes': 1322517},
-    {'year': 1988, 'state': 'KENTUCKY', 'candidate': 'DUKE, DAVID', 'party_detailed': 'POPULIST', 'candidatevotes': 4494, 'totalvotes': 1322517},
-    {'year': 1988, 'state': 'KENTUCKY', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2118, 'totalvotes': 1322517},
-    {'year': 1988, 'state': 'KENTUCKY', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 1256, 'totalvotes': 1322517},
-    {'year': 1988, 'state': 'LOUISIANA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 883702, 'totalvotes': 1628202},
-    {'year': 1988, 'state': 'LOUISIANA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 717460, 'totalvotes': 1628202},
-    {'year': 1988, 'state': 'LOUISIANA', 'candidate': 'DUKE, DAVID', 'party_detailed': 'POPULIST', 'candidatevotes': 18612, 'totalvotes': 1628202},
-    {'year': 1988, 'state': 'LOUISIANA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4115, 'totalvotes': 1628202},
-    {'year': 1988, 'state': 'LOUISIANA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 2355, 'totalvotes': 1628202},
-    {'year': 1988, 'state': 'LOUISIANA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'NATIONAL ECONOMIC RECOVERY', 'candidatevotes': 1958, 'totalvotes': 1628202},
-    {'year': 1988, 'state': 'MAINE', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 307131, 'totalvotes': 555035},
-    {'year': 1988, 'state': 'MAINE', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 243569, 'totalvotes': 555035},
-    {'year': 1988, 'state': 'MAINE', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2700, 'totalvotes': 555035},
-    {'year': 1988, 'state': 'MAINE', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 1405, 'totalvotes': 555035},
-    {'year': 1988, 'state': 'MAINE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 230, 'totalvotes': 555035},
-    {'year': 1988, 'state': 'MARYLAND', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 876167, 'totalvotes': 1714358},
-    {'year': 1988, 'state': 'MARYLAND', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 826304, 'totalvotes': 1714358},
-    {'year': 1988, 'state': 'MARYLAND', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6748, 'totalvotes': 1714358},
-    {'year': 1988, 'state': 'MARYLAND', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 5115, 'totalvotes': 1714358},
-    {'year': 1988, 'state': 'MARYLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 24, 'totalvotes': 1714358},
-    {'year': 1988, 'state': 'MASSACHUSETTS', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1401415, 'totalvotes': 2632801},
-    {'year': 1988, 'state': 'MASSACHUSETTS', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1194635, 'totalvotes': 2632801},
-    {'year': 1988, 'state': 'MASSACHUSETTS', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 24251, 'totalvotes': 2632801},
-    {'year': 1988, 'state': 'MASSACHUSETTS', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 9561, 'totalvotes': 2632801},
-    {'year': 1988, 'state': 'MASSACHUSETTS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2939, 'totalvotes': 2632801},
-    {'year': 1988, 'state': 'MICHIGAN', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1965486, 'totalvotes': 3669163},
-    {'year': 1988, 'state': 'MICHIGAN', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1675783, 'totalvotes': 3669163},
-    {'year': 1988, 'state': 'MICHIGAN', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 18336, 'totalvotes': 3669163},
-    {'year': 1988, 'state': 'MICHIGAN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 7600, 'totalvotes': 3669163},
-    {'year': 1988, 'state': 'MICHIGAN', 'candidate': 'WINN, EDWARD', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 1958, 'totalvotes': 3669163},
-    {'year': 1988, 'state': 'MINNESOTA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1109471, 'totalvotes': 2096790},
-    {'year': 1988, 'state': 'MINNESOTA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 962337, 'totalvotes': 2096790},
-    {'year': 1988, 'state': 'MINNESOTA', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'PROGRESSIVE', 'candidatevotes': 5403, 'totalvotes': 2096790},
-    {'year': 1988, 'state': 'MINNESOTA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5109, 'totalvotes': 2096790},
-    {'year': 1988, 'state': 'MINNESOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 3614, 'totalvotes': 2096790},
-    {'year': 1988, 'state': 'MINNESOTA', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 2155, 'totalvotes': 2096790},
-    {'year': 1988, 'state': 'MINNESOTA', 'candidate': 'HERER, JACK', 'party_detailed': 'GRASSROOTS', 'candidatevotes': 1949, 'totalvotes': 2096790},
-    {'year': 1988, 'state': 'MINNESOTA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 1734, 'totalvotes': 2096790},
-    {'year': 1988, 'state': 'MINNESOTA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'NATIONAL ECONOMIC RECOVERY', 'candidatevotes': 1702, 'totalvotes': 2096790},
-    {'year': 1988, 'state': 'MINNESOTA', 'candidate': 'DUKE, DAVID', 'party_detailed': 'POPULIST', 'candidatevotes': 1529, 'totalvotes': 2096790},
-    {'year': 1988, 'state': 'MINNESOTA', 'candidate': 'DENNIS, DELMAR', 'party_detailed': 'AMERICAN', 'candidatevotes': 1298, 'totalvotes': 2096790},
-    {'year': 1988, 'state': 'MINNESOTA', 'candidate': 'WINN, EDWARD', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 489, 'totalvotes': 2096790},
-    {'year': 1988, 'state': 'MISSISSIPPI', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 557890, 'totalvotes': 931527},
-    {'year': 1988, 'state': 'MISSISSIPPI', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 363921, 'totalvotes': 931527},
-    {'year': 1988, 'state': 'MISSISSIPPI', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 6387, 'totalvotes': 931527},
-    {'year': 1988, 'state': 'MISSISSIPPI', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3329, 'totalvotes': 931527},
-    {'year': 1988, 'state': 'MISSOURI', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1084953, 'totalvotes': 2093228},
-    {'year': 1988, 'state': 'MISSOURI', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1001619, 'totalvotes': 2093228},
-    {'year': 1988, 'state': 'MISSOURI', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 6656, 'totalvotes': 2093228},
-    {'year': 1988, 'state': 'MONTANA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 190412, 'totalvotes': 365674},
-    {'year': 1988, 'state': 'MONTANA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 168936, 'totalvotes': 365674},
-    {'year': 1988, 'state': 'MONTANA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5047, 'totalvotes': 365674},
-    {'year': 1988, 'state': 'MONTANA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 1279, 'totalvotes': 365674},
-    {'year': 1988, 'state': 'NEBRASKA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 397956, 'totalvotes': 661465},
-    {'year': 1988, 'state': 'NEBRASKA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 259235, 'totalvotes': 661465},
-    {'year': 1988, 'state': 'NEBRASKA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2534, 'totalvotes': 661465},
-    {'year': 1988, 'state': 'NEBRASKA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 1740, 'totalvotes': 661465},
-    {'year': 1988, 'state': 'NEVADA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 206040, 'totalvotes': 343133},
-    {'year': 1988, 'state': 'NEVADA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 132738, 'totalvotes': 343133},
-    {'year': 1988, 'state': 'NEVADA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3520, 'totalvotes': 343133},
-    {'year': 1988, 'state': 'NEVADA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 835, 'totalvotes': 343133},
-    {'year': 1988, 'state': 'NEW HAMPSHIRE', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 281537, 'totalvotes': 450525},
-    {'year': 1988, 'state': 'NEW HAMPSHIRE', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 163696, 'totalvotes': 450525},
-    {'year': 1988, 'state': 'NEW HAMPSHIRE', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4502, 'totalvotes': 450525},
-    {'year': 1988, 'state': 'NEW HAMPSHIRE', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 790, 'totalvotes': 450525},
-    {'year': 1988, 'state': 'NEW JERSEY', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1743192, 'totalvotes': 3099553},
-    {'year': 1988, 'state': 'NEW JERSEY', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1320352, 'totalvotes': 3099553},
-    {'year': 1988, 'state': 'NEW JERSEY', 'candidate': 'HERBERG G., LEWIN', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 9953, 'totalvotes': 3099553},
-    {'year': 1988, 'state': 'NEW JERSEY', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8421, 'totalvotes': 3099553},
-    {'year': 1988, 'state': 'NEW JERSEY', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 5139, 'totalvotes': 3099553},
-    {'year': 1988, 'state': 'NEW JERSEY', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'CONSUMER', 'candidatevotes': 3454, 'totalvotes': 3099553},
-    {'year': 1988, 'state': 'NEW JERSEY', 'candidate': 'KENOYER, WILLA', 'party_detailed': 'SOCIALIST', 'candidatevotes': 2587, 'totalvotes': 3099553},
-    {'year': 1988, 'state': 'NEW JERSEY', 'candidate': 'DUKE, DAVID', 'party_detailed': 'POPULIST', 'candidatevotes': 2446, 'totalvotes': 3099553},
-    {'year': 1988, 'state': 'NEW JERSEY', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 2298, 'totalvotes': 3099553},
-    {'year': 1988, 'state': 'NEW JERSEY', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 1020, 'totalvotes': 3099553},
-    {'year': 1988, 'state': 'NEW JERSEY', 'candidate': 'WINN, EDWARD', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 691, 'totalvotes': 3099553},
-    {'year': 1988, 'state': 'NEW MEXICO', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 270341, 'totalvotes': 521387},
-    {'year': 1988, 'state': 'NEW MEXICO', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 244497, 'totalvotes': 521387},
-    {'year': 1988, 'state': 'NEW MEXICO', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3368, 'totalvotes': 521387},
-    {'year': 1988, 'state': 'NEW MEXICO', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 2237, 'totalvotes': 521387},
-    {'year': 1988, 'state': 'NEW MEXICO', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 344, 'totalvotes': 521387},
-    {'year': 1988, 'state': 'NEW MEXICO', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 258, 'totalvotes': 521387},
-    {'year': 1988, 'state': 'NEW MEXICO', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 249, 'totalvotes': 521387},
-    {'year': 1988, 'state': 'NEW MEXICO', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'WRITE-IN', 'candidatevotes': 93, 'totalvotes': 521387},
-    {'year': 1988, 'state': 'NEW YORK', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3255487, 'totalvotes': 6485683},
-    {'year': 1988, 'state': 'NEW YORK', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2838414, 'totalvotes': 6485683},
-    {'year': 1988, 'state': 'NEW YORK', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 243457, 'totalvotes': 6485683},
-    {'year': 1988, 'state': 'NEW YORK', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'LIBERAL PARTY', 'candidatevotes': 92395, 'totalvotes': 6485683},
-    {'year': 1988, 'state': 'NEW YORK', 'candidate': 'MARRA, WILLIAM A.', 'party_detailed': 'RIGHT-TO-LIFE', 'candidatevotes': 20497, 'totalvotes': 6485683},
-    {'year': 1988, 'state': 'NEW YORK', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 15845, 'totalvotes': 6485683},
-    {'year': 1988, 'state': 'NEW YORK', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12109, 'totalvotes': 6485683},
-    {'year': 1988, 'state': 'NEW YORK', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 4179, 'totalvotes': 6485683},
-    {'year': 1988, 'state': 'NEW YORK', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 3287, 'totalvotes': 6485683},
-    {'year': 1988, 'state': 'NEW YORK', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 13, 'totalvotes': 6485683},
-    {'year': 1988, 'state': 'NORTH CAROLINA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1237258, 'totalvotes': 2134370},
-    {'year': 1988, 'state': 'NORTH CAROLINA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 890167, 'totalvotes': 2134370},
-    {'year': 1988, 'state': 'NORTH CAROLINA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 5682, 'totalvotes': 2134370},
-    {'year': 1988, 'state': 'NORTH CAROLINA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'OTHER', 'candidatevotes': 1263, 'totalvotes': 2134370},
-    {'year': 1988, 'state': 'NORTH DAKOTA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 166559, 'totalvotes': 297261},
-    {'year': 1988, 'state': 'NORTH DAKOTA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 127739, 'totalvotes': 297261},
-    {'year': 1988, 'state': 'NORTH DAKOTA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1315, 'totalvotes': 297261},
-    {'year': 1988, 'state': 'NORTH DAKOTA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'NATIONAL ECONOMIC RECOVERY', 'candidatevotes': 905, 'totalvotes': 297261},
-    {'year': 1988, 'state': 'NORTH DAKOTA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 396, 'totalvotes': 297261},
-    {'year': 1988, 'state': 'NORTH DAKOTA', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 347, 'totalvotes': 297261},
-    {'year': 1988, 'state': 'OHIO', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2416549, 'totalvotes': 4393585},
-    {'year': 1988, 'state': 'OHIO', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1939629, 'totalvotes': 4393585},
-    {'year': 1988, 'state': 'OHIO', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 12017, 'totalvotes': 4393585},
-    {'year': 1988, 'state': 'OHIO', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11926, 'totalvotes': 4393585},
-    {'year': 1988, 'state': 'OHIO', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 7713, 'totalvotes': 4393585},
-    {'year': 1988, 'state': 'OHIO', 'candidate': 'WINN, EDWARD', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 5401, 'totalvotes': 4393585},
-    {'year': 1988, 'state': 'OHIO', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 350, 'totalvotes': 4393585},
-    {'year': 1988, 'state': 'OKLAHOMA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 678367, 'totalvotes': 1171036},
-    {'year': 1988, 'state': 'OKLAHOMA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 483423, 'totalvotes': 1171036},
-    {'year': 1988, 'state': 'OKLAHOMA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6261, 'totalvotes': 1171036},
-    {'year': 1988, 'state': 'OKLAHOMA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 2985, 'totalvotes': 1171036},
-    {'year': 1988, 'state': 'OREGON', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 616206, 'totalvotes': 1201694},
-    {'year': 1988, 'state': 'OREGON', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 560126, 'totalvotes': 1201694},
-    {'year': 1988, 'state': 'OREGON', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 14811, 'totalvotes': 1201694},
-    {'year': 1988, 'state': 'OREGON', 'candidate': 'FULANI, LENORA', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 6487, 'totalvotes': 1201694},
-    {'year': 1988, 'state': 'OREGON', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 4064, 'totalvotes': 1201694},
-    {'year': 1988, 'state': 'PENNSYLVANIA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2300087, 'totalvotes': 4536251},
-    {'year': 1988, 'state': 'PENNSYLVANIA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2194944, 'totalvotes': 4536251},
-    {'year': 1988, 'state': 'PENNSYLVANIA', 'candidate': 'MCCARTHY, EUGENE ""GENE""', 'party_detailed': 'CONSUMER', 'candidatevotes': 19158, 'totalvotes': 4536251},
-    {'year': 1988, 'state': 'PENNSYLVANIA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12051, 'totalvotes': 4536251},
-    {'year': 1988, 'state': 'PENNSYLVANIA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 4379, 'totalvotes': 4536251},
-    {'year': 1988, 'state': 'PENNSYLVANIA', 'candidate': 'DUKE, DAVID', 'party_detailed': 'POPULIST', 'candidatevotes': 3444, 'totalvotes': 4536251},
-    {'year': 1988, 'state': 'PENNSYLVANIA', 'candidate': 'WINN, EDWARD', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 2188, 'totalvotes': 4536251},
-    {'year': 1988, 'state': 'RHODE ISLAND', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 225123, 'totalvotes': 404622},
-    {'year': 1988, 'state': 'RHODE ISLAND', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 177761, 'totalvotes': 404622},
-    {'year': 1988, 'state': 'RHODE ISLAND', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 825, 'totalvotes': 404622},
-    {'year': 1988, 'state': 'RHODE ISLAND', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 280, 'totalvotes': 404622},
-    {'year': 1988, 'state': 'RHODE ISLAND', 'candidate': 'HERBERG G., LEWIN', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 195, 'totalvotes': 404622},
-    {'year': 1988, 'state': 'RHODE ISLAND', 'candidate': 'DUKE, DAVID', 'party_detailed': 'POPULIST', 'candidatevotes': 159, 'totalvotes': 404622},
-    {'year': 1988, 'state': 'RHODE ISLAND', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 130, 'totalvotes': 404622},
-    {'year': 1988, 'state': 'RHODE ISLAND', 'candidate': 'KENOYER, WILLA', 'party_detailed': 'SOCIALIST', 'candidatevotes': 96, 'totalvotes': 404622},
-    {'year': 1988, 'state': 'RHODE ISLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 53, 'totalvotes': 404622},
-    {'year': 1988, 'state': 'SOUTH CAROLINA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 606443, 'totalvotes': 986009},
-    {'year': 1988, 'state': 'SOUTH CAROLINA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 370554, 'totalvotes': 986009},
-    {'year': 1988, 'state': 'SOUTH CAROLINA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4935, 'totalvotes': 986009},
-    {'year': 1988, 'state': 'SOUTH CAROLINA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'UNITED CITIZENS', 'candidatevotes': 4077, 'totalvotes': 986009},
-    {'year': 1988, 'state': 'SOUTH DAKOTA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 165415, 'totalvotes': 312991},
-    {'year': 1988, 'state': 'SOUTH DAKOTA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 145560, 'totalvotes': 312991},
-    {'year': 1988, 'state': 'SOUTH DAKOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2016, 'totalvotes': 312991},
-    {'year': 1988, 'state': 'TENNESSEE', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 947233, 'totalvotes': 1636250},
-    {'year': 1988, 'state': 'TENNESSEE', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 679794, 'totalvotes': 1636250},
-    {'year': 1988, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 8938, 'totalvotes': 1636250},
-    {'year': 1988, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 285, 'totalvotes': 1636250},
-    {'year': 1988, 'state': 'TEXAS', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 3036829, 'totalvotes': 5427410},
-    {'year': 1988, 'state': 'TEXAS', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2352748, 'totalvotes': 5427410},
-    {'year': 1988, 'state': 'TEXAS', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 30355, 'totalvotes': 5427410},
-    {'year': 1988, 'state': 'TEXAS', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 7208, 'totalvotes': 5427410},
-    {'year': 1988, 'state': 'TEXAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 270, 'totalvotes': 5427410},
-    {'year': 1988, 'state': 'UTAH', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 428442, 'totalvotes': 647008},
-    {'year': 1988, 'state': 'UTAH', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 207343, 'totalvotes': 647008},
-    {'year': 1988, 'state': 'UTAH', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7473, 'totalvotes': 647008},
-    {'year': 1988, 'state': 'UTAH', 'candidate': 'DENNIS, DELMAR', 'party_detailed': 'AMERICAN', 'candidatevotes': 2158, 'totalvotes': 647008},
-    {'year': 1988, 'state': 'UTAH', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 455, 'totalvotes': 647008},
-    {'year': 1988, 'state': 'UTAH', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'NATIONAL ECONOMIC RECOVERY', 'candidatevotes': 427, 'totalvotes': 647008},
-    {'year': 1988, 'state': 'UTAH', 'candidate': 'YOUNGKEIT, LOUIE G.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 372, 'totalvotes': 647008},
-    {'year': 1988, 'state': 'UTAH', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 209, 'totalvotes': 647008},
-    {'year': 1988, 'state': 'UTAH', 'candidate': 'KENOYER, WILLA', 'party_detailed': 'SOCIALIST', 'candidatevotes': 129, 'totalvotes': 647008},
-    {'year': 1988, 'state': 'VERMONT', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 124331, 'totalvotes': 243328},
-    {'year': 1988, 'state': 'VERMONT', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 115775, 'totalvotes': 243328},
-    {'year': 1988, 'state': 'VERMONT', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 1134, 'totalvotes': 243328},
-    {'year': 1988, 'state': 'VERMONT', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1000, 'totalvotes': 243328},
-    {'year': 1988, 'state': 'VERMONT', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 275, 'totalvotes': 243328},
-    {'year': 1988, 'state': 'VERMONT', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 205, 'totalvotes': 243328},
-    {'year': 1988, 'state': 'VERMONT', 'candidate': 'DUKE, DAVID', 'party_detailed': 'POPULIST', 'candidatevotes': 189, 'totalvotes': 243328},
-    {'year': 1988, 'state': 'VERMONT', 'candidate': 'HERBERG G., LEWIN', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 164, 'totalvotes': 243328},
-    {'year': 1988, 'state': 'VERMONT', 'candidate': 'KENOYER, WILLA', 'party_detailed': 'LIBERTY UNION PARTY', 'candidatevotes': 142, 'totalvotes': 243328},
-    {'year': 1988, 'state': 'VERMONT', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 113, 'totalvotes': 243328},
-    {'year': 1988, 'state': 'VIRGINIA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1309162, 'totalvotes': 2191609},
-    {'year': 1988, 'state': 'VIRGINIA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 859799, 'totalvotes': 2191609},
-    {'year': 1988, 'state': 'VIRGINIA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 14312, 'totalvotes': 2191609},
-    {'year': 1988, 'state': 'VIRGINIA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8336, 'totalvotes': 2191609},
-    {'year': 1988, 'state': 'WASHINGTON', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 933516, 'totalvotes': 1865253},
-    {'year': 1988, 'state': 'WASHINGTON', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 903835, 'totalvotes': 1865253},
-    {'year': 1988, 'state': 'WASHINGTON', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 17240, 'totalvotes': 1865253},
-    {'year': 1988, 'state': 'WASHINGTON', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4412, 'totalvotes': 1865253},
-    {'year': 1988, 'state': 'WASHINGTON', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 3520, 'totalvotes': 1865253},
-    {'year': 1988, 'state': 'WASHINGTON', 'candidate': 'HOLMES, LARRY', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 1440, 'totalvotes': 1865253},
-    {'year': 1988, 'state': 'WASHINGTON', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1290, 'totalvotes': 1865253},
-    {'year': 1988, 'state': 'WEST VIRGINIA', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 341016, 'totalvotes': 653311},
-    {'year': 1988, 'state': 'WEST VIRGINIA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 310065, 'totalvotes': 653311},
-    {'year': 1988, 'state': 'WEST VIRGINIA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 2230, 'totalvotes': 653311},
-    {'year': 1988, 'state': 'WISCONSIN', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1126794, 'totalvotes': 2191608},
-    {'year': 1988, 'state': 'WISCONSIN', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1047499, 'totalvotes': 2191608},
-    {'year': 1988, 'state': 'WISCONSIN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 15042, 'totalvotes': 2191608},
-    {'year': 1988, 'state': 'WISCONSIN', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 2273, 'totalvotes': 2191608},
-    {'year': 1988, 'state': 'WYOMING', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 106867, 'totalvotes': 176551},
-    {'year': 1988, 'state': 'WYOMING', 'candidate': 'DUKAKIS, MICHAEL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 67113, 'totalvotes': 176551},
-    {'year': 1988, 'state': 'WYOMING', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2026, 'totalvotes': 176551},
-    {'year': 1988, 'state': 'WYOMING', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 545, 'totalvotes': 176551},
-    {'year': 1992, 'state': 'ALABAMA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 804283, 'totalvotes': 1688060},
-    {'year': 1992, 'state': 'ALABAMA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 690080, 'totalvotes': 1688060},
-    {'year': 1992, 'state': 'ALABAMA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 183109, 'totalvotes': 1688060},
-    {'year': 1992, 'state': 'ALABAMA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5737, 'totalvotes': 1688060},
-    {'year': 1992, 'state': 'ALABAMA', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4128, 'totalvotes': 1688060},
-    {'year': 1992, 'state': 'ALABAMA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 723, 'totalvotes': 1688060},
-    {'year': 1992, 'state': 'ALASKA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 102000, 'totalvotes': 258506},
-    {'year': 1992, 'state': 'ALASKA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 78294, 'totalvotes': 258506},
-    {'year': 1992, 'state': 'ALASKA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 73481, 'totalvotes': 258506},
-    {'year': 1992, 'state': 'ALASKA', 'candidate': 'GRITZ, JAMES ""BO""', 'party_detailed': 'AMERICA FIRST', 'candidatevotes': 1379, 'totalvotes': 258506},
-    {'year': 1992, 'state': 'ALASKA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1378, 'totalvotes': 258506},
-    {'year': 1992, 'state': 'ALASKA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENTS FOR ECONOMIC RECOVERY', 'candidatevotes': 469, 'totalvotes': 258506},
-    {'year': 1992, 'state': 'ALASKA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 433, 'totalvotes': 258506},
-    {'year': 1992, 'state': 'ALASKA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TAXPAYERS PARTY', 'candidatevotes': 377, 'totalvotes': 258506},
-    {'year': 1992, 'state': 'ALASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 365, 'totalvotes': 258506},
-    {'year': 1992, 'state': 'ALASKA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 330, 'totalvotes': 258506},
-    {'year': 1992, 'state': 'ARIZONA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 572086, 'totalvotes': 1486975},
-    {'year': 1992, 'state': 'ARIZONA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 543050, 'totalvotes': 1486975},
-    {'year': 1992, 'state': 'ARIZONA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 353741, 'totalvotes': 1486975},
-    {'year': 1992, 'state': 'ARIZONA', 'candidate': 'GRITZ, JAMES ""BO""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 8141, 'totalvotes': 1486975},
-    {'year': 1992, 'state': 'ARIZONA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6759, 'totalvotes': 1486975},
-    {'year': 1992, 'state': 'ARIZONA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2267, 'totalvotes': 1486975},
-    {'year': 1992, 'state': 'ARIZONA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 923, 'totalvotes': 1486975},
-    {'year': 1992, 'state': 'ARIZONA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 8, 'totalvotes': 1486975},
-    {'year': 1992, 'state': 'ARKANSAS', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 505823, 'totalvotes': 950653},
-    {'year': 1992, 'state': 'ARKANSAS', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 337324, 'totalvotes': 950653},
-    {'year': 1992, 'state': 'ARKANSAS', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 99132, 'totalvotes': 950653},
-    {'year': 1992, 'state': 'ARKANSAS', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 8374, 'totalvotes': 950653},
-    {'year': 1992, 'state': 'CALIFORNIA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 5121325, 'totalvotes': 11131721},
-    {'year': 1992, 'state': 'CALIFORNIA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 3630574, 'totalvotes': 11131721},
-    {'year': 1992, 'state': 'CALIFORNIA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2296006, 'totalvotes': 11131721},
-    {'year': 1992, 'state': 'CALIFORNIA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 48139, 'totalvotes': 11131721},
-    {'year': 1992, 'state': 'CALIFORNIA', 'candidate': 'DANIELS, RON', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 18597, 'totalvotes': 11131721},
-    {'year': 1992, 'state': 'CALIFORNIA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 12711, 'totalvotes': 11131721},
-    {'year': 1992, 'state': 'CALIFORNIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 4369, 'totalvotes': 11131721},
-    {'year': 1992, 'state': 'COLORADO', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 629681, 'totalvotes': 1569180},
-    {'year': 1992, 'state': 'COLORADO', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 562850, 'totalvotes': 1569180},
-    {'year': 1992, 'state': 'COLORADO', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 366010, 'totalvotes': 1569180},
-    {'year': 1992, 'state': 'COLORADO', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8669, 'totalvotes': 1569180},
-    {'year': 1992, 'state': 'COLORADO', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 1608, 'totalvotes': 1569180},
-    {'year': 1992, 'state': 'COLORADO', 'candidate': 'GRITZ, JAMES ""BO""', 'party_detailed': 'DEMOCRAT/REPUBLICAN', 'candidatevotes': 274, 'totalvotes': 1569180},
-    {'year': 1992, 'state': 'COLORADO', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 47, 'totalvotes': 1569180},
-    {'year': 1992, 'state': 'COLORADO', 'candidate': 'PROHIBITION', 'party_detailed': 'PROHIBITION', 'candidatevotes': 21, 'totalvotes': 1569180},
-    {'year': 1992, 'state': 'COLORADO', 'candidate': 'UNAFFILIATED', 'party_detailed': 'UNAFFILIATED', 'candidatevotes': 20, 'totalvotes': 1569180},
-    {'year': 1992, 'state': 'CONNECTICUT', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 682318, 'totalvotes': 1616156},
-    {'year': 1992, 'state': 'CONNECTICUT', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 578313, 'totalvotes': 1616156},
-    {'year': 1992, 'state': 'CONNECTICUT', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 348771, 'totalvotes': 1616156},
-    {'year': 1992, 'state': 'CONNECTICUT', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5391, 'totalvotes': 1616156},
-    {'year': 1992, 'state': 'CONNECTICUT', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 1363, 'totalvotes': 1616156},
-    {'year': 1992, 'state': 'DELAWARE', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 126054, 'totalvotes': 289620},
-    {'year': 1992, 'state': 'DELAWARE', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 102313, 'totalvotes': 289620},
-    {'year': 1992, 'state': 'DELAWARE', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 59213, 'totalvotes': 289620},
-    {'year': 1992, 'state': 'DELAWARE', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 1105, 'totalvotes': 289620},
-    {'year': 1992, 'state': 'DELAWARE', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 935, 'totalvotes': 289620},
-    {'year': 1992, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 192619, 'totalvotes': 227572},
-    {'year': 1992, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 20698, 'totalvotes': 227572},
-    {'year': 1992, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 9681, 'totalvotes': 227572},
-    {'year': 1992, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 1459, 'totalvotes': 227572},
-    {'year': 1992, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'DANIELS, RONALD', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1446, 'totalvotes': 227572},
-    {'year': 1992, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 676, 'totalvotes': 227572},
-    {'year': 1992, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 467, 'totalvotes': 227572},
-    {'year': 1992, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 230, 'totalvotes': 227572},
-    {'year': 1992, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'OTHER', 'party_detailed': 'SOCIALIST', 'candidatevotes': 191, 'totalvotes': 227572},
-    {'year': 1992, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'OTHER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 105, 'totalvotes': 227572},
-    {'year': 1992, 'state': 'FLORIDA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2173310, 'totalvotes': 5313392},
-    {'year': 1992, 'state': 'FLORIDA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2071698, 'totalvotes': 5313392},
-    {'year': 1992, 'state': 'FLORIDA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1053067, 'totalvotes': 5313392},
-    {'year': 1992, 'state': 'FLORIDA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 15079, 'totalvotes': 5313392},
-    {'year': 1992, 'state': 'FLORIDA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 238, 'totalvotes': 5313392},
-    {'year': 1992, 'state': 'GEORGIA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1008966, 'totalvotes': 2321133},
-    {'year': 1992, 'state': 'GEORGIA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 995252, 'totalvotes': 2321133},
-    {'year': 1992, 'state': 'GEORGIA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 309657, 'totalvotes': 2321133},
-    {'year': 1992, 'state': 'GEORGIA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7110, 'totalvotes': 2321133},
-    {'year': 1992, 'state': 'GEORGIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 148, 'totalvotes': 2321133},
-    {'year': 1992, 'state': 'HAWAII', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 179310, 'totalvotes': 372842},
-    {'year': 1992, 'state': 'HAWAII', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 136822, 'totalvotes': 372842},
-    {'year': 1992, 'state': 'HAWAII', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 53003, 'totalvotes': 372842},
-    {'year': 1992, 'state': 'HAWAII', 'candidate': 'GRITZ, JAMES ""BO""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1452, 'totalvotes': 372842},
-    {'year': 1992, 'state': 'HAWAII', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1119, 'totalvotes': 372842},
-    {'year': 1992, 'state': 'HAWAII', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 720, 'totalvotes': 372842},
-    {'year': 1992, 'state': 'HAWAII', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 416, 'totalvotes': 372842},
-    {'year': 1992, 'state': 'IDAHO', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 202645, 'totalvotes': 482114},
-    {'year': 1992, 'state': 'IDAHO', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 137013, 'totalvotes': 482114},
-    {'year': 1992, 'state': 'IDAHO', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 130395, 'totalvotes': 482114},
-    {'year': 1992, 'state': 'IDAHO', 'candidate': 'GRITZ, JAMES ""BO""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 10894, 'totalvotes': 482114},
-    {'year': 1992, 'state': 'IDAHO', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1167, 'totalvotes': 482114},
-    {'year': 1992, 'state': 'ILLINOIS', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2453350, 'totalvotes': 5050157},
-    {'year': 1992, 'state': 'ILLINOIS', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1734096, 'totalvotes': 5050157},
-    {'year': 1992, 'state': 'ILLINOIS', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 840515, 'totalvotes': 5050157},
-    {'year': 1992, 'state': 'ILLINOIS', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9218, 'totalvotes': 5050157},
-    {'year': 1992, 'state': 'ILLINOIS', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 5267, 'totalvotes': 5050157},
-    {'year': 1992, 'state': 'ILLINOIS', 'candidate': 'GRITZ, JAMES ""BO""', 'party_detailed': 'POPULIST', 'candidatevotes': 3577, 'totalvotes': 5050157},
-    {'year': 1992, 'state': 'ILLINOIS', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2751, 'totalvotes': 5050157},
-    {'year': 1992, 'state': 'ILLINOIS', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1361, 'totalvotes': 5050157},
-    {'year': 1992, 'state': 'ILLINOIS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 22, 'totalvotes': 5050157},
-    {'year': 1992, 'state': 'INDIANA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 989375, 'totalvotes': 2305871},
-    {'year': 1992, 'state': 'INDIANA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 848420, 'totalvotes': 2305871},
-    {'year': 1992, 'state': 'INDIANA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 455934, 'totalvotes': 2305871},
-    {'year': 1992, 'state': 'INDIANA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7936, 'totalvotes': 2305871},
-    {'year': 1992, 'state': 'INDIANA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 2583, 'totalvotes': 2305871},
-    {'year': 1992, 'state': 'INDIANA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1623, 'totalvotes': 2305871},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 586353, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 504891, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 253468, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 3079, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 1753, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'GRITZ, JAMES ""BO""', 'party_detailed': 'AMERICA FIRST', 'candidatevotes': 1177, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1076, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 741, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'HERER, JACK', 'party_detailed': 'GRASSROOTS', 'candidatevotes': 669, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TAXPAYERS PARTY', 'candidatevotes': 480, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 273, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENTS FOR ECONOMIC RECOVERY', 'candidatevotes': 238, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'OTHER', 'party_detailed': 'CAMPAIGN FOR A NEW TOMORROW', 'candidatevotes': 212, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'IOWA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 197, 'totalvotes': 1354607},
-    {'year': 1992, 'state': 'KANSAS', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 449951, 'totalvotes': 1157236},
-    {'year': 1992, 'state': 'KANSAS', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 390434, 'totalvotes': 1157236},
-    {'year': 1992, 'state': 'KANSAS', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 312358, 'totalvotes': 1157236},
-    {'year': 1992, 'state': 'KANSAS', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4314, 'totalvotes': 1157236},
-    {'year': 1992, 'state': 'KANSAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 179, 'totalvotes': 1157236},
-    {'year': 1992, 'state': 'KENTUCKY', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 665104, 'totalvotes': 1492900},
-    {'year': 1992, 'state': 'KENTUCKY', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 617178, 'totalvotes': 1492900},
-    {'year': 1992, 'state': 'KENTUCKY', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 203944, 'totalvotes': 1492900},
-    {'year': 1992, 'state': 'KENTUCKY', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4513, 'totalvotes': 1492900},
-    {'year': 1992, 'state': 'KENTUCKY', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TAXPAYERS PARTY', 'candidatevotes': 989, 'totalvotes': 1492900},
-    {'year': 1992, 'state': 'KENTUCKY', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 695, 'totalvotes': 1492900},
-    {'year': 1992, 'state': 'KENTUCKY', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 430, 'totalvotes': 1492900},
-    {'year': 1992, 'state': 'KENTUCKY', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 47, 'totalvotes': 1492900},
-    {'year': 1992, 'state': 'LOUISIANA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 815971, 'totalvotes': 1790017},
-    {'year': 1992, 'state': 'LOUISIANA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 733386, 'totalvotes': 1790017},
-    {'year': 1992, 'state': 'LOUISIANA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 211478, 'totalvotes': 1790017},
-    {'year': 1992, 'state': 'LOUISIANA', 'candidate': 'GRITZ, JAMES ""BO""', 'party_detailed': 'AMERICA FIRST', 'candidatevotes': 18545, 'totalvotes': 1790017},
-    {'year': 1992, 'state': 'LOUISIANA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3155, 'totalvotes': 1790017},
-    {'year': 1992, 'state': 'LOUISIANA', 'candidate': 'OTHER', 'party_detailed': 'EQUAL JUSTICE AND OPPORTUNITY', 'candidatevotes': 1663, 'totalvotes': 1790017},
-    {'year': 1992, 'state': 'LOUISIANA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TAXPAYERS PARTY', 'candidatevotes': 1552, 'totalvotes': 1790017},
-    {'year': 1992, 'state': 'LOUISIANA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'MORE PERFECT DEMOCRACY', 'candidatevotes': 1434, 'totalvotes': 1790017},
-    {'year': 1992, 'state': 'LOUISIANA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'JUSTICE, INDUSTRY, AND AGRICULTURE', 'candidatevotes': 1136, 'totalvotes': 1790017},
-    {'year': 1992, 'state': 'LOUISIANA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 889, 'totalvotes': 1790017},
-    {'year': 1992, 'state': 'LOUISIANA', 'candidate': 'YIAMOUYIANNIS, JOHN', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 808, 'totalvotes': 1790017},
-    {'year': 1992, 'state': 'MAINE', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 263420, 'totalvotes': 679499},
-    {'year': 1992, 'state': 'MAINE', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 206820, 'totalvotes': 679499},
-    {'year': 1992, 'state': 'MAINE', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 206504, 'totalvotes': 679499},
-    {'year': 1992, 'state': 'MAINE', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1681, 'totalvotes': 679499},
-    {'year': 1992, 'state': 'MAINE', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 519, 'totalvotes': 679499},
-    {'year': 1992, 'state': 'MAINE', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TAXPAYERS PARTY', 'candidatevotes': 464, 'totalvotes': 679499},
-    {'year': 1992, 'state': 'MAINE', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 91, 'totalvotes': 679499},
-    {'year': 1992, 'state': 'MARYLAND', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 988571, 'totalvotes': 1984580},
-    {'year': 1992, 'state': 'MARYLAND', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 707094, 'totalvotes': 1984580},
-    {'year': 1992, 'state': 'MARYLAND', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 281414, 'totalvotes': 1984580},
-    {'year': 1992, 'state': 'MARYLAND', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4715, 'totalvotes': 1984580},
-    {'year': 1992, 'state': 'MARYLAND', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 2786, 'totalvotes': 1984580},
-    {'year': 1992, 'state': 'MASSACHUSETTS', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1318639, 'totalvotes': 2773664},
-    {'year': 1992, 'state': 'MASSACHUSETTS', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 805039, 'totalvotes': 2773664},
-    {'year': 1992, 'state': 'MASSACHUSETTS', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 630731, 'totalvotes': 2773664},
-    {'year': 1992, 'state': 'MASSACHUSETTS', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9021, 'totalvotes': 2773664},
-    {'year': 1992, 'state': 'MASSACHUSETTS', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 3172, 'totalvotes': 2773664},
-    {'year': 1992, 'state': 'MASSACHUSETTS', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT VOTERS', 'candidatevotes': 2218, 'totalvotes': 2773664},
-    {'year': 1992, 'state': 'MASSACHUSETTS', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 1990, 'totalvotes': 2773664},
-    {'year': 1992, 'state': 'MASSACHUSETTS', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1812, 'totalvotes': 2773664},
-    {'year': 1992, 'state': 'MASSACHUSETTS', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'LAROUCHE FOR PRESIDENT PARTY', 'candidatevotes': 1027, 'totalvotes': 2773664},
-    {'year': 1992, 'state': 'MASSACHUSETTS', 'candidate': 'BRISBEN, J. QUINN', 'party_detailed': 'SOCIALIST PARTY USA', 'candidatevotes': 13, 'totalvotes': 2773664},
-    {'year': 1992, 'state': 'MASSACHUSETTS', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 2, 'totalvotes': 2773664},
-    {'year': 1992, 'state': 'MICHIGAN', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1871182, 'totalvotes': 4274673},
-    {'year': 1992, 'state': 'MICHIGAN', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1554940, 'totalvotes': 4274673},
-    {'year': 1992, 'state': 'MICHIGAN', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 824813, 'totalvotes': 4274673},
-    {'year': 1992, 'state': 'MICHIGAN', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 10175, 'totalvotes': 4274673},
-    {'year': 1992, 'state': 'MICHIGAN', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TISCH INDEPENDENT CITIZENS', 'candidatevotes': 8263, 'totalvotes': 4274673},
-    {'year': 1992, 'state': 'MICHIGAN', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2954, 'totalvotes': 4274673},
-    {'year': 1992, 'state': 'MICHIGAN', 'candidate': 'HALYARD, HELEN', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 1432, 'totalvotes': 4274673},
-    {'year': 1992, 'state': 'MICHIGAN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 914, 'totalvotes': 4274673},
-    {'year': 1992, 'state': 'MINNESOTA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1020997, 'totalvotes': 2347948},
-    {'year': 1992, 'state': 'MINNESOTA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 747841, 'totalvotes': 2347948},
-    {'year': 1992, 'state': 'MINNESOTA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 562506, 'totalvotes': 2347948},
-    {'year': 1992, 'state': 'MINNESOTA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3374, 'totalvotes': 2347948},
-    {'year': 1992, 'state': 'MINNESOTA', 'candidate': 'GRITZ, JAMES ""BO""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3363, 'totalvotes': 2347948},
-    {'year': 1992, 'state': 'MINNESOTA', 'candidate': 'HERER, JACK', 'party_detailed': 'GRASSROOTS', 'candidatevotes': 2659, 'totalvotes': 2347948},
-    {'year': 1992, 'state': 'MINNESOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2499, 'totalvotes': 2347948},
-    {'year': 1992, 'state': 'MINNESOTA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1406, 'totalvotes': 2347948},
-    {'year': 1992, 'state': 'MINNESOTA', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 990, 'totalvotes': 2347948},
-    {'year': 1992, 'state': 'MINNESOTA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 958, 'totalvotes': 2347948},
-    {'year': 1992, 'state': 'MINNESOTA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TAXPAYERS PARTY', 'candidatevotes': 733, 'totalvotes': 2347948},
-    {'year': 1992, 'state': 'MINNESOTA', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENTS FOR ECONOMIC RECOVERY', 'candidatevotes': 622, 'totalvotes': 2347948},
-    {'year': 1992, 'state': 'MISSISSIPPI', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 487793, 'totalvotes': 981793},
-    {'year': 1992, 'state': 'MISSISSIPPI', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 400258, 'totalvotes': 981793},
-    {'year': 1992, 'state': 'MISSISSIPPI', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 85626, 'totalvotes': 981793},
-    {'year': 1992, 'state': 'MISSISSIPPI', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4310, 'totalvotes': 981793},
-    {'year': 1992, 'state': 'MISSISSIPPI', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2154, 'totalvotes': 981793},
-    {'year': 1992, 'state': 'MISSISSIPPI', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TAXPAYERS PARTY', 'candidatevotes': 1652, 'totalvotes': 981793},
-    {'year': 1992, 'state': 'MISSOURI', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1053873, 'totalvotes': 2391270},
-    {'year': 1992, 'state': 'MISSOURI', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 811159, 'totalvotes': 2391270},
-    {'year': 1992, 'state': 'MISSOURI', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 518741, 'totalvotes': 2391270},
-    {'year': 1992, 'state': 'MISSOURI', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7497, 'totalvotes': 2391270},
-    {'year': 1992, 'state': 'MONTANA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 154507, 'totalvotes': 410583},
-    {'year': 1992, 'state': 'MONTANA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 144207, 'totalvotes': 410583},
-    {'year': 1992, 'state': 'MONTANA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 107225, 'totalvotes': 410583},
-    {'year': 1992, 'state': 'MONTANA', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3658, 'totalvotes': 410583},
-    {'year': 1992, 'state': 'MONTANA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 986, 'totalvotes': 410583},
-    {'year': 1992, 'state': 'NEBRASKA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 343678, 'totalvotes': 737546},
-    {'year': 1992, 'state': 'NEBRASKA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 216864, 'totalvotes': 737546},
-    {'year': 1992, 'state': 'NEBRASKA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 174104, 'totalvotes': 737546},
-    {'year': 1992, 'state': 'NEBRASKA', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1560, 'totalvotes': 737546},
-    {'year': 1992, 'state': 'NEBRASKA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1340, 'totalvotes': 737546},
-    {'year': 1992, 'state': 'NEVADA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 189148, 'totalvotes': 506318},
-    {'year': 1992, 'state': 'NEVADA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 175828, 'totalvotes': 506318},
-    {'year': 1992, 'state': 'NEVADA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 132580, 'totalvotes': 506318},
-    {'year': 1992, 'state': 'NEVADA', 'candidate': 'GRITZ, JAMES ""BO""', 'party_detailed': 'POPULIST', 'candidatevotes': 2892, 'totalvotes': 506318},
-    {'year': 1992, 'state': 'NEVADA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 2537, 'totalvotes': 506318},
-    {'year': 1992, 'state': 'NEVADA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1835, 'totalvotes': 506318},
-    {'year': 1992, 'state': 'NEVADA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'INDEPENDENT AMERICAN', 'candidatevotes': 677, 'totalvotes': 506318},
-    {'year': 1992, 'state': 'NEVADA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 483, 'totalvotes': 506318},
-    {'year': 1992, 'state': 'NEVADA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 338, 'totalvotes': 506318},
-    {'year': 1992, 'state': 'NEW HAMPSHIRE', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 209040, 'totalvotes': 537215},
-    {'year': 1992, 'state': 'NEW HAMPSHIRE', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 202484, 'totalvotes': 537215},
-    {'year': 1992, 'state': 'NEW HAMPSHIRE', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 121337, 'totalvotes': 537215},
-    {'year': 1992, 'state': 'NEW HAMPSHIRE', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3548, 'totalvotes': 537215},
-    {'year': 1992, 'state': 'NEW HAMPSHIRE', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 512, 'totalvotes': 537215},
-    {'year': 1992, 'state': 'NEW HAMPSHIRE', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 294, 'totalvotes': 537215},
-    {'year': 1992, 'state': 'NEW JERSEY', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1436206, 'totalvotes': 3343594},
-    {'year': 1992, 'state': 'NEW JERSEY', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1356865, 'totalvotes': 3343594},
-    {'year': 1992, 'state': 'NEW JERSEY', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 521829, 'totalvotes': 3343594},
-    {'year': 1992, 'state': 'NEW JERSEY', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6822, 'totalvotes': 3343594},
-    {'year': 1992, 'state': 'NEW JERSEY', 'candidate': 'BRADFORD, DREW', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4749, 'totalvotes': 3343594},
-    {'year': 1992, 'state': 'NEW JERSEY', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 3513, 'totalvotes': 3343594},
-    {'year': 1992, 'state': 'NEW JERSEY', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TAXPAYERS PARTY', 'candidatevotes': 2670, 'totalvotes': 3343594},
-    {'year': 1992, 'state': 'NEW JERSEY', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': '6 MILLION JOBS', 'candidatevotes': 2095, 'totalvotes': 3343594},
-    {'year': 1992, 'state': 'NEW JERSEY', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 2011, 'totalvotes': 3343594},
-    {'year': 1992, 'state': 'NEW JERSEY', 'candidate': 'DANIELS, RON', 'party_detailed': 'RON DANIELS INDEPENDENT', 'candidatevotes': 1996, 'totalvotes': 3343594},
-    {'year': 1992, 'state': 'NEW JERSEY', 'candidate': 'GRITZ, JAMES ""BO""', 'party_detailed': 'AMERICA FIRST POPULIST', 'candidatevotes': 1867, 'totalvotes': 3343594},
-    {'year': 1992, 'state': 'NEW JERSEY', 'candidate': 'HAYLARD, HELEN', 'party_detailed': 'WORKERS LEAGUE', 'candidatevotes': 1618, 'totalvotes': 3343594},
-    {'year': 1992, 'state': 'NEW JERSEY', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1353, 'totalvotes': 3343594},
-    {'year': 1992, 'state': 'NEW MEXICO', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 261617, 'totalvotes': 569986},
-    {'year': 1992, 'state': 'NEW MEXICO', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 212824, 'totalvotes': 569986},
-    {'year': 1992, 'state': 'NEW MEXICO', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 91895, 'totalvotes': 569986},
-    {'year': 1992, 'state': 'NEW MEXICO', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1615, 'totalvotes': 569986},
-    {'year': 1992, 'state': 'NEW MEXICO', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TAXPAYERS PARTY', 'candidatevotes': 620, 'totalvotes': 569986},
-    {'year': 1992, 'state': 'NEW MEXICO', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 562, 'totalvotes': 569986},
-    {'year': 1992, 'state': 'NEW MEXICO', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 369, 'totalvotes': 569986},
-    {'year': 1992, 'state': 'NEW MEXICO', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 183, 'totalvotes': 569986},
-    {'year': 1992, 'state': 'NEW MEXICO', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 181, 'totalvotes': 569986},
-    {'year': 1992, 'state': 'NEW MEXICO', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 120, 'totalvotes': 569986},
-    {'year': 1992, 'state': 'NEW YORK', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3346894, 'totalvotes': 7079432},
-    {'year': 1992, 'state': 'NEW YORK', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2041690, 'totalvotes': 7079432},
-    {'year': 1992, 'state': 'NEW YORK', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1090721, 'totalvotes': 7079432},
-    {'year': 1992, 'state': 'NEW YORK', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 177000, 'totalvotes': 7079432},
-    {'year': 1992, 'state': 'NEW YORK', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 152951, 'totalvotes': 7079432},
-    {'year': 1992, 'state': 'NEW YORK', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'RIGHT-TO-LIFE', 'candidatevotes': 127959, 'totalvotes': 7079432},
-    {'year': 1992, 'state': 'NEW YORK', 'candidate': 'CLINTON, BILL', 'party_detailed': 'LIBERAL PARTY', 'candidatevotes': 97556, 'totalvotes': 7079432},
-    {'year': 1992, 'state': 'NEW YORK', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 15472, 'totalvotes': 7079432},
-    {'year': 1992, 'state': 'NEW YORK', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 13451, 'totalvotes': 7079432},
-    {'year': 1992, 'state': 'NEW YORK', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 11318, 'totalvotes': 7079432},
-    {'year': 1992, 'state': 'NEW YORK', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 4420, 'totalvotes': 7079432},
-    {'year': 1992, 'state': 'NORTH CAROLINA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1134661, 'totalvotes': 2611850},
-    {'year': 1992, 'state': 'NORTH CAROLINA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1114042, 'totalvotes': 2611850},
-    {'year': 1992, 'state': 'NORTH CAROLINA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 357864, 'totalvotes': 2611850},
-    {'year': 1992, 'state': 'NORTH CAROLINA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5171, 'totalvotes': 2611850},
-    {'year': 1992, 'state': 'NORTH CAROLINA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 59, 'totalvotes': 2611850},
-    {'year': 1992, 'state': 'NORTH CAROLINA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 41, 'totalvotes': 2611850},
-    {'year': 1992, 'state': 'NORTH CAROLINA', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 12, 'totalvotes': 2611850},
-    {'year': 1992, 'state': 'NORTH DAKOTA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 136244, 'totalvotes': 308133},
-    {'year': 1992, 'state': 'NORTH DAKOTA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 99168, 'totalvotes': 308133},
-    {'year': 1992, 'state': 'NORTH DAKOTA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 71084, 'totalvotes': 308133},
-    {'year': 1992, 'state': 'NORTH DAKOTA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 1637, 'totalvotes': 308133},
-    {'year': 1992, 'state': 'OHIO', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1984942, 'totalvotes': 4939967},
-    {'year': 1992, 'state': 'OHIO', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1894310, 'totalvotes': 4939967},
-    {'year': 1992, 'state': 'OHIO', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1036426, 'totalvotes': 4939967},
-    {'year': 1992, 'state': 'OHIO', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 24247, 'totalvotes': 4939967},
-    {'year': 1992, 'state': 'OHIO', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 42, 'totalvotes': 4939967},
-    {'year': 1992, 'state': 'OKLAHOMA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 592929, 'totalvotes': 1390359},
-    {'year': 1992, 'state': 'OKLAHOMA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 473066, 'totalvotes': 1390359},
-    {'year': 1992, 'state': 'OKLAHOMA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 319878, 'totalvotes': 1390359},
-    {'year': 1992, 'state': 'OKLAHOMA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4486, 'totalvotes': 1390359},
-    {'year': 1992, 'state': 'OREGON', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 621314, 'totalvotes': 1462643},
-    {'year': 1992, 'state': 'OREGON', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 475757, 'totalvotes': 1462643},
-    {'year': 1992, 'state': 'OREGON', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 354091, 'totalvotes': 1462643},
-    {'year': 1992, 'state': 'OREGON', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4277, 'totalvotes': 1462643},
-    {'year': 1992, 'state': 'OREGON', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 3030, 'totalvotes': 1462643},
-    {'year': 1992, 'state': 'OREGON', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 2609, 'totalvotes': 1462643},
-    {'year': 1992, 'state': 'OREGON', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1565, 'totalvotes': 1462643},
-    {'year': 1992, 'state': 'PENNSYLVANIA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2239164, 'totalvotes': 4959810},
-    {'year': 1992, 'state': 'PENNSYLVANIA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1791841, 'totalvotes': 4959810},
-    {'year': 1992, 'state': 'PENNSYLVANIA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 902667, 'totalvotes': 4959810},
-    {'year': 1992, 'state': 'PENNSYLVANIA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 21477, 'totalvotes': 4959810},
-    {'year': 1992, 'state': 'PENNSYLVANIA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 4661, 'totalvotes': 4959810},
-    {'year': 1992, 'state': 'RHODE ISLAND', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 213299, 'totalvotes': 453365},
-    {'year': 1992, 'state': 'RHODE ISLAND', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 131601, 'totalvotes': 453365},
-    {'year': 1992, 'state': 'RHODE ISLAND', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 105045, 'totalvotes': 453365},
-    {'year': 1992, 'state': 'RHODE ISLAND', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 1878, 'totalvotes': 453365},
-    {'year': 1992, 'state': 'RHODE ISLAND', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 571, 'totalvotes': 453365},
-    {'year': 1992, 'state': 'RHODE ISLAND', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENTS FOR LAROUCHE', 'candidatevotes': 494, 'totalvotes': 453365},
-    {'year': 1992, 'state': 'RHODE ISLAND', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 262, 'totalvotes': 453365},
-    {'year': 1992, 'state': 'RHODE ISLAND', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TAXPAYERS PARTY', 'candidatevotes': 215, 'totalvotes': 453365},
-    {'year': 1992, 'state': 'SOUTH CAROLINA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 577507, 'totalvotes': 1228912},
-    {'year': 1992, 'state': 'SOUTH CAROLINA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 525514, 'totalvotes': 1228912},
-    {'year': 1992, 'state': 'SOUTH CAROLINA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 119257, 'totalvotes': 1228912},
-    {'year': 1992, 'state': 'SOUTH CAROLINA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2719, 'totalvotes': 1228912},
-    {'year': 1992, 'state': 'SOUTH CAROLINA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'AMERICAN', 'candidatevotes': 2680, 'totalvotes': 1228912},
-    {'year': 1992, 'state': 'SOUTH CAROLINA', 'candidate': 'FULANI, LENORA', 'party_detailed': 'UNITED CITIZENS', 'candidatevotes': 1235, 'totalvotes': 1228912},
-    {'year': 1992, 'state': 'SOUTH DAKOTA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 136718, 'totalvotes': 336254},
-    {'year': 1992, 'state': 'SOUTH DAKOTA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 124888, 'totalvotes': 336254},
-    {'year': 1992, 'state': 'SOUTH DAKOTA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 73295, 'totalvotes': 336254},
-    {'year': 1992, 'state': 'SOUTH DAKOTA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 814, 'totalvotes': 336254},
-    {'year': 1992, 'state': 'SOUTH DAKOTA', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 539, 'totalvotes': 336254},
-    {'year': 1992, 'state': 'TENNESSEE', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 933521, 'totalvotes': 1982638},
-    {'year': 1992, 'state': 'TENNESSEE', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 841300, 'totalvotes': 1982638},
-    {'year': 1992, 'state': 'TENNESSEE', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 199968, 'totalvotes': 1982638},
-    {'year': 1992, 'state': 'TENNESSEE', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 7688, 'totalvotes': 1982638},
-    {'year': 1992, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 161, 'totalvotes': 1982638},
-    {'year': 1992, 'state': 'TEXAS', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2496071, 'totalvotes': 6154018},
-    {'year': 1992, 'state': 'TEXAS', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2281815, 'totalvotes': 6154018},
-    {'year': 1992, 'state': 'TEXAS', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1354781, 'totalvotes': 6154018},
-    {'year': 1992, 'state': 'TEXAS', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 19699, 'totalvotes': 6154018},
-    {'year': 1992, 'state': 'TEXAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1652, 'totalvotes': 6154018},
-    {'year': 1992, 'state': 'UTAH', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 322632, 'totalvotes': 743998},
-    {'year': 1992, 'state': 'UTAH', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 203400, 'totalvotes': 743998},
-    {'year': 1992, 'state': 'UTAH', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 183429, 'totalvotes': 743998},
-    {'year': 1992, 'state': 'UTAH', 'candidate': 'GRITZ, JAMES ""BO""', 'party_detailed': 'POPULIST', 'candidatevotes': 28602, 'totalvotes': 743998},
-    {'year': 1992, 'state': 'UTAH', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1900, 'totalvotes': 743998},
-    {'year': 1992, 'state': 'UTAH', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1319, 'totalvotes': 743998},
-    {'year': 1992, 'state': 'UTAH', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'INDEPENDENTS FOR ECONOMIC RECOVERY', 'candidatevotes': 1089, 'totalvotes': 743998},
-    {'year': 1992, 'state': 'UTAH', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 414, 'totalvotes': 743998},
-    {'year': 1992, 'state': 'UTAH', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TAXPAYERS PARTY', 'candidatevotes': 393, 'totalvotes': 743998},
-    {'year': 1992, 'state': 'UTAH', 'candidate': 'OTHER', 'party_detailed': 'AMERICAN', 'candidatevotes': 292, 'totalvotes': 743998},
-    {'year': 1992, 'state': 'UTAH', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 200, 'totalvotes': 743998},
-    {'year': 1992, 'state': 'UTAH', 'candidate': 'DANIELS, RON', 'party_detailed': 'CAMPAIGN FOR A NEW TOMORROW', 'candidatevotes': 177, 'totalvotes': 743998},
-    {'year': 1992, 'state': 'UTAH', 'candidate': 'BRISBEN, J. QUINN', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 151, 'totalvotes': 743998},
-    {'year': 1992, 'state': 'VERMONT', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 133592, 'totalvotes': 289701},
-    {'year': 1992, 'state': 'VERMONT', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 88122, 'totalvotes': 289701},
-    {'year': 1992, 'state': 'VERMONT', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 65991, 'totalvotes': 289701},
-    {'year': 1992, 'state': 'VERMONT', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 501, 'totalvotes': 289701},
-    {'year': 1992, 'state': 'VERMONT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 488, 'totalvotes': 289701},
-    {'year': 1992, 'state': 'VERMONT', 'candidate': 'OTHER', 'party_detailed': 'LIBERTY UNION PARTY', 'candidatevotes': 329, 'totalvotes': 289701},
-    {'year': 1992, 'state': 'VERMONT', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 315, 'totalvotes': 289701},
-    {'year': 1992, 'state': 'VERMONT', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TAXPAYERS PARTY', 'candidatevotes': 124, 'totalvotes': 289701},
-    {'year': 1992, 'state': 'VERMONT', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 100, 'totalvotes': 289701},
-    {'year': 1992, 'state': 'VERMONT', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 82, 'totalvotes': 289701},
-    {'year': 1992, 'state': 'VERMONT', 'candidate': 'LAROUCHE, LYNDON, JR.', 'party_detailed': 'FREEDOM FOR LAROUCHE', 'candidatevotes': 57, 'totalvotes': 289701},
-    {'year': 1992, 'state': 'VIRGINIA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1150517, 'totalvotes': 2559129},
-    {'year': 1992, 'state': 'VIRGINIA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1038650, 'totalvotes': 2559129},
-    {'year': 1992, 'state': 'VIRGINIA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 348639, 'totalvotes': 2559129},
-    {'year': 1992, 'state': 'VIRGINIA', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 15129, 'totalvotes': 2559129},
-    {'year': 1992, 'state': 'VIRGINIA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5730, 'totalvotes': 2559129},
-    {'year': 1992, 'state': 'VIRGINIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 464, 'totalvotes': 2559129},
-    {'year': 1992, 'state': 'WASHINGTON', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 993037, 'totalvotes': 2287565},
-    {'year': 1992, 'state': 'WASHINGTON', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 731234, 'totalvotes': 2287565},
-    {'year': 1992, 'state': 'WASHINGTON', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 541780, 'totalvotes': 2287565},
-    {'year': 1992, 'state': 'WASHINGTON', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7533, 'totalvotes': 2287565},
-    {'year': 1992, 'state': 'WASHINGTON', 'candidate': 'GRITZ, JAMES ""BO""', 'party_detailed': 'POPULIST', 'candidatevotes': 4854, 'totalvotes': 2287565},
-    {'year': 1992, 'state': 'WASHINGTON', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2456, 'totalvotes': 2287565},
-    {'year': 1992, 'state': 'WASHINGTON', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'TAXPAYERS PARTY', 'candidatevotes': 2354, 'totalvotes': 2287565},
-    {'year': 1992, 'state': 'WASHINGTON', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2026, 'totalvotes': 2287565},
-    {'year': 1992, 'state': 'WASHINGTON', 'candidate': 'FULANI, LENORA', 'party_detailed': 'NEW ALLIANCE', 'candidatevotes': 1776, 'totalvotes': 2287565},
-    {'year': 1992, 'state': 'WASHINGTON', 'candidate': 'WARREN, JAMES ""MAC""', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 515, 'totalvotes': 2287565},
-    {'year': 1992, 'state': 'WEST VIRGINIA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 331001, 'totalvotes': 683677},
-    {'year': 1992, 'state': 'WEST VIRGINIA', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 241974, 'totalvotes': 683677},
-    {'year': 1992, 'state': 'WEST VIRGINIA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 108829, 'totalvotes': 683677},
-    {'year': 1992, 'state': 'WEST VIRGINIA', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1873, 'totalvotes': 683677},
-    {'year': 1992, 'state': 'WISCONSIN', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1041066, 'totalvotes': 2531064},
-    {'year': 1992, 'state': 'WISCONSIN', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 930855, 'totalvotes': 2531064},
-    {'year': 1992, 'state': 'WISCONSIN', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 544479, 'totalvotes': 2531064},
-    {'year': 1992, 'state': 'WISCONSIN', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 7518, 'totalvotes': 2531064},
-    {'year': 1992, 'state': 'WISCONSIN', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2877, 'totalvotes': 2531064},
-    {'year': 1992, 'state': 'WISCONSIN', 'candidate': 'DANIELS, RON', 'party_detailed': 'LABOR-FARM-LABORISTA-AGRARIO', 'candidatevotes': 1833, 'totalvotes': 2531064},
-    {'year': 1992, 'state': 'WISCONSIN', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1070, 'totalvotes': 2531064},
-    {'year': 1992, 'state': 'WISCONSIN', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 961, 'totalvotes': 2531064},
-    {'year': 1992, 'state': 'WISCONSIN', 'candidate': 'HEM, ROLAND', 'party_detailed': 'THIRD PARTY', 'candidatevotes': 405, 'totalvotes': 2531064},
-    {'year': 1992, 'state': 'WYOMING', 'candidate': 'BUSH, GEORGE H.W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 79347, 'totalvotes': 199884},
-    {'year': 1992, 'state': 'WYOMING', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 68160, 'totalvotes': 199884},
-    {'year': 1992, 'state': 'WYOMING', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 51263, 'totalvotes': 199884},
-    {'year': 1992, 'state': 'WYOMING', 'candidate': 'MARROU, ANDRE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 844, 'totalvotes': 199884},
-    {'year': 1992, 'state': 'WYOMING', 'candidate': 'FULANI, LENORA', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 270, 'totalvotes': 199884},
-    {'year': 1996, 'state': 'ALABAMA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 769044, 'totalvotes': 1534349},
-    {'year': 1996, 'state': 'ALABAMA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 662165, 'totalvotes': 1534349},
-    {'year': 1996, 'state': 'ALABAMA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 95030, 'totalvotes': 1534349},
-    {'year': 1996, 'state': 'ALABAMA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5290, 'totalvotes': 1534349},
-    {'year': 1996, 'state': 'ALABAMA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1697, 'totalvotes': 1534349},
-    {'year': 1996, 'state': 'ALABAMA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1123, 'totalvotes': 1534349},
-    {'year': 1996, 'state': 'ALASKA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 122746, 'totalvotes': 241620},
-    {'year': 1996, 'state': 'ALASKA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 80380, 'totalvotes': 241620},
-    {'year': 1996, 'state': 'ALASKA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 26333, 'totalvotes': 241620},
-    {'year': 1996, 'state': 'ALASKA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 7597, 'totalvotes': 241620},
-    {'year': 1996, 'state': 'ALASKA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2276, 'totalvotes': 241620},
-    {'year': 1996, 'state': 'ALASKA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 925, 'totalvotes': 241620},
-    {'year': 1996, 'state': 'ALASKA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 729, 'totalvotes': 241620},
-    {'year': 1996, 'state': 'ALASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 634, 'totalvotes': 241620},
-    {'year': 1996, 'state': 'ARIZONA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 653288, 'totalvotes': 1404405},
-    {'year': 1996, 'state': 'ARIZONA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 622073, 'totalvotes': 1404405},
-    {'year': 1996, 'state': 'ARIZONA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 112072, 'totalvotes': 1404405},
-    {'year': 1996, 'state': 'ARIZONA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 14358, 'totalvotes': 1404405},
-    {'year': 1996, 'state': 'ARIZONA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2573, 'totalvotes': 1404405},
-    {'year': 1996, 'state': 'ARIZONA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 41, 'totalvotes': 1404405},
-    {'year': 1996, 'state': 'ARKANSAS', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 475171, 'totalvotes': 884262},
-    {'year': 1996, 'state': 'ARKANSAS', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 325416, 'totalvotes': 884262},
-    {'year': 1996, 'state': 'ARKANSAS', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 69884, 'totalvotes': 884262},
-    {'year': 1996, 'state': 'ARKANSAS', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 3649, 'totalvotes': 884262},
-    {'year': 1996, 'state': 'ARKANSAS', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3076, 'totalvotes': 884262},
-    {'year': 1996, 'state': 'ARKANSAS', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 2065, 'totalvotes': 884262},
-    {'year': 1996, 'state': 'ARKANSAS', 'candidate': 'FORBES, RALPH', 'party_detailed': 'AMERICA FIRST', 'candidatevotes': 932, 'totalvotes': 884262},
-    {'year': 1996, 'state': 'ARKANSAS', 'candidate': 'COLLINS, CHARLES', 'party_detailed': 'UNAFFILIATED', 'candidatevotes': 823, 'totalvotes': 884262},
-    {'year': 1996, 'state': 'ARKANSAS', 'candidate': 'MASTERS, ISABELL', 'party_detailed': 'LOOKING BACK PARTY', 'candidatevotes': 749, 'totalvotes': 884262},
-    {'year': 1996, 'state': 'ARKANSAS', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 747, 'totalvotes': 884262},
-    {'year': 1996, 'state': 'ARKANSAS', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 729, 'totalvotes': 884262},
-    {'year': 1996, 'state': 'ARKANSAS', 'candidate': 'HOLLIS, MARY CAL', 'party_detailed': 'SOCIALIST', 'candidatevotes': 538, 'totalvotes': 884262},
-    {'year': 1996, 'state': 'ARKANSAS', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 483, 'totalvotes': 884262},
-    {'year': 1996, 'state': 'CALIFORNIA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 5119835, 'totalvotes': 10019469},
-    {'year': 1996, 'state': 'CALIFORNIA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 3828381, 'totalvotes': 10019469},
-    {'year': 1996, 'state': 'CALIFORNIA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 697847, 'totalvotes': 10019469},
-    {'year': 1996, 'state': 'CALIFORNIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 237016, 'totalvotes': 10019469},
-    {'year': 1996, 'state': 'CALIFORNIA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 73600, 'totalvotes': 10019469},
-    {'year': 1996, 'state': 'CALIFORNIA', 'candidate': 'FEINLAND, MARSHA', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 25332, 'totalvotes': 10019469},
-    {'year': 1996, 'state': 'CALIFORNIA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 21202, 'totalvotes': 10019469},
-    {'year': 1996, 'state': 'CALIFORNIA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 15403, 'totalvotes': 10019469},
-    {'year': 1996, 'state': 'CALIFORNIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 853, 'totalvotes': 10019469},
-    {'year': 1996, 'state': 'COLORADO', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 691848, 'totalvotes': 1510702},
-    {'year': 1996, 'state': 'COLORADO', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 671152, 'totalvotes': 1510702},
-    {'year': 1996, 'state': 'COLORADO', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 99629, 'totalvotes': 1510702},
-    {'year': 1996, 'state': 'COLORADO', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 25070, 'totalvotes': 1510702},
-    {'year': 1996, 'state': 'COLORADO', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12392, 'totalvotes': 1510702},
-    {'year': 1996, 'state': 'COLORADO', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2813, 'totalvotes': 1510702},
-    {'year': 1996, 'state': 'COLORADO', 'candidate': 'COLLINS, CHARLES', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2809, 'totalvotes': 1510702},
-    {'year': 1996, 'state': 'COLORADO', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2545, 'totalvotes': 1510702},
-    {'year': 1996, 'state': 'COLORADO', 'candidate': 'HOLLIS, MARY CAL', 'party_detailed': 'SOCIALIST', 'candidatevotes': 669, 'totalvotes': 1510702},
-    {'year': 1996, 'state': 'COLORADO', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 599, 'totalvotes': 1510702},
-    {'year': 1996, 'state': 'COLORADO', 'candidate': 'TEMPLIN, DIANE', 'party_detailed': 'AMERICAN', 'candidatevotes': 557, 'totalvotes': 1510702},
-    {'year': 1996, 'state': 'COLORADO', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 375, 'totalvotes': 1510702},
-    {'year': 1996, 'state': 'COLORADO', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 244, 'totalvotes': 1510702},
-    {'year': 1996, 'state': 'CONNECTICUT', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 735740, 'totalvotes': 1392614},
-    {'year': 1996, 'state': 'CONNECTICUT', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 483109, 'totalvotes': 1392614},
-    {'year': 1996, 'state': 'CONNECTICUT', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 139523, 'totalvotes': 1392614},
-    {'year': 1996, 'state': 'CONNECTICUT', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 24321, 'totalvotes': 1392614},
-    {'year': 1996, 'state': 'CONNECTICUT', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5788, 'totalvotes': 1392614},
-    {'year': 1996, 'state': 'CONNECTICUT', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONCERNED CITIZENS', 'candidatevotes': 2425, 'totalvotes': 1392614},
-    {'year': 1996, 'state': 'CONNECTICUT', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1703, 'totalvotes': 1392614},
-    {'year': 1996, 'state': 'CONNECTICUT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 5, 'totalvotes': 1392614},
-    {'year': 1996, 'state': 'DELAWARE', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 140355, 'totalvotes': 270810},
-    {'year': 1996, 'state': 'DELAWARE', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 99062, 'totalvotes': 270810},
-    {'year': 1996, 'state': 'DELAWARE', 'candidate': 'PEROT, ROSS', 'party_detailed': 'UNAFFILIATED', 'candidatevotes': 28719, 'totalvotes': 270810},
-    {'year': 1996, 'state': 'DELAWARE', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2052, 'totalvotes': 270810},
-    {'year': 1996, 'state': 'DELAWARE', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 348, 'totalvotes': 270810},
-    {'year': 1996, 'state': 'DELAWARE', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 274, 'totalvotes': 270810},
-    {'year': 1996, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 158220, 'totalvotes': 185726},
-    {'year': 1996, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 17339, 'totalvotes': 185726},
-    {'year': 1996, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 4780, 'totalvotes': 185726},
-    {'year': 1996, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 3611, 'totalvotes': 185726},
-    {'year': 1996, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 648, 'totalvotes': 185726},
-    {'year': 1996, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 588, 'totalvotes': 185726},
-    {'year': 1996, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 283, 'totalvotes': 185726},
-    {'year': 1996, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 257, 'totalvotes': 185726},
-    {'year': 1996, 'state': 'FLORIDA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2546870, 'totalvotes': 5303154},
-    {'year': 1996, 'state': 'FLORIDA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2244536, 'totalvotes': 5303154},
-    {'year': 1996, 'state': 'FLORIDA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 483870, 'totalvotes': 5303154},
-    {'year': 1996, 'state': 'FLORIDA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 23326, 'totalvotes': 5303154},
-    {'year': 1996, 'state': 'FLORIDA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 4552, 'totalvotes': 5303154},
-    {'year': 1996, 'state': 'GEORGIA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1080843, 'totalvotes': 2298899},
-    {'year': 1996, 'state': 'GEORGIA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1053849, 'totalvotes': 2298899},
-    {'year': 1996, 'state': 'GEORGIA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 146337, 'totalvotes': 2298899},
-    {'year': 1996, 'state': 'GEORGIA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 17870, 'totalvotes': 2298899},
-    {'year': 1996, 'state': 'HAWAII', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 205012, 'totalvotes': 360120},
-    {'year': 1996, 'state': 'HAWAII', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 113943, 'totalvotes': 360120},
-    {'year': 1996, 'state': 'HAWAII', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 27358, 'totalvotes': 360120},
-    {'year': 1996, 'state': 'HAWAII', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 10386, 'totalvotes': 360120},
-    {'year': 1996, 'state': 'HAWAII', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2493, 'totalvotes': 360120},
-    {'year': 1996, 'state': 'HAWAII', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 570, 'totalvotes': 360120},
-    {'year': 1996, 'state': 'HAWAII', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 358, 'totalvotes': 360120},
-    {'year': 1996, 'state': 'IDAHO', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 256595, 'totalvotes': 491711},
-    {'year': 1996, 'state': 'IDAHO', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 165443, 'totalvotes': 491711},
-    {'year': 1996, 'state': 'IDAHO', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 62518, 'totalvotes': 491711},
-    {'year': 1996, 'state': 'IDAHO', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3325, 'totalvotes': 491711},
-    {'year': 1996, 'state': 'IDAHO', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 2230, 'totalvotes': 491711},
-    {'year': 1996, 'state': 'IDAHO', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1600, 'totalvotes': 491711},
-    {'year': 1996, 'state': 'ILLINOIS', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2341744, 'totalvotes': 4311391},
-    {'year': 1996, 'state': 'ILLINOIS', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1587021, 'totalvotes': 4311391},
-    {'year': 1996, 'state': 'ILLINOIS', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 346408, 'totalvotes': 4311391},
-    {'year': 1996, 'state': 'ILLINOIS', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 22548, 'totalvotes': 4311391},
-    {'year': 1996, 'state': 'ILLINOIS', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 7606, 'totalvotes': 4311391},
-    {'year': 1996, 'state': 'ILLINOIS', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 4606, 'totalvotes': 4311391},
-    {'year': 1996, 'state': 'ILLINOIS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1458, 'totalvotes': 4311391},
-    {'year': 1996, 'state': 'INDIANA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1006693, 'totalvotes': 2135431},
-    {'year': 1996, 'state': 'INDIANA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 887424, 'totalvotes': 2135431},
-    {'year': 1996, 'state': 'INDIANA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 224299, 'totalvotes': 2135431},
-    {'year': 1996, 'state': 'INDIANA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 15632, 'totalvotes': 2135431},
-    {'year': 1996, 'state': 'INDIANA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1383, 'totalvotes': 2135431},
-    {'year': 1996, 'state': 'IOWA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 620258, 'totalvotes': 1234075},
-    {'year': 1996, 'state': 'IOWA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 492644, 'totalvotes': 1234075},
-    {'year': 1996, 'state': 'IOWA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 105159, 'totalvotes': 1234075},
-    {'year': 1996, 'state': 'IOWA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 6550, 'totalvotes': 1234075},
-    {'year': 1996, 'state': 'IOWA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 3349, 'totalvotes': 1234075},
-    {'year': 1996, 'state': 'IOWA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2315, 'totalvotes': 1234075},
-    {'year': 1996, 'state': 'IOWA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 2229, 'totalvotes': 1234075},
-    {'year': 1996, 'state': 'IOWA', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 1240, 'totalvotes': 1234075},
-    {'year': 1996, 'state': 'IOWA', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 331, 'totalvotes': 1234075},
-    {'year': 1996, 'state': 'KANSAS', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 583245, 'totalvotes': 1074300},
-    {'year': 1996, 'state': 'KANSAS', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 387659, 'totalvotes': 1074300},
-    {'year': 1996, 'state': 'KANSAS', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 92639, 'totalvotes': 1074300},
-    {'year': 1996, 'state': 'KANSAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 5174, 'totalvotes': 1074300},
-    {'year': 1996, 'state': 'KANSAS', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4557, 'totalvotes': 1074300},
-    {'year': 1996, 'state': 'KANSAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1026, 'totalvotes': 1074300},
-    {'year': 1996, 'state': 'KENTUCKY', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 636614, 'totalvotes': 1388708},
-    {'year': 1996, 'state': 'KENTUCKY', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 623283, 'totalvotes': 1388708},
-    {'year': 1996, 'state': 'KENTUCKY', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 120396, 'totalvotes': 1388708},
-    {'year': 1996, 'state': 'KENTUCKY', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4009, 'totalvotes': 1388708},
-    {'year': 1996, 'state': 'KENTUCKY', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 2204, 'totalvotes': 1388708},
-    {'year': 1996, 'state': 'KENTUCKY', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1493, 'totalvotes': 1388708},
-    {'year': 1996, 'state': 'KENTUCKY', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 709, 'totalvotes': 1388708},
-    {'year': 1996, 'state': 'LOUISIANA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 927837, 'totalvotes': 1783959},
-    {'year': 1996, 'state': 'LOUISIANA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 712586, 'totalvotes': 1783959},
-    {'year': 1996, 'state': 'LOUISIANA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 123293, 'totalvotes': 1783959},
-    {'year': 1996, 'state': 'LOUISIANA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7499, 'totalvotes': 1783959},
-    {'year': 1996, 'state': 'LOUISIANA', 'candidate': 'NADER, RALPH', 'party_detailed': 'LIBERTY, ECOLOGY, COMMUNITY', 'candidatevotes': 4719, 'totalvotes': 1783959},
-    {'year': 1996, 'state': 'LOUISIANA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 3366, 'totalvotes': 1783959},
-    {'year': 1996, 'state': 'LOUISIANA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2981, 'totalvotes': 1783959},
-    {'year': 1996, 'state': 'LOUISIANA', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 1678, 'totalvotes': 1783959},
-    {'year': 1996, 'state': 'MAINE', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 312788, 'totalvotes': 605897},
-    {'year': 1996, 'state': 'MAINE', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 186378, 'totalvotes': 605897},
-    {'year': 1996, 'state': 'MAINE', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 85970, 'totalvotes': 605897},
-    {'year': 1996, 'state': 'MAINE', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 15279, 'totalvotes': 605897},
-    {'year': 1996, 'state': 'MAINE', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2996, 'totalvotes': 605897},
-    {'year': 1996, 'state': 'MAINE', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 1517, 'totalvotes': 605897},
-    {'year': 1996, 'state': 'MAINE', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 825, 'totalvotes': 605897},
-    {'year': 1996, 'state': 'MAINE', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 144, 'totalvotes': 605897},
-    {'year': 1996, 'state': 'MARYLAND', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 966207, 'totalvotes': 1780870},
-    {'year': 1996, 'state': 'MARYLAND', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 681530, 'totalvotes': 1780870},
-    {'year': 1996, 'state': 'MARYLAND', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 115812, 'totalvotes': 1780870},
-    {'year': 1996, 'state': 'MARYLAND', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8765, 'totalvotes': 1780870},
-    {'year': 1996, 'state': 'MARYLAND', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 3402, 'totalvotes': 1780870},
-    {'year': 1996, 'state': 'MARYLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2637, 'totalvotes': 1780870},
-    {'year': 1996, 'state': 'MARYLAND', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2517, 'totalvotes': 1780870},
-    {'year': 1996, 'state': 'MASSACHUSETTS', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1571509, 'totalvotes': 2556459},
-    {'year': 1996, 'state': 'MASSACHUSETTS', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 718058, 'totalvotes': 2556459},
-    {'year': 1996, 'state': 'MASSACHUSETTS', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 227206, 'totalvotes': 2556459},
-    {'year': 1996, 'state': 'MASSACHUSETTS', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 20424, 'totalvotes': 2556459},
-    {'year': 1996, 'state': 'MASSACHUSETTS', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 6180, 'totalvotes': 2556459},
-    {'year': 1996, 'state': 'MASSACHUSETTS', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 5183, 'totalvotes': 2556459},
-    {'year': 1996, 'state': 'MASSACHUSETTS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 4623, 'totalvotes': 2556459},
-    {'year': 1996, 'state': 'MASSACHUSETTS', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 3276, 'totalvotes': 2556459},
-    {'year': 1996, 'state': 'MICHIGAN', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1989653, 'totalvotes': 3848844},
-    {'year': 1996, 'state': 'MICHIGAN', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1481212, 'totalvotes': 3848844},
-    {'year': 1996, 'state': 'MICHIGAN', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 336670, 'totalvotes': 3848844},
-    {'year': 1996, 'state': 'MICHIGAN', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 27670, 'totalvotes': 3848844},
-    {'year': 1996, 'state': 'MICHIGAN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 4678, 'totalvotes': 3848844},
-    {'year': 1996, 'state': 'MICHIGAN', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 4254, 'totalvotes': 3848844},
-    {'year': 1996, 'state': 'MICHIGAN', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 3153, 'totalvotes': 3848844},
-    {'year': 1996, 'state': 'MICHIGAN', 'candidate': 'WHITE, JEROME ""JERRY""', 'party_detailed': 'SOCIALIST EQUALITY PARTY', 'candidatevotes': 1554, 'totalvotes': 3848844},
-    {'year': 1996, 'state': 'MINNESOTA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1120380, 'totalvotes': 2192492},
-    {'year': 1996, 'state': 'MINNESOTA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 766395, 'totalvotes': 2192492},
-    {'year': 1996, 'state': 'MINNESOTA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 257698, 'totalvotes': 2192492},
-    {'year': 1996, 'state': 'MINNESOTA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 24906, 'totalvotes': 2192492},
-    {'year': 1996, 'state': 'MINNESOTA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8271, 'totalvotes': 2192492},
-    {'year': 1996, 'state': 'MINNESOTA', 'candidate': 'PERON, DENNIS', 'party_detailed': 'GRASSROOTS', 'candidatevotes': 4898, 'totalvotes': 2192492},
-    {'year': 1996, 'state': 'MINNESOTA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 3415, 'totalvotes': 2192492},
-    {'year': 1996, 'state': 'MINNESOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2903, 'totalvotes': 2192492},
-    {'year': 1996, 'state': 'MINNESOTA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1808, 'totalvotes': 2192492},
-    {'year': 1996, 'state': 'MINNESOTA', 'candidate': 'BIRRENBACK, JOHN', 'party_detailed': 'INDEPENDENT GRASSROOTS', 'candidatevotes': 787, 'totalvotes': 2192492},
-    {'year': 1996, 'state': 'MINNESOTA', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 684, 'totalvotes': 2192492},
-    {'year': 1996, 'state': 'MINNESOTA', 'candidate': 'WHITE, JEROME ""JERRY""', 'party_detailed': 'SOCIALIST EQUALITY PARTY', 'candidatevotes': 347, 'totalvotes': 2192492},
-    {'year': 1996, 'state': 'MISSISSIPPI', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 439838, 'totalvotes': 893857},
-    {'year': 1996, 'state': 'MISSISSIPPI', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 394022, 'totalvotes': 893857},
-    {'year': 1996, 'state': 'MISSISSIPPI', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 53427, 'totalvotes': 893857},
-    {'year': 1996, 'state': 'MISSISSIPPI', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2809, 'totalvotes': 893857},
-    {'year': 1996, 'state': 'MISSISSIPPI', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 2314, 'totalvotes': 893857},
-    {'year': 1996, 'state': 'MISSISSIPPI', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1447, 'totalvotes': 893857},
-    {'year': 1996, 'state': 'MISSOURI', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1025935, 'totalvotes': 2158065},
-    {'year': 1996, 'state': 'MISSOURI', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 890016, 'totalvotes': 2158065},
-    {'year': 1996, 'state': 'MISSOURI', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 217188, 'totalvotes': 2158065},
-    {'year': 1996, 'state': 'MISSOURI', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 11521, 'totalvotes': 2158065},
-    {'year': 1996, 'state': 'MISSOURI', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 10522, 'totalvotes': 2158065},
-    {'year': 1996, 'state': 'MISSOURI', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2287, 'totalvotes': 2158065},
-    {'year': 1996, 'state': 'MISSOURI', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 596, 'totalvotes': 2158065},
-    {'year': 1996, 'state': 'MONTANA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 179652, 'totalvotes': 407083},
-    {'year': 1996, 'state': 'MONTANA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 167922, 'totalvotes': 407083},
-    {'year': 1996, 'state': 'MONTANA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 55229, 'totalvotes': 407083},
-    {'year': 1996, 'state': 'MONTANA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2526, 'totalvotes': 407083},
-    {'year': 1996, 'state': 'MONTANA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1754, 'totalvotes': 407083},
-    {'year': 1996, 'state': 'NEBRASKA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 363467, 'totalvotes': 677415},
-    {'year': 1996, 'state': 'NEBRASKA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 236761, 'totalvotes': 677415},
-    {'year': 1996, 'state': 'NEBRASKA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 71278, 'totalvotes': 677415},
-    {'year': 1996, 'state': 'NEBRASKA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2792, 'totalvotes': 677415},
-    {'year': 1996, 'state': 'NEBRASKA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 1928, 'totalvotes': 677415},
-    {'year': 1996, 'state': 'NEBRASKA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1189, 'totalvotes': 677415},
-    {'year': 1996, 'state': 'NEVADA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 203974, 'totalvotes': 464279},
-    {'year': 1996, 'state': 'NEVADA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 199244, 'totalvotes': 464279},
-    {'year': 1996, 'state': 'NEVADA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 43986, 'totalvotes': 464279},
-    {'year': 1996, 'state': 'NEVADA', 'candidate': 'NONE OF THE ABOVE', 'party_detailed': 'OTHER', 'candidatevotes': 5608, 'totalvotes': 464279},
-    {'year': 1996, 'state': 'NEVADA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 4730, 'totalvotes': 464279},
-    {'year': 1996, 'state': 'NEVADA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4460, 'totalvotes': 464279},
-    {'year': 1996, 'state': 'NEVADA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'INDEPENDENT AMERICAN', 'candidatevotes': 1732, 'totalvotes': 464279},
-    {'year': 1996, 'state': 'NEVADA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 545, 'totalvotes': 464279},
-    {'year': 1996, 'state': 'NEW HAMPSHIRE', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 246166, 'totalvotes': 496597},
-    {'year': 1996, 'state': 'NEW HAMPSHIRE', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 196486, 'totalvotes': 496597},
-    {'year': 1996, 'state': 'NEW HAMPSHIRE', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 48387, 'totalvotes': 496597},
-    {'year': 1996, 'state': 'NEW HAMPSHIRE', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4214, 'totalvotes': 496597},
-    {'year': 1996, 'state': 'NEW HAMPSHIRE', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 1344, 'totalvotes': 496597},
-    {'year': 1996, 'state': 'NEW JERSEY', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1652361, 'totalvotes': 3075860},
-    {'year': 1996, 'state': 'NEW JERSEY', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1103099, 'totalvotes': 3075860},
-    {'year': 1996, 'state': 'NEW JERSEY', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 320400, 'totalvotes': 3075860},
-    {'year': 1996, 'state': 'NEW MEXICO', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 273495, 'totalvotes': 556074},
-    {'year': 1996, 'state': 'NEW MEXICO', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 232751, 'totalvotes': 556074},
-    {'year': 1996, 'state': 'NEW MEXICO', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 32257, 'totalvotes': 556074},
-    {'year': 1996, 'state': 'NEW MEXICO', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 13218, 'totalvotes': 556074},
-    {'year': 1996, 'state': 'NEW MEXICO', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2996, 'totalvotes': 556074},
-    {'year': 1996, 'state': 'NEW MEXICO', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 713, 'totalvotes': 556074},
-    {'year': 1996, 'state': 'NEW MEXICO', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 644, 'totalvotes': 556074},
-    {'year': 1996, 'state': 'NEW YORK', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3649630, 'totalvotes': 6439129},
-    {'year': 1996, 'state': 'NEW YORK', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1738707, 'totalvotes': 6439129},
-    {'year': 1996, 'state': 'NEW YORK', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENCE', 'candidatevotes': 503458, 'totalvotes': 6439129},
-    {'year': 1996, 'state': 'NEW YORK', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 183392, 'totalvotes': 6439129},
-    {'year': 1996, 'state': 'NEW YORK', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 123000, 'totalvotes': 6439129},
-    {'year': 1996, 'state': 'NEW YORK', 'candidate': 'CLINTON, BILL', 'party_detailed': 'LIBERAL PARTY', 'candidatevotes': 106547, 'totalvotes': 6439129},
-    {'year': 1996, 'state': 'NEW YORK', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 75956, 'totalvotes': 6439129},
-    {'year': 1996, 'state': 'NEW YORK', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'RIGHT-TO-LIFE', 'candidatevotes': 23580, 'totalvotes': 6439129},
-    {'year': 1996, 'state': 'NEW YORK', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12220, 'totalvotes': 6439129},
-    {'year': 1996, 'state': 'NEW YORK', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'FREEDOM', 'candidatevotes': 11393, 'totalvotes': 6439129},
-    {'year': 1996, 'state': 'NEW YORK', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 5011, 'totalvotes': 6439129},
-    {'year': 1996, 'state': 'NEW YORK', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 3473, 'totalvotes': 6439129},
-    {'year': 1996, 'state': 'NEW YORK', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 2762, 'totalvotes': 6439129},
-    {'year': 1996, 'state': 'NORTH CAROLINA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1225938, 'totalvotes': 2515807},
-    {'year': 1996, 'state': 'NORTH CAROLINA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1107849, 'totalvotes': 2515807},
-    {'year': 1996, 'state': 'NORTH CAROLINA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 168059, 'totalvotes': 2515807},
-    {'year': 1996, 'state': 'NORTH CAROLINA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8740, 'totalvotes': 2515807},
-    {'year': 1996, 'state': 'NORTH CAROLINA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2771, 'totalvotes': 2515807},
-    {'year': 1996, 'state': 'NORTH CAROLINA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2450, 'totalvotes': 2515807},
-    {'year': 1996, 'state': 'NORTH DAKOTA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 125050, 'totalvotes': 266411},
-    {'year': 1996, 'state': 'NORTH DAKOTA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 106905, 'totalvotes': 266411},
-    {'year': 1996, 'state': 'NORTH DAKOTA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 32515, 'totalvotes': 266411},
-    {'year': 1996, 'state': 'NORTH DAKOTA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 847, 'totalvotes': 266411},
-    {'year': 1996, 'state': 'NORTH DAKOTA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'INDEPENDENT NOMINATION', 'candidatevotes': 745, 'totalvotes': 266411},
-    {'year': 1996, 'state': 'NORTH DAKOTA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 349, 'totalvotes': 266411},
-    {'year': 1996, 'state': 'OHIO', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2148222, 'totalvotes': 4534434},
-    {'year': 1996, 'state': 'OHIO', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1859883, 'totalvotes': 4534434},
-    {'year': 1996, 'state': 'OHIO', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 483207, 'totalvotes': 4534434},
-    {'year': 1996, 'state': 'OHIO', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12851, 'totalvotes': 4534434},
-    {'year': 1996, 'state': 'OHIO', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 10813, 'totalvotes': 4534434},
-    {'year': 1996, 'state': 'OHIO', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 9120, 'totalvotes': 4534434},
-    {'year': 1996, 'state': 'OHIO', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 7361, 'totalvotes': 4534434},
-    {'year': 1996, 'state': 'OHIO', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 2962, 'totalvotes': 4534434},
-    {'year': 1996, 'state': 'OHIO', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 15, 'totalvotes': 4534434},
-    {'year': 1996, 'state': 'OKLAHOMA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 582315, 'totalvotes': 1206713},
-    {'year': 1996, 'state': 'OKLAHOMA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 488105, 'totalvotes': 1206713},
-    {'year': 1996, 'state': 'OKLAHOMA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 130788, 'totalvotes': 1206713},
-    {'year': 1996, 'state': 'OKLAHOMA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5505, 'totalvotes': 1206713},
-    {'year': 1996, 'state': 'OREGON', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 649641, 'totalvotes': 1377760},
-    {'year': 1996, 'state': 'OREGON', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 538152, 'totalvotes': 1377760},
-    {'year': 1996, 'state': 'OREGON', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 121221, 'totalvotes': 1377760},
-    {'year': 1996, 'state': 'OREGON', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 49415, 'totalvotes': 1377760},
-    {'year': 1996, 'state': 'OREGON', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8903, 'totalvotes': 1377760},
-    {'year': 1996, 'state': 'OREGON', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 3379, 'totalvotes': 1377760},
-    {'year': 1996, 'state': 'OREGON', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2798, 'totalvotes': 1377760},
-    {'year': 1996, 'state': 'OREGON', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 2329, 'totalvotes': 1377760},
-    {'year': 1996, 'state': 'OREGON', 'candidate': 'HOLLIS, MARY CAL', 'party_detailed': 'SOCIALIST', 'candidatevotes': 1922, 'totalvotes': 1377760},
-    {'year': 1996, 'state': 'PENNSYLVANIA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2215819, 'totalvotes': 4501307},
-    {'year': 1996, 'state': 'PENNSYLVANIA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1801169, 'totalvotes': 4501307},
-    {'year': 1996, 'state': 'PENNSYLVANIA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 430984, 'totalvotes': 4501307},
-    {'year': 1996, 'state': 'PENNSYLVANIA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 28000, 'totalvotes': 4501307},
-    {'year': 1996, 'state': 'PENNSYLVANIA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 19552, 'totalvotes': 4501307},
-    {'year': 1996, 'state': 'PENNSYLVANIA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 5783, 'totalvotes': 4501307},
-    {'year': 1996, 'state': 'RHODE ISLAND', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 233050, 'totalvotes': 390247},
-    {'year': 1996, 'state': 'RHODE ISLAND', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 104683, 'totalvotes': 390247},
-    {'year': 1996, 'state': 'RHODE ISLAND', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 43723, 'totalvotes': 390247},
-    {'year': 1996, 'state': 'RHODE ISLAND', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 6040, 'totalvotes': 390247},
-    {'year': 1996, 'state': 'RHODE ISLAND', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1109, 'totalvotes': 390247},
-    {'year': 1996, 'state': 'RHODE ISLAND', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 1021, 'totalvotes': 390247},
-    {'year': 1996, 'state': 'RHODE ISLAND', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 435, 'totalvotes': 390247},
-    {'year': 1996, 'state': 'RHODE ISLAND', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 186, 'totalvotes': 390247},
-    {'year': 1996, 'state': 'SOUTH CAROLINA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 573339, 'totalvotes': 1150182},
-    {'year': 1996, 'state': 'SOUTH CAROLINA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 506152, 'totalvotes': 1150182},
-    {'year': 1996, 'state': 'SOUTH CAROLINA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'PATRIOT PARTY', 'candidatevotes': 36913, 'totalvotes': 1150182},
-    {'year': 1996, 'state': 'SOUTH CAROLINA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 27464, 'totalvotes': 1150182},
-    {'year': 1996, 'state': 'SOUTH CAROLINA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4271, 'totalvotes': 1150182},
-    {'year': 1996, 'state': 'SOUTH CAROLINA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 2043, 'totalvotes': 1150182},
-    {'year': 1996, 'state': 'SOUTH DAKOTA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 150543, 'totalvotes': 323826},
-    {'year': 1996, 'state': 'SOUTH DAKOTA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 139333, 'totalvotes': 323826},
-    {'year': 1996, 'state': 'SOUTH DAKOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 32478, 'totalvotes': 323826},
-    {'year': 1996, 'state': 'SOUTH DAKOTA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1472, 'totalvotes': 323826},
-    {'year': 1996, 'state': 'TENNESSEE', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 909146, 'totalvotes': 1894105},
-    {'year': 1996, 'state': 'TENNESSEE', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 863530, 'totalvotes': 1894105},
-    {'year': 1996, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 121239, 'totalvotes': 1894105},
-    {'year': 1996, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 190, 'totalvotes': 1894105},
-    {'year': 1996, 'state': 'TEXAS', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2736167, 'totalvotes': 5611644},
-    {'year': 1996, 'state': 'TEXAS', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2459683, 'totalvotes': 5611644},
-    {'year': 1996, 'state': 'TEXAS', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 378537, 'totalvotes': 5611644},
-    {'year': 1996, 'state': 'TEXAS', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 20256, 'totalvotes': 5611644},
-    {'year': 1996, 'state': 'TEXAS', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 7472, 'totalvotes': 5611644},
-    {'year': 1996, 'state': 'TEXAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 5107, 'totalvotes': 5611644},
-    {'year': 1996, 'state': 'TEXAS', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 4422, 'totalvotes': 5611644},
-    {'year': 1996, 'state': 'UTAH', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 361911, 'totalvotes': 665629},
-    {'year': 1996, 'state': 'UTAH', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 221633, 'totalvotes': 665629},
-    {'year': 1996, 'state': 'UTAH', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 66461, 'totalvotes': 665629},
-    {'year': 1996, 'state': 'UTAH', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 4615, 'totalvotes': 665629},
-    {'year': 1996, 'state': 'UTAH', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4129, 'totalvotes': 665629},
-    {'year': 1996, 'state': 'UTAH', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 2601, 'totalvotes': 665629},
-    {'year': 1996, 'state': 'UTAH', 'candidate': 'TEMPLIN, DIANE', 'party_detailed': 'INDEPENDENT AMERICAN', 'candidatevotes': 1290, 'totalvotes': 665629},
-    {'year': 1996, 'state': 'UTAH', 'candidate': 'CRANE, PETER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1101, 'totalvotes': 665629},
-    {'year': 1996, 'state': 'UTAH', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1085, 'totalvotes': 665629},
-    {'year': 1996, 'state': 'UTAH', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 298, 'totalvotes': 665629},
-    {'year': 1996, 'state': 'UTAH', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 235, 'totalvotes': 665629},
-    {'year': 1996, 'state': 'UTAH', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 159, 'totalvotes': 665629},
-    {'year': 1996, 'state': 'UTAH', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 111, 'totalvotes': 665629},
-    {'year': 1996, 'state': 'VERMONT', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 137894, 'totalvotes': 258449},
-    {'year': 1996, 'state': 'VERMONT', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 80352, 'totalvotes': 258449},
-    {'year': 1996, 'state': 'VERMONT', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 31024, 'totalvotes': 258449},
-    {'year': 1996, 'state': 'VERMONT', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 5585, 'totalvotes': 258449},
-    {'year': 1996, 'state': 'VERMONT', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1183, 'totalvotes': 258449},
-    {'year': 1996, 'state': 'VERMONT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 560, 'totalvotes': 258449},
-    {'year': 1996, 'state': 'VERMONT', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 498, 'totalvotes': 258449},
-    {'year': 1996, 'state': 'VERMONT', 'candidate': 'PERON, DENNIS', 'party_detailed': 'GRASSROOTS', 'candidatevotes': 480, 'totalvotes': 258449},
-    {'year': 1996, 'state': 'VERMONT', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 382, 'totalvotes': 258449},
-    {'year': 1996, 'state': 'VERMONT', 'candidate': 'HOLLIS, MARY CAL', 'party_detailed': 'LIBERTY UNION PARTY', 'candidatevotes': 292, 'totalvotes': 258449},
-    {'year': 1996, 'state': 'VERMONT', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 199, 'totalvotes': 258449},
-    {'year': 1996, 'state': 'VIRGINIA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1138350, 'totalvotes': 2416642},
-    {'year': 1996, 'state': 'VIRGINIA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1091060, 'totalvotes': 2416642},
-    {'year': 1996, 'state': 'VIRGINIA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 159861, 'totalvotes': 2416642},
-    {'year': 1996, 'state': 'VIRGINIA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 13687, 'totalvotes': 2416642},
-    {'year': 1996, 'state': 'VIRGINIA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9174, 'totalvotes': 2416642},
-    {'year': 1996, 'state': 'VIRGINIA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 4510, 'totalvotes': 2416642},
-    {'year': 1996, 'state': 'WASHINGTON', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1123323, 'totalvotes': 2253837},
-    {'year': 1996, 'state': 'WASHINGTON', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 840712, 'totalvotes': 2253837},
-    {'year': 1996, 'state': 'WASHINGTON', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 201003, 'totalvotes': 2253837},
-    {'year': 1996, 'state': 'WASHINGTON', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 62696, 'totalvotes': 2253837},
-    {'year': 1996, 'state': 'WASHINGTON', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12522, 'totalvotes': 2253837},
-    {'year': 1996, 'state': 'WASHINGTON', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 6076, 'totalvotes': 2253837},
-    {'year': 1996, 'state': 'WASHINGTON', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 4578, 'totalvotes': 2253837},
-    {'year': 1996, 'state': 'WASHINGTON', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 2189, 'totalvotes': 2253837},
-    {'year': 1996, 'state': 'WASHINGTON', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 738, 'totalvotes': 2253837},
-    {'year': 1996, 'state': 'WEST VIRGINIA', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 327812, 'totalvotes': 636459},
-    {'year': 1996, 'state': 'WEST VIRGINIA', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 233946, 'totalvotes': 636459},
-    {'year': 1996, 'state': 'WEST VIRGINIA', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 71639, 'totalvotes': 636459},
-    {'year': 1996, 'state': 'WEST VIRGINIA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3062, 'totalvotes': 636459},
-    {'year': 1996, 'state': 'WISCONSIN', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1071971, 'totalvotes': 2196169},
-    {'year': 1996, 'state': 'WISCONSIN', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 845029, 'totalvotes': 2196169},
-    {'year': 1996, 'state': 'WISCONSIN', 'candidate': 'PEROT, ROSS', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 227339, 'totalvotes': 2196169},
-    {'year': 1996, 'state': 'WISCONSIN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 32766, 'totalvotes': 2196169},
-    {'year': 1996, 'state': 'WISCONSIN', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 8811, 'totalvotes': 2196169},
-    {'year': 1996, 'state': 'WISCONSIN', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7929, 'totalvotes': 2196169},
-    {'year': 1996, 'state': 'WISCONSIN', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 2324, 'totalvotes': 2196169},
-    {'year': 1996, 'state': 'WYOMING', 'candidate': 'DOLE, ROBERT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 105388, 'totalvotes': 211571},
-    {'year': 1996, 'state': 'WYOMING', 'candidate': 'CLINTON, BILL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 77934, 'totalvotes': 211571},
-    {'year': 1996, 'state': 'WYOMING', 'candidate': 'PEROT, ROSS', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 25928, 'totalvotes': 211571},
-    {'year': 1996, 'state': 'WYOMING', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1739, 'totalvotes': 211571},
-    {'year': 1996, 'state': 'WYOMING', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 582, 'totalvotes': 211571},
-    {'year': 2000, 'state': 'ALABAMA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 941173, 'totalvotes': 1666272},
-    {'year': 2000, 'state': 'ALABAMA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 692611, 'totalvotes': 1666272},
-    {'year': 2000, 'state': 'ALABAMA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 25896, 'totalvotes': 1666272},
-    {'year': 2000, 'state': 'ALABAMA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5893, 'totalvotes': 1666272},
-    {'year': 2000, 'state': 'ALABAMA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 699, 'totalvotes': 1666272},
-    {'year': 2000, 'state': 'ALASKA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 167398, 'totalvotes': 285560},
-    {'year': 2000, 'state': 'ALASKA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 79004, 'totalvotes': 285560},
-    {'year': 2000, 'state': 'ALASKA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 28747, 'totalvotes': 285560},
-    {'year': 2000, 'state': 'ALASKA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 5192, 'totalvotes': 285560},
-    {'year': 2000, 'state': 'ALASKA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2636, 'totalvotes': 285560},
-    {'year': 2000, 'state': 'ALASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1068, 'totalvotes': 285560},
-    {'year': 2000, 'state': 'ALASKA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 919, 'totalvotes': 285560},
-    {'year': 2000, 'state': 'ALASKA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 596, 'totalvotes': 285560},
-    {'year': 2000, 'state': 'ARIZONA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 781652, 'totalvotes': 1532016},
-    {'year': 2000, 'state': 'ARIZONA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 685341, 'totalvotes': 1532016},
-    {'year': 2000, 'state': 'ARIZONA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 45645, 'totalvotes': 1532016},
-    {'year': 2000, 'state': 'ARIZONA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 12373, 'totalvotes': 1532016},
-    {'year': 2000, 'state': 'ARIZONA', 'candidate': 'L. NEIL, SMITH', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5775, 'totalvotes': 1532016},
-    {'year': 2000, 'state': 'ARIZONA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1120, 'totalvotes': 1532016},
-    {'year': 2000, 'state': 'ARIZONA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 110, 'totalvotes': 1532016},
-    {'year': 2000, 'state': 'ARKANSAS', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 472940, 'totalvotes': 921781},
-    {'year': 2000, 'state': 'ARKANSAS', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 422768, 'totalvotes': 921781},
-    {'year': 2000, 'state': 'ARKANSAS', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 13421, 'totalvotes': 921781},
-    {'year': 2000, 'state': 'ARKANSAS', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 7358, 'totalvotes': 921781},
-    {'year': 2000, 'state': 'ARKANSAS', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2781, 'totalvotes': 921781},
-    {'year': 2000, 'state': 'ARKANSAS', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1415, 'totalvotes': 921781},
-    {'year': 2000, 'state': 'ARKANSAS', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1098, 'totalvotes': 921781},
-    {'year': 2000, 'state': 'CALIFORNIA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 5861203, 'totalvotes': 10965822},
-    {'year': 2000, 'state': 'CALIFORNIA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 4567429, 'totalvotes': 10965822},
-    {'year': 2000, 'state': 'CALIFORNIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 418707, 'totalvotes': 10965822},
-    {'year': 2000, 'state': 'CALIFORNIA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 45520, 'totalvotes': 10965822},
-    {'year': 2000, 'state': 'CALIFORNIA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 44987, 'totalvotes': 10965822},
-    {'year': 2000, 'state': 'CALIFORNIA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 17042, 'totalvotes': 10965822},
-    {'year': 2000, 'state': 'CALIFORNIA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 10934, 'totalvotes': 10965822},
-    {'year': 2000, 'state': 'COLORADO', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 883748, 'totalvotes': 1741368},
-    {'year': 2000, 'state': 'COLORADO', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 738227, 'totalvotes': 1741368},
-    {'year': 2000, 'state': 'COLORADO', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 91434, 'totalvotes': 1741368},
-    {'year': 2000, 'state': 'COLORADO', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12799, 'totalvotes': 1741368},
-    {'year': 2000, 'state': 'COLORADO', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'FREEDOM', 'candidatevotes': 10465, 'totalvotes': 1741368},
-    {'year': 2000, 'state': 'COLORADO', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2240, 'totalvotes': 1741368},
-    {'year': 2000, 'state': 'COLORADO', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1319, 'totalvotes': 1741368},
-    {'year': 2000, 'state': 'COLORADO', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 712, 'totalvotes': 1741368},
-    {'year': 2000, 'state': 'COLORADO', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 216, 'totalvotes': 1741368},
-    {'year': 2000, 'state': 'COLORADO', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 208, 'totalvotes': 1741368},
-    {'year': 2000, 'state': 'CONNECTICUT', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 816015, 'totalvotes': 1459525},
-    {'year': 2000, 'state': 'CONNECTICUT', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 561094, 'totalvotes': 1459525},
-    {'year': 2000, 'state': 'CONNECTICUT', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 64452, 'totalvotes': 1459525},
-    {'year': 2000, 'state': 'CONNECTICUT', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONCERNED CITIZENS', 'candidatevotes': 9695, 'totalvotes': 1459525},
-    {'year': 2000, 'state': 'CONNECTICUT', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 4731, 'totalvotes': 1459525},
-    {'year': 2000, 'state': 'CONNECTICUT', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3484, 'totalvotes': 1459525},
-    {'year': 2000, 'state': 'CONNECTICUT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 54, 'totalvotes': 1459525},
-    {'year': 2000, 'state': 'DELAWARE', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 180068, 'totalvotes': 327529},
-    {'year': 2000, 'state': 'DELAWARE', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 137288, 'totalvotes': 327529},
-    {'year': 2000, 'state': 'DELAWARE', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 8307, 'totalvotes': 327529},
-    {'year': 2000, 'state': 'DELAWARE', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 777, 'totalvotes': 327529},
-    {'year': 2000, 'state': 'DELAWARE', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 774, 'totalvotes': 327529},
-    {'year': 2000, 'state': 'DELAWARE', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 208, 'totalvotes': 327529},
-    {'year': 2000, 'state': 'DELAWARE', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 107, 'totalvotes': 327529},
-    {'year': 2000, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 171923, 'totalvotes': 201894},
-    {'year': 2000, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 18073, 'totalvotes': 201894},
-    {'year': 2000, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 10576, 'totalvotes': 201894},
-    {'year': 2000, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 669, 'totalvotes': 201894},
-    {'year': 2000, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 539, 'totalvotes': 201894},
-    {'year': 2000, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 114, 'totalvotes': 201894},
-    {'year': 2000, 'state': 'FLORIDA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2912790, 'totalvotes': 5963110},
-    {'year': 2000, 'state': 'FLORIDA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2912253, 'totalvotes': 5963110},
-    {'year': 2000, 'state': 'FLORIDA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 97488, 'totalvotes': 5963110},
-    {'year': 2000, 'state': 'FLORIDA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 17484, 'totalvotes': 5963110},
-    {'year': 2000, 'state': 'FLORIDA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 16415, 'totalvotes': 5963110},
-    {'year': 2000, 'state': 'FLORIDA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2281, 'totalvotes': 5963110},
-    {'year': 2000, 'state': 'FLORIDA', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 1804, 'totalvotes': 5963110},
-    {'year': 2000, 'state': 'FLORIDA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1371, 'totalvotes': 5963110},
-    {'year': 2000, 'state': 'FLORIDA', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 622, 'totalvotes': 5963110},
-    {'year': 2000, 'state': 'FLORIDA', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 562, 'totalvotes': 5963110},
-    {'year': 2000, 'state': 'FLORIDA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 40, 'totalvotes': 5963110},
-    {'year': 2000, 'state': 'GEORGIA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1419720, 'totalvotes': 2583208},
-    {'year': 2000, 'state': 'GEORGIA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1116230, 'totalvotes': 2583208},
-    {'year': 2000, 'state': 'GEORGIA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 36332, 'totalvotes': 2583208},
-    {'year': 2000, 'state': 'GEORGIA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 10926, 'totalvotes': 2583208},
-    {'year': 2000, 'state': 'HAWAII', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 205286, 'totalvotes': 367951},
-    {'year': 2000, 'state': 'HAWAII', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 137845, 'totalvotes': 367951},
-    {'year': 2000, 'state': 'HAWAII', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 21623, 'totalvotes': 367951},
-    {'year': 2000, 'state': 'HAWAII', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1477, 'totalvotes': 367951},
-    {'year': 2000, 'state': 'HAWAII', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 1071, 'totalvotes': 367951},
-    {'year': 2000, 'state': 'HAWAII', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 343, 'totalvotes': 367951},
-    {'year': 2000, 'state': 'HAWAII', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 306, 'totalvotes': 367951},
-    {'year': 2000, 'state': 'IDAHO', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 336937, 'totalvotes': 501615},
-    {'year': 2000, 'state': 'IDAHO', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 138637, 'totalvotes': 501615},
-    {'year': 2000, 'state': 'IDAHO', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 12292, 'totalvotes': 501615},
-    {'year': 2000, 'state': 'IDAHO', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 7615, 'totalvotes': 501615},
-    {'year': 2000, 'state': 'IDAHO', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3488, 'totalvotes': 501615},
-    {'year': 2000, 'state': 'IDAHO', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1469, 'totalvotes': 501615},
-    {'year': 2000, 'state': 'IDAHO', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1177, 'totalvotes': 501615},
-    {'year': 2000, 'state': 'ILLINOIS', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2589026, 'totalvotes': 4742108},
-    {'year': 2000, 'state': 'ILLINOIS', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2019421, 'totalvotes': 4742108},
-    {'year': 2000, 'state': 'ILLINOIS', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 103759, 'totalvotes': 4742108},
-    {'year': 2000, 'state': 'ILLINOIS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 16106, 'totalvotes': 4742108},
-    {'year': 2000, 'state': 'ILLINOIS', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11623, 'totalvotes': 4742108},
-    {'year': 2000, 'state': 'ILLINOIS', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 2127, 'totalvotes': 4742108},
-    {'year': 2000, 'state': 'ILLINOIS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 46, 'totalvotes': 4742108},
-    {'year': 2000, 'state': 'INDIANA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1245836, 'totalvotes': 2199302},
-    {'year': 2000, 'state': 'INDIANA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 901980, 'totalvotes': 2199302},
-    {'year': 2000, 'state': 'INDIANA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 18997, 'totalvotes': 2199302},
-    {'year': 2000, 'state': 'INDIANA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 16959, 'totalvotes': 2199302},
-    {'year': 2000, 'state': 'INDIANA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 15530, 'totalvotes': 2199302},
-    {'year': 2000, 'state': 'IOWA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 638517, 'totalvotes': 1353022},
-    {'year': 2000, 'state': 'IOWA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 634373, 'totalvotes': 1353022},
-    {'year': 2000, 'state': 'IOWA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 37459, 'totalvotes': 1353022},
-    {'year': 2000, 'state': 'IOWA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 29374, 'totalvotes': 1353022},
-    {'year': 2000, 'state': 'IOWA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 5731, 'totalvotes': 1353022},
-    {'year': 2000, 'state': 'IOWA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3209, 'totalvotes': 1353022},
-    {'year': 2000, 'state': 'IOWA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NOMINATED BY PETITION', 'candidatevotes': 2281, 'totalvotes': 1353022},
-    {'year': 2000, 'state': 'IOWA', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 1168, 'totalvotes': 1353022},
-    {'year': 2000, 'state': 'IOWA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 613, 'totalvotes': 1353022},
-    {'year': 2000, 'state': 'IOWA', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 190, 'totalvotes': 1353022},
-    {'year': 2000, 'state': 'IOWA', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 107, 'totalvotes': 1353022},
-    {'year': 2000, 'state': 'KANSAS', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 622332, 'totalvotes': 1072216},
-    {'year': 2000, 'state': 'KANSAS', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 399276, 'totalvotes': 1072216},
-    {'year': 2000, 'state': 'KANSAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 37459, 'totalvotes': 1072216},
-    {'year': 2000, 'state': 'KANSAS', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 7370, 'totalvotes': 1072216},
-    {'year': 2000, 'state': 'KANSAS', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4525, 'totalvotes': 1072216},
-    {'year': 2000, 'state': 'KANSAS', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1254, 'totalvotes': 1072216},
-    {'year': 2000, 'state': 'KENTUCKY', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 872520, 'totalvotes': 1544106},
-    {'year': 2000, 'state': 'KENTUCKY', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 638923, 'totalvotes': 1544106},
-    {'year': 2000, 'state': 'KENTUCKY', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 23118, 'totalvotes': 1544106},
-    {'year': 2000, 'state': 'KENTUCKY', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 4152, 'totalvotes': 1544106},
-    {'year': 2000, 'state': 'KENTUCKY', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2885, 'totalvotes': 1544106},
-    {'year': 2000, 'state': 'KENTUCKY', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1513, 'totalvotes': 1544106},
-    {'year': 2000, 'state': 'KENTUCKY', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 915, 'totalvotes': 1544106},
-    {'year': 2000, 'state': 'KENTUCKY', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 80, 'totalvotes': 1544106},
-    {'year': 2000, 'state': 'LOUISIANA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 927871, 'totalvotes': 1765656},
-    {'year': 2000, 'state': 'LOUISIANA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 792344, 'totalvotes': 1765656},
-    {'year': 2000, 'state': 'LOUISIANA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 20473, 'totalvotes': 1765656},
-    {'year': 2000, 'state': 'LOUISIANA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 14356, 'totalvotes': 1765656},
-    {'year': 2000, 'state': 'LOUISIANA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 5483, 'totalvotes': 1765656},
-    {'year': 2000, 'state': 'LOUISIANA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2951, 'totalvotes': 1765656},
-    {'year': 2000, 'state': 'LOUISIANA', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1103, 'totalvotes': 1765656},
-    {'year': 2000, 'state': 'LOUISIANA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1075, 'totalvotes': 1765656},
-    {'year': 2000, 'state': 'MAINE', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 319951, 'totalvotes': 651817},
-    {'year': 2000, 'state': 'MAINE', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 286616, 'totalvotes': 651817},
-    {'year': 2000, 'state': 'MAINE', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 37127, 'totalvotes': 651817},
-    {'year': 2000, 'state': 'MAINE', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 4443, 'totalvotes': 651817},
-    {'year': 2000, 'state': 'MAINE', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3074, 'totalvotes': 651817},
-    {'year': 2000, 'state': 'MAINE', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 579, 'totalvotes': 651817},
-    {'year': 2000, 'state': 'MAINE', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 27, 'totalvotes': 651817},
-    {'year': 2000, 'state': 'MARYLAND', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1144008, 'totalvotes': 2025212},
-    {'year': 2000, 'state': 'MARYLAND', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 813827, 'totalvotes': 2025212},
-    {'year': 2000, 'state': 'MARYLAND', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 53768, 'totalvotes': 2025212},
-    {'year': 2000, 'state': 'MARYLAND', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5310, 'totalvotes': 2025212},
-    {'year': 2000, 'state': 'MARYLAND', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 4248, 'totalvotes': 2025212},
-    {'year': 2000, 'state': 'MARYLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1656, 'totalvotes': 2025212},
-    {'year': 2000, 'state': 'MARYLAND', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 1477, 'totalvotes': 2025212},
-    {'year': 2000, 'state': 'MARYLAND', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 918, 'totalvotes': 2025212},
-    {'year': 2000, 'state': 'MASSACHUSETTS', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1616487, 'totalvotes': 2733964},
-    {'year': 2000, 'state': 'MASSACHUSETTS', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 878502, 'totalvotes': 2733964},
-    {'year': 2000, 'state': 'MASSACHUSETTS', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 173564, 'totalvotes': 2733964},
-    {'year': 2000, 'state': 'MASSACHUSETTS', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 31022, 'totalvotes': 2733964},
-    {'year': 2000, 'state': 'MASSACHUSETTS', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 16366, 'totalvotes': 2733964},
-    {'year': 2000, 'state': 'MASSACHUSETTS', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 11149, 'totalvotes': 2733964},
-    {'year': 2000, 'state': 'MASSACHUSETTS', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 3990, 'totalvotes': 2733964},
-    {'year': 2000, 'state': 'MASSACHUSETTS', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'UNENROLLED', 'candidatevotes': 2884, 'totalvotes': 2733964},
-    {'year': 2000, 'state': 'MICHIGAN', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2170418, 'totalvotes': 4232501},
-    {'year': 2000, 'state': 'MICHIGAN', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1953139, 'totalvotes': 4232501},
-    {'year': 2000, 'state': 'MICHIGAN', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 84165, 'totalvotes': 4232501},
-    {'year': 2000, 'state': 'MICHIGAN', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 16711, 'totalvotes': 4232501},
-    {'year': 2000, 'state': 'MICHIGAN', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 3791, 'totalvotes': 4232501},
-    {'year': 2000, 'state': 'MICHIGAN', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2426, 'totalvotes': 4232501},
-    {'year': 2000, 'state': 'MICHIGAN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1851, 'totalvotes': 4232501},
-    {'year': 2000, 'state': 'MINNESOTA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRATIC-FARMER-LABOR', 'candidatevotes': 1168266, 'totalvotes': 2438685},
-    {'year': 2000, 'state': 'MINNESOTA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1109659, 'totalvotes': 2438685},
-    {'year': 2000, 'state': 'MINNESOTA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 126696, 'totalvotes': 2438685},
-    {'year': 2000, 'state': 'MINNESOTA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY MINNESOTA', 'candidatevotes': 22166, 'totalvotes': 2438685},
-    {'year': 2000, 'state': 'MINNESOTA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5282, 'totalvotes': 2438685},
-    {'year': 2000, 'state': 'MINNESOTA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3272, 'totalvotes': 2438685},
-    {'year': 2000, 'state': 'MINNESOTA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 2294, 'totalvotes': 2438685},
-    {'year': 2000, 'state': 'MINNESOTA', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1022, 'totalvotes': 2438685},
-    {'year': 2000, 'state': 'MINNESOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 28, 'totalvotes': 2438685},
-    {'year': 2000, 'state': 'MISSISSIPPI', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 572844, 'totalvotes': 994184},
-    {'year': 2000, 'state': 'MISSISSIPPI', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 404614, 'totalvotes': 994184},
-    {'year': 2000, 'state': 'MISSISSIPPI', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 8735, 'totalvotes': 994184},
-    {'year': 2000, 'state': 'MISSISSIPPI', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3267, 'totalvotes': 994184},
-    {'year': 2000, 'state': 'MISSISSIPPI', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 2265, 'totalvotes': 994184},
-    {'year': 2000, 'state': 'MISSISSIPPI', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2009, 'totalvotes': 994184},
-    {'year': 2000, 'state': 'MISSISSIPPI', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 450, 'totalvotes': 994184},
-    {'year': 2000, 'state': 'MISSOURI', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1189924, 'totalvotes': 2359892},
-    {'year': 2000, 'state': 'MISSOURI', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1111138, 'totalvotes': 2359892},
-    {'year': 2000, 'state': 'MISSOURI', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 38515, 'totalvotes': 2359892},
-    {'year': 2000, 'state': 'MISSOURI', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 9818, 'totalvotes': 2359892},
-    {'year': 2000, 'state': 'MISSOURI', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7436, 'totalvotes': 2359892},
-    {'year': 2000, 'state': 'MISSOURI', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1957, 'totalvotes': 2359892},
-    {'year': 2000, 'state': 'MISSOURI', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1104, 'totalvotes': 2359892},
-    {'year': 2000, 'state': 'MONTANA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 240178, 'totalvotes': 410986},
-    {'year': 2000, 'state': 'MONTANA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 137126, 'totalvotes': 410986},
-    {'year': 2000, 'state': 'MONTANA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 24437, 'totalvotes': 410986},
-    {'year': 2000, 'state': 'MONTANA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 5697, 'totalvotes': 410986},
-    {'year': 2000, 'state': 'MONTANA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1718, 'totalvotes': 410986},
-    {'year': 2000, 'state': 'MONTANA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1155, 'totalvotes': 410986},
-    {'year': 2000, 'state': 'MONTANA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 675, 'totalvotes': 410986},
-    {'year': 2000, 'state': 'NEBRASKA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 433862, 'totalvotes': 697019},
-    {'year': 2000, 'state': 'NEBRASKA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 231780, 'totalvotes': 697019},
-    {'year': 2000, 'state': 'NEBRASKA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 24540, 'totalvotes': 697019},
-    {'year': 2000, 'state': 'NEBRASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'NOMINATED BY PETITION', 'candidatevotes': 4114, 'totalvotes': 697019},
-    {'year': 2000, 'state': 'NEBRASKA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2245, 'totalvotes': 697019},
-    {'year': 2000, 'state': 'NEBRASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 478, 'totalvotes': 697019},
-    {'year': 2000, 'state': 'NEVADA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 301575, 'totalvotes': 609426},
-    {'year': 2000, 'state': 'NEVADA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 279978, 'totalvotes': 609426},
-    {'year': 2000, 'state': 'NEVADA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 15008, 'totalvotes': 609426},
-    {'year': 2000, 'state': 'NEVADA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'CITIZENS FIRST', 'candidatevotes': 4747, 'totalvotes': 609426},
-    {'year': 2000, 'state': 'NEVADA', 'candidate': 'NONE OF THESE CANDIDATES', 'party_detailed': 'OTHER', 'candidatevotes': 3315, 'totalvotes': 609426},
-    {'year': 2000, 'state': 'NEVADA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3311, 'totalvotes': 609426},
-    {'year': 2000, 'state': 'NEVADA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'INDEPENDENT AMERICAN', 'candidatevotes': 621, 'totalvotes': 609426},
-    {'year': 2000, 'state': 'NEVADA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 415, 'totalvotes': 609426},
-    {'year': 2000, 'state': 'NEVADA', 'candidate': 'BLANK VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 282, 'totalvotes': 609426},
-    {'year': 2000, 'state': 'NEVADA', 'candidate': 'OVER VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 174, 'totalvotes': 609426},
-    {'year': 2000, 'state': 'NEW HAMPSHIRE', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 273559, 'totalvotes': 569081},
-    {'year': 2000, 'state': 'NEW HAMPSHIRE', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 266348, 'totalvotes': 569081},
-    {'year': 2000, 'state': 'NEW HAMPSHIRE', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 22198, 'totalvotes': 569081},
-    {'year': 2000, 'state': 'NEW HAMPSHIRE', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2757, 'totalvotes': 569081},
-    {'year': 2000, 'state': 'NEW HAMPSHIRE', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'INDEPENDENCE', 'candidatevotes': 2615, 'totalvotes': 569081},
-    {'year': 2000, 'state': 'NEW HAMPSHIRE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1276, 'totalvotes': 569081},
-    {'year': 2000, 'state': 'NEW HAMPSHIRE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 328, 'totalvotes': 569081},
-    {'year': 2000, 'state': 'NEW JERSEY', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1788850, 'totalvotes': 3187226},
-    {'year': 2000, 'state': 'NEW JERSEY', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1284173, 'totalvotes': 3187226},
-    {'year': 2000, 'state': 'NEW JERSEY', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 114203, 'totalvotes': 3187226},
-    {'year': 2000, 'state': 'NEW MEXICO', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 286783, 'totalvotes': 598605},
-    {'year': 2000, 'state': 'NEW MEXICO', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 286417, 'totalvotes': 598605},
-    {'year': 2000, 'state': 'NEW MEXICO', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 21251, 'totalvotes': 598605},
-    {'year': 2000, 'state': 'NEW MEXICO', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2058, 'totalvotes': 598605},
-    {'year': 2000, 'state': 'NEW MEXICO', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 1392, 'totalvotes': 598605},
-    {'year': 2000, 'state': 'NEW MEXICO', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 361, 'totalvotes': 598605},
-    {'year': 2000, 'state': 'NEW MEXICO', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 343, 'totalvotes': 598605},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3942215, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2258577, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 244030, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 144797, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 138216, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'GORE, AL', 'party_detailed': 'WORKING FAMILIES', 'candidatevotes': 88395, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'GORE, AL', 'party_detailed': 'LIBERAL PARTY', 'candidatevotes': 77087, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'RIGHT-TO-LIFE', 'candidatevotes': 25175, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'INDEPENDENCE', 'candidatevotes': 24361, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7649, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 6424, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1789, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1498, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NEW YORK', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'SOCIALIST', 'candidatevotes': 2, 'totalvotes': 6960215},
-    {'year': 2000, 'state': 'NORTH CAROLINA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1631163, 'totalvotes': 2914990},
-    {'year': 2000, 'state': 'NORTH CAROLINA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1257692, 'totalvotes': 2914990},
-    {'year': 2000, 'state': 'NORTH CAROLINA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 13891, 'totalvotes': 2914990},
-    {'year': 2000, 'state': 'NORTH CAROLINA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 8874, 'totalvotes': 2914990},
-    {'year': 2000, 'state': 'NORTH CAROLINA', 'candidate': 'NOT DESIGNATED', 'party_detailed': 'SOCIALIST', 'candidatevotes': 3370, 'totalvotes': 2914990},
-    {'year': 2000, 'state': 'NORTH DAKOTA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 174852, 'totalvotes': 288256},
-    {'year': 2000, 'state': 'NORTH DAKOTA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 95284, 'totalvotes': 288256},
-    {'year': 2000, 'state': 'NORTH DAKOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 10459, 'totalvotes': 288256},
-    {'year': 2000, 'state': 'NORTH DAKOTA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 7288, 'totalvotes': 288256},
-    {'year': 2000, 'state': 'NORTH DAKOTA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 373, 'totalvotes': 288256},
-    {'year': 2000, 'state': 'OHIO', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2350363, 'totalvotes': 4701998},
-    {'year': 2000, 'state': 'OHIO', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2183628, 'totalvotes': 4701998},
-    {'year': 2000, 'state': 'OHIO', 'candidate': 'NOT DESIGNATED', 'party_detailed': 'OTHER', 'candidatevotes': 148353, 'totalvotes': 4701998},
-    {'year': 2000, 'state': 'OHIO', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 13473, 'totalvotes': 4701998},
-    {'year': 2000, 'state': 'OHIO', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 6181, 'totalvotes': 4701998},
-    {'year': 2000, 'state': 'OKLAHOMA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 744337, 'totalvotes': 1234229},
-    {'year': 2000, 'state': 'OKLAHOMA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 474276, 'totalvotes': 1234229},
-    {'year': 2000, 'state': 'OKLAHOMA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 9014, 'totalvotes': 1234229},
-    {'year': 2000, 'state': 'OKLAHOMA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6602, 'totalvotes': 1234229},
-    {'year': 2000, 'state': 'OREGON', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 720342, 'totalvotes': 1533950},
-    {'year': 2000, 'state': 'OREGON', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 713577, 'totalvotes': 1533950},
-    {'year': 2000, 'state': 'OREGON', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 77357, 'totalvotes': 1533950},
-    {'year': 2000, 'state': 'OREGON', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7447, 'totalvotes': 1533950},
-    {'year': 2000, 'state': 'OREGON', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 7063, 'totalvotes': 1533950},
-    {'year': 2000, 'state': 'OREGON', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 3401, 'totalvotes': 1533950},
-    {'year': 2000, 'state': 'OREGON', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 2574, 'totalvotes': 1533950},
-    {'year': 2000, 'state': 'OREGON', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2189, 'totalvotes': 1533950},
-    {'year': 2000, 'state': 'PENNSYLVANIA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2485967, 'totalvotes': 4912185},
-    {'year': 2000, 'state': 'PENNSYLVANIA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2281127, 'totalvotes': 4912185},
-    {'year': 2000, 'state': 'PENNSYLVANIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 103392, 'totalvotes': 4912185},
-    {'year': 2000, 'state': 'PENNSYLVANIA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 16023, 'totalvotes': 4912185},
-    {'year': 2000, 'state': 'PENNSYLVANIA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 14428, 'totalvotes': 4912185},
-    {'year': 2000, 'state': 'PENNSYLVANIA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11248, 'totalvotes': 4912185},
-    {'year': 2000, 'state': 'RHODE ISLAND', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 249508, 'totalvotes': 409112},
-    {'year': 2000, 'state': 'RHODE ISLAND', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 130555, 'totalvotes': 409112},
-    {'year': 2000, 'state': 'RHODE ISLAND', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 25052, 'totalvotes': 409112},
-    {'year': 2000, 'state': 'RHODE ISLAND', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 2273, 'totalvotes': 409112},
-    {'year': 2000, 'state': 'RHODE ISLAND', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 742, 'totalvotes': 409112},
-    {'year': 2000, 'state': 'RHODE ISLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 329, 'totalvotes': 409112},
-    {'year': 2000, 'state': 'RHODE ISLAND', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 271, 'totalvotes': 409112},
-    {'year': 2000, 'state': 'RHODE ISLAND', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 199, 'totalvotes': 409112},
-    {'year': 2000, 'state': 'RHODE ISLAND', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 97, 'totalvotes': 409112},
-    {'year': 2000, 'state': 'RHODE ISLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'SOCIALIST', 'candidatevotes': 52, 'totalvotes': 409112},
-    {'year': 2000, 'state': 'RHODE ISLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 34, 'totalvotes': 409112},
-    {'year': 2000, 'state': 'SOUTH CAROLINA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 786892, 'totalvotes': 1383902},
-    {'year': 2000, 'state': 'SOUTH CAROLINA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 566037, 'totalvotes': 1383902},
-    {'year': 2000, 'state': 'SOUTH CAROLINA', 'candidate': 'NADER, RALPH', 'party_detailed': 'UNITED CITIZENS', 'candidatevotes': 20279, 'totalvotes': 1383902},
-    {'year': 2000, 'state': 'SOUTH CAROLINA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4760, 'totalvotes': 1383902},
-    {'year': 2000, 'state': 'SOUTH CAROLINA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 3309, 'totalvotes': 1383902},
-    {'year': 2000, 'state': 'SOUTH CAROLINA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1682, 'totalvotes': 1383902},
-    {'year': 2000, 'state': 'SOUTH CAROLINA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 943, 'totalvotes': 1383902},
-    {'year': 2000, 'state': 'SOUTH DAKOTA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 190700, 'totalvotes': 316269},
-    {'year': 2000, 'state': 'SOUTH DAKOTA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 118804, 'totalvotes': 316269},
-    {'year': 2000, 'state': 'SOUTH DAKOTA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 3322, 'totalvotes': 316269},
-    {'year': 2000, 'state': 'SOUTH DAKOTA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1781, 'totalvotes': 316269},
-    {'year': 2000, 'state': 'SOUTH DAKOTA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1662, 'totalvotes': 316269},
-    {'year': 2000, 'state': 'TENNESSEE', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1061949, 'totalvotes': 2076181},
-    {'year': 2000, 'state': 'TENNESSEE', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 981720, 'totalvotes': 2076181},
-    {'year': 2000, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 32084, 'totalvotes': 2076181},
-    {'year': 2000, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 428, 'totalvotes': 2076181},
-    {'year': 2000, 'state': 'TEXAS', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 3799639, 'totalvotes': 6407637},
-    {'year': 2000, 'state': 'TEXAS', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2433746, 'totalvotes': 6407637},
-    {'year': 2000, 'state': 'TEXAS', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 137994, 'totalvotes': 6407637},
-    {'year': 2000, 'state': 'TEXAS', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 23160, 'totalvotes': 6407637},
-    {'year': 2000, 'state': 'TEXAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 12394, 'totalvotes': 6407637},
-    {'year': 2000, 'state': 'TEXAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 704, 'totalvotes': 6407637},
-    {'year': 2000, 'state': 'UTAH', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 515096, 'totalvotes': 770754},
-    {'year': 2000, 'state': 'UTAH', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 203053, 'totalvotes': 770754},
-    {'year': 2000, 'state': 'UTAH', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 35850, 'totalvotes': 770754},
-    {'year': 2000, 'state': 'UTAH', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 9319, 'totalvotes': 770754},
-    {'year': 2000, 'state': 'UTAH', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3616, 'totalvotes': 770754},
-    {'year': 2000, 'state': 'UTAH', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'INDEPENDENT AMERICAN', 'candidatevotes': 2709, 'totalvotes': 770754},
-    {'year': 2000, 'state': 'UTAH', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 763, 'totalvotes': 770754},
-    {'year': 2000, 'state': 'UTAH', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 186, 'totalvotes': 770754},
-    {'year': 2000, 'state': 'UTAH', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'NO PARTY AFFILIATION', 'candidatevotes': 161, 'totalvotes': 770754},
-    {'year': 2000, 'state': 'UTAH', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 770754},
-    {'year': 2000, 'state': 'VERMONT', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 149022, 'totalvotes': 294308},
-    {'year': 2000, 'state': 'VERMONT', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 119775, 'totalvotes': 294308},
-    {'year': 2000, 'state': 'VERMONT', 'candidate': 'NADER, RALPH', 'party_detailed': 'PROGRESSIVE/GREEN', 'candidatevotes': 20374, 'totalvotes': 294308},
-    {'year': 2000, 'state': 'VERMONT', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 2192, 'totalvotes': 294308},
-    {'year': 2000, 'state': 'VERMONT', 'candidate': 'DENNIS ""DENNY"", LANE', 'party_detailed': 'VERMONT GRASSROOTS', 'candidatevotes': 1044, 'totalvotes': 294308},
-    {'year': 2000, 'state': 'VERMONT', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 784, 'totalvotes': 294308},
-    {'year': 2000, 'state': 'VERMONT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 514, 'totalvotes': 294308},
-    {'year': 2000, 'state': 'VERMONT', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 219, 'totalvotes': 294308},
-    {'year': 2000, 'state': 'VERMONT', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'LIBERTY UNION PARTY', 'candidatevotes': 161, 'totalvotes': 294308},
-    {'year': 2000, 'state': 'VERMONT', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 153, 'totalvotes': 294308},
-    {'year': 2000, 'state': 'VERMONT', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 70, 'totalvotes': 294308},
-    {'year': 2000, 'state': 'VIRGINIA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1437490, 'totalvotes': 2739447},
-    {'year': 2000, 'state': 'VIRGINIA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1217290, 'totalvotes': 2739447},
-    {'year': 2000, 'state': 'VIRGINIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 59398, 'totalvotes': 2739447},
-    {'year': 2000, 'state': 'VIRGINIA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 15198, 'totalvotes': 2739447},
-    {'year': 2000, 'state': 'VIRGINIA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 5455, 'totalvotes': 2739447},
-    {'year': 2000, 'state': 'VIRGINIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2807, 'totalvotes': 2739447},
-    {'year': 2000, 'state': 'VIRGINIA', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 1809, 'totalvotes': 2739447},
-    {'year': 2000, 'state': 'WASHINGTON', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1247652, 'totalvotes': 2487433},
-    {'year': 2000, 'state': 'WASHINGTON', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1108864, 'totalvotes': 2487433},
-    {'year': 2000, 'state': 'WASHINGTON', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 103002, 'totalvotes': 2487433},
-    {'year': 2000, 'state': 'WASHINGTON', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 13135, 'totalvotes': 2487433},
-    {'year': 2000, 'state': 'WASHINGTON', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'FREEDOM', 'candidatevotes': 7171, 'totalvotes': 2487433},
-    {'year': 2000, 'state': 'WASHINGTON', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2927, 'totalvotes': 2487433},
-    {'year': 2000, 'state': 'WASHINGTON', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1989, 'totalvotes': 2487433},
-    {'year': 2000, 'state': 'WASHINGTON', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 1729, 'totalvotes': 2487433},
-    {'year': 2000, 'state': 'WASHINGTON', 'candidate': 'MCREYNOLDS, DAVID', 'party_detailed': 'SOCIALIST', 'candidatevotes': 660, 'totalvotes': 2487433},
-    {'year': 2000, 'state': 'WASHINGTON', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 304, 'totalvotes': 2487433},
-    {'year': 2000, 'state': 'WEST VIRGINIA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 336475, 'totalvotes': 648124},
-    {'year': 2000, 'state': 'WEST VIRGINIA', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 295497, 'totalvotes': 648124},
-    {'year': 2000, 'state': 'WEST VIRGINIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 10680, 'totalvotes': 648124},
-    {'year': 2000, 'state': 'WEST VIRGINIA', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 3169, 'totalvotes': 648124},
-    {'year': 2000, 'state': 'WEST VIRGINIA', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1912, 'totalvotes': 648124},
-    {'year': 2000, 'state': 'WEST VIRGINIA', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 367, 'totalvotes': 648124},
-    {'year': 2000, 'state': 'WEST VIRGINIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 24, 'totalvotes': 648124},
-    {'year': 2000, 'state': 'WISCONSIN', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1242987, 'totalvotes': 2598607},
-    {'year': 2000, 'state': 'WISCONSIN', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1237279, 'totalvotes': 2598607},
-    {'year': 2000, 'state': 'WISCONSIN', 'candidate': 'NADER, RALPH', 'party_detailed': 'GREEN', 'candidatevotes': 94070, 'totalvotes': 2598607},
-    {'year': 2000, 'state': 'WISCONSIN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 13693, 'totalvotes': 2598607},
-    {'year': 2000, 'state': 'WISCONSIN', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6640, 'totalvotes': 2598607},
-    {'year': 2000, 'state': 'WISCONSIN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2042, 'totalvotes': 2598607},
-    {'year': 2000, 'state': 'WISCONSIN', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 1896, 'totalvotes': 2598607},
-    {'year': 2000, 'state': 'WYOMING', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 147947, 'totalvotes': 213726},
-    {'year': 2000, 'state': 'WYOMING', 'candidate': 'GORE, AL', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 60481, 'totalvotes': 213726},
-    {'year': 2000, 'state': 'WYOMING', 'candidate': 'BUCHANAN, PATRICK ""PAT""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 2724, 'totalvotes': 213726},
-    {'year': 2000, 'state': 'WYOMING', 'candidate': 'BROWNE, HARRY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1443, 'totalvotes': 213726},
-    {'year': 2000, 'state': 'WYOMING', 'candidate': 'PHILLIPS, HOWARD', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 720, 'totalvotes': 213726},
-    {'year': 2000, 'state': 'WYOMING', 'candidate': 'HAGELIN, JOHN', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 411, 'totalvotes': 213726},
-    {'year': 2004, 'state': 'ALABAMA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1176394, 'totalvotes': 1883415},
-    {'year': 2004, 'state': 'ALABAMA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 693933, 'totalvotes': 1883415},
-    {'year': 2004, 'state': 'ALABAMA', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 12190, 'totalvotes': 1883415},
-    {'year': 2004, 'state': 'ALABAMA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 898, 'totalvotes': 1883415},
-    {'year': 2004, 'state': 'ALASKA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 190889, 'totalvotes': 312598},
-    {'year': 2004, 'state': 'ALASKA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 111025, 'totalvotes': 312598},
-    {'year': 2004, 'state': 'ALASKA', 'candidate': 'NADER, RALPH', 'party_detailed': 'POPULIST', 'candidatevotes': 5069, 'totalvotes': 312598},
-    {'year': 2004, 'state': 'ALASKA', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'ALASKAN INDEPENDENCE PARTY', 'candidatevotes': 2092, 'totalvotes': 312598},
-    {'year': 2004, 'state': 'ALASKA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1675, 'totalvotes': 312598},
-    {'year': 2004, 'state': 'ALASKA', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 1058, 'totalvotes': 312598},
-    {'year': 2004, 'state': 'ALASKA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 790, 'totalvotes': 312598},
-    {'year': 2004, 'state': 'ARIZONA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1104294, 'totalvotes': 2012585},
-    {'year': 2004, 'state': 'ARIZONA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 893524, 'totalvotes': 2012585},
-    {'year': 2004, 'state': 'ARIZONA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11856, 'totalvotes': 2012585},
-    {'year': 2004, 'state': 'ARIZONA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 2911, 'totalvotes': 2012585},
-    {'year': 2004, 'state': 'ARKANSAS', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 572898, 'totalvotes': 1054945},
-    {'year': 2004, 'state': 'ARKANSAS', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 469953, 'totalvotes': 1054945},
-    {'year': 2004, 'state': 'ARKANSAS', 'candidate': 'NADER, RALPH', 'party_detailed': 'POPULIST', 'candidatevotes': 6171, 'totalvotes': 1054945},
-    {'year': 2004, 'state': 'ARKANSAS', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2352, 'totalvotes': 1054945},
-    {'year': 2004, 'state': 'ARKANSAS', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2083, 'totalvotes': 1054945},
-    {'year': 2004, 'state': 'ARKANSAS', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 1488, 'totalvotes': 1054945},
-    {'year': 2004, 'state': 'CALIFORNIA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 6745485, 'totalvotes': 12421353},
-    {'year': 2004, 'state': 'CALIFORNIA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 5509826, 'totalvotes': 12421353},
-    {'year': 2004, 'state': 'CALIFORNIA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 50165, 'totalvotes': 12421353},
-    {'year': 2004, 'state': 'CALIFORNIA', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 40771, 'totalvotes': 12421353},
-    {'year': 2004, 'state': 'CALIFORNIA', 'candidate': 'PELTIER, LEONARD', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 27607, 'totalvotes': 12421353},
-    {'year': 2004, 'state': 'CALIFORNIA', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 26645, 'totalvotes': 12421353},
-    {'year': 2004, 'state': 'CALIFORNIA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 20854, 'totalvotes': 12421353},
-    {'year': 2004, 'state': 'COLORADO', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1101255, 'totalvotes': 2129630},
-    {'year': 2004, 'state': 'COLORADO', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1001732, 'totalvotes': 2129630},
-    {'year': 2004, 'state': 'COLORADO', 'candidate': 'NADER, RALPH', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 12718, 'totalvotes': 2129630},
-    {'year': 2004, 'state': 'COLORADO', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7664, 'totalvotes': 2129630},
-    {'year': 2004, 'state': 'COLORADO', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'AMERICAN CONSTITUTION PARTY', 'candidatevotes': 2562, 'totalvotes': 2129630},
-    {'year': 2004, 'state': 'COLORADO', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 1591, 'totalvotes': 2129630},
-    {'year': 2004, 'state': 'COLORADO', 'candidate': 'ANDRESS, STANFORD', 'party_detailed': 'UNAFFILIATED', 'candidatevotes': 804, 'totalvotes': 2129630},
-    {'year': 2004, 'state': 'COLORADO', 'candidate': 'AMONDSON, GENE', 'party_detailed': 'CONCERNS OF PEOPLE', 'candidatevotes': 378, 'totalvotes': 2129630},
-    {'year': 2004, 'state': 'COLORADO', 'candidate': 'VAN AUKEN, BILL', 'party_detailed': 'SOCIALIST EQUALITY PARTY', 'candidatevotes': 329, 'totalvotes': 2129630},
-    {'year': 2004, 'state': 'COLORADO', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 241, 'totalvotes': 2129630},
-    {'year': 2004, 'state': 'COLORADO', 'candidate': 'BROWN, WALT', 'party_detailed': 'SOCIALIST', 'candidatevotes': 216, 'totalvotes': 2129630},
-    {'year': 2004, 'state': 'COLORADO', 'candidate': 'DODGE, EARL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 140, 'totalvotes': 2129630},
-    {'year': 2004, 'state': 'CONNECTICUT', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 857488, 'totalvotes': 1578769},
-    {'year': 2004, 'state': 'CONNECTICUT', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 693826, 'totalvotes': 1578769},
-    {'year': 2004, 'state': 'CONNECTICUT', 'candidate': 'NADER, RALPH', 'party_detailed': 'PETITIONING CANDIDATE', 'candidatevotes': 12969, 'totalvotes': 1578769},
-    {'year': 2004, 'state': 'CONNECTICUT', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 9564, 'totalvotes': 1578769},
-    {'year': 2004, 'state': 'CONNECTICUT', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3367, 'totalvotes': 1578769},
-    {'year': 2004, 'state': 'CONNECTICUT', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONCERNED CITIZENS', 'candidatevotes': 1543, 'totalvotes': 1578769},
-    {'year': 2004, 'state': 'CONNECTICUT', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 12, 'totalvotes': 1578769},
-    {'year': 2004, 'state': 'DELAWARE', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 200152, 'totalvotes': 375190},
-    {'year': 2004, 'state': 'DELAWARE', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 171660, 'totalvotes': 375190},
-    {'year': 2004, 'state': 'DELAWARE', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2153, 'totalvotes': 375190},
-    {'year': 2004, 'state': 'DELAWARE', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 586, 'totalvotes': 375190},
-    {'year': 2004, 'state': 'DELAWARE', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 289, 'totalvotes': 375190},
-    {'year': 2004, 'state': 'DELAWARE', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 250, 'totalvotes': 375190},
-    {'year': 2004, 'state': 'DELAWARE', 'candidate': 'BROWN, WALT', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 100, 'totalvotes': 375190},
-    {'year': 2004, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 202970, 'totalvotes': 227586},
-    {'year': 2004, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 21256, 'totalvotes': 227586},
-    {'year': 2004, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1485, 'totalvotes': 227586},
-    {'year': 2004, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'COBB, DAVID', 'party_detailed': 'D.C. STATEHOOD GREEN', 'candidatevotes': 737, 'totalvotes': 227586},
-    {'year': 2004, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'OTHERS', 'party_detailed': 'OTHER', 'candidatevotes': 506, 'totalvotes': 227586},
-    {'year': 2004, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 502, 'totalvotes': 227586},
-    {'year': 2004, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 130, 'totalvotes': 227586},
-    {'year': 2004, 'state': 'FLORIDA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 3964522, 'totalvotes': 7609810},
-    {'year': 2004, 'state': 'FLORIDA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3583544, 'totalvotes': 7609810},
-    {'year': 2004, 'state': 'FLORIDA', 'candidate': 'NADER, RALPH', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 32971, 'totalvotes': 7609810},
-    {'year': 2004, 'state': 'FLORIDA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11996, 'totalvotes': 7609810},
-    {'year': 2004, 'state': 'FLORIDA', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY OF FLORIDA', 'candidatevotes': 6626, 'totalvotes': 7609810},
-    {'year': 2004, 'state': 'FLORIDA', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 3917, 'totalvotes': 7609810},
-    {'year': 2004, 'state': 'FLORIDA', 'candidate': 'BROWN, WALT', 'party_detailed': 'SOCIALIST PARTY OF FLORIDA', 'candidatevotes': 3502, 'totalvotes': 7609810},
-    {'year': 2004, 'state': 'FLORIDA', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 2732, 'totalvotes': 7609810},
-    {'year': 2004, 'state': 'GEORGIA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1914254, 'totalvotes': 3301875},
-    {'year': 2004, 'state': 'GEORGIA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1366149, 'totalvotes': 3301875},
-    {'year': 2004, 'state': 'GEORGIA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 18387, 'totalvotes': 3301875},
-    {'year': 2004, 'state': 'GEORGIA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 3085, 'totalvotes': 3301875},
-    {'year': 2004, 'state': 'HAWAII', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 231708, 'totalvotes': 429013},
-    {'year': 2004, 'state': 'HAWAII', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 194191, 'totalvotes': 429013},
-    {'year': 2004, 'state': 'HAWAII', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 1737, 'totalvotes': 429013},
-    {'year': 2004, 'state': 'HAWAII', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1377, 'totalvotes': 429013},
-    {'year': 2004, 'state': 'IDAHO', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 409235, 'totalvotes': 598376},
-    {'year': 2004, 'state': 'IDAHO', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 181098, 'totalvotes': 598376},
-    {'year': 2004, 'state': 'IDAHO', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3844, 'totalvotes': 598376},
-    {'year': 2004, 'state': 'IDAHO', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3084, 'totalvotes': 598376},
-    {'year': 2004, 'state': 'IDAHO', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1115, 'totalvotes': 598376},
-    {'year': 2004, 'state': 'ILLINOIS', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2891550, 'totalvotes': 5274322},
-    {'year': 2004, 'state': 'ILLINOIS', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2345946, 'totalvotes': 5274322},
-    {'year': 2004, 'state': 'ILLINOIS', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 32442, 'totalvotes': 5274322},
-    {'year': 2004, 'state': 'ILLINOIS', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 4384, 'totalvotes': 5274322},
-    {'year': 2004, 'state': 'INDIANA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1479438, 'totalvotes': 2468002},
-    {'year': 2004, 'state': 'INDIANA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 969011, 'totalvotes': 2468002},
-    {'year': 2004, 'state': 'INDIANA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 18058, 'totalvotes': 2468002},
-    {'year': 2004, 'state': 'INDIANA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 1495, 'totalvotes': 2468002},
-    {'year': 2004, 'state': 'IOWA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 751957, 'totalvotes': 1506908},
-    {'year': 2004, 'state': 'IOWA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 741898, 'totalvotes': 1506908},
-    {'year': 2004, 'state': 'IOWA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 6149, 'totalvotes': 1506908},
-    {'year': 2004, 'state': 'IOWA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2992, 'totalvotes': 1506908},
-    {'year': 2004, 'state': 'IOWA', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1304, 'totalvotes': 1506908},
-    {'year': 2004, 'state': 'IOWA', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 1141, 'totalvotes': 1506908},
-    {'year': 2004, 'state': 'IOWA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 1094, 'totalvotes': 1506908},
-    {'year': 2004, 'state': 'IOWA', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 373, 'totalvotes': 1506908},
-    {'year': 2004, 'state': 'KANSAS', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 736456, 'totalvotes': 1187756},
-    {'year': 2004, 'state': 'KANSAS', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 434993, 'totalvotes': 1187756},
-    {'year': 2004, 'state': 'KANSAS', 'candidate': 'NADER, RALPH', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 9348, 'totalvotes': 1187756},
-    {'year': 2004, 'state': 'KANSAS', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4013, 'totalvotes': 1187756},
-    {'year': 2004, 'state': 'KANSAS', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2899, 'totalvotes': 1187756},
-    {'year': 2004, 'state': 'KANSAS', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 47, 'totalvotes': 1187756},
-    {'year': 2004, 'state': 'KENTUCKY', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1069439, 'totalvotes': 1795882},
-    {'year': 2004, 'state': 'KENTUCKY', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 712733, 'totalvotes': 1795882},
-    {'year': 2004, 'state': 'KENTUCKY', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 8856, 'totalvotes': 1795882},
-    {'year': 2004, 'state': 'KENTUCKY', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2619, 'totalvotes': 1795882},
-    {'year': 2004, 'state': 'KENTUCKY', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2213, 'totalvotes': 1795882},
-    {'year': 2004, 'state': 'KENTUCKY', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 22, 'totalvotes': 1795882},
-    {'year': 2004, 'state': 'LOUISIANA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1102169, 'totalvotes': 1943106},
-    {'year': 2004, 'state': 'LOUISIANA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 820299, 'totalvotes': 1943106},
-    {'year': 2004, 'state': 'LOUISIANA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 7032, 'totalvotes': 1943106},
-    {'year': 2004, 'state': 'LOUISIANA', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 5203, 'totalvotes': 1943106},
-    {'year': 2004, 'state': 'LOUISIANA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2781, 'totalvotes': 1943106},
-    {'year': 2004, 'state': 'LOUISIANA', 'candidate': 'BROWN, WALT', 'party_detailed': 'PROTECTING WORKING FAMILIES', 'candidatevotes': 1795, 'totalvotes': 1943106},
-    {'year': 2004, 'state': 'LOUISIANA', 'candidate': 'AMONDSON, GENE', 'party_detailed': 'PROHIBITION', 'candidatevotes': 1566, 'totalvotes': 1943106},
-    {'year': 2004, 'state': 'LOUISIANA', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 1276, 'totalvotes': 1943106},
-    {'year': 2004, 'state': 'LOUISIANA', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST', 'candidatevotes': 985, 'totalvotes': 1943106},
-    {'year': 2004, 'state': 'MAINE', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 396842, 'totalvotes': 740752},
-    {'year': 2004, 'state': 'MAINE', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 330201, 'totalvotes': 740752},
-    {'year': 2004, 'state': 'MAINE', 'candidate': 'THE BETTER LIFE,', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 8069, 'totalvotes': 740752},
-    {'year': 2004, 'state': 'MAINE', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 2936, 'totalvotes': 740752},
-    {'year': 2004, 'state': 'MAINE', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1965, 'totalvotes': 740752},
-    {'year': 2004, 'state': 'MAINE', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 735, 'totalvotes': 740752},
-    {'year': 2004, 'state': 'MAINE', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 4, 'totalvotes': 740752},
-    {'year': 2004, 'state': 'MARYLAND', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1334493, 'totalvotes': 2384238},
-    {'year': 2004, 'state': 'MARYLAND', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1024703, 'totalvotes': 2384238},
-    {'year': 2004, 'state': 'MARYLAND', 'candidate': 'NADER, RALPH', 'party_detailed': 'POPULIST', 'candidatevotes': 11854, 'totalvotes': 2384238},
-    {'year': 2004, 'state': 'MARYLAND', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6094, 'totalvotes': 2384238},
-    {'year': 2004, 'state': 'MARYLAND', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 3632, 'totalvotes': 2384238},
-    {'year': 2004, 'state': 'MARYLAND', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3421, 'totalvotes': 2384238},
-    {'year': 2004, 'state': 'MARYLAND', 'candidate': 'OTHER', 'party_detailed': 'UNAFFILIATED', 'candidatevotes': 34, 'totalvotes': 2384238},
-    {'year': 2004, 'state': 'MARYLAND', 'candidate': 'OTHER', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 7, 'totalvotes': 2384238},
-    {'year': 2004, 'state': 'MASSACHUSETTS', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1803800, 'totalvotes': 2927455},
-    {'year': 2004, 'state': 'MASSACHUSETTS', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1071109, 'totalvotes': 2927455},
-    {'year': 2004, 'state': 'MASSACHUSETTS', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 15067, 'totalvotes': 2927455},
-    {'year': 2004, 'state': 'MASSACHUSETTS', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 15022, 'totalvotes': 2927455},
-    {'year': 2004, 'state': 'MASSACHUSETTS', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN-RAINBOW', 'candidatevotes': 10623, 'totalvotes': 2927455},
-    {'year': 2004, 'state': 'MASSACHUSETTS', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 7028, 'totalvotes': 2927455},
-    {'year': 2004, 'state': 'MASSACHUSETTS', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4806, 'totalvotes': 2927455},
-    {'year': 2004, 'state': 'MICHIGAN', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2479183, 'totalvotes': 4839252},
-    {'year': 2004, 'state': 'MICHIGAN', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2313746, 'totalvotes': 4839252},
-    {'year': 2004, 'state': 'MICHIGAN', 'candidate': 'NADER, RALPH', 'party_detailed': 'NO PARTY AFFILIATION', 'candidatevotes': 24035, 'totalvotes': 4839252},
-    {'year': 2004, 'state': 'MICHIGAN', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 10552, 'totalvotes': 4839252},
-    {'year': 2004, 'state': 'MICHIGAN', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 5325, 'totalvotes': 4839252},
-    {'year': 2004, 'state': 'MICHIGAN', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 4980, 'totalvotes': 4839252},
-    {'year': 2004, 'state': 'MICHIGAN', 'candidate': 'BROWN, WALT', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 1431, 'totalvotes': 4839252},
-    {'year': 2004, 'state': 'MINNESOTA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRATIC-FARMER-LABOR', 'candidatevotes': 1445014, 'totalvotes': 2828387},
-    {'year': 2004, 'state': 'MINNESOTA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1346695, 'totalvotes': 2828387},
-    {'year': 2004, 'state': 'MINNESOTA', 'candidate': 'NADER, RALPH', 'party_detailed': 'BETTER LIFE', 'candidatevotes': 18683, 'totalvotes': 2828387},
-    {'year': 2004, 'state': 'MINNESOTA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4639, 'totalvotes': 2828387},
-    {'year': 2004, 'state': 'MINNESOTA', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 4408, 'totalvotes': 2828387},
-    {'year': 2004, 'state': 'MINNESOTA', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3074, 'totalvotes': 2828387},
-    {'year': 2004, 'state': 'MINNESOTA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 2532, 'totalvotes': 2828387},
-    {'year': 2004, 'state': 'MINNESOTA', 'candidate': 'HARENS, THOMAS', 'party_detailed': 'CHRISTIAN FREEDOM PARTY', 'candidatevotes': 2387, 'totalvotes': 2828387},
-    {'year': 2004, 'state': 'MINNESOTA', 'candidate': 'VAN AUKEN, BILL', 'party_detailed': 'SOCIALIST EQUALITY PARTY', 'candidatevotes': 539, 'totalvotes': 2828387},
-    {'year': 2004, 'state': 'MINNESOTA', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 416, 'totalvotes': 2828387},
-    {'year': 2004, 'state': 'MISSISSIPPI', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 672660, 'totalvotes': 1139824},
-    {'year': 2004, 'state': 'MISSISSIPPI', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 457766, 'totalvotes': 1139824},
-    {'year': 2004, 'state': 'MISSISSIPPI', 'candidate': 'NADER, RALPH', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 3175, 'totalvotes': 1139824},
-    {'year': 2004, 'state': 'MISSISSIPPI', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1793, 'totalvotes': 1139824},
-    {'year': 2004, 'state': 'MISSISSIPPI', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1758, 'totalvotes': 1139824},
-    {'year': 2004, 'state': 'MISSISSIPPI', 'candidate': 'CALERO, ROGER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1599, 'totalvotes': 1139824},
-    {'year': 2004, 'state': 'MISSISSIPPI', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 1073, 'totalvotes': 1139824},
-    {'year': 2004, 'state': 'MISSOURI', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1455713, 'totalvotes': 2731364},
-    {'year': 2004, 'state': 'MISSOURI', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1259171, 'totalvotes': 2731364},
-    {'year': 2004, 'state': 'MISSOURI', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9831, 'totalvotes': 2731364},
-    {'year': 2004, 'state': 'MISSOURI', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 5355, 'totalvotes': 2731364},
-    {'year': 2004, 'state': 'MISSOURI', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1294, 'totalvotes': 2731364},
-    {'year': 2004, 'state': 'MONTANA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 266063, 'totalvotes': 450434},
-    {'year': 2004, 'state': 'MONTANA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 173710, 'totalvotes': 450434},
-    {'year': 2004, 'state': 'MONTANA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 6168, 'totalvotes': 450434},
-    {'year': 2004, 'state': 'MONTANA', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1764, 'totalvotes': 450434},
-    {'year': 2004, 'state': 'MONTANA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1733, 'totalvotes': 450434},
-    {'year': 2004, 'state': 'MONTANA', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 996, 'totalvotes': 450434},
-    {'year': 2004, 'state': 'NEBRASKA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 512814, 'totalvotes': 778186},
-    {'year': 2004, 'state': 'NEBRASKA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 254328, 'totalvotes': 778186},
-    {'year': 2004, 'state': 'NEBRASKA', 'candidate': 'NADER, RALPH', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 5780, 'totalvotes': 778186},
-    {'year': 2004, 'state': 'NEBRASKA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2041, 'totalvotes': 778186},
-    {'year': 2004, 'state': 'NEBRASKA', 'candidate': 'OTHER', 'party_detailed': 'NEBRASKA PARTY', 'candidatevotes': 1314, 'totalvotes': 778186},
-    {'year': 2004, 'state': 'NEBRASKA', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 978, 'totalvotes': 778186},
-    {'year': 2004, 'state': 'NEBRASKA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 931, 'totalvotes': 778186},
-    {'year': 2004, 'state': 'NEVADA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 418690, 'totalvotes': 829587},
-    {'year': 2004, 'state': 'NEVADA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 397190, 'totalvotes': 829587},
-    {'year': 2004, 'state': 'NEVADA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4838, 'totalvotes': 829587},
-    {'year': 2004, 'state': 'NEVADA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 3688, 'totalvotes': 829587},
-    {'year': 2004, 'state': 'NEVADA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3176, 'totalvotes': 829587},
-    {'year': 2004, 'state': 'NEVADA', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'INDEPENDENT AMERICAN', 'candidatevotes': 1152, 'totalvotes': 829587},
-    {'year': 2004, 'state': 'NEVADA', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 853, 'totalvotes': 829587},
-    {'year': 2004, 'state': 'NEW HAMPSHIRE', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 340511, 'totalvotes': 678287},
-    {'year': 2004, 'state': 'NEW HAMPSHIRE', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 331237, 'totalvotes': 678287},
-    {'year': 2004, 'state': 'NEW HAMPSHIRE', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4479, 'totalvotes': 678287},
-    {'year': 2004, 'state': 'NEW HAMPSHIRE', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 1095, 'totalvotes': 678287},
-    {'year': 2004, 'state': 'NEW HAMPSHIRE', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 965, 'totalvotes': 678287},
-    {'year': 2004, 'state': 'NEW JERSEY', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1911430, 'totalvotes': 3611691},
-    {'year': 2004, 'state': 'NEW JERSEY', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1670003, 'totalvotes': 3611691},
-    {'year': 2004, 'state': 'NEW JERSEY', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 30258, 'totalvotes': 3611691},
-    {'year': 2004, 'state': 'NEW MEXICO', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 376930, 'totalvotes': 756304},
-    {'year': 2004, 'state': 'NEW MEXICO', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 370942, 'totalvotes': 756304},
-    {'year': 2004, 'state': 'NEW MEXICO', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4053, 'totalvotes': 756304},
-    {'year': 2004, 'state': 'NEW MEXICO', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2382, 'totalvotes': 756304},
-    {'year': 2004, 'state': 'NEW MEXICO', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 1226, 'totalvotes': 756304},
-    {'year': 2004, 'state': 'NEW MEXICO', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 771, 'totalvotes': 756304},
-    {'year': 2004, 'state': 'NEW YORK', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 4180755, 'totalvotes': 7448266},
-    {'year': 2004, 'state': 'NEW YORK', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2806993, 'totalvotes': 7448266},
-    {'year': 2004, 'state': 'NEW YORK', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 155574, 'totalvotes': 7448266},
-    {'year': 2004, 'state': 'NEW YORK', 'candidate': 'KERRY, JOHN', 'party_detailed': 'WORKING FAMILIES', 'candidatevotes': 133525, 'totalvotes': 7448266},
-    {'year': 2004, 'state': 'NEW YORK', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENCE', 'candidatevotes': 84247, 'totalvotes': 7448266},
-    {'year': 2004, 'state': 'NEW YORK', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 57230, 'totalvotes': 7448266},
-    {'year': 2004, 'state': 'NEW YORK', 'candidate': 'NADER, RALPH', 'party_detailed': 'PEACE AND JUSTICE', 'candidatevotes': 15626, 'totalvotes': 7448266},
-    {'year': 2004, 'state': 'NEW YORK', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11607, 'totalvotes': 7448266},
-    {'year': 2004, 'state': 'NEW YORK', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 2405, 'totalvotes': 7448266},
-    {'year': 2004, 'state': 'NEW YORK', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 304, 'totalvotes': 7448266},
-    {'year': 2004, 'state': 'NORTH CAROLINA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1961166, 'totalvotes': 3501007},
-    {'year': 2004, 'state': 'NORTH CAROLINA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1525849, 'totalvotes': 3501007},
-    {'year': 2004, 'state': 'NORTH CAROLINA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11731, 'totalvotes': 3501007},
-    {'year': 2004, 'state': 'NORTH CAROLINA', 'candidate': 'OTHER', 'party_detailed': 'UNAFFILIATED', 'candidatevotes': 2261, 'totalvotes': 3501007},
-    {'year': 2004, 'state': 'NORTH DAKOTA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 196651, 'totalvotes': 312833},
-    {'year': 2004, 'state': 'NORTH DAKOTA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 111052, 'totalvotes': 312833},
-    {'year': 2004, 'state': 'NORTH DAKOTA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3756, 'totalvotes': 312833},
-    {'year': 2004, 'state': 'NORTH DAKOTA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 851, 'totalvotes': 312833},
-    {'year': 2004, 'state': 'NORTH DAKOTA', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 514, 'totalvotes': 312833},
-    {'year': 2004, 'state': 'NORTH DAKOTA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 9, 'totalvotes': 312833},
-    {'year': 2004, 'state': 'OHIO', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2859764, 'totalvotes': 5627903},
-    {'year': 2004, 'state': 'OHIO', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2741165, 'totalvotes': 5627903},
-    {'year': 2004, 'state': 'OHIO', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 26616, 'totalvotes': 5627903},
-    {'year': 2004, 'state': 'OHIO', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 358, 'totalvotes': 5627903},
-    {'year': 2004, 'state': 'OKLAHOMA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 959792, 'totalvotes': 1463758},
-    {'year': 2004, 'state': 'OKLAHOMA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 503966, 'totalvotes': 1463758},
-    {'year': 2004, 'state': 'OREGON', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 943163, 'totalvotes': 1836782},
-    {'year': 2004, 'state': 'OREGON', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 866831, 'totalvotes': 1836782},
-    {'year': 2004, 'state': 'OREGON', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 8956, 'totalvotes': 1836782},
-    {'year': 2004, 'state': 'OREGON', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7260, 'totalvotes': 1836782},
-    {'year': 2004, 'state': 'OREGON', 'candidate': 'COBB, DAVID', 'party_detailed': 'PACIFIC GREEN', 'candidatevotes': 5315, 'totalvotes': 1836782},
-    {'year': 2004, 'state': 'OREGON', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 5257, 'totalvotes': 1836782},
-    {'year': 2004, 'state': 'PENNSYLVANIA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2938095, 'totalvotes': 5769590},
-    {'year': 2004, 'state': 'PENNSYLVANIA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2793847, 'totalvotes': 5769590},
-    {'year': 2004, 'state': 'PENNSYLVANIA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 21185, 'totalvotes': 5769590},
-    {'year': 2004, 'state': 'PENNSYLVANIA', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 6319, 'totalvotes': 5769590},
-    {'year': 2004, 'state': 'PENNSYLVANIA', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 6318, 'totalvotes': 5769590},
-    {'year': 2004, 'state': 'PENNSYLVANIA', 'candidate': 'INDEPENDENT PARTY CANDIDATE,', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2656, 'totalvotes': 5769590},
-    {'year': 2004, 'state': 'PENNSYLVANIA', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 1170, 'totalvotes': 5769590},
-    {'year': 2004, 'state': 'RHODE ISLAND', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 259760, 'totalvotes': 437134},
-    {'year': 2004, 'state': 'RHODE ISLAND', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 169046, 'totalvotes': 437134},
-    {'year': 2004, 'state': 'RHODE ISLAND', 'candidate': 'NADER, RALPH', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 4651, 'totalvotes': 437134},
-    {'year': 2004, 'state': 'RHODE ISLAND', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 1333, 'totalvotes': 437134},
-    {'year': 2004, 'state': 'RHODE ISLAND', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 907, 'totalvotes': 437134},
-    {'year': 2004, 'state': 'RHODE ISLAND', 'candidate': 'NONPARTISAN', 'party_detailed': 'NONPARTISAN', 'candidatevotes': 845, 'totalvotes': 437134},
-    {'year': 2004, 'state': 'RHODE ISLAND', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 339, 'totalvotes': 437134},
-    {'year': 2004, 'state': 'RHODE ISLAND', 'candidate': 'WORKERS WORLD', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 253, 'totalvotes': 437134},
-    {'year': 2004, 'state': 'SOUTH CAROLINA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 937974, 'totalvotes': 1617700},
-    {'year': 2004, 'state': 'SOUTH CAROLINA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 661669, 'totalvotes': 1617700},
-    {'year': 2004, 'state': 'SOUTH CAROLINA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENCE', 'candidatevotes': 5520, 'totalvotes': 1617700},
-    {'year': 2004, 'state': 'SOUTH CAROLINA', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 5317, 'totalvotes': 1617700},
-    {'year': 2004, 'state': 'SOUTH CAROLINA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3608, 'totalvotes': 1617700},
-    {'year': 2004, 'state': 'SOUTH CAROLINA', 'candidate': 'BROWN, WALT', 'party_detailed': 'UNITED CITIZENS', 'candidatevotes': 2124, 'totalvotes': 1617700},
-    {'year': 2004, 'state': 'SOUTH CAROLINA', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 1488, 'totalvotes': 1617700},
-    {'year': 2004, 'state': 'SOUTH DAKOTA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 232584, 'totalvotes': 388215},
-    {'year': 2004, 'state': 'SOUTH DAKOTA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 149244, 'totalvotes': 388215},
-    {'year': 2004, 'state': 'SOUTH DAKOTA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4320, 'totalvotes': 388215},
-    {'year': 2004, 'state': 'SOUTH DAKOTA', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1103, 'totalvotes': 388215},
-    {'year': 2004, 'state': 'SOUTH DAKOTA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 964, 'totalvotes': 388215},
-    {'year': 2004, 'state': 'TENNESSEE', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1384375, 'totalvotes': 2437319},
-    {'year': 2004, 'state': 'TENNESSEE', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1036477, 'totalvotes': 2437319},
-    {'year': 2004, 'state': 'TENNESSEE', 'candidate': 'OTHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 16428, 'totalvotes': 2437319},
-    {'year': 2004, 'state': 'TENNESSEE', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 39, 'totalvotes': 2437319},
-    {'year': 2004, 'state': 'TEXAS', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 4526917, 'totalvotes': 7410749},
-    {'year': 2004, 'state': 'TEXAS', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2832704, 'totalvotes': 7410749},
-    {'year': 2004, 'state': 'TEXAS', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 38787, 'totalvotes': 7410749},
-    {'year': 2004, 'state': 'TEXAS', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 12341, 'totalvotes': 7410749},
-    {'year': 2004, 'state': 'UTAH', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 663742, 'totalvotes': 927844},
-    {'year': 2004, 'state': 'UTAH', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 241199, 'totalvotes': 927844},
-    {'year': 2004, 'state': 'UTAH', 'candidate': 'NADER, RALPH', 'party_detailed': 'UNAFFILIATED', 'candidatevotes': 11305, 'totalvotes': 927844},
-    {'year': 2004, 'state': 'UTAH', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 6841, 'totalvotes': 927844},
-    {'year': 2004, 'state': 'UTAH', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3375, 'totalvotes': 927844},
-    {'year': 2004, 'state': 'UTAH', 'candidate': 'JAY, CHARLES', 'party_detailed': 'PERSONAL CHOICE', 'candidatevotes': 946, 'totalvotes': 927844},
-    {'year': 2004, 'state': 'UTAH', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 393, 'totalvotes': 927844},
-    {'year': 2004, 'state': 'UTAH', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 43, 'totalvotes': 927844},
-    {'year': 2004, 'state': 'VERMONT', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 184067, 'totalvotes': 312309},
-    {'year': 2004, 'state': 'VERMONT', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 121180, 'totalvotes': 312309},
-    {'year': 2004, 'state': 'VERMONT', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4494, 'totalvotes': 312309},
-    {'year': 2004, 'state': 'VERMONT', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1102, 'totalvotes': 312309},
-    {'year': 2004, 'state': 'VERMONT', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 957, 'totalvotes': 312309},
-    {'year': 2004, 'state': 'VERMONT', 'candidate': 'PARKER, JOHN', 'party_detailed': 'LIBERTY UNION PARTY', 'candidatevotes': 265, 'totalvotes': 312309},
-    {'year': 2004, 'state': 'VERMONT', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 244, 'totalvotes': 312309},
-    {'year': 2004, 'state': 'VIRGINIA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1716959, 'totalvotes': 3195415},
-    {'year': 2004, 'state': 'VIRGINIA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1454742, 'totalvotes': 3195415},
-    {'year': 2004, 'state': 'VIRGINIA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11032, 'totalvotes': 3195415},
-    {'year': 2004, 'state': 'VIRGINIA', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 10161, 'totalvotes': 3195415},
-    {'year': 2004, 'state': 'VIRGINIA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 2521, 'totalvotes': 3195415},
-    {'year': 2004, 'state': 'WASHINGTON', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1510201, 'totalvotes': 2859084},
-    {'year': 2004, 'state': 'WASHINGTON', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1304894, 'totalvotes': 2859084},
-    {'year': 2004, 'state': 'WASHINGTON', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 23283, 'totalvotes': 2859084},
-    {'year': 2004, 'state': 'WASHINGTON', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11955, 'totalvotes': 2859084},
-    {'year': 2004, 'state': 'WASHINGTON', 'candidate': 'PEROUTKA, MICHAEL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3922, 'totalvotes': 2859084},
-    {'year': 2004, 'state': 'WASHINGTON', 'candidate': 'COBB, DAVID', 'party_detailed': 'GREEN', 'candidatevotes': 2974, 'totalvotes': 2859084},
-    {'year': 2004, 'state': 'WASHINGTON', 'candidate': 'PARKER, JOHN', 'party_detailed': 'WORKERS WORLD', 'candidatevotes': 1077, 'totalvotes': 2859084},
-    {'year': 2004, 'state': 'WASHINGTON', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 547, 'totalvotes': 2859084},
-    {'year': 2004, 'state': 'WASHINGTON', 'candidate': 'VAN AUKEN, BILL', 'party_detailed': 'SOCIALIST EQUALITY PARTY', 'candidatevotes': 231, 'totalvotes': 2859084},
-    {'year': 2004, 'state': 'WEST VIRGINIA', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 423778, 'totalvotes': 755792},
-    {'year': 2004, 'state': 'WEST VIRGINIA', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 326541, 'totalvotes': 755792},
-    {'year': 2004, 'state': 'WEST VIRGINIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4063, 'totalvotes': 755792},
-    {'year': 2004, 'state': 'WEST VIRGINIA', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1405, 'totalvotes': 755792},
-    {'year': 2004, 'state': 'WEST VIRGINIA', 'candidate': 'COBB, DAVID', 'party_detailed': 'OTHER', 'candidatevotes': 5, 'totalvotes': 755792},
-    {'year': 2004, 'state': 'WISCONSIN', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1489504, 'totalvotes': 2997007},
-    {'year': 2004, 'state': 'WISCONSIN', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1478120, 'totalvotes': 2997007},
-    {'year': 2004, 'state': 'WISCONSIN', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 17272, 'totalvotes': 2997007},
-    {'year': 2004, 'state': 'WISCONSIN', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6464, 'totalvotes': 2997007},
-    {'year': 2004, 'state': 'WISCONSIN', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 2986, 'totalvotes': 2997007},
-    {'year': 2004, 'state': 'WISCONSIN', 'candidate': 'COBB, DAVID', 'party_detailed': 'WISCONSIN GREEN', 'candidatevotes': 2661, 'totalvotes': 2997007},
-    {'year': 2004, 'state': 'WYOMING', 'candidate': 'BUSH, GEORGE W.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 167629, 'totalvotes': 243861},
-    {'year': 2004, 'state': 'WYOMING', 'candidate': 'KERRY, JOHN', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 70776, 'totalvotes': 243861},
-    {'year': 2004, 'state': 'WYOMING', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3372, 'totalvotes': 243861},
-    {'year': 2004, 'state': 'WYOMING', 'candidate': 'BADNARIK, MICHAEL', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1171, 'totalvotes': 243861},
-    {'year': 2004, 'state': 'WYOMING', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 480, 'totalvotes': 243861},
-    {'year': 2004, 'state': 'WYOMING', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 433, 'totalvotes': 243861},
-    {'year': 2008, 'state': 'ALABAMA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1266546, 'totalvotes': 2099819},
-    {'year': 2008, 'state': 'ALABAMA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 813479, 'totalvotes': 2099819},
-    {'year': 2008, 'state': 'ALABAMA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 16089, 'totalvotes': 2099819},
-    {'year': 2008, 'state': 'ALABAMA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 3705, 'totalvotes': 2099819},
-    {'year': 2008, 'state': 'ALASKA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 193841, 'totalvotes': 326197},
-    {'year': 2008, 'state': 'ALASKA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 123594, 'totalvotes': 326197},
-    {'year': 2008, 'state': 'ALASKA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3783, 'totalvotes': 326197},
-    {'year': 2008, 'state': 'ALASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1730, 'totalvotes': 326197},
-    {'year': 2008, 'state': 'ALASKA', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'ALASKAN INDEPENDENCE PARTY', 'candidatevotes': 1660, 'totalvotes': 326197},
-    {'year': 2008, 'state': 'ALASKA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1589, 'totalvotes': 326197},
-    {'year': 2008, 'state': 'ARIZONA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1230111, 'totalvotes': 2293475},
-    {'year': 2008, 'state': 'ARIZONA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1034707, 'totalvotes': 2293475},
-    {'year': 2008, 'state': 'ARIZONA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12555, 'totalvotes': 2293475},
-    {'year': 2008, 'state': 'ARIZONA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 11301, 'totalvotes': 2293475},
-    {'year': 2008, 'state': 'ARIZONA', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 3406, 'totalvotes': 2293475},
-    {'year': 2008, 'state': 'ARIZONA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1395, 'totalvotes': 2293475},
-    {'year': 2008, 'state': 'ARKANSAS', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 638017, 'totalvotes': 1086617},
-    {'year': 2008, 'state': 'ARKANSAS', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 422310, 'totalvotes': 1086617},
-    {'year': 2008, 'state': 'ARKANSAS', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 12882, 'totalvotes': 1086617},
-    {'year': 2008, 'state': 'ARKANSAS', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4776, 'totalvotes': 1086617},
-    {'year': 2008, 'state': 'ARKANSAS', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 4023, 'totalvotes': 1086617},
-    {'year': 2008, 'state': 'ARKANSAS', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 3470, 'totalvotes': 1086617},
-    {'year': 2008, 'state': 'ARKANSAS', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 1139, 'totalvotes': 1086617},
-    {'year': 2008, 'state': 'CALIFORNIA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 8274473, 'totalvotes': 13561900},
-    {'year': 2008, 'state': 'CALIFORNIA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 5011781, 'totalvotes': 13561900},
-    {'year': 2008, 'state': 'CALIFORNIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 108381, 'totalvotes': 13561900},
-    {'year': 2008, 'state': 'CALIFORNIA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 67582, 'totalvotes': 13561900},
-    {'year': 2008, 'state': 'CALIFORNIA', 'candidate': 'KEYES, ALAN', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 40673, 'totalvotes': 13561900},
-    {'year': 2008, 'state': 'CALIFORNIA', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 38774, 'totalvotes': 13561900},
-    {'year': 2008, 'state': 'CALIFORNIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 20236, 'totalvotes': 13561900},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1288576, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1073589, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 13350, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 10897, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 6233, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'KEYES, ALAN', 'party_detailed': "AMERICA'S INDEPENDENT PARTY", 'candidatevotes': 3051, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 2822, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'MCENULTY, FRANK', 'party_detailed': 'UNAFFILIATED', 'candidatevotes': 828, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'JAY, CHARLES', 'party_detailed': 'BOSTON TEA PARTY', 'candidatevotes': 598, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'ALLEN, JONATHAN', 'party_detailed': "HEARTQUAKE '08", 'candidatevotes': 348, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'STEVENS, THOMAS R.', 'party_detailed': 'OBJECTIVIST PARTY', 'candidatevotes': 336, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'MOORE, BRIAN', 'party_detailed': 'SOCIALIST', 'candidatevotes': 226, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 158, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 154, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'LYTTLE, BRADFORD', 'party_detailed': 'U.S. PACIFIST PARTY', 'candidatevotes': 110, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'COLORADO', 'candidate': 'AMONDSON, GENE', 'party_detailed': 'PROHIBITION', 'candidatevotes': 85, 'totalvotes': 2401361},
-    {'year': 2008, 'state': 'CONNECTICUT', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 997772, 'totalvotes': 1646792},
-    {'year': 2008, 'state': 'CONNECTICUT', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 629428, 'totalvotes': 1646792},
-    {'year': 2008, 'state': 'CONNECTICUT', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 19162, 'totalvotes': 1646792},
-    {'year': 2008, 'state': 'CONNECTICUT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 430, 'totalvotes': 1646792},
-    {'year': 2008, 'state': 'DELAWARE', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 255459, 'totalvotes': 412412},
-    {'year': 2008, 'state': 'DELAWARE', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 152374, 'totalvotes': 412412},
-    {'year': 2008, 'state': 'DELAWARE', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2401, 'totalvotes': 412412},
-    {'year': 2008, 'state': 'DELAWARE', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1109, 'totalvotes': 412412},
-    {'year': 2008, 'state': 'DELAWARE', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 626, 'totalvotes': 412412},
-    {'year': 2008, 'state': 'DELAWARE', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 385, 'totalvotes': 412412},
-    {'year': 2008, 'state': 'DELAWARE', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 58, 'totalvotes': 412412},
-    {'year': 2008, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 245800, 'totalvotes': 265853},
-    {'year': 2008, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 17367, 'totalvotes': 265853},
-    {'year': 2008, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1138, 'totalvotes': 265853},
-    {'year': 2008, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 958, 'totalvotes': 265853},
-    {'year': 2008, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 590, 'totalvotes': 265853},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 4282074, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 4045624, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'NADER, RALPH', 'party_detailed': 'ECOLOGY PARTY OF FLORIDA', 'candidatevotes': 28124, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 17218, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 7915, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 2887, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'KEYES, ALAN', 'party_detailed': "AMERICA'S INDEPENDENT PARTY", 'candidatevotes': 2550, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 1516, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'JAY, CHARLES', 'party_detailed': 'BOSTON TEA PARTY', 'candidatevotes': 795, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 533, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'STEVENS, THOMAS R.', 'party_detailed': 'OBJECTIVIST PARTY', 'candidatevotes': 419, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'MOORE, BRIAN', 'party_detailed': 'SOCIALIST', 'candidatevotes': 405, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 391, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'FLORIDA', 'candidate': 'AMONDSON, GENE', 'party_detailed': 'PROHIBITION', 'candidatevotes': 293, 'totalvotes': 8390744},
-    {'year': 2008, 'state': 'GEORGIA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2048759, 'totalvotes': 3924486},
-    {'year': 2008, 'state': 'GEORGIA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1844123, 'totalvotes': 3924486},
-    {'year': 2008, 'state': 'GEORGIA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 28731, 'totalvotes': 3924486},
-    {'year': 2008, 'state': 'GEORGIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1715, 'totalvotes': 3924486},
-    {'year': 2008, 'state': 'GEORGIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1158, 'totalvotes': 3924486},
-    {'year': 2008, 'state': 'HAWAII', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 325871, 'totalvotes': 456064},
-    {'year': 2008, 'state': 'HAWAII', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 120566, 'totalvotes': 456064},
-    {'year': 2008, 'state': 'HAWAII', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3825, 'totalvotes': 456064},
-    {'year': 2008, 'state': 'HAWAII', 'candidate': 'BLANK VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 2193, 'totalvotes': 456064},
-    {'year': 2008, 'state': 'HAWAII', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1314, 'totalvotes': 456064},
-    {'year': 2008, 'state': 'HAWAII', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1013, 'totalvotes': 456064},
-    {'year': 2008, 'state': 'HAWAII', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 979, 'totalvotes': 456064},
-    {'year': 2008, 'state': 'HAWAII', 'candidate': 'OVER VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 303, 'totalvotes': 456064},
-    {'year': 2008, 'state': 'IDAHO', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 403012, 'totalvotes': 655122},
-    {'year': 2008, 'state': 'IDAHO', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 236440, 'totalvotes': 655122},
-    {'year': 2008, 'state': 'IDAHO', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 7175, 'totalvotes': 655122},
-    {'year': 2008, 'state': 'IDAHO', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 4747, 'totalvotes': 655122},
-    {'year': 2008, 'state': 'IDAHO', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3658, 'totalvotes': 655122},
-    {'year': 2008, 'state': 'IDAHO', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 90, 'totalvotes': 655122},
-    {'year': 2008, 'state': 'ILLINOIS', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3419348, 'totalvotes': 5522371},
-    {'year': 2008, 'state': 'ILLINOIS', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2031179, 'totalvotes': 5522371},
-    {'year': 2008, 'state': 'ILLINOIS', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 30948, 'totalvotes': 5522371},
-    {'year': 2008, 'state': 'ILLINOIS', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 19642, 'totalvotes': 5522371},
-    {'year': 2008, 'state': 'ILLINOIS', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 11838, 'totalvotes': 5522371},
-    {'year': 2008, 'state': 'ILLINOIS', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 8256, 'totalvotes': 5522371},
-    {'year': 2008, 'state': 'ILLINOIS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'NEW', 'candidatevotes': 1149, 'totalvotes': 5522371},
-    {'year': 2008, 'state': 'ILLINOIS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 11, 'totalvotes': 5522371},
-    {'year': 2008, 'state': 'INDIANA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1374039, 'totalvotes': 2751054},
-    {'year': 2008, 'state': 'INDIANA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1345648, 'totalvotes': 2751054},
-    {'year': 2008, 'state': 'INDIANA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 29257, 'totalvotes': 2751054},
-    {'year': 2008, 'state': 'INDIANA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1201, 'totalvotes': 2751054},
-    {'year': 2008, 'state': 'INDIANA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 909, 'totalvotes': 2751054},
-    {'year': 2008, 'state': 'IOWA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 828940, 'totalvotes': 1537123},
-    {'year': 2008, 'state': 'IOWA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 682379, 'totalvotes': 1537123},
-    {'year': 2008, 'state': 'IOWA', 'candidate': 'NADER, RALPH', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 8014, 'totalvotes': 1537123},
-    {'year': 2008, 'state': 'IOWA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 6737, 'totalvotes': 1537123},
-    {'year': 2008, 'state': 'IOWA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4590, 'totalvotes': 1537123},
-    {'year': 2008, 'state': 'IOWA', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 4445, 'totalvotes': 1537123},
-    {'year': 2008, 'state': 'IOWA', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 1423, 'totalvotes': 1537123},
-    {'year': 2008, 'state': 'IOWA', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 292, 'totalvotes': 1537123},
-    {'year': 2008, 'state': 'IOWA', 'candidate': 'MOORE, BRIAN', 'party_detailed': 'SOCIALIST', 'candidatevotes': 182, 'totalvotes': 1537123},
-    {'year': 2008, 'state': 'IOWA', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 121, 'totalvotes': 1537123},
-    {'year': 2008, 'state': 'KANSAS', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 699655, 'totalvotes': 1235872},
-    {'year': 2008, 'state': 'KANSAS', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 514765, 'totalvotes': 1235872},
-    {'year': 2008, 'state': 'KANSAS', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 10598, 'totalvotes': 1235872},
-    {'year': 2008, 'state': 'KANSAS', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6706, 'totalvotes': 1235872},
-    {'year': 2008, 'state': 'KANSAS', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 4148, 'totalvotes': 1235872},
-    {'year': 2008, 'state': 'KENTUCKY', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1048462, 'totalvotes': 1826620},
-    {'year': 2008, 'state': 'KENTUCKY', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 751985, 'totalvotes': 1826620},
-    {'year': 2008, 'state': 'KENTUCKY', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 15378, 'totalvotes': 1826620},
-    {'year': 2008, 'state': 'KENTUCKY', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5989, 'totalvotes': 1826620},
-    {'year': 2008, 'state': 'KENTUCKY', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 4694, 'totalvotes': 1826620},
-    {'year': 2008, 'state': 'KENTUCKY', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 112, 'totalvotes': 1826620},
-    {'year': 2008, 'state': 'LOUISIANA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1148275, 'totalvotes': 1960761},
-    {'year': 2008, 'state': 'LOUISIANA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 782989, 'totalvotes': 1960761},
-    {'year': 2008, 'state': 'LOUISIANA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'LOUISIANA TAXPAYERS PARTY', 'candidatevotes': 9368, 'totalvotes': 1960761},
-    {'year': 2008, 'state': 'LOUISIANA', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 9187, 'totalvotes': 1960761},
-    {'year': 2008, 'state': 'LOUISIANA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 6997, 'totalvotes': 1960761},
-    {'year': 2008, 'state': 'LOUISIANA', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2581, 'totalvotes': 1960761},
-    {'year': 2008, 'state': 'LOUISIANA', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 735, 'totalvotes': 1960761},
-    {'year': 2008, 'state': 'LOUISIANA', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 354, 'totalvotes': 1960761},
-    {'year': 2008, 'state': 'LOUISIANA', 'candidate': 'AMONDSON, GENE', 'party_detailed': 'PROHIBITION', 'candidatevotes': 275, 'totalvotes': 1960761},
-    {'year': 2008, 'state': 'MAINE', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 421923, 'totalvotes': 731163},
-    {'year': 2008, 'state': 'MAINE', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 295273, 'totalvotes': 731163},
-    {'year': 2008, 'state': 'MAINE', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 10636, 'totalvotes': 731163},
-    {'year': 2008, 'state': 'MAINE', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 2900, 'totalvotes': 731163},
-    {'year': 2008, 'state': 'MAINE', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 431, 'totalvotes': 731163},
-    {'year': 2008, 'state': 'MARYLAND', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1629467, 'totalvotes': 2631596},
-    {'year': 2008, 'state': 'MARYLAND', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 959862, 'totalvotes': 2631596},
-    {'year': 2008, 'state': 'MARYLAND', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 14713, 'totalvotes': 2631596},
-    {'year': 2008, 'state': 'MARYLAND', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9842, 'totalvotes': 2631596},
-    {'year': 2008, 'state': 'MARYLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 9205, 'totalvotes': 2631596},
-    {'year': 2008, 'state': 'MARYLAND', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 4747, 'totalvotes': 2631596},
-    {'year': 2008, 'state': 'MARYLAND', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3760, 'totalvotes': 2631596},
-    {'year': 2008, 'state': 'MASSACHUSETTS', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1904097, 'totalvotes': 3102995},
-    {'year': 2008, 'state': 'MASSACHUSETTS', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1108854, 'totalvotes': 3102995},
-    {'year': 2008, 'state': 'MASSACHUSETTS', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 28841, 'totalvotes': 3102995},
-    {'year': 2008, 'state': 'MASSACHUSETTS', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 22010, 'totalvotes': 3102995},
-    {'year': 2008, 'state': 'MASSACHUSETTS', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 14483, 'totalvotes': 3102995},
-    {'year': 2008, 'state': 'MASSACHUSETTS', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 13189, 'totalvotes': 3102995},
-    {'year': 2008, 'state': 'MASSACHUSETTS', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 6550, 'totalvotes': 3102995},
-    {'year': 2008, 'state': 'MASSACHUSETTS', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 4971, 'totalvotes': 3102995},
-    {'year': 2008, 'state': 'MICHIGAN', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2872579, 'totalvotes': 5001596},
-    {'year': 2008, 'state': 'MICHIGAN', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2048639, 'totalvotes': 5001596},
-    {'year': 2008, 'state': 'MICHIGAN', 'candidate': 'NADER, RALPH', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 33085, 'totalvotes': 5001596},
-    {'year': 2008, 'state': 'MICHIGAN', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 23716, 'totalvotes': 5001596},
-    {'year': 2008, 'state': 'MICHIGAN', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 14685, 'totalvotes': 5001596},
-    {'year': 2008, 'state': 'MICHIGAN', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 8892, 'totalvotes': 5001596},
-    {'year': 2008, 'state': 'MINNESOTA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1573354, 'totalvotes': 2910369},
-    {'year': 2008, 'state': 'MINNESOTA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1275409, 'totalvotes': 2910369},
-    {'year': 2008, 'state': 'MINNESOTA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 30152, 'totalvotes': 2910369},
-    {'year': 2008, 'state': 'MINNESOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 9529, 'totalvotes': 2910369},
-    {'year': 2008, 'state': 'MINNESOTA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9174, 'totalvotes': 2910369},
-    {'year': 2008, 'state': 'MINNESOTA', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 6787, 'totalvotes': 2910369},
-    {'year': 2008, 'state': 'MINNESOTA', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 5174, 'totalvotes': 2910369},
-    {'year': 2008, 'state': 'MINNESOTA', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 790, 'totalvotes': 2910369},
-    {'year': 2008, 'state': 'MISSISSIPPI', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 724597, 'totalvotes': 1289865},
-    {'year': 2008, 'state': 'MISSISSIPPI', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 554662, 'totalvotes': 1289865},
-    {'year': 2008, 'state': 'MISSISSIPPI', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4011, 'totalvotes': 1289865},
-    {'year': 2008, 'state': 'MISSISSIPPI', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2551, 'totalvotes': 1289865},
-    {'year': 2008, 'state': 'MISSISSIPPI', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2529, 'totalvotes': 1289865},
-    {'year': 2008, 'state': 'MISSISSIPPI', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 1034, 'totalvotes': 1289865},
-    {'year': 2008, 'state': 'MISSISSIPPI', 'candidate': 'WEILL, TED', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 481, 'totalvotes': 1289865},
-    {'year': 2008, 'state': 'MISSOURI', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1445814, 'totalvotes': 2925205},
-    {'year': 2008, 'state': 'MISSOURI', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1441911, 'totalvotes': 2925205},
-    {'year': 2008, 'state': 'MISSOURI', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 17813, 'totalvotes': 2925205},
-    {'year': 2008, 'state': 'MISSOURI', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11386, 'totalvotes': 2925205},
-    {'year': 2008, 'state': 'MISSOURI', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 8201, 'totalvotes': 2925205},
-    {'year': 2008, 'state': 'MISSOURI', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'OTHER', 'candidatevotes': 80, 'totalvotes': 2925205},
-    {'year': 2008, 'state': 'MONTANA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 242763, 'totalvotes': 490109},
-    {'year': 2008, 'state': 'MONTANA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 231667, 'totalvotes': 490109},
-    {'year': 2008, 'state': 'MONTANA', 'candidate': 'PAUL, RONALD ""RON""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 10638, 'totalvotes': 490109},
-    {'year': 2008, 'state': 'MONTANA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3686, 'totalvotes': 490109},
-    {'year': 2008, 'state': 'MONTANA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1355, 'totalvotes': 490109},
-    {'year': 2008, 'state': 'NEBRASKA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 452979, 'totalvotes': 801281},
-    {'year': 2008, 'state': 'NEBRASKA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 333319, 'totalvotes': 801281},
-    {'year': 2008, 'state': 'NEBRASKA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 5406, 'totalvotes': 801281},
-    {'year': 2008, 'state': 'NEBRASKA', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'NEBRASKA PARTY', 'candidatevotes': 2972, 'totalvotes': 801281},
-    {'year': 2008, 'state': 'NEBRASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2837, 'totalvotes': 801281},
-    {'year': 2008, 'state': 'NEBRASKA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2740, 'totalvotes': 801281},
-    {'year': 2008, 'state': 'NEBRASKA', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 1028, 'totalvotes': 801281},
-    {'year': 2008, 'state': 'NEVADA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 533736, 'totalvotes': 967848},
-    {'year': 2008, 'state': 'NEVADA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 412827, 'totalvotes': 967848},
-    {'year': 2008, 'state': 'NEVADA', 'candidate': 'NONE OF THESE CANDIDATES', 'party_detailed': 'OTHER', 'candidatevotes': 6267, 'totalvotes': 967848},
-    {'year': 2008, 'state': 'NEVADA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 6150, 'totalvotes': 967848},
-    {'year': 2008, 'state': 'NEVADA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4263, 'totalvotes': 967848},
-    {'year': 2008, 'state': 'NEVADA', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'INDEPENDENT AMERICAN', 'candidatevotes': 3194, 'totalvotes': 967848},
-    {'year': 2008, 'state': 'NEVADA', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 1411, 'totalvotes': 967848},
-    {'year': 2008, 'state': 'NEW HAMPSHIRE', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 384826, 'totalvotes': 710970},
-    {'year': 2008, 'state': 'NEW HAMPSHIRE', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 316534, 'totalvotes': 710970},
-    {'year': 2008, 'state': 'NEW HAMPSHIRE', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3503, 'totalvotes': 710970},
-    {'year': 2008, 'state': 'NEW HAMPSHIRE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 3359, 'totalvotes': 710970},
-    {'year': 2008, 'state': 'NEW HAMPSHIRE', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2748, 'totalvotes': 710970},
-    {'year': 2008, 'state': 'NEW JERSEY', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2215422, 'totalvotes': 3868237},
-    {'year': 2008, 'state': 'NEW JERSEY', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1613207, 'totalvotes': 3868237},
-    {'year': 2008, 'state': 'NEW JERSEY', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 21298, 'totalvotes': 3868237},
-    {'year': 2008, 'state': 'NEW JERSEY', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8441, 'totalvotes': 3868237},
-    {'year': 2008, 'state': 'NEW JERSEY', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3956, 'totalvotes': 3868237},
-    {'year': 2008, 'state': 'NEW JERSEY', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 3636, 'totalvotes': 3868237},
-    {'year': 2008, 'state': 'NEW JERSEY', 'candidate': 'MOORE, BRIAN', 'party_detailed': 'SOCIALIST', 'candidatevotes': 699, 'totalvotes': 3868237},
-    {'year': 2008, 'state': 'NEW JERSEY', 'candidate': 'BOSS, JEFFERY', 'party_detailed': 'VOTE HERE', 'candidatevotes': 639, 'totalvotes': 3868237},
-    {'year': 2008, 'state': 'NEW JERSEY', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 523, 'totalvotes': 3868237},
-    {'year': 2008, 'state': 'NEW JERSEY', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 416, 'totalvotes': 3868237},
-    {'year': 2008, 'state': 'NEW MEXICO', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 472422, 'totalvotes': 830158},
-    {'year': 2008, 'state': 'NEW MEXICO', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 346832, 'totalvotes': 830158},
-    {'year': 2008, 'state': 'NEW MEXICO', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 5327, 'totalvotes': 830158},
-    {'year': 2008, 'state': 'NEW MEXICO', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2428, 'totalvotes': 830158},
-    {'year': 2008, 'state': 'NEW MEXICO', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1597, 'totalvotes': 830158},
-    {'year': 2008, 'state': 'NEW MEXICO', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 1552, 'totalvotes': 830158},
-    {'year': 2008, 'state': 'NEW YORK', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 4645332, 'totalvotes': 7722019},
-    {'year': 2008, 'state': 'NEW YORK', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2418323, 'totalvotes': 7722019},
-    {'year': 2008, 'state': 'NEW YORK', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 170475, 'totalvotes': 7722019},
-    {'year': 2008, 'state': 'NEW YORK', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'INDEPENDENCE', 'candidatevotes': 163973, 'totalvotes': 7722019},
-    {'year': 2008, 'state': 'NEW YORK', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'WORKING FAMILIES', 'candidatevotes': 159613, 'totalvotes': 7722019},
-    {'year': 2008, 'state': 'NEW YORK', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 84701, 'totalvotes': 7722019},
-    {'year': 2008, 'state': 'NEW YORK', 'candidate': 'NADER, RALPH', 'party_detailed': 'POPULIST', 'candidatevotes': 41249, 'totalvotes': 7722019},
-    {'year': 2008, 'state': 'NEW YORK', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 19596, 'totalvotes': 7722019},
-    {'year': 2008, 'state': 'NEW YORK', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 12801, 'totalvotes': 7722019},
-    {'year': 2008, 'state': 'NEW YORK', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 3615, 'totalvotes': 7722019},
-    {'year': 2008, 'state': 'NEW YORK', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 1639, 'totalvotes': 7722019},
-    {'year': 2008, 'state': 'NEW YORK', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 702, 'totalvotes': 7722019},
-    {'year': 2008, 'state': 'NORTH CAROLINA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2142651, 'totalvotes': 4310851},
-    {'year': 2008, 'state': 'NORTH CAROLINA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2128474, 'totalvotes': 4310851},
-    {'year': 2008, 'state': 'NORTH CAROLINA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 25722, 'totalvotes': 4310851},
-    {'year': 2008, 'state': 'NORTH CAROLINA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 12494, 'totalvotes': 4310851},
-    {'year': 2008, 'state': 'NORTH CAROLINA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1510, 'totalvotes': 4310851},
-    {'year': 2008, 'state': 'NORTH DAKOTA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 168601, 'totalvotes': 316621},
-    {'year': 2008, 'state': 'NORTH DAKOTA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 141278, 'totalvotes': 316621},
-    {'year': 2008, 'state': 'NORTH DAKOTA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4189, 'totalvotes': 316621},
-    {'year': 2008, 'state': 'NORTH DAKOTA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1354, 'totalvotes': 316621},
-    {'year': 2008, 'state': 'NORTH DAKOTA', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1199, 'totalvotes': 316621},
-    {'year': 2008, 'state': 'OHIO', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2940044, 'totalvotes': 5708350},
-    {'year': 2008, 'state': 'OHIO', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2677820, 'totalvotes': 5708350},
-    {'year': 2008, 'state': 'OHIO', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 46242, 'totalvotes': 5708350},
-    {'year': 2008, 'state': 'OHIO', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 19917, 'totalvotes': 5708350},
-    {'year': 2008, 'state': 'OHIO', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 12565, 'totalvotes': 5708350},
-    {'year': 2008, 'state': 'OHIO', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 8518, 'totalvotes': 5708350},
-    {'year': 2008, 'state': 'OHIO', 'candidate': 'MOORE, BRIAN', 'party_detailed': 'SOCIALIST', 'candidatevotes': 2735, 'totalvotes': 5708350},
-    {'year': 2008, 'state': 'OHIO', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 509, 'totalvotes': 5708350},
-    {'year': 2008, 'state': 'OKLAHOMA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 960165, 'totalvotes': 1462661},
-    {'year': 2008, 'state': 'OKLAHOMA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 502496, 'totalvotes': 1462661},
-    {'year': 2008, 'state': 'OREGON', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1037291, 'totalvotes': 1827864},
-    {'year': 2008, 'state': 'OREGON', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 738475, 'totalvotes': 1827864},
-    {'year': 2008, 'state': 'OREGON', 'candidate': 'NADER, RALPH', 'party_detailed': 'PEACE PARTY', 'candidatevotes': 18614, 'totalvotes': 1827864},
-    {'year': 2008, 'state': 'OREGON', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 13613, 'totalvotes': 1827864},
-    {'year': 2008, 'state': 'OREGON', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 7693, 'totalvotes': 1827864},
-    {'year': 2008, 'state': 'OREGON', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7635, 'totalvotes': 1827864},
-    {'year': 2008, 'state': 'OREGON', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 4543, 'totalvotes': 1827864},
-    {'year': 2008, 'state': 'PENNSYLVANIA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3276363, 'totalvotes': 6013272},
-    {'year': 2008, 'state': 'PENNSYLVANIA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2655885, 'totalvotes': 6013272},
-    {'year': 2008, 'state': 'PENNSYLVANIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 42977, 'totalvotes': 6013272},
-    {'year': 2008, 'state': 'PENNSYLVANIA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 19912, 'totalvotes': 6013272},
-    {'year': 2008, 'state': 'PENNSYLVANIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 9955, 'totalvotes': 6013272},
-    {'year': 2008, 'state': 'PENNSYLVANIA', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 8180, 'totalvotes': 6013272},
-    {'year': 2008, 'state': 'RHODE ISLAND', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 296571, 'totalvotes': 471766},
-    {'year': 2008, 'state': 'RHODE ISLAND', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 165391, 'totalvotes': 471766},
-    {'year': 2008, 'state': 'RHODE ISLAND', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4829, 'totalvotes': 471766},
-    {'year': 2008, 'state': 'RHODE ISLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1999, 'totalvotes': 471766},
-    {'year': 2008, 'state': 'RHODE ISLAND', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1382, 'totalvotes': 471766},
-    {'year': 2008, 'state': 'RHODE ISLAND', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 797, 'totalvotes': 471766},
-    {'year': 2008, 'state': 'RHODE ISLAND', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 675, 'totalvotes': 471766},
-    {'year': 2008, 'state': 'RHODE ISLAND', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 122, 'totalvotes': 471766},
-    {'year': 2008, 'state': 'SOUTH CAROLINA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1034896, 'totalvotes': 1920969},
-    {'year': 2008, 'state': 'SOUTH CAROLINA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 862449, 'totalvotes': 1920969},
-    {'year': 2008, 'state': 'SOUTH CAROLINA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7283, 'totalvotes': 1920969},
-    {'year': 2008, 'state': 'SOUTH CAROLINA', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 6827, 'totalvotes': 1920969},
-    {'year': 2008, 'state': 'SOUTH CAROLINA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 5053, 'totalvotes': 1920969},
-    {'year': 2008, 'state': 'SOUTH CAROLINA', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 4461, 'totalvotes': 1920969},
-    {'year': 2008, 'state': 'SOUTH DAKOTA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 203054, 'totalvotes': 381975},
-    {'year': 2008, 'state': 'SOUTH DAKOTA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 170924, 'totalvotes': 381975},
-    {'year': 2008, 'state': 'SOUTH DAKOTA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4267, 'totalvotes': 381975},
-    {'year': 2008, 'state': 'SOUTH DAKOTA', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1895, 'totalvotes': 381975},
-    {'year': 2008, 'state': 'SOUTH DAKOTA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1835, 'totalvotes': 381975},
-    {'year': 2008, 'state': 'TENNESSEE', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1479178, 'totalvotes': 2599749},
-    {'year': 2008, 'state': 'TENNESSEE', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1087437, 'totalvotes': 2599749},
-    {'year': 2008, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 33134, 'totalvotes': 2599749},
-    {'year': 2008, 'state': 'TEXAS', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 4479328, 'totalvotes': 8077795},
-    {'year': 2008, 'state': 'TEXAS', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3528633, 'totalvotes': 8077795},
-    {'year': 2008, 'state': 'TEXAS', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 56116, 'totalvotes': 8077795},
-    {'year': 2008, 'state': 'TEXAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 7967, 'totalvotes': 8077795},
-    {'year': 2008, 'state': 'TEXAS', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 5751, 'totalvotes': 8077795},
-    {'year': 2008, 'state': 'UTAH', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 596030, 'totalvotes': 952370},
-    {'year': 2008, 'state': 'UTAH', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 327670, 'totalvotes': 952370},
-    {'year': 2008, 'state': 'UTAH', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 12012, 'totalvotes': 952370},
-    {'year': 2008, 'state': 'UTAH', 'candidate': 'NADER, RALPH', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 8416, 'totalvotes': 952370},
-    {'year': 2008, 'state': 'UTAH', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6966, 'totalvotes': 952370},
-    {'year': 2008, 'state': 'UTAH', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 982, 'totalvotes': 952370},
-    {'year': 2008, 'state': 'UTAH', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 262, 'totalvotes': 952370},
-    {'year': 2008, 'state': 'UTAH', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 32, 'totalvotes': 952370},
-    {'year': 2008, 'state': 'VERMONT', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 219262, 'totalvotes': 325046},
-    {'year': 2008, 'state': 'VERMONT', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 98974, 'totalvotes': 325046},
-    {'year': 2008, 'state': 'VERMONT', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3339, 'totalvotes': 325046},
-    {'year': 2008, 'state': 'VERMONT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1464, 'totalvotes': 325046},
-    {'year': 2008, 'state': 'VERMONT', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1067, 'totalvotes': 325046},
-    {'year': 2008, 'state': 'VERMONT', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 500, 'totalvotes': 325046},
-    {'year': 2008, 'state': 'VERMONT', 'candidate': 'CALERO, ROGER', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 150, 'totalvotes': 325046},
-    {'year': 2008, 'state': 'VERMONT', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 149, 'totalvotes': 325046},
-    {'year': 2008, 'state': 'VERMONT', 'candidate': 'MOORE, BRIAN', 'party_detailed': 'LIBERTY UNION PARTY', 'candidatevotes': 141, 'totalvotes': 325046},
-    {'year': 2008, 'state': 'VIRGINIA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1959532, 'totalvotes': 3723260},
-    {'year': 2008, 'state': 'VIRGINIA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1725005, 'totalvotes': 3723260},
-    {'year': 2008, 'state': 'VIRGINIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 11483, 'totalvotes': 3723260},
-    {'year': 2008, 'state': 'VIRGINIA', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11067, 'totalvotes': 3723260},
-    {'year': 2008, 'state': 'VIRGINIA', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'INDEPENDENT GREEN', 'candidatevotes': 7474, 'totalvotes': 3723260},
-    {'year': 2008, 'state': 'VIRGINIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 6355, 'totalvotes': 3723260},
-    {'year': 2008, 'state': 'VIRGINIA', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 2344, 'totalvotes': 3723260},
-    {'year': 2008, 'state': 'WASHINGTON', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1750848, 'totalvotes': 3036878},
-    {'year': 2008, 'state': 'WASHINGTON', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1229216, 'totalvotes': 3036878},
-    {'year': 2008, 'state': 'WASHINGTON', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 29489, 'totalvotes': 3036878},
-    {'year': 2008, 'state': 'WASHINGTON', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12728, 'totalvotes': 3036878},
-    {'year': 2008, 'state': 'WASHINGTON', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 9432, 'totalvotes': 3036878},
-    {'year': 2008, 'state': 'WASHINGTON', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 3819, 'totalvotes': 3036878},
-    {'year': 2008, 'state': 'WASHINGTON', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 705, 'totalvotes': 3036878},
-    {'year': 2008, 'state': 'WASHINGTON', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 641, 'totalvotes': 3036878},
-    {'year': 2008, 'state': 'WEST VIRGINIA', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 397466, 'totalvotes': 713451},
-    {'year': 2008, 'state': 'WEST VIRGINIA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 303857, 'totalvotes': 713451},
-    {'year': 2008, 'state': 'WEST VIRGINIA', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 7219, 'totalvotes': 713451},
-    {'year': 2008, 'state': 'WEST VIRGINIA', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2465, 'totalvotes': 713451},
-    {'year': 2008, 'state': 'WEST VIRGINIA', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'MOUNTAIN PARTY', 'candidatevotes': 2355, 'totalvotes': 713451},
-    {'year': 2008, 'state': 'WEST VIRGINIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 89, 'totalvotes': 713451},
-    {'year': 2008, 'state': 'WISCONSIN', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1677211, 'totalvotes': 2983417},
-    {'year': 2008, 'state': 'WISCONSIN', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1262393, 'totalvotes': 2983417},
-    {'year': 2008, 'state': 'WISCONSIN', 'candidate': 'NADER, RALPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 17605, 'totalvotes': 2983417},
-    {'year': 2008, 'state': 'WISCONSIN', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8858, 'totalvotes': 2983417},
-    {'year': 2008, 'state': 'WISCONSIN', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 6521, 'totalvotes': 2983417},
-    {'year': 2008, 'state': 'WISCONSIN', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 5072, 'totalvotes': 2983417},
-    {'year': 2008, 'state': 'WISCONSIN', 'candidate': 'MCKINNEY, CYNTHIA', 'party_detailed': 'GREEN', 'candidatevotes': 4216, 'totalvotes': 2983417},
-    {'year': 2008, 'state': 'WISCONSIN', 'candidate': 'WAMBOLDT, JEFFREY', 'party_detailed': 'WE THE PEOPLE', 'candidatevotes': 764, 'totalvotes': 2983417},
-    {'year': 2008, 'state': 'WISCONSIN', 'candidate': 'MOORE, BRIAN', 'party_detailed': 'SOCIALIST PARTY USA', 'candidatevotes': 540, 'totalvotes': 2983417},
-    {'year': 2008, 'state': 'WISCONSIN', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 237, 'totalvotes': 2983417},
-    {'year': 2008, 'state': 'WYOMING', 'candidate': 'MCCAIN, JOHN', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 164958, 'totalvotes': 254904},
-    {'year': 2008, 'state': 'WYOMING', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 82868, 'totalvotes': 254904},
-    {'year': 2008, 'state': 'WYOMING', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3717, 'totalvotes': 254904},
-    {'year': 2008, 'state': 'WYOMING', 'candidate': 'BARR, BOB', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 1594, 'totalvotes': 254904},
-    {'year': 2008, 'state': 'WYOMING', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1521, 'totalvotes': 254904},
-    {'year': 2008, 'state': 'WYOMING', 'candidate': 'OVER VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 246, 'totalvotes': 254904},
-    {'year': 2012, 'state': 'ALABAMA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1255925, 'totalvotes': 2074338},
-    {'year': 2012, 'state': 'ALABAMA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 795696, 'totalvotes': 2074338},
-    {'year': 2012, 'state': 'ALABAMA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 18706, 'totalvotes': 2074338},
-    {'year': 2012, 'state': 'ALABAMA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 4011, 'totalvotes': 2074338},
-    {'year': 2012, 'state': 'ALASKA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 164676, 'totalvotes': 300495},
-    {'year': 2012, 'state': 'ALASKA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 122640, 'totalvotes': 300495},
-    {'year': 2012, 'state': 'ALASKA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 7392, 'totalvotes': 300495},
-    {'year': 2012, 'state': 'ALASKA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 2917, 'totalvotes': 300495},
-    {'year': 2012, 'state': 'ALASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2870, 'totalvotes': 300495},
-    {'year': 2012, 'state': 'ARIZONA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1233654, 'totalvotes': 2299254},
-    {'year': 2012, 'state': 'ARIZONA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1025232, 'totalvotes': 2299254},
-    {'year': 2012, 'state': 'ARIZONA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 32100, 'totalvotes': 2299254},
-    {'year': 2012, 'state': 'ARIZONA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 7816, 'totalvotes': 2299254},
-    {'year': 2012, 'state': 'ARIZONA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 452, 'totalvotes': 2299254},
-    {'year': 2012, 'state': 'ARKANSAS', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 647744, 'totalvotes': 1069468},
-    {'year': 2012, 'state': 'ARKANSAS', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 394409, 'totalvotes': 1069468},
-    {'year': 2012, 'state': 'ARKANSAS', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 16276, 'totalvotes': 1069468},
-    {'year': 2012, 'state': 'ARKANSAS', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 9305, 'totalvotes': 1069468},
-    {'year': 2012, 'state': 'ARKANSAS', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 1734, 'totalvotes': 1069468},
-    {'year': 2012, 'state': 'CALIFORNIA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 7854285, 'totalvotes': 13038547},
-    {'year': 2012, 'state': 'CALIFORNIA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 4839958, 'totalvotes': 13038547},
-    {'year': 2012, 'state': 'CALIFORNIA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 143221, 'totalvotes': 13038547},
-    {'year': 2012, 'state': 'CALIFORNIA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 85638, 'totalvotes': 13038547},
-    {'year': 2012, 'state': 'CALIFORNIA', 'candidate': 'BARR, ROSEANNE', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 53824, 'totalvotes': 13038547},
-    {'year': 2012, 'state': 'CALIFORNIA', 'candidate': 'HOEFLING, THOMAS CONRAD ""TOM""', 'party_detailed': 'AMERICAN INDEPENDENT PARTY', 'candidatevotes': 38372, 'totalvotes': 13038547},
-    {'year': 2012, 'state': 'CALIFORNIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 23249, 'totalvotes': 13038547},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1323101, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1185243, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 35545, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 7508, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'AMERICAN CONSTITUTION PARTY', 'candidatevotes': 6234, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'BARR, ROSEANNE', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 5057, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'REED, JILL ANN', 'party_detailed': 'NO PARTY AFFILIATION', 'candidatevotes': 2588, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'ANDERSON, ROSS CARL ""ROCKY""', 'party_detailed': 'JUSTICE', 'candidatevotes': 1262, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'TITTLE, SHEILA ""SAMM""', 'party_detailed': 'WE THE PEOPLE', 'candidatevotes': 791, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'HOEFLING, THOMAS CONRAD ""TOM""', 'party_detailed': "AMERICA'S PARTY", 'candidatevotes': 679, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 317, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'ALEXANDER, STEWART', 'party_detailed': 'SOCIALIST', 'candidatevotes': 308, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'MILLER, MERLIN', 'party_detailed': 'AMERICAN THIRD POSITION', 'candidatevotes': 267, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'STEVENS, THOMAS ROBERT ""TOM""', 'party_detailed': 'OBJECTIVIST PARTY', 'candidatevotes': 235, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 192, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'COLORADO', 'candidate': 'WHITE, JERRY', 'party_detailed': 'SOCIALIST EQUALITY PARTY', 'candidatevotes': 189, 'totalvotes': 2569516},
-    {'year': 2012, 'state': 'CONNECTICUT', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 905083, 'totalvotes': 1558204},
-    {'year': 2012, 'state': 'CONNECTICUT', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 634892, 'totalvotes': 1558204},
-    {'year': 2012, 'state': 'CONNECTICUT', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12340, 'totalvotes': 1558204},
-    {'year': 2012, 'state': 'CONNECTICUT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4971, 'totalvotes': 1558204},
-    {'year': 2012, 'state': 'CONNECTICUT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 918, 'totalvotes': 1558204},
-    {'year': 2012, 'state': 'DELAWARE', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 242584, 'totalvotes': 413890},
-    {'year': 2012, 'state': 'DELAWARE', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 165484, 'totalvotes': 413890},
-    {'year': 2012, 'state': 'DELAWARE', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3882, 'totalvotes': 413890},
-    {'year': 2012, 'state': 'DELAWARE', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 1940, 'totalvotes': 413890},
-    {'year': 2012, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 267070, 'totalvotes': 293764},
-    {'year': 2012, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 21381, 'totalvotes': 293764},
-    {'year': 2012, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'STEIN, JILL', 'party_detailed': 'D.C. STATEHOOD GREEN', 'candidatevotes': 2458, 'totalvotes': 293764},
-    {'year': 2012, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2083, 'totalvotes': 293764},
-    {'year': 2012, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 772, 'totalvotes': 293764},
-    {'year': 2012, 'state': 'FLORIDA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 4237756, 'totalvotes': 8474179},
-    {'year': 2012, 'state': 'FLORIDA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 4163447, 'totalvotes': 8474179},
-    {'year': 2012, 'state': 'FLORIDA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 44726, 'totalvotes': 8474179},
-    {'year': 2012, 'state': 'FLORIDA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 8947, 'totalvotes': 8474179},
-    {'year': 2012, 'state': 'FLORIDA', 'candidate': 'BARR, ROSEANNE', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 8154, 'totalvotes': 8474179},
-    {'year': 2012, 'state': 'FLORIDA', 'candidate': 'STEVENS, THOMAS ROBERT ""TOM""', 'party_detailed': 'OBJECTIVIST PARTY', 'candidatevotes': 3856, 'totalvotes': 8474179},
-    {'year': 2012, 'state': 'FLORIDA', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2607, 'totalvotes': 8474179},
-    {'year': 2012, 'state': 'FLORIDA', 'candidate': 'ANDERSON, ROSS CARL ""ROCKY""', 'party_detailed': 'JUSTICE', 'candidatevotes': 1754, 'totalvotes': 8474179},
-    {'year': 2012, 'state': 'FLORIDA', 'candidate': 'HOEFLING, THOMAS CONRAD ""TOM""', 'party_detailed': 'AMERICAN INDEPENDENT', 'candidatevotes': 946, 'totalvotes': 8474179},
-    {'year': 2012, 'state': 'FLORIDA', 'candidate': 'BARNETT, ANDRE', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 820, 'totalvotes': 8474179},
-    {'year': 2012, 'state': 'FLORIDA', 'candidate': 'ALEXANDER, STEWART', 'party_detailed': 'SOCIALIST', 'candidatevotes': 799, 'totalvotes': 8474179},
-    {'year': 2012, 'state': 'FLORIDA', 'candidate': 'LINDSAY, PETA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 322, 'totalvotes': 8474179},
-    {'year': 2012, 'state': 'FLORIDA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 45, 'totalvotes': 8474179},
-    {'year': 2012, 'state': 'GEORGIA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2078688, 'totalvotes': 3897839},
-    {'year': 2012, 'state': 'GEORGIA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1773827, 'totalvotes': 3897839},
-    {'year': 2012, 'state': 'GEORGIA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 45324, 'totalvotes': 3897839},
-    {'year': 2012, 'state': 'HAWAII', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 306658, 'totalvotes': 437159},
-    {'year': 2012, 'state': 'HAWAII', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 121015, 'totalvotes': 437159},
-    {'year': 2012, 'state': 'HAWAII', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3840, 'totalvotes': 437159},
-    {'year': 2012, 'state': 'HAWAII', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 3184, 'totalvotes': 437159},
-    {'year': 2012, 'state': 'HAWAII', 'candidate': 'BLANK VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 2227, 'totalvotes': 437159},
-    {'year': 2012, 'state': 'HAWAII', 'candidate': 'OVER VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 235, 'totalvotes': 437159},
-    {'year': 2012, 'state': 'IDAHO', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 420911, 'totalvotes': 652274},
-    {'year': 2012, 'state': 'IDAHO', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 212787, 'totalvotes': 652274},
-    {'year': 2012, 'state': 'IDAHO', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9453, 'totalvotes': 652274},
-    {'year': 2012, 'state': 'IDAHO', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 6901, 'totalvotes': 652274},
-    {'year': 2012, 'state': 'IDAHO', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2222, 'totalvotes': 652274},
-    {'year': 2012, 'state': 'ILLINOIS', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3019512, 'totalvotes': 5242014},
-    {'year': 2012, 'state': 'ILLINOIS', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2135216, 'totalvotes': 5242014},
-    {'year': 2012, 'state': 'ILLINOIS', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 56229, 'totalvotes': 5242014},
-    {'year': 2012, 'state': 'ILLINOIS', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 30222, 'totalvotes': 5242014},
-    {'year': 2012, 'state': 'ILLINOIS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 835, 'totalvotes': 5242014},
-    {'year': 2012, 'state': 'INDIANA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1420543, 'totalvotes': 2624534},
-    {'year': 2012, 'state': 'INDIANA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1152887, 'totalvotes': 2624534},
-    {'year': 2012, 'state': 'INDIANA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 50111, 'totalvotes': 2624534},
-    {'year': 2012, 'state': 'INDIANA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 993, 'totalvotes': 2624534},
-    {'year': 2012, 'state': 'IOWA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 822544, 'totalvotes': 1582180},
-    {'year': 2012, 'state': 'IOWA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 730617, 'totalvotes': 1582180},
-    {'year': 2012, 'state': 'IOWA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12926, 'totalvotes': 1582180},
-    {'year': 2012, 'state': 'IOWA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 7442, 'totalvotes': 1582180},
-    {'year': 2012, 'state': 'IOWA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 3769, 'totalvotes': 1582180},
-    {'year': 2012, 'state': 'IOWA', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3038, 'totalvotes': 1582180},
-    {'year': 2012, 'state': 'IOWA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'NOMINATED BY PETITION', 'candidatevotes': 1027, 'totalvotes': 1582180},
-    {'year': 2012, 'state': 'IOWA', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 445, 'totalvotes': 1582180},
-    {'year': 2012, 'state': 'IOWA', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 372, 'totalvotes': 1582180},
-    {'year': 2012, 'state': 'KANSAS', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 692634, 'totalvotes': 1159971},
-    {'year': 2012, 'state': 'KANSAS', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 440726, 'totalvotes': 1159971},
-    {'year': 2012, 'state': 'KANSAS', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 20456, 'totalvotes': 1159971},
-    {'year': 2012, 'state': 'KANSAS', 'candidate': 'BALDWIN, CHARLES ""CHUCK""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 5017, 'totalvotes': 1159971},
-    {'year': 2012, 'state': 'KANSAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1138, 'totalvotes': 1159971},
-    {'year': 2012, 'state': 'KENTUCKY', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1087190, 'totalvotes': 1797212},
-    {'year': 2012, 'state': 'KENTUCKY', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 679370, 'totalvotes': 1797212},
-    {'year': 2012, 'state': 'KENTUCKY', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 17063, 'totalvotes': 1797212},
-    {'year': 2012, 'state': 'KENTUCKY', 'candidate': 'TERRY, RANDALL', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 6872, 'totalvotes': 1797212},
-    {'year': 2012, 'state': 'KENTUCKY', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 6337, 'totalvotes': 1797212},
-    {'year': 2012, 'state': 'KENTUCKY', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 380, 'totalvotes': 1797212},
-    {'year': 2012, 'state': 'LOUISIANA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1152262, 'totalvotes': 1994065},
-    {'year': 2012, 'state': 'LOUISIANA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 809141, 'totalvotes': 1994065},
-    {'year': 2012, 'state': 'LOUISIANA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 18157, 'totalvotes': 1994065},
-    {'year': 2012, 'state': 'LOUISIANA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 6978, 'totalvotes': 1994065},
-    {'year': 2012, 'state': 'LOUISIANA', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2508, 'totalvotes': 1994065},
-    {'year': 2012, 'state': 'LOUISIANA', 'candidate': 'TITTLE, SHEILA ""SAMM""', 'party_detailed': 'WE THE PEOPLE', 'candidatevotes': 1767, 'totalvotes': 1994065},
-    {'year': 2012, 'state': 'LOUISIANA', 'candidate': 'ANDERSON, ROSS CARL ""ROCKY""', 'party_detailed': 'JUSTICE', 'candidatevotes': 1368, 'totalvotes': 1994065},
-    {'year': 2012, 'state': 'LOUISIANA', 'candidate': 'LINDSAY, PETA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 622, 'totalvotes': 1994065},
-    {'year': 2012, 'state': 'LOUISIANA', 'candidate': 'FELLURE, LOWELL JACKSON ""JACK""', 'party_detailed': 'PROHIBITION', 'candidatevotes': 518, 'totalvotes': 1994065},
-    {'year': 2012, 'state': 'LOUISIANA', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 389, 'totalvotes': 1994065},
-    {'year': 2012, 'state': 'LOUISIANA', 'candidate': 'WHITE, JEROME ""JERRY""', 'party_detailed': 'SOCIALIST EQUALITY PARTY', 'candidatevotes': 355, 'totalvotes': 1994065},
-    {'year': 2012, 'state': 'MAINE', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 401306, 'totalvotes': 724758},
-    {'year': 2012, 'state': 'MAINE', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 292276, 'totalvotes': 724758},
-    {'year': 2012, 'state': 'MAINE', 'candidate': 'BLANK VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 11578, 'totalvotes': 724758},
-    {'year': 2012, 'state': 'MAINE', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9352, 'totalvotes': 724758},
-    {'year': 2012, 'state': 'MAINE', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 8119, 'totalvotes': 724758},
-    {'year': 2012, 'state': 'MAINE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2127, 'totalvotes': 724758},
-    {'year': 2012, 'state': 'MARYLAND', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1677844, 'totalvotes': 2707327},
-    {'year': 2012, 'state': 'MARYLAND', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 971869, 'totalvotes': 2707327},
-    {'year': 2012, 'state': 'MARYLAND', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 30195, 'totalvotes': 2707327},
-    {'year': 2012, 'state': 'MARYLAND', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 17110, 'totalvotes': 2707327},
-    {'year': 2012, 'state': 'MARYLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 10309, 'totalvotes': 2707327},
-    {'year': 2012, 'state': 'MASSACHUSETTS', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1921290, 'totalvotes': 3184196},
-    {'year': 2012, 'state': 'MASSACHUSETTS', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1188314, 'totalvotes': 3184196},
-    {'year': 2012, 'state': 'MASSACHUSETTS', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 30920, 'totalvotes': 3184196},
-    {'year': 2012, 'state': 'MASSACHUSETTS', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN-RAINBOW', 'candidatevotes': 20691, 'totalvotes': 3184196},
-    {'year': 2012, 'state': 'MASSACHUSETTS', 'candidate': 'BLANK VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 16429, 'totalvotes': 3184196},
-    {'year': 2012, 'state': 'MASSACHUSETTS', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 6552, 'totalvotes': 3184196},
-    {'year': 2012, 'state': 'MICHIGAN', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2564569, 'totalvotes': 4730961},
-    {'year': 2012, 'state': 'MICHIGAN', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2115256, 'totalvotes': 4730961},
-    {'year': 2012, 'state': 'MICHIGAN', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 21897, 'totalvotes': 4730961},
-    {'year': 2012, 'state': 'MICHIGAN', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 16119, 'totalvotes': 4730961},
-    {'year': 2012, 'state': 'MICHIGAN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 7973, 'totalvotes': 4730961},
-    {'year': 2012, 'state': 'MICHIGAN', 'candidate': 'ANDERSON, ROSS CARL ""ROCKY""', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 5147, 'totalvotes': 4730961},
-    {'year': 2012, 'state': 'MINNESOTA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRATIC-FARMER-LABOR', 'candidatevotes': 1546167, 'totalvotes': 2936561},
-    {'year': 2012, 'state': 'MINNESOTA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1320225, 'totalvotes': 2936561},
-    {'year': 2012, 'state': 'MINNESOTA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 35098, 'totalvotes': 2936561},
-    {'year': 2012, 'state': 'MINNESOTA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 13023, 'totalvotes': 2936561},
-    {'year': 2012, 'state': 'MINNESOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 10641, 'totalvotes': 2936561},
-    {'year': 2012, 'state': 'MINNESOTA', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3722, 'totalvotes': 2936561},
-    {'year': 2012, 'state': 'MINNESOTA', 'candidate': 'CARLSON, JIM', 'party_detailed': 'GRASSROOTS', 'candidatevotes': 3149, 'totalvotes': 2936561},
-    {'year': 2012, 'state': 'MINNESOTA', 'candidate': 'ANDERSON, ROSS CARL ""ROCKY""', 'party_detailed': 'JUSTICE', 'candidatevotes': 1996, 'totalvotes': 2936561},
-    {'year': 2012, 'state': 'MINNESOTA', 'candidate': 'MORSTAD, DEAN', 'party_detailed': 'CONSTITUTIONAL GOVERNMENT', 'candidatevotes': 1092, 'totalvotes': 2936561},
-    {'year': 2012, 'state': 'MINNESOTA', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1051, 'totalvotes': 2936561},
-    {'year': 2012, 'state': 'MINNESOTA', 'candidate': 'LINDSAY, PETA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 397, 'totalvotes': 2936561},
-    {'year': 2012, 'state': 'MISSISSIPPI', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 710746, 'totalvotes': 1285584},
-    {'year': 2012, 'state': 'MISSISSIPPI', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 562949, 'totalvotes': 1285584},
-    {'year': 2012, 'state': 'MISSISSIPPI', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6676, 'totalvotes': 1285584},
-    {'year': 2012, 'state': 'MISSISSIPPI', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2609, 'totalvotes': 1285584},
-    {'year': 2012, 'state': 'MISSISSIPPI', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 1588, 'totalvotes': 1285584},
-    {'year': 2012, 'state': 'MISSISSIPPI', 'candidate': 'WASHER, BARBARA DALE', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 1016, 'totalvotes': 1285584},
-    {'year': 2012, 'state': 'MISSOURI', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1482440, 'totalvotes': 2757323},
-    {'year': 2012, 'state': 'MISSOURI', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1223796, 'totalvotes': 2757323},
-    {'year': 2012, 'state': 'MISSOURI', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 43151, 'totalvotes': 2757323},
-    {'year': 2012, 'state': 'MISSOURI', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 7936, 'totalvotes': 2757323},
-    {'year': 2012, 'state': 'MONTANA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 267928, 'totalvotes': 484048},
-    {'year': 2012, 'state': 'MONTANA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 201839, 'totalvotes': 484048},
-    {'year': 2012, 'state': 'MONTANA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 14165, 'totalvotes': 484048},
-    {'year': 2012, 'state': 'MONTANA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 116, 'totalvotes': 484048},
-    {'year': 2012, 'state': 'NEBRASKA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 475064, 'totalvotes': 794379},
-    {'year': 2012, 'state': 'NEBRASKA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 302081, 'totalvotes': 794379},
-    {'year': 2012, 'state': 'NEBRASKA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11109, 'totalvotes': 794379},
-    {'year': 2012, 'state': 'NEBRASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 3717, 'totalvotes': 794379},
-    {'year': 2012, 'state': 'NEBRASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'NOMINATED BY PETITION', 'candidatevotes': 2408, 'totalvotes': 794379},
-    {'year': 2012, 'state': 'NEVADA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 531373, 'totalvotes': 1014918},
-    {'year': 2012, 'state': 'NEVADA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 463567, 'totalvotes': 1014918},
-    {'year': 2012, 'state': 'NEVADA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 10968, 'totalvotes': 1014918},
-    {'year': 2012, 'state': 'NEVADA', 'candidate': 'NONE OF THESE CANDIDATES', 'party_detailed': 'OTHER', 'candidatevotes': 5770, 'totalvotes': 1014918},
-    {'year': 2012, 'state': 'NEVADA', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'INDEPENDENT AMERICAN', 'candidatevotes': 3240, 'totalvotes': 1014918},
-    {'year': 2012, 'state': 'NEW HAMPSHIRE', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 369561, 'totalvotes': 710972},
-    {'year': 2012, 'state': 'NEW HAMPSHIRE', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 329918, 'totalvotes': 710972},
-    {'year': 2012, 'state': 'NEW HAMPSHIRE', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8212, 'totalvotes': 710972},
-    {'year': 2012, 'state': 'NEW HAMPSHIRE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1698, 'totalvotes': 710972},
-    {'year': 2012, 'state': 'NEW HAMPSHIRE', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 875, 'totalvotes': 710972},
-    {'year': 2012, 'state': 'NEW HAMPSHIRE', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 708, 'totalvotes': 710972},
-    {'year': 2012, 'state': 'NEW JERSEY', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2122786, 'totalvotes': 3638499},
-    {'year': 2012, 'state': 'NEW JERSEY', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1478088, 'totalvotes': 3638499},
-    {'year': 2012, 'state': 'NEW JERSEY', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 21035, 'totalvotes': 3638499},
-    {'year': 2012, 'state': 'NEW JERSEY', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 9886, 'totalvotes': 3638499},
-    {'year': 2012, 'state': 'NEW JERSEY', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2063, 'totalvotes': 3638499},
-    {'year': 2012, 'state': 'NEW JERSEY', 'candidate': 'ANDERSON, ROSS CARL ""ROCKY""', 'party_detailed': 'JUSTICE', 'candidatevotes': 1723, 'totalvotes': 3638499},
-    {'year': 2012, 'state': 'NEW JERSEY', 'candidate': 'BOSS, JEFFERY', 'party_detailed': 'NSA DID 911', 'candidatevotes': 1024, 'totalvotes': 3638499},
-    {'year': 2012, 'state': 'NEW JERSEY', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 709, 'totalvotes': 3638499},
-    {'year': 2012, 'state': 'NEW JERSEY', 'candidate': 'MILLER, MERLIN', 'party_detailed': 'AMERICAN THIRD POSITION', 'candidatevotes': 664, 'totalvotes': 3638499},
-    {'year': 2012, 'state': 'NEW JERSEY', 'candidate': 'LINDSAY, PETA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 521, 'totalvotes': 3638499},
-    {'year': 2012, 'state': 'NEW MEXICO', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 415335, 'totalvotes': 783758},
-    {'year': 2012, 'state': 'NEW MEXICO', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 335788, 'totalvotes': 783758},
-    {'year': 2012, 'state': 'NEW MEXICO', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 27788, 'totalvotes': 783758},
-    {'year': 2012, 'state': 'NEW MEXICO', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 2691, 'totalvotes': 783758},
-    {'year': 2012, 'state': 'NEW MEXICO', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'NEW MEXICO INDEPENDENT PARTY', 'candidatevotes': 1174, 'totalvotes': 783758},
-    {'year': 2012, 'state': 'NEW MEXICO', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 982, 'totalvotes': 783758},
-    {'year': 2012, 'state': 'NEW YORK', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 4324228, 'totalvotes': 7116784},
-    {'year': 2012, 'state': 'NEW YORK', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2223397, 'totalvotes': 7116784},
-    {'year': 2012, 'state': 'NEW YORK', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 262035, 'totalvotes': 7116784},
-    {'year': 2012, 'state': 'NEW YORK', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'WORKING FAMILIES', 'candidatevotes': 147643, 'totalvotes': 7116784},
-    {'year': 2012, 'state': 'NEW YORK', 'candidate': 'BLANK VOTE/VOID VOTE/SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 63881, 'totalvotes': 7116784},
-    {'year': 2012, 'state': 'NEW YORK', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 47092, 'totalvotes': 7116784},
-    {'year': 2012, 'state': 'NEW YORK', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 39856, 'totalvotes': 7116784},
-    {'year': 2012, 'state': 'NEW YORK', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 6270, 'totalvotes': 7116784},
-    {'year': 2012, 'state': 'NEW YORK', 'candidate': 'LINDSAY, PETA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 2039, 'totalvotes': 7116784},
-    {'year': 2012, 'state': 'NEW YORK', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 343, 'totalvotes': 7116784},
-    {'year': 2012, 'state': 'NORTH CAROLINA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2270395, 'totalvotes': 4505372},
-    {'year': 2012, 'state': 'NORTH CAROLINA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2178391, 'totalvotes': 4505372},
-    {'year': 2012, 'state': 'NORTH CAROLINA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 44515, 'totalvotes': 4505372},
-    {'year': 2012, 'state': 'NORTH CAROLINA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 12071, 'totalvotes': 4505372},
-    {'year': 2012, 'state': 'NORTH DAKOTA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 188320, 'totalvotes': 322932},
-    {'year': 2012, 'state': 'NORTH DAKOTA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 124966, 'totalvotes': 322932},
-    {'year': 2012, 'state': 'NORTH DAKOTA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5238, 'totalvotes': 322932},
-    {'year': 2012, 'state': 'NORTH DAKOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1860, 'totalvotes': 322932},
-    {'year': 2012, 'state': 'NORTH DAKOTA', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1186, 'totalvotes': 322932},
-    {'year': 2012, 'state': 'NORTH DAKOTA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 1362, 'totalvotes': 322932},
-    {'year': 2012, 'state': 'OHIO', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2827621, 'totalvotes': 5580822},
-    {'year': 2012, 'state': 'OHIO', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2661407, 'totalvotes': 5580822},
-    {'year': 2012, 'state': 'OHIO', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 49493, 'totalvotes': 5580822},
-    {'year': 2012, 'state': 'OHIO', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 18574, 'totalvotes': 5580822},
-    {'year': 2012, 'state': 'OHIO', 'candidate': 'DUNCAN, RICHARD', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 12502, 'totalvotes': 5580822},
-    {'year': 2012, 'state': 'OHIO', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 8151, 'totalvotes': 5580822},
-    {'year': 2012, 'state': 'OHIO', 'candidate': 'ALEXANDER, STEWART', 'party_detailed': 'SOCIALIST', 'candidatevotes': 2967, 'totalvotes': 5580822},
-    {'year': 2012, 'state': 'OHIO', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 107, 'totalvotes': 5580822},
-    {'year': 2012, 'state': 'OKLAHOMA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 891325, 'totalvotes': 1334872},
-    {'year': 2012, 'state': 'OKLAHOMA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 443547, 'totalvotes': 1334872},
-    {'year': 2012, 'state': 'OREGON', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 970488, 'totalvotes': 1789270},
-    {'year': 2012, 'state': 'OREGON', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 754175, 'totalvotes': 1789270},
-    {'year': 2012, 'state': 'OREGON', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 24089, 'totalvotes': 1789270},
-    {'year': 2012, 'state': 'OREGON', 'candidate': 'STEIN, JILL', 'party_detailed': 'PACIFIC GREEN', 'candidatevotes': 19427, 'totalvotes': 1789270},
-    {'year': 2012, 'state': 'OREGON', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 13275, 'totalvotes': 1789270},
-    {'year': 2012, 'state': 'OREGON', 'candidate': 'CHRISTENSEN, WILL', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 4432, 'totalvotes': 1789270},
-    {'year': 2012, 'state': 'OREGON', 'candidate': 'ANDERSON, ROSS CARL ""ROCKY""', 'party_detailed': 'PROGRESSIVE', 'candidatevotes': 3384, 'totalvotes': 1789270},
-    {'year': 2012, 'state': 'PENNSYLVANIA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2990274, 'totalvotes': 5742040},
-    {'year': 2012, 'state': 'PENNSYLVANIA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2680434, 'totalvotes': 5742040},
-    {'year': 2012, 'state': 'PENNSYLVANIA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 49991, 'totalvotes': 5742040},
-    {'year': 2012, 'state': 'PENNSYLVANIA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 21341, 'totalvotes': 5742040},
-    {'year': 2012, 'state': 'RHODE ISLAND', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 279677, 'totalvotes': 446049},
-    {'year': 2012, 'state': 'RHODE ISLAND', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 157204, 'totalvotes': 446049},
-    {'year': 2012, 'state': 'RHODE ISLAND', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4388, 'totalvotes': 446049},
-    {'year': 2012, 'state': 'RHODE ISLAND', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 2421, 'totalvotes': 446049},
-    {'year': 2012, 'state': 'RHODE ISLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1381, 'totalvotes': 446049},
-    {'year': 2012, 'state': 'RHODE ISLAND', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 430, 'totalvotes': 446049},
-    {'year': 2012, 'state': 'RHODE ISLAND', 'candidate': 'ANDERSON, ROSS CARL ""ROCKY""', 'party_detailed': 'JUSTICE', 'candidatevotes': 416, 'totalvotes': 446049},
-    {'year': 2012, 'state': 'RHODE ISLAND', 'candidate': 'LINDSAY, PETA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 132, 'totalvotes': 446049},
-    {'year': 2012, 'state': 'SOUTH CAROLINA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1071645, 'totalvotes': 1964118},
-    {'year': 2012, 'state': 'SOUTH CAROLINA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 865941, 'totalvotes': 1964118},
-    {'year': 2012, 'state': 'SOUTH CAROLINA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 16321, 'totalvotes': 1964118},
-    {'year': 2012, 'state': 'SOUTH CAROLINA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 5446, 'totalvotes': 1964118},
-    {'year': 2012, 'state': 'SOUTH CAROLINA', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 4765, 'totalvotes': 1964118},
-    {'year': 2012, 'state': 'SOUTH DAKOTA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 210610, 'totalvotes': 363815},
-    {'year': 2012, 'state': 'SOUTH DAKOTA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 145039, 'totalvotes': 363815},
-    {'year': 2012, 'state': 'SOUTH DAKOTA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5795, 'totalvotes': 363815},
-    {'year': 2012, 'state': 'SOUTH DAKOTA', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2371, 'totalvotes': 363815},
-    {'year': 2012, 'state': 'TENNESSEE', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1462330, 'totalvotes': 2458577},
-    {'year': 2012, 'state': 'TENNESSEE', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 960709, 'totalvotes': 2458577},
-    {'year': 2012, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 23001, 'totalvotes': 2458577},
-    {'year': 2012, 'state': 'TENNESSEE', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 6515, 'totalvotes': 2458577},
-    {'year': 2012, 'state': 'TENNESSEE', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 6022, 'totalvotes': 2458577},
-    {'year': 2012, 'state': 'TEXAS', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 4569843, 'totalvotes': 7993851},
-    {'year': 2012, 'state': 'TEXAS', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3308124, 'totalvotes': 7993851},
-    {'year': 2012, 'state': 'TEXAS', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 88580, 'totalvotes': 7993851},
-    {'year': 2012, 'state': 'TEXAS', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 24657, 'totalvotes': 7993851},
-    {'year': 2012, 'state': 'TEXAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2647, 'totalvotes': 7993851},
-    {'year': 2012, 'state': 'UTAH', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 740600, 'totalvotes': 1017440},
-    {'year': 2012, 'state': 'UTAH', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 251813, 'totalvotes': 1017440},
-    {'year': 2012, 'state': 'UTAH', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12572, 'totalvotes': 1017440},
-    {'year': 2012, 'state': 'UTAH', 'candidate': 'ANDERSON, ROSS CARL ""ROCKY""', 'party_detailed': 'JUSTICE', 'candidatevotes': 5335, 'totalvotes': 1017440},
-    {'year': 2012, 'state': 'UTAH', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 3817, 'totalvotes': 1017440},
-    {'year': 2012, 'state': 'UTAH', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2871, 'totalvotes': 1017440},
-    {'year': 2012, 'state': 'UTAH', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'NO PARTY AFFILIATION', 'candidatevotes': 393, 'totalvotes': 1017440},
-    {'year': 2012, 'state': 'UTAH', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 39, 'totalvotes': 1017440},
-    {'year': 2012, 'state': 'VERMONT', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 199239, 'totalvotes': 299290},
-    {'year': 2012, 'state': 'VERMONT', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 92698, 'totalvotes': 299290},
-    {'year': 2012, 'state': 'VERMONT', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3487, 'totalvotes': 299290},
-    {'year': 2012, 'state': 'VERMONT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2043, 'totalvotes': 299290},
-    {'year': 2012, 'state': 'VERMONT', 'candidate': 'ANDERSON, ROSS CARL ""ROCKY""', 'party_detailed': 'JUSTICE', 'candidatevotes': 1128, 'totalvotes': 299290},
-    {'year': 2012, 'state': 'VERMONT', 'candidate': 'LINDSAY, PETA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 695, 'totalvotes': 299290},
-    {'year': 2012, 'state': 'VIRGINIA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1971820, 'totalvotes': 3854489},
-    {'year': 2012, 'state': 'VIRGINIA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1822522, 'totalvotes': 3854489},
-    {'year': 2012, 'state': 'VIRGINIA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 31216, 'totalvotes': 3854489},
-    {'year': 2012, 'state': 'VIRGINIA', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 13058, 'totalvotes': 3854489},
-    {'year': 2012, 'state': 'VIRGINIA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 8627, 'totalvotes': 3854489},
-    {'year': 2012, 'state': 'VIRGINIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 7246, 'totalvotes': 3854489},
-    {'year': 2012, 'state': 'WASHINGTON', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1755396, 'totalvotes': 3125516},
-    {'year': 2012, 'state': 'WASHINGTON', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1290670, 'totalvotes': 3125516},
-    {'year': 2012, 'state': 'WASHINGTON', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 42202, 'totalvotes': 3125516},
-    {'year': 2012, 'state': 'WASHINGTON', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 20928, 'totalvotes': 3125516},
-    {'year': 2012, 'state': 'WASHINGTON', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 8851, 'totalvotes': 3125516},
-    {'year': 2012, 'state': 'WASHINGTON', 'candidate': 'ANDERSON, ROSS CARL ""ROCKY""', 'party_detailed': 'JUSTICE', 'candidatevotes': 4946, 'totalvotes': 3125516},
-    {'year': 2012, 'state': 'WASHINGTON', 'candidate': 'LINDSAY, PETA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 1318, 'totalvotes': 3125516},
-    {'year': 2012, 'state': 'WASHINGTON', 'candidate': 'HARRIS, JAMES', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1205, 'totalvotes': 3125516},
-    {'year': 2012, 'state': 'WEST VIRGINIA', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 417655, 'totalvotes': 670438},
-    {'year': 2012, 'state': 'WEST VIRGINIA', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 238269, 'totalvotes': 670438},
-    {'year': 2012, 'state': 'WEST VIRGINIA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 6302, 'totalvotes': 670438},
-    {'year': 2012, 'state': 'WEST VIRGINIA', 'candidate': 'STEIN, JILL', 'party_detailed': 'MOUNTAIN PARTY', 'candidatevotes': 4406, 'totalvotes': 670438},
-    {'year': 2012, 'state': 'WEST VIRGINIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'NO PARTY AFFILIATION', 'candidatevotes': 3806, 'totalvotes': 670438},
-    {'year': 2012, 'state': 'WISCONSIN', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1620985, 'totalvotes': 3071434},
-    {'year': 2012, 'state': 'WISCONSIN', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1410966, 'totalvotes': 3071434},
-    {'year': 2012, 'state': 'WISCONSIN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 29383, 'totalvotes': 3071434},
-    {'year': 2012, 'state': 'WISCONSIN', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 5170, 'totalvotes': 3071434},
-    {'year': 2012, 'state': 'WISCONSIN', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 4930, 'totalvotes': 3071434},
-    {'year': 2012, 'state': 'WYOMING', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 170962, 'totalvotes': 250701},
-    {'year': 2012, 'state': 'WYOMING', 'candidate': 'OBAMA, BARACK H.', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 69286, 'totalvotes': 250701},
-    {'year': 2012, 'state': 'WYOMING', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5326, 'totalvotes': 250701},
-    {'year': 2012, 'state': 'WYOMING', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2035, 'totalvotes': 250701},
-    {'year': 2012, 'state': 'WYOMING', 'candidate': 'GOODE, VIRGIL HAMLIN, JR.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1452, 'totalvotes': 250701},
-    {'year': 2012, 'state': 'WYOMING', 'candidate': 'BLANK VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 1367, 'totalvotes': 250701},
-    {'year': 2012, 'state': 'WYOMING', 'candidate': 'OVER VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 273, 'totalvotes': 250701},
-    {'year': 2016, 'state': 'ALABAMA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1318255, 'totalvotes': 2123372},
-    {'year': 2016, 'state': 'ALABAMA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 729547, 'totalvotes': 2123372},
-    {'year': 2016, 'state': 'ALABAMA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 44467, 'totalvotes': 2123372},
-    {'year': 2016, 'state': 'ALABAMA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 21712, 'totalvotes': 2123372},
-    {'year': 2016, 'state': 'ALABAMA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 9391, 'totalvotes': 2123372},
-    {'year': 2016, 'state': 'ALASKA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 163387, 'totalvotes': 318608},
-    {'year': 2016, 'state': 'ALASKA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 116454, 'totalvotes': 318608},
-    {'year': 2016, 'state': 'ALASKA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 18725, 'totalvotes': 318608},
-    {'year': 2016, 'state': 'ALASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 9201, 'totalvotes': 318608},
-    {'year': 2016, 'state': 'ALASKA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 5735, 'totalvotes': 318608},
-    {'year': 2016, 'state': 'ALASKA', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3866, 'totalvotes': 318608},
-    {'year': 2016, 'state': 'ALASKA', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'NO PARTY AFFILIATION', 'candidatevotes': 1240, 'totalvotes': 318608},
-    {'year': 2016, 'state': 'ARIZONA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1252401, 'totalvotes': 2573165},
-    {'year': 2016, 'state': 'ARIZONA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1161167, 'totalvotes': 2573165},
-    {'year': 2016, 'state': 'ARIZONA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 106327, 'totalvotes': 2573165},
-    {'year': 2016, 'state': 'ARIZONA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 34345, 'totalvotes': 2573165},
-    {'year': 2016, 'state': 'ARIZONA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 17473, 'totalvotes': 2573165},
-    {'year': 2016, 'state': 'ARIZONA', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1058, 'totalvotes': 2573165},
-    {'year': 2016, 'state': 'ARIZONA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'NO PARTY AFFILIATION', 'candidatevotes': 311, 'totalvotes': 2573165},
-    {'year': 2016, 'state': 'ARIZONA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 42, 'totalvotes': 2573165},
-    {'year': 2016, 'state': 'ARIZONA', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'AMERICAN DELTA PARTY', 'candidatevotes': 29, 'totalvotes': 2573165},
-    {'year': 2016, 'state': 'ARIZONA', 'candidate': 'TITTLE, SHEILA ""SAMM""', 'party_detailed': 'WE THE PEOPLE', 'candidatevotes': 12, 'totalvotes': 2573165},
-    {'year': 2016, 'state': 'ARKANSAS', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 684872, 'totalvotes': 1130635},
-    {'year': 2016, 'state': 'ARKANSAS', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 380494, 'totalvotes': 1130635},
-    {'year': 2016, 'state': 'ARKANSAS', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 29829, 'totalvotes': 1130635},
-    {'year': 2016, 'state': 'ARKANSAS', 'candidate': 'MCMULLIN, EVAN', 'party_detailed': 'BETTER FOR AMERICA', 'candidatevotes': 13255, 'totalvotes': 1130635},
-    {'year': 2016, 'state': 'ARKANSAS', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 9473, 'totalvotes': 1130635},
-    {'year': 2016, 'state': 'ARKANSAS', 'candidate': 'HEDGES, JIM', 'party_detailed': 'PROHIBITION', 'candidatevotes': 4709, 'totalvotes': 1130635},
-    {'year': 2016, 'state': 'ARKANSAS', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 4613, 'totalvotes': 1130635},
-    {'year': 2016, 'state': 'ARKANSAS', 'candidate': 'KAHN, LYNN S.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3390, 'totalvotes': 1130635},
-    {'year': 2016, 'state': 'CALIFORNIA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 8753788, 'totalvotes': 14181595},
-    {'year': 2016, 'state': 'CALIFORNIA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 4483810, 'totalvotes': 14181595},
-    {'year': 2016, 'state': 'CALIFORNIA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 478500, 'totalvotes': 14181595},
-    {'year': 2016, 'state': 'CALIFORNIA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 278657, 'totalvotes': 14181595},
-    {'year': 2016, 'state': 'CALIFORNIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 120739, 'totalvotes': 14181595},
-    {'year': 2016, 'state': 'CALIFORNIA', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 66101, 'totalvotes': 14181595},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1338870, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1202484, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 144121, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 38437, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'SCATTERING', 'party_detailed': 'UNAFFILIATED', 'candidatevotes': 31485, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'AMERICAN CONSTITUTION PARTY', 'candidatevotes': 11699, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'KENISTON, CHRIS', 'party_detailed': 'VETERANS PARTY OF AMERICA', 'candidatevotes': 5028, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'AMERICAN DELTA PARTY', 'candidatevotes': 1255, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'KOPITKE, KYLE KENLEY', 'party_detailed': 'INDEPENDENT AMERICAN', 'candidatevotes': 1096, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'MALDONADO, JOSEPH ALLEN', 'party_detailed': 'INDEPENDENT PEOPLE OF COLORADO', 'candidatevotes': 872, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'MATUREN, MICHAEL A.', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 862, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'SILVA, ROD', 'party_detailed': 'NUTRITION PARTY', 'candidatevotes': 751, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'HOEFLING, TOM', 'party_detailed': "AMERICA'S PARTY", 'candidatevotes': 710, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 531, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'KENNEDY, ALYSON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 452, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'KOTLIKOFF, LAURENCE', 'party_detailed': 'KOTLIKOFF FOR PRESIDENT', 'candidatevotes': 392, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'LYTTLE, BRADFORD', 'party_detailed': 'NONVIOLENT RESISTANCE/PACIFIST', 'candidatevotes': 382, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'ATWOOD, FRANK', 'party_detailed': 'APPROVAL VOTING PARTY', 'candidatevotes': 337, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'EMIDIO ""MIMI"", SOLTYSIK', 'party_detailed': 'SOCIALIST PARTY USA', 'candidatevotes': 271, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'COLORADO', 'candidate': 'HEDGES, JAMES', 'party_detailed': 'PROHIBITION', 'candidatevotes': 185, 'totalvotes': 2780220},
-    {'year': 2016, 'state': 'CONNECTICUT', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 897572, 'totalvotes': 1644920},
-    {'year': 2016, 'state': 'CONNECTICUT', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 673215, 'totalvotes': 1644920},
-    {'year': 2016, 'state': 'CONNECTICUT', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 48676, 'totalvotes': 1644920},
-    {'year': 2016, 'state': 'CONNECTICUT', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 22841, 'totalvotes': 1644920},
-    {'year': 2016, 'state': 'CONNECTICUT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2616, 'totalvotes': 1644920},
-    {'year': 2016, 'state': 'DELAWARE', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 235603, 'totalvotes': 441590},
-    {'year': 2016, 'state': 'DELAWARE', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 185127, 'totalvotes': 441590},
-    {'year': 2016, 'state': 'DELAWARE', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 14757, 'totalvotes': 441590},
-    {'year': 2016, 'state': 'DELAWARE', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 6103, 'totalvotes': 441590},
-    {'year': 2016, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 282830, 'totalvotes': 312575},
-    {'year': 2016, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 12723, 'totalvotes': 312575},
-    {'year': 2016, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 6551, 'totalvotes': 312575},
-    {'year': 2016, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 4906, 'totalvotes': 312575},
-    {'year': 2016, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 4258, 'totalvotes': 312575},
-    {'year': 2016, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'BLANK VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 1064, 'totalvotes': 312575},
-    {'year': 2016, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'OVER VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 243, 'totalvotes': 312575},
-    {'year': 2016, 'state': 'FLORIDA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 4617886, 'totalvotes': 9420039},
-    {'year': 2016, 'state': 'FLORIDA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 4504975, 'totalvotes': 9420039},
-    {'year': 2016, 'state': 'FLORIDA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 207043, 'totalvotes': 9420039},
-    {'year': 2016, 'state': 'FLORIDA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 64399, 'totalvotes': 9420039},
-    {'year': 2016, 'state': 'FLORIDA', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 16475, 'totalvotes': 9420039},
-    {'year': 2016, 'state': 'FLORIDA', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'REFORM PARTY', 'candidatevotes': 9108, 'totalvotes': 9420039},
-    {'year': 2016, 'state': 'FLORIDA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 153, 'totalvotes': 9420039},
-    {'year': 2016, 'state': 'GEORGIA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2089104, 'totalvotes': 4114732},
-    {'year': 2016, 'state': 'GEORGIA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1877963, 'totalvotes': 4114732},
-    {'year': 2016, 'state': 'GEORGIA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 125306, 'totalvotes': 4114732},
-    {'year': 2016, 'state': 'GEORGIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 22359, 'totalvotes': 4114732},
-    {'year': 2016, 'state': 'HAWAII', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 266891, 'totalvotes': 437664},
-    {'year': 2016, 'state': 'HAWAII', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 128847, 'totalvotes': 437664},
-    {'year': 2016, 'state': 'HAWAII', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 15954, 'totalvotes': 437664},
-    {'year': 2016, 'state': 'HAWAII', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 12737, 'totalvotes': 437664},
-    {'year': 2016, 'state': 'HAWAII', 'candidate': 'BLANK VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 8289, 'totalvotes': 437664},
-    {'year': 2016, 'state': 'HAWAII', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 4508, 'totalvotes': 437664},
-    {'year': 2016, 'state': 'HAWAII', 'candidate': 'OVER VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 438, 'totalvotes': 437664},
-    {'year': 2016, 'state': 'IDAHO', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 409055, 'totalvotes': 690255},
-    {'year': 2016, 'state': 'IDAHO', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 189765, 'totalvotes': 690255},
-    {'year': 2016, 'state': 'IDAHO', 'candidate': 'MCMULLIN, EVAN', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 60748, 'totalvotes': 690255},
-    {'year': 2016, 'state': 'IDAHO', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 28331, 'totalvotes': 690255},
-    {'year': 2016, 'state': 'IDAHO', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2356, 'totalvotes': 690255},
-    {'year': 2016, 'state': 'ILLINOIS', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3090729, 'totalvotes': 5536424},
-    {'year': 2016, 'state': 'ILLINOIS', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2146015, 'totalvotes': 5536424},
-    {'year': 2016, 'state': 'ILLINOIS', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 209596, 'totalvotes': 5536424},
-    {'year': 2016, 'state': 'ILLINOIS', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 76802, 'totalvotes': 5536424},
-    {'year': 2016, 'state': 'ILLINOIS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 13282, 'totalvotes': 5536424},
-    {'year': 2016, 'state': 'INDIANA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1557286, 'totalvotes': 2734958},
-    {'year': 2016, 'state': 'INDIANA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1033126, 'totalvotes': 2734958},
-    {'year': 2016, 'state': 'INDIANA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 133993, 'totalvotes': 2734958},
-    {'year': 2016, 'state': 'INDIANA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'GREEN', 'candidatevotes': 7841, 'totalvotes': 2734958},
-    {'year': 2016, 'state': 'INDIANA', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1937, 'totalvotes': 2734958},
-    {'year': 2016, 'state': 'INDIANA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 718, 'totalvotes': 2734958},
-    {'year': 2016, 'state': 'INDIANA', 'candidate': 'EMIDIO ""MIMI"", SOLTYSIK', 'party_detailed': 'SOCIALIST PARTY USA', 'candidatevotes': 57, 'totalvotes': 2734958},
-    {'year': 2016, 'state': 'IOWA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 800983, 'totalvotes': 1565580},
-    {'year': 2016, 'state': 'IOWA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 653669, 'totalvotes': 1565580},
-    {'year': 2016, 'state': 'IOWA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 59186, 'totalvotes': 1565580},
-    {'year': 2016, 'state': 'IOWA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 17746, 'totalvotes': 1565580},
-    {'year': 2016, 'state': 'IOWA', 'candidate': 'MCMULLIN, EVAN', 'party_detailed': 'NOMINATED BY PETITION', 'candidatevotes': 12366, 'totalvotes': 1565580},
-    {'year': 2016, 'state': 'IOWA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 11479, 'totalvotes': 1565580},
-    {'year': 2016, 'state': 'IOWA', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 5335, 'totalvotes': 1565580},
-    {'year': 2016, 'state': 'IOWA', 'candidate': 'KAHN, LYNN S.', 'party_detailed': 'NEW INDEPENDENT PARTY IOWA', 'candidatevotes': 2247, 'totalvotes': 1565580},
-    {'year': 2016, 'state': 'IOWA', 'candidate': 'VACEK, DAN', 'party_detailed': 'LEGAL MARIJUANA NOW', 'candidatevotes': 2246, 'totalvotes': 1565580},
-    {'year': 2016, 'state': 'IOWA', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 323, 'totalvotes': 1565580},
-    {'year': 2016, 'state': 'KANSAS', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 671018, 'totalvotes': 1184402},
-    {'year': 2016, 'state': 'KANSAS', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 427005, 'totalvotes': 1184402},
-    {'year': 2016, 'state': 'KANSAS', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 55406, 'totalvotes': 1184402},
-    {'year': 2016, 'state': 'KANSAS', 'candidate': 'STEIN, JILL', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 23506, 'totalvotes': 1184402},
-    {'year': 2016, 'state': 'KANSAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 7467, 'totalvotes': 1184402},
-    {'year': 2016, 'state': 'KENTUCKY', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1202971, 'totalvotes': 1924149},
-    {'year': 2016, 'state': 'KENTUCKY', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 628854, 'totalvotes': 1924149},
-    {'year': 2016, 'state': 'KENTUCKY', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 53752, 'totalvotes': 1924149},
-    {'year': 2016, 'state': 'KENTUCKY', 'candidate': 'MCMULLIN, EVAN', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 22780, 'totalvotes': 1924149},
-    {'year': 2016, 'state': 'KENTUCKY', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 13913, 'totalvotes': 1924149},
-    {'year': 2016, 'state': 'KENTUCKY', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'AMERICAN DELTA PARTY', 'candidatevotes': 1128, 'totalvotes': 1924149},
-    {'year': 2016, 'state': 'KENTUCKY', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 751, 'totalvotes': 1924149},
-    {'year': 2016, 'state': 'LOUISIANA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1178638, 'totalvotes': 2029032},
-    {'year': 2016, 'state': 'LOUISIANA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 780154, 'totalvotes': 2029032},
-    {'year': 2016, 'state': 'LOUISIANA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 37978, 'totalvotes': 2029032},
-    {'year': 2016, 'state': 'LOUISIANA', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 18231, 'totalvotes': 2029032},
-    {'year': 2016, 'state': 'LOUISIANA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 14031, 'totalvotes': 2029032},
-    {'year': 2016, 'state': 'MAINE', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 357735, 'totalvotes': 771892},
-    {'year': 2016, 'state': 'MAINE', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 335593, 'totalvotes': 771892},
-    {'year': 2016, 'state': 'MAINE', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 38105, 'totalvotes': 771892},
-    {'year': 2016, 'state': 'MAINE', 'candidate': 'BLANK VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 23965, 'totalvotes': 771892},
-    {'year': 2016, 'state': 'MAINE', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 14251, 'totalvotes': 771892},
-    {'year': 2016, 'state': 'MAINE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'UNENROLLED', 'candidatevotes': 2243, 'totalvotes': 771892},
-    {'year': 2016, 'state': 'MARYLAND', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1677928, 'totalvotes': 2781446},
-    {'year': 2016, 'state': 'MARYLAND', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 943169, 'totalvotes': 2781446},
-    {'year': 2016, 'state': 'MARYLAND', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 79605, 'totalvotes': 2781446},
-    {'year': 2016, 'state': 'MARYLAND', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 35945, 'totalvotes': 2781446},
-    {'year': 2016, 'state': 'MARYLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 33263, 'totalvotes': 2781446},
-    {'year': 2016, 'state': 'MARYLAND', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 10921, 'totalvotes': 2781446},
-    {'year': 2016, 'state': 'MARYLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'NO PARTY AFFILIATION', 'candidatevotes': 278, 'totalvotes': 2781446},
-    {'year': 2016, 'state': 'MARYLAND', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 259, 'totalvotes': 2781446},
-    {'year': 2016, 'state': 'MARYLAND', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 78, 'totalvotes': 2781446},
-    {'year': 2016, 'state': 'MASSACHUSETTS', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1995196, 'totalvotes': 3378821},
-    {'year': 2016, 'state': 'MASSACHUSETTS', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1090893, 'totalvotes': 3378821},
-    {'year': 2016, 'state': 'MASSACHUSETTS', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 138018, 'totalvotes': 3378821},
-    {'year': 2016, 'state': 'MASSACHUSETTS', 'candidate': 'BLANK VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 53775, 'totalvotes': 3378821},
-    {'year': 2016, 'state': 'MASSACHUSETTS', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 50488, 'totalvotes': 3378821},
-    {'year': 2016, 'state': 'MASSACHUSETTS', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 47661, 'totalvotes': 3378821},
-    {'year': 2016, 'state': 'MASSACHUSETTS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2790, 'totalvotes': 3378821},
-    {'year': 2016, 'state': 'MICHIGAN', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2279543, 'totalvotes': 4799284},
-    {'year': 2016, 'state': 'MICHIGAN', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2268839, 'totalvotes': 4799284},
-    {'year': 2016, 'state': 'MICHIGAN', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 172136, 'totalvotes': 4799284},
-    {'year': 2016, 'state': 'MICHIGAN', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 51463, 'totalvotes': 4799284},
-    {'year': 2016, 'state': 'MICHIGAN', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'U.S. TAXPAYERS PARTY', 'candidatevotes': 16139, 'totalvotes': 4799284},
-    {'year': 2016, 'state': 'MICHIGAN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 8955, 'totalvotes': 4799284},
-    {'year': 2016, 'state': 'MICHIGAN', 'candidate': 'EMIDIO ""MIMI"", SOLTYSIK', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2209, 'totalvotes': 4799284},
-    {'year': 2016, 'state': 'MINNESOTA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1367705, 'totalvotes': 2944782},
-    {'year': 2016, 'state': 'MINNESOTA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1322949, 'totalvotes': 2944782},
-    {'year': 2016, 'state': 'MINNESOTA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 112972, 'totalvotes': 2944782},
-    {'year': 2016, 'state': 'MINNESOTA', 'candidate': 'MCMULLIN, EVAN', 'party_detailed': 'INDEPENDENCE', 'candidatevotes': 53075, 'totalvotes': 2944782},
-    {'year': 2016, 'state': 'MINNESOTA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 36986, 'totalvotes': 2944782},
-    {'year': 2016, 'state': 'MINNESOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 27247, 'totalvotes': 2944782},
-    {'year': 2016, 'state': 'MINNESOTA', 'candidate': 'VACEK, DAN', 'party_detailed': 'LEGAL MARIJUANA NOW', 'candidatevotes': 11291, 'totalvotes': 2944782},
-    {'year': 2016, 'state': 'MINNESOTA', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 9456, 'totalvotes': 2944782},
-    {'year': 2016, 'state': 'MINNESOTA', 'candidate': 'KENNEDY, ALYSON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 1671, 'totalvotes': 2944782},
-    {'year': 2016, 'state': 'MINNESOTA', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'AMERICAN DELTA PARTY', 'candidatevotes': 1430, 'totalvotes': 2944782},
-    {'year': 2016, 'state': 'MISSISSIPPI', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 700714, 'totalvotes': 1209357},
-    {'year': 2016, 'state': 'MISSISSIPPI', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 485131, 'totalvotes': 1209357},
-    {'year': 2016, 'state': 'MISSISSIPPI', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 14435, 'totalvotes': 1209357},
-    {'year': 2016, 'state': 'MISSISSIPPI', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3987, 'totalvotes': 1209357},
-    {'year': 2016, 'state': 'MISSISSIPPI', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 3731, 'totalvotes': 1209357},
-    {'year': 2016, 'state': 'MISSISSIPPI', 'candidate': 'HEDGES, JAMES', 'party_detailed': 'PROHIBITION', 'candidatevotes': 715, 'totalvotes': 1209357},
-    {'year': 2016, 'state': 'MISSISSIPPI', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'AMERICAN DELTA PARTY', 'candidatevotes': 644, 'totalvotes': 1209357},
-    {'year': 2016, 'state': 'MISSOURI', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1594511, 'totalvotes': 2808605},
-    {'year': 2016, 'state': 'MISSOURI', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1071068, 'totalvotes': 2808605},
-    {'year': 2016, 'state': 'MISSOURI', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 97359, 'totalvotes': 2808605},
-    {'year': 2016, 'state': 'MISSOURI', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 25419, 'totalvotes': 2808605},
-    {'year': 2016, 'state': 'MISSOURI', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 13092, 'totalvotes': 2808605},
-    {'year': 2016, 'state': 'MISSOURI', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 7156, 'totalvotes': 2808605},
-    {'year': 2016, 'state': 'MONTANA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 279240, 'totalvotes': 494526},
-    {'year': 2016, 'state': 'MONTANA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 177709, 'totalvotes': 494526},
-    {'year': 2016, 'state': 'MONTANA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 28037, 'totalvotes': 494526},
-    {'year': 2016, 'state': 'MONTANA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 7970, 'totalvotes': 494526},
-    {'year': 2016, 'state': 'MONTANA', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'AMERICAN DELTA PARTY', 'candidatevotes': 1570, 'totalvotes': 494526},
-    {'year': 2016, 'state': 'NEBRASKA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 495961, 'totalvotes': 844227},
-    {'year': 2016, 'state': 'NEBRASKA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 284494, 'totalvotes': 844227},
-    {'year': 2016, 'state': 'NEBRASKA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 38946, 'totalvotes': 844227},
-    {'year': 2016, 'state': 'NEBRASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 16051, 'totalvotes': 844227},
-    {'year': 2016, 'state': 'NEBRASKA', 'candidate': 'STEIN, JILL', 'party_detailed': 'NOMINATED BY PETITION', 'candidatevotes': 8775, 'totalvotes': 844227},
-    {'year': 2016, 'state': 'NEVADA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 539260, 'totalvotes': 1125385},
-    {'year': 2016, 'state': 'NEVADA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 512058, 'totalvotes': 1125385},
-    {'year': 2016, 'state': 'NEVADA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 37384, 'totalvotes': 1125385},
-    {'year': 2016, 'state': 'NEVADA', 'candidate': 'NONE OF THE ABOVE', 'party_detailed': 'OTHER', 'candidatevotes': 28863, 'totalvotes': 1125385},
-    {'year': 2016, 'state': 'NEVADA', 'candidate': 'KOPITKE, KYLE KENLEY', 'party_detailed': 'INDEPENDENT AMERICAN', 'candidatevotes': 5268, 'totalvotes': 1125385},
-    {'year': 2016, 'state': 'NEVADA', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'NO PARTY AFFILIATION', 'candidatevotes': 2552, 'totalvotes': 1125385},
-    {'year': 2016, 'state': 'NEW HAMPSHIRE', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 348526, 'totalvotes': 744296},
-    {'year': 2016, 'state': 'NEW HAMPSHIRE', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 345790, 'totalvotes': 744296},
-    {'year': 2016, 'state': 'NEW HAMPSHIRE', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 30777, 'totalvotes': 744296},
-    {'year': 2016, 'state': 'NEW HAMPSHIRE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 9618, 'totalvotes': 744296},
-    {'year': 2016, 'state': 'NEW HAMPSHIRE', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 6496, 'totalvotes': 744296},
-    {'year': 2016, 'state': 'NEW HAMPSHIRE', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 2411, 'totalvotes': 744296},
-    {'year': 2016, 'state': 'NEW HAMPSHIRE', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'AMERICAN DELTA PARTY', 'candidatevotes': 678, 'totalvotes': 744296},
-    {'year': 2016, 'state': 'NEW JERSEY', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2148278, 'totalvotes': 3874046},
-    {'year': 2016, 'state': 'NEW JERSEY', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1601933, 'totalvotes': 3874046},
-    {'year': 2016, 'state': 'NEW JERSEY', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 72477, 'totalvotes': 3874046},
-    {'year': 2016, 'state': 'NEW JERSEY', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 37772, 'totalvotes': 3874046},
-    {'year': 2016, 'state': 'NEW JERSEY', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 6161, 'totalvotes': 3874046},
-    {'year': 2016, 'state': 'NEW JERSEY', 'candidate': 'KENNEDY, ALYSON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 2156, 'totalvotes': 3874046},
-    {'year': 2016, 'state': 'NEW JERSEY', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'AMERICAN DELTA PARTY', 'candidatevotes': 1838, 'totalvotes': 3874046},
-    {'year': 2016, 'state': 'NEW JERSEY', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD PARTY', 'candidatevotes': 1749, 'totalvotes': 3874046},
-    {'year': 2016, 'state': 'NEW JERSEY', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 1682, 'totalvotes': 3874046},
-    {'year': 2016, 'state': 'NEW MEXICO', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 385234, 'totalvotes': 798319},
-    {'year': 2016, 'state': 'NEW MEXICO', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 319667, 'totalvotes': 798319},
-    {'year': 2016, 'state': 'NEW MEXICO', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 74541, 'totalvotes': 798319},
-    {'year': 2016, 'state': 'NEW MEXICO', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 9879, 'totalvotes': 798319},
-    {'year': 2016, 'state': 'NEW MEXICO', 'candidate': 'MCMULLIN, EVAN', 'party_detailed': 'BETTER FOR AMERICA', 'candidatevotes': 5825, 'totalvotes': 798319},
-    {'year': 2016, 'state': 'NEW MEXICO', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1514, 'totalvotes': 798319},
-    {'year': 2016, 'state': 'NEW MEXICO', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 1184, 'totalvotes': 798319},
-    {'year': 2016, 'state': 'NEW MEXICO', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'AMERICAN DELTA PARTY', 'candidatevotes': 475, 'totalvotes': 798319},
-    {'year': 2016, 'state': 'NEW YORK', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 4379789, 'totalvotes': 7802084},
-    {'year': 2016, 'state': 'NEW YORK', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2527142, 'totalvotes': 7802084},
-    {'year': 2016, 'state': 'NEW YORK', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'CONSERVATIVE', 'candidatevotes': 292392, 'totalvotes': 7802084},
-    {'year': 2016, 'state': 'NEW YORK', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'WORKING FAMILIES', 'candidatevotes': 140041, 'totalvotes': 7802084},
-    {'year': 2016, 'state': 'NEW YORK', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'INDEPENDENCE', 'candidatevotes': 119156, 'totalvotes': 7802084},
-    {'year': 2016, 'state': 'NEW YORK', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 107934, 'totalvotes': 7802084},
-    {'year': 2016, 'state': 'NEW YORK', 'candidate': 'BLANK VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 77179, 'totalvotes': 7802084},
-    {'year': 2016, 'state': 'NEW YORK', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 57442, 'totalvotes': 7802084},
-    {'year': 2016, 'state': 'NEW YORK', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 48447, 'totalvotes': 7802084},
-    {'year': 2016, 'state': 'NEW YORK', 'candidate': 'CLINTON, HILLARY', 'party_detailed': "WOMEN'S EQUALITY", 'candidatevotes': 36294, 'totalvotes': 7802084},
-    {'year': 2016, 'state': 'NEW YORK', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 12816, 'totalvotes': 7802084},
-    {'year': 2016, 'state': 'NEW YORK', 'candidate': 'VOID VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 3452, 'totalvotes': 7802084},
-    {'year': 2016, 'state': 'NORTH CAROLINA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2362631, 'totalvotes': 4741564},
-    {'year': 2016, 'state': 'NORTH CAROLINA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2189316, 'totalvotes': 4741564},
-    {'year': 2016, 'state': 'NORTH CAROLINA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 130126, 'totalvotes': 4741564},
-    {'year': 2016, 'state': 'NORTH CAROLINA', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 47386, 'totalvotes': 4741564},
-    {'year': 2016, 'state': 'NORTH CAROLINA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 12105, 'totalvotes': 4741564},
-    {'year': 2016, 'state': 'NORTH DAKOTA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 216794, 'totalvotes': 344360},
-    {'year': 2016, 'state': 'NORTH DAKOTA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 93758, 'totalvotes': 344360},
-    {'year': 2016, 'state': 'NORTH DAKOTA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 21434, 'totalvotes': 344360},
-    {'year': 2016, 'state': 'NORTH DAKOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 6397, 'totalvotes': 344360},
-    {'year': 2016, 'state': 'NORTH DAKOTA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 3780, 'totalvotes': 344360},
-    {'year': 2016, 'state': 'NORTH DAKOTA', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1833, 'totalvotes': 344360},
-    {'year': 2016, 'state': 'NORTH DAKOTA', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'AMERICAN DELTA PARTY', 'candidatevotes': 364, 'totalvotes': 344360},
-    {'year': 2016, 'state': 'OHIO', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2841005, 'totalvotes': 5496487},
-    {'year': 2016, 'state': 'OHIO', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2394164, 'totalvotes': 5496487},
-    {'year': 2016, 'state': 'OHIO', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'NO PARTY AFFILIATION', 'candidatevotes': 198733, 'totalvotes': 5496487},
-    {'year': 2016, 'state': 'OHIO', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 46271, 'totalvotes': 5496487},
-    {'year': 2016, 'state': 'OHIO', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 16314, 'totalvotes': 5496487},
-    {'year': 2016, 'state': 'OKLAHOMA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 949136, 'totalvotes': 1452992},
-    {'year': 2016, 'state': 'OKLAHOMA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 420375, 'totalvotes': 1452992},
-    {'year': 2016, 'state': 'OKLAHOMA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 83481, 'totalvotes': 1452992},
-    {'year': 2016, 'state': 'OREGON', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1002106, 'totalvotes': 2001336},
-    {'year': 2016, 'state': 'OREGON', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 782403, 'totalvotes': 2001336},
-    {'year': 2016, 'state': 'OREGON', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 94231, 'totalvotes': 2001336},
-    {'year': 2016, 'state': 'OREGON', 'candidate': 'OTHER', 'party_detailed': 'OTHER', 'candidatevotes': 72594, 'totalvotes': 2001336},
-    {'year': 2016, 'state': 'OREGON', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 50002, 'totalvotes': 2001336},
-    {'year': 2016, 'state': 'PENNSYLVANIA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2970733, 'totalvotes': 6115402},
-    {'year': 2016, 'state': 'PENNSYLVANIA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2926441, 'totalvotes': 6115402},
-    {'year': 2016, 'state': 'PENNSYLVANIA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 146715, 'totalvotes': 6115402},
-    {'year': 2016, 'state': 'PENNSYLVANIA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 49941, 'totalvotes': 6115402},
-    {'year': 2016, 'state': 'PENNSYLVANIA', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 21572, 'totalvotes': 6115402},
-    {'year': 2016, 'state': 'RHODE ISLAND', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 252525, 'totalvotes': 464144},
-    {'year': 2016, 'state': 'RHODE ISLAND', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 180543, 'totalvotes': 464144},
-    {'year': 2016, 'state': 'RHODE ISLAND', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 14746, 'totalvotes': 464144},
-    {'year': 2016, 'state': 'RHODE ISLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 9439, 'totalvotes': 464144},
-    {'year': 2016, 'state': 'RHODE ISLAND', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 6220, 'totalvotes': 464144},
-    {'year': 2016, 'state': 'RHODE ISLAND', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'AMERICAN DELTA PARTY', 'candidatevotes': 671, 'totalvotes': 464144},
-    {'year': 2016, 'state': 'SOUTH CAROLINA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1155389, 'totalvotes': 2103027},
-    {'year': 2016, 'state': 'SOUTH CAROLINA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 855373, 'totalvotes': 2103027},
-    {'year': 2016, 'state': 'SOUTH CAROLINA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 49204, 'totalvotes': 2103027},
-    {'year': 2016, 'state': 'SOUTH CAROLINA', 'candidate': 'MCMULLIN, EVAN', 'party_detailed': 'INDEPENDENCE', 'candidatevotes': 21016, 'totalvotes': 2103027},
-    {'year': 2016, 'state': 'SOUTH CAROLINA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 13034, 'totalvotes': 2103027},
-    {'year': 2016, 'state': 'SOUTH CAROLINA', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 5765, 'totalvotes': 2103027},
-    {'year': 2016, 'state': 'SOUTH CAROLINA', 'candidate': 'SKEWES, PETER', 'party_detailed': 'AMERICAN', 'candidatevotes': 3246, 'totalvotes': 2103027},
-    {'year': 2016, 'state': 'SOUTH DAKOTA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 227721, 'totalvotes': 370093},
-    {'year': 2016, 'state': 'SOUTH DAKOTA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 117458, 'totalvotes': 370093},
-    {'year': 2016, 'state': 'SOUTH DAKOTA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 20850, 'totalvotes': 370093},
-    {'year': 2016, 'state': 'SOUTH DAKOTA', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 4064, 'totalvotes': 370093},
-    {'year': 2016, 'state': 'TENNESSEE', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1522925, 'totalvotes': 2508027},
-    {'year': 2016, 'state': 'TENNESSEE', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 870695, 'totalvotes': 2508027},
-    {'year': 2016, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 100618, 'totalvotes': 2508027},
-    {'year': 2016, 'state': 'TENNESSEE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 13789, 'totalvotes': 2508027},
-    {'year': 2016, 'state': 'TEXAS', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 4685047, 'totalvotes': 8969226},
-    {'year': 2016, 'state': 'TEXAS', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3877868, 'totalvotes': 8969226},
-    {'year': 2016, 'state': 'TEXAS', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 283492, 'totalvotes': 8969226},
-    {'year': 2016, 'state': 'TEXAS', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 71558, 'totalvotes': 8969226},
-    {'year': 2016, 'state': 'TEXAS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 51261, 'totalvotes': 8969226},
-    {'year': 2016, 'state': 'UTAH', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 515211, 'totalvotes': 1131317},
-    {'year': 2016, 'state': 'UTAH', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 310674, 'totalvotes': 1131317},
-    {'year': 2016, 'state': 'UTAH', 'candidate': 'MCMULLIN, EVAN', 'party_detailed': 'NO PARTY AFFILIATION', 'candidatevotes': 255060, 'totalvotes': 1131317},
-    {'year': 2016, 'state': 'UTAH', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 39608, 'totalvotes': 1131317},
-    {'year': 2016, 'state': 'UTAH', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 8032, 'totalvotes': 1131317},
-    {'year': 2016, 'state': 'UTAH', 'candidate': 'KOPITKE, KYLE KENLEY', 'party_detailed': 'INDEPENDENT AMERICAN', 'candidatevotes': 2732, 'totalvotes': 1131317},
-    {'year': 2016, 'state': 'VERMONT', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 178573, 'totalvotes': 320467},
-    {'year': 2016, 'state': 'VERMONT', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 95369, 'totalvotes': 320467},
-    {'year': 2016, 'state': 'VERMONT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 22899, 'totalvotes': 320467},
-    {'year': 2016, 'state': 'VERMONT', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 10078, 'totalvotes': 320467},
-    {'year': 2016, 'state': 'VERMONT', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 6758, 'totalvotes': 320467},
-    {'year': 2016, 'state': 'VERMONT', 'candidate': 'BLANK VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 4574, 'totalvotes': 320467},
-    {'year': 2016, 'state': 'VERMONT', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1063, 'totalvotes': 320467},
-    {'year': 2016, 'state': 'VERMONT', 'candidate': 'VOID VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 826, 'totalvotes': 320467},
-    {'year': 2016, 'state': 'VERMONT', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'LIBERTY UNION PARTY', 'candidatevotes': 327, 'totalvotes': 320467},
-    {'year': 2016, 'state': 'VIRGINIA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1981473, 'totalvotes': 3982752},
-    {'year': 2016, 'state': 'VIRGINIA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1769443, 'totalvotes': 3982752},
-    {'year': 2016, 'state': 'VIRGINIA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 118274, 'totalvotes': 3982752},
-    {'year': 2016, 'state': 'VIRGINIA', 'candidate': 'MCMULLIN, EVAN', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 54054, 'totalvotes': 3982752},
-    {'year': 2016, 'state': 'VIRGINIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 31870, 'totalvotes': 3982752},
-    {'year': 2016, 'state': 'VIRGINIA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 27638, 'totalvotes': 3982752},
-    {'year': 2016, 'state': 'WASHINGTON', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1742718, 'totalvotes': 3317019},
-    {'year': 2016, 'state': 'WASHINGTON', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1221747, 'totalvotes': 3317019},
-    {'year': 2016, 'state': 'WASHINGTON', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 160879, 'totalvotes': 3317019},
-    {'year': 2016, 'state': 'WASHINGTON', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 107805, 'totalvotes': 3317019},
-    {'year': 2016, 'state': 'WASHINGTON', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 58417, 'totalvotes': 3317019},
-    {'year': 2016, 'state': 'WASHINGTON', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 17623, 'totalvotes': 3317019},
-    {'year': 2016, 'state': 'WASHINGTON', 'candidate': 'KENNEDY, ALYSON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 4307, 'totalvotes': 3317019},
-    {'year': 2016, 'state': 'WASHINGTON', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'SOCIALISM AND LIBERATION PARTY', 'candidatevotes': 3523, 'totalvotes': 3317019},
-    {'year': 2016, 'state': 'WEST VIRGINIA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 489371, 'totalvotes': 713051},
-    {'year': 2016, 'state': 'WEST VIRGINIA', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 188794, 'totalvotes': 713051},
-    {'year': 2016, 'state': 'WEST VIRGINIA', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 23004, 'totalvotes': 713051},
-    {'year': 2016, 'state': 'WEST VIRGINIA', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 8075, 'totalvotes': 713051},
-    {'year': 2016, 'state': 'WEST VIRGINIA', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3807, 'totalvotes': 713051},
-    {'year': 2016, 'state': 'WISCONSIN', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1405284, 'totalvotes': 2976150},
-    {'year': 2016, 'state': 'WISCONSIN', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1382536, 'totalvotes': 2976150},
-    {'year': 2016, 'state': 'WISCONSIN', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 106674, 'totalvotes': 2976150},
-    {'year': 2016, 'state': 'WISCONSIN', 'candidate': 'STEIN, JILL', 'party_detailed': 'GREEN', 'candidatevotes': 31072, 'totalvotes': 2976150},
-    {'year': 2016, 'state': 'WISCONSIN', 'candidate': 'SCATTERING', 'party_detailed': 'OTHER', 'candidatevotes': 22764, 'totalvotes': 2976150},
-    {'year': 2016, 'state': 'WISCONSIN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 12386, 'totalvotes': 2976150},
-    {'year': 2016, 'state': 'WISCONSIN', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 12162, 'totalvotes': 2976150},
-    {'year': 2016, 'state': 'WISCONSIN', 'candidate': 'MOOREHEAD, MONICA', 'party_detailed': 'WORKERS WORLD PARTY', 'candidatevotes': 1770, 'totalvotes': 2976150},
-    {'year': 2016, 'state': 'WISCONSIN', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'AMERICAN DELTA PARTY', 'candidatevotes': 1502, 'totalvotes': 2976150},
-    {'year': 2016, 'state': 'WYOMING', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 174419, 'totalvotes': 258788},
-    {'year': 2016, 'state': 'WYOMING', 'candidate': 'CLINTON, HILLARY', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 55973, 'totalvotes': 258788},
-    {'year': 2016, 'state': 'WYOMING', 'candidate': 'JOHNSON, GARY', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 13287, 'totalvotes': 258788},
-    {'year': 2016, 'state': 'WYOMING', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 6904, 'totalvotes': 258788},
-    {'year': 2016, 'state': 'WYOMING', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3224, 'totalvotes': 258788},
-    {'year': 2016, 'state': 'WYOMING', 'candidate': 'BLANK VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 2661, 'totalvotes': 258788},
-    {'year': 2016, 'state': 'WYOMING', 'candidate': 'CASTLE, DARRELL L.', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2042, 'totalvotes': 258788},
-    {'year': 2016, 'state': 'WYOMING', 'candidate': 'OVER VOTE', 'party_detailed': 'OTHER', 'candidatevotes': 278, 'totalvotes': 258788},
-    {'year': 2020, 'state': 'ALABAMA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 849624, 'totalvotes': 2323282},
-    {'year': 2020, 'state': 'ALABAMA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1441170, 'totalvotes': 2323282},
-    {'year': 2020, 'state': 'ALABAMA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 25176, 'totalvotes': 2323282},
-    {'year': 2020, 'state': 'ALABAMA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 7312, 'totalvotes': 2323282},
-    {'year': 2020, 'state': 'ALASKA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 153778, 'totalvotes': 359530},
-    {'year': 2020, 'state': 'ALASKA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 189951, 'totalvotes': 359530},
-    {'year': 2020, 'state': 'ALASKA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8897, 'totalvotes': 359530},
-    {'year': 2020, 'state': 'ALASKA', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'ALLIANCE', 'candidatevotes': 318, 'totalvotes': 359530},
-    {'year': 2020, 'state': 'ALASKA', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 825, 'totalvotes': 359530},
-    {'year': 2020, 'state': 'ALASKA', 'candidate': 'JANOS, JAMES G. "JESSE VENTURA"', 'party_detailed': 'GREEN', 'candidatevotes': 2673, 'totalvotes': 359530},
-    {'year': 2020, 'state': 'ALASKA', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1127, 'totalvotes': 359530},
-    {'year': 2020, 'state': 'ALASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1961, 'totalvotes': 359530},
-    {'year': 2020, 'state': 'ARIZONA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1672143, 'totalvotes': 3387326},
-    {'year': 2020, 'state': 'ARIZONA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1661686, 'totalvotes': 3387326},
-    {'year': 2020, 'state': 'ARIZONA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 51465, 'totalvotes': 3387326},
-    {'year': 2020, 'state': 'ARIZONA', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 190, 'totalvotes': 3387326},
-    {'year': 2020, 'state': 'ARIZONA', 'candidate': 'CUMMINGS, DANIEL CLYDE', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 36, 'totalvotes': 3387326},
-    {'year': 2020, 'state': 'ARIZONA', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 236, 'totalvotes': 3387326},
-    {'year': 2020, 'state': 'ARIZONA', 'candidate': 'BODDIE, R. PRESIDENT', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 13, 'totalvotes': 3387326},
-    {'year': 2020, 'state': 'ARIZONA', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 1557, 'totalvotes': 3387326},
-    {'year': 2020, 'state': 'ARKANSAS', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 1713, 'totalvotes': 1219069},
-    {'year': 2020, 'state': 'ARKANSAS', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2108, 'totalvotes': 1219069},
-    {'year': 2020, 'state': 'ARKANSAS', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 423932, 'totalvotes': 1219069},
-    {'year': 2020, 'state': 'ARKANSAS', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 2980, 'totalvotes': 1219069},
-    {'year': 2020, 'state': 'ARKANSAS', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2141, 'totalvotes': 1219069},
-    {'year': 2020, 'state': 'ARKANSAS', 'candidate': 'GAMMON, C. L.', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1475, 'totalvotes': 1219069},
-    {'year': 2020, 'state': 'ARKANSAS', 'candidate': 'WEST, KANYE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4099, 'totalvotes': 1219069},
-    {'year': 2020, 'state': 'ARKANSAS', 'candidate': 'COLLINS, PHIL', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2812, 'totalvotes': 1219069},
-    {'year': 2020, 'state': 'ARKANSAS', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1321, 'totalvotes': 1219069},
-    {'year': 2020, 'state': 'ARKANSAS', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 13133, 'totalvotes': 1219069},
-    {'year': 2020, 'state': 'ARKANSAS', 'candidate': 'MYERS, JOHN RICHARD', 'party_detailed': 'LIFE AND LIBERTY PARTY', 'candidatevotes': 1372, 'totalvotes': 1219069},
-    {'year': 2020, 'state': 'ARKANSAS', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 760647, 'totalvotes': 1219069},
-    {'year': 2020, 'state': 'ARKANSAS', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 1336, 'totalvotes': 1219069},
-    {'year': 2020, 'state': 'CALIFORNIA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 11110250, 'totalvotes': 17500881},
-    {'year': 2020, 'state': 'CALIFORNIA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 6006429, 'totalvotes': 17500881},
-    {'year': 2020, 'state': 'CALIFORNIA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 187895, 'totalvotes': 17500881},
-    {'year': 2020, 'state': 'CALIFORNIA', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 81029, 'totalvotes': 17500881},
-    {'year': 2020, 'state': 'CALIFORNIA', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'AMERICAN INDEPENDENT', 'candidatevotes': 60160, 'totalvotes': 17500881},
-    {'year': 2020, 'state': 'CALIFORNIA', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PEACE & FREEDOM', 'candidatevotes': 51037, 'totalvotes': 17500881},
-    {'year': 2020, 'state': 'CALIFORNIA', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 2605, 'totalvotes': 17500881},
-    {'year': 2020, 'state': 'CALIFORNIA', 'candidate': 'JANOS, JAMES G. "JESSE VENTURA"', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 611, 'totalvotes': 17500881},
-    {'year': 2020, 'state': 'CALIFORNIA', 'candidate': 'MARK CHARLES', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 559, 'totalvotes': 17500881},
-    {'year': 2020, 'state': 'CALIFORNIA', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 185, 'totalvotes': 17500881},
-    {'year': 2020, 'state': 'CALIFORNIA', 'candidate': 'JOSEPH KISHORE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 121, 'totalvotes': 17500881},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1804352, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1364607, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 52460, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 8986, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 1035, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'ALLIANCE', 'candidatevotes': 636, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 572, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'WEST, KANYE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 8089, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 5061, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'HAMMONS, BILL', 'party_detailed': 'UNITY PARTY', 'candidatevotes': 2730, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'HUBER, BLAKE', 'party_detailed': 'APPROVAL VOTING PARTY', 'candidatevotes': 355, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 25515, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'CHARLES, MARK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2011, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'COLLINS, PHIL', 'party_detailed': 'PROHIBITION PARTY', 'candidatevotes': 568, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'HUNTER, PHIL', 'party_detailed': 'PROGRESSIVE PARTY', 'candidatevotes': 379, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'JACOB?FAMBRO, PRINCESS KHADIJAH MARYAM', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 495, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'KENNEDY, ALYSON', 'party_detailed': 'SOCIALIST WORKERS PARTY', 'candidatevotes': 354, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'KISHORE, JOSEPH', 'party_detailed': 'SOCIALIST EQUALITY PARTY', 'candidatevotes': 196, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'KOPITKE, KYLE KENLEY', 'party_detailed': 'INDEPENDENT AMERICAN PARTY', 'candidatevotes': 762, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'MCHUGH, JOE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 614, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'SCOTT, JORDAN "CANCER"', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 175, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'CELLA, TODD', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'COLORADO', 'candidate': 'HOEFLING, TOM', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 24, 'totalvotes': 3279980},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1080831, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 714717, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 20230, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 7538, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 219, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'CHARLES, MARK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 11, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'KLOJZY, JEFFREY J.', 'party_detailed': 'OTHER', 'candidatevotes': 0, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'WEINSTEIN, KARYNN KRILL', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'WELLS, KASEY', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 6, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'SIMMONS, MARY RUTH CARO', 'party_detailed': 'OTHER', 'candidatevotes': 2, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'ALLIANCE', 'candidatevotes': 13, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'HOWARD, SHAWN W.', 'party_detailed': 'OTHER', 'candidatevotes': 12, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 22, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'CONNECTICUT', 'candidate': 'WEST, KANYE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 255, 'totalvotes': 1823857},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'BELLAR, BARBARA', 'party_detailed': 'OTHER', 'candidatevotes': 7, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 87, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 5, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'ROUSE, DEBORAH', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'BALL, DENNIS ANDREW', 'party_detailed': 'OTHER', 'candidatevotes': 3, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 14, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 28, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'WEST, KANYE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 169, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'WELLS, KASEY', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 1, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'GIBSON, KATHRYN', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'CHARLES, MARK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 8, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'WILLIAMS, MITCHELL', 'party_detailed': 'OTHER', 'candidatevotes': 2, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'BODDIE, R. PRESIDENT', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'JACOB?FAMBRO, PRINCESS KHADIJAH MARYAM', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'HOWARD, SHAWN W.', 'party_detailed': 'OTHER', 'candidatevotes': 4, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'CELLA, TODD', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'HOEFLING, TOM', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 1, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 296268, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 200603, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5000, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DELAWARE', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 2139, 'totalvotes': 504346},
-    {'year': 2020, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 317323, 'totalvotes': 344356},
-    {'year': 2020, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 18586, 'totalvotes': 344356},
-    {'year': 2020, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 2036, 'totalvotes': 344356},
-    {'year': 2020, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'DC STATEHOOD GREEN', 'candidatevotes': 1726, 'totalvotes': 344356},
-    {'year': 2020, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 855, 'totalvotes': 344356},
-    {'year': 2020, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 3137, 'totalvotes': 344356},
-    {'year': 2020, 'state': 'DISTRICT OF COLUMBIA', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 693, 'totalvotes': 344356},
-    {'year': 2020, 'state': 'FLORIDA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 5297045, 'totalvotes': 11067456},
-    {'year': 2020, 'state': 'FLORIDA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 5668731, 'totalvotes': 11067456},
-    {'year': 2020, 'state': 'FLORIDA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 70324, 'totalvotes': 11067456},
-    {'year': 2020, 'state': 'FLORIDA', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 14721, 'totalvotes': 11067456},
-    {'year': 2020, 'state': 'FLORIDA', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 5712, 'totalvotes': 11067456},
-    {'year': 2020, 'state': 'FLORIDA', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'ALLIANCE', 'candidatevotes': 5966, 'totalvotes': 11067456},
-    {'year': 2020, 'state': 'FLORIDA', 'candidate': 'HOWARD, SHAWN W.', 'party_detailed': 'OTHER', 'candidatevotes': 9, 'totalvotes': 11067456},
-    {'year': 2020, 'state': 'FLORIDA', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3902, 'totalvotes': 11067456},
-    {'year': 2020, 'state': 'FLORIDA', 'candidate': 'WELLS, KASEY', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 8, 'totalvotes': 11067456},
-    {'year': 2020, 'state': 'FLORIDA', 'candidate': 'WALLS-WINDHAUSER, ANGELA', 'party_detailed': 'OTHER', 'candidatevotes': 2, 'totalvotes': 11067456},
-    {'year': 2020, 'state': 'FLORIDA', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 181, 'totalvotes': 11067456},
-    {'year': 2020, 'state': 'FLORIDA', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 854, 'totalvotes': 11067456},
-    {'year': 2020, 'state': 'FLORIDA', 'candidate': 'LABOCH, MICHAEL', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 11067456},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'BELLAR, BARBARA', 'party_detailed': 'OTHER', 'candidatevotes': 10, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 701, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'BYRNE, DAVID', 'party_detailed': 'OTHER', 'candidatevotes': 6, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'ROUSE, DEBORAH', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 61, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 159, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 1013, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 181, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'WELLS, KASEY', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 6, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'GIBSON, KATHRYN', 'party_detailed': 'OTHER', 'candidatevotes': 2, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'COLLINS, LOREN', 'party_detailed': 'OTHER', 'candidatevotes': 11, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'CHARLES, MARK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 65, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'SHERRILL, PETER', 'party_detailed': 'OTHER', 'candidatevotes': 8, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'BODDIE, R. PRESIDENT', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 8, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'JACOB?FAMBRO, PRINCESS KHADIJAH MARYAM', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 7, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'HOWARD, SHAWN W.', 'party_detailed': 'OTHER', 'candidatevotes': 5, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2473633, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2461854, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'GEORGIA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 62229, 'totalvotes': 4999960},
-    {'year': 2020, 'state': 'HAWAII', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 366130, 'totalvotes': 579784},
-    {'year': 2020, 'state': 'HAWAII', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 196864, 'totalvotes': 579784},
-    {'year': 2020, 'state': 'HAWAII', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5539, 'totalvotes': 579784},
-    {'year': 2020, 'state': 'HAWAII', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 3822, 'totalvotes': 579784},
-    {'year': 2020, 'state': 'HAWAII', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'AMERICAN SHOPPING PARTY', 'candidatevotes': 1183, 'totalvotes': 579784},
-    {'year': 2020, 'state': 'HAWAII', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 931, 'totalvotes': 579784},
-    {'year': 2020, 'state': 'HAWAII', 'candidate': 'BLANK VOTES', 'party_detailed': 'OTHER', 'candidatevotes': 4927, 'totalvotes': 579784},
-    {'year': 2020, 'state': 'HAWAII', 'candidate': 'OVERVOTES', 'party_detailed': 'OTHER', 'candidatevotes': 388, 'totalvotes': 579784},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 287021, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 554119, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 16404, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 407, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2808, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1886, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1491, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'WEST, KANYE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3632, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 49, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 163, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'CELLA, TODD', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'FRANKLIN, CHRIS', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'HOEFLING, TOM', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 7, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'HOWARD, SHAWN W.', 'party_detailed': 'OTHER', 'candidatevotes': 4, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'IDAHO', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 21, 'totalvotes': 868014},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3471915, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2446891, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 66544, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 30494, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 9548, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 8046, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'FARNEY, JOHN', 'party_detailed': 'OTHER', 'candidatevotes': 84, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 78, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'MARK CHARLES', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 75, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'WELLS, KASEY', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 18, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 18, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'WILLIAMS JR., ANDY', 'party_detailed': 'OTHER', 'candidatevotes': 8, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'BELLAR, BARBARA', 'party_detailed': 'OTHER', 'candidatevotes': 7, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'KISHORE, JOSEPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 5, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'MCKEE, KEVIN', 'party_detailed': 'OTHER', 'candidatevotes': 4, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'COLLINS, PHIL', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'STRUCK, JAMES TIMOTHY', 'party_detailed': 'OTHER', 'candidatevotes': 2, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'ROUSE, DEBORAH', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'HIGGS, JEREMY', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'ILLINOIS', 'candidate': 'SIMMONS, MARY RUTH CARO', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 6033743},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1242416, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1729519, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 59232, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 988, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 893, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'HOWARD, SHAWN W.', 'party_detailed': 'OTHER', 'candidatevotes': 23, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'MCCRAY, VALERIE', 'party_detailed': 'OTHER', 'candidatevotes': 17, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'SCHRINER, JOE', 'party_detailed': 'OTHER', 'candidatevotes': 13, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'JOHNSON JR. JAMES L.', 'party_detailed': 'OTHER', 'candidatevotes': 5, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'ROUSE, DEBORAH', 'party_detailed': 'OTHER', 'candidatevotes': 4, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'WILLIAMS, MITCHELL', 'party_detailed': 'OTHER', 'candidatevotes': 4, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'STRIED, CHRISTOPHER', 'party_detailed': 'OTHER', 'candidatevotes': 2, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'F, RANDALL', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'INDIANA', 'candidate': 'WELLS, KASEY', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 1, 'totalvotes': 3033118},
-    {'year': 2020, 'state': 'IOWA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 897672, 'totalvotes': 1700130},
-    {'year': 2020, 'state': 'IOWA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 759061, 'totalvotes': 1700130},
-    {'year': 2020, 'state': 'IOWA', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1082, 'totalvotes': 1700130},
-    {'year': 2020, 'state': 'IOWA', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1707, 'totalvotes': 1700130},
-    {'year': 2020, 'state': 'IOWA', 'candidate': 'KING, RICKI SUE', 'party_detailed': 'GENEOLOGY KNOW YOUR FAMILY HISTORY PARTY', 'candidatevotes': 546, 'totalvotes': 1700130},
-    {'year': 2020, 'state': 'IOWA', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 3075, 'totalvotes': 1700130},
-    {'year': 2020, 'state': 'IOWA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 19637, 'totalvotes': 1700130},
-    {'year': 2020, 'state': 'IOWA', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 544, 'totalvotes': 1700130},
-    {'year': 2020, 'state': 'IOWA', 'candidate': 'WEST, KANYE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3210, 'totalvotes': 1700130},
-    {'year': 2020, 'state': 'IOWA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 4337, 'totalvotes': 1700130},
-    {'year': 2020, 'state': 'IOWA', 'candidate': 'UNDERVOTES', 'party_detailed': 'OTHER', 'candidatevotes': 6614, 'totalvotes': 1700130},
-    {'year': 2020, 'state': 'IOWA', 'candidate': 'OVERVOTES', 'party_detailed': 'OTHER', 'candidatevotes': 2645, 'totalvotes': 1700130},
-    {'year': 2020, 'state': 'KANSAS', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 771406, 'totalvotes': 1372303},
-    {'year': 2020, 'state': 'KANSAS', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 570323, 'totalvotes': 1372303},
-    {'year': 2020, 'state': 'KANSAS', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 30574, 'totalvotes': 1372303},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1326646, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 772474, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 26234, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'WEST, KANYE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 6483, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3599, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 716, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 408, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 98, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'CHARLES, MARK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 43, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 29, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'HOEFLING, TOM', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 20, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'HOWARD, SHAWN W.', 'party_detailed': 'OTHER', 'candidatevotes': 9, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'BODDIE, R. PRESIDENT', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 7, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'WELLS, KASEY', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 1, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'KENTUCKY', 'candidate': 'STEVENS, TIMOTHY ALLEN', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 2136768},
-    {'year': 2020, 'state': 'LOUISIANA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 856034, 'totalvotes': 2148062},
-    {'year': 2020, 'state': 'LOUISIANA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 21645, 'totalvotes': 2148062},
-    {'year': 2020, 'state': 'LOUISIANA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1255776, 'totalvotes': 2148062},
-    {'year': 2020, 'state': 'LOUISIANA', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 2497, 'totalvotes': 2148062},
-    {'year': 2020, 'state': 'LOUISIANA', 'candidate': 'JADE SIMMONS', 'party_detailed': 'BECOMING ONE NATION', 'candidatevotes': 1626, 'totalvotes': 2148062},
-    {'year': 2020, 'state': 'LOUISIANA', 'candidate': 'BODDIE, R. PRESIDENT', 'party_detailed': 'C.U.P', 'candidatevotes': 1125, 'totalvotes': 2148062},
-    {'year': 2020, 'state': 'LOUISIANA', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 860, 'totalvotes': 2148062},
-    {'year': 2020, 'state': 'LOUISIANA', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'FREEDOM AND PROSPERITY', 'candidatevotes': 749, 'totalvotes': 2148062},
-    {'year': 2020, 'state': 'LOUISIANA', 'candidate': 'HOEFLING, TOM', 'party_detailed': 'LIFE , LIBERTY, CONSTITUTION', 'candidatevotes': 668, 'totalvotes': 2148062},
-    {'year': 2020, 'state': 'LOUISIANA', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 987, 'totalvotes': 2148062},
-    {'year': 2020, 'state': 'LOUISIANA', 'candidate': 'KENNEDY, ALYSON', 'party_detailed': 'SOCIALIST WORKERS PARTY', 'candidatevotes': 536, 'totalvotes': 2148062},
-    {'year': 2020, 'state': 'LOUISIANA', 'candidate': 'WEST, KANYE', 'party_detailed': 'THE BIRTHDAY PARTY', 'candidatevotes': 4897, 'totalvotes': 2148062},
-    {'year': 2020, 'state': 'LOUISIANA', 'candidate': 'HAMMONS, BILL', 'party_detailed': 'UNITY PARTY', 'candidatevotes': 662, 'totalvotes': 2148062},
-    {'year': 2020, 'state': 'MAINE', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 435072, 'totalvotes': 828305},
-    {'year': 2020, 'state': 'MAINE', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 14152, 'totalvotes': 828305},
-    {'year': 2020, 'state': 'MAINE', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 360737, 'totalvotes': 828305},
-    {'year': 2020, 'state': 'MAINE', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 8230, 'totalvotes': 828305},
-    {'year': 2020, 'state': 'MAINE', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'ALLIANCE', 'candidatevotes': 1183, 'totalvotes': 828305},
-    {'year': 2020, 'state': 'MAINE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 87, 'totalvotes': 828305},
-    {'year': 2020, 'state': 'MAINE', 'candidate': 'BLANK VOTES', 'party_detailed': 'OTHER', 'candidatevotes': 8844, 'totalvotes': 828305},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 976414, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1985023, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 33488, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 15799, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'SEGAL, JEROME M.', 'party_detailed': 'BREAD AND ROSES', 'candidatevotes': 5884, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'BALL, DENNIS ANDREW', 'party_detailed': 'OTHER', 'candidatevotes': 8, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'BELLAR, BARBARA', 'party_detailed': 'OTHER', 'candidatevotes': 23, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'BODDIE, R. PRESIDENT', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 795, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'CELLA, TODD', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 11, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'CHARLES, MARK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 30, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'COLLINS, PHIL', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 10, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'ALLIANCE', 'candidatevotes': 26, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'HOEFLING, TOM', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 11, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'HOWARD, SHAWN W.', 'party_detailed': 'OTHER', 'candidatevotes': 20, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'LEE, JOHNSON', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 16, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'ROUSE, DEBORAH', 'party_detailed': 'OTHER', 'candidatevotes': 6, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'SHERRILL, PETER', 'party_detailed': 'OTHER', 'candidatevotes': 3, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'BECOMING ONE NATION', 'candidatevotes': 131, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'WELLS, KASEY', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 5, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'WEST, KANYE', 'party_detailed': 'THE BIRTHDAY PARTY', 'candidatevotes': 1117, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 125, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'RALEY, ALBERT', 'party_detailed': 'OTHER', 'candidatevotes': 32, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'SCHAWLB, BENJAMIN', 'party_detailed': 'OTHER', 'candidatevotes': 3, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MARYLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 18045, 'totalvotes': 3037030},
-    {'year': 2020, 'state': 'MASSACHUSETTS', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2382202, 'totalvotes': 3658005},
-    {'year': 2020, 'state': 'MASSACHUSETTS', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1167202, 'totalvotes': 3658005},
-    {'year': 2020, 'state': 'MASSACHUSETTS', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 47013, 'totalvotes': 3658005},
-    {'year': 2020, 'state': 'MASSACHUSETTS', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN-RAINBOW', 'candidatevotes': 18658, 'totalvotes': 3658005},
-    {'year': 2020, 'state': 'MASSACHUSETTS', 'candidate': 'BLANK VOTES', 'party_detailed': 'OTHER', 'candidatevotes': 26603, 'totalvotes': 3658005},
-    {'year': 2020, 'state': 'MASSACHUSETTS', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 16327, 'totalvotes': 3658005},
-    {'year': 2020, 'state': 'MICHIGAN', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2804040, 'totalvotes': 5539302},
-    {'year': 2020, 'state': 'MICHIGAN', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2649852, 'totalvotes': 5539302},
-    {'year': 2020, 'state': 'MICHIGAN', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 60381, 'totalvotes': 5539302},
-    {'year': 2020, 'state': 'MICHIGAN', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'US TAXPAYERS PARTY', 'candidatevotes': 7235, 'totalvotes': 5539302},
-    {'year': 2020, 'state': 'MICHIGAN', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 13718, 'totalvotes': 5539302},
-    {'year': 2020, 'state': 'MICHIGAN', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'NATURAL LAW', 'candidatevotes': 2986, 'totalvotes': 5539302},
-    {'year': 2020, 'state': 'MICHIGAN', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 963, 'totalvotes': 5539302},
-    {'year': 2020, 'state': 'MICHIGAN', 'candidate': 'HOEFLING, TOM', 'party_detailed': 'OTHER', 'candidatevotes': 32, 'totalvotes': 5539302},
-    {'year': 2020, 'state': 'MICHIGAN', 'candidate': 'HUNTER, TARA RENEE', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 5539302},
-    {'year': 2020, 'state': 'MICHIGAN', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'BECOMING ONE NATION', 'candidatevotes': 89, 'totalvotes': 5539302},
-    {'year': 2020, 'state': 'MICHIGAN', 'candidate': 'WELLS, KASEY', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 5, 'totalvotes': 5539302},
-    {'year': 2020, 'state': 'MINNESOTA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1484065, 'totalvotes': 3277171},
-    {'year': 2020, 'state': 'MINNESOTA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1717077, 'totalvotes': 3277171},
-    {'year': 2020, 'state': 'MINNESOTA', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'ALLIANCE', 'candidatevotes': 5611, 'totalvotes': 3277171},
-    {'year': 2020, 'state': 'MINNESOTA', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 10033, 'totalvotes': 3277171},
-    {'year': 2020, 'state': 'MINNESOTA', 'candidate': 'WEST, KANYE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 7940, 'totalvotes': 3277171},
-    {'year': 2020, 'state': 'MINNESOTA', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 5651, 'totalvotes': 3277171},
-    {'year': 2020, 'state': 'MINNESOTA', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 1210, 'totalvotes': 3277171},
-    {'year': 2020, 'state': 'MINNESOTA', 'candidate': 'KENNEDY, ALYSON', 'party_detailed': 'SOCIALIST WORKERS PARTY', 'candidatevotes': 643, 'totalvotes': 3277171},
-    {'year': 2020, 'state': 'MINNESOTA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 34976, 'totalvotes': 3277171},
-    {'year': 2020, 'state': 'MINNESOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 9965, 'totalvotes': 3277171},
-    {'year': 2020, 'state': 'MISSISSIPPI', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 539398, 'totalvotes': 1313759},
-    {'year': 2020, 'state': 'MISSISSIPPI', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 756764, 'totalvotes': 1313759},
-    {'year': 2020, 'state': 'MISSISSIPPI', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1279, 'totalvotes': 1313759},
-    {'year': 2020, 'state': 'MISSISSIPPI', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 1161, 'totalvotes': 1313759},
-    {'year': 2020, 'state': 'MISSISSIPPI', 'candidate': 'COLLINS, PHIL', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1317, 'totalvotes': 1313759},
-    {'year': 2020, 'state': 'MISSISSIPPI', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 1498, 'totalvotes': 1313759},
-    {'year': 2020, 'state': 'MISSISSIPPI', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 8026, 'totalvotes': 1313759},
-    {'year': 2020, 'state': 'MISSISSIPPI', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 659, 'totalvotes': 1313759},
-    {'year': 2020, 'state': 'MISSISSIPPI', 'candidate': 'WEST, KANYE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3657, 'totalvotes': 1313759},
-    {'year': 2020, 'state': 'MISSOURI', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1718736, 'totalvotes': 3025962},
-    {'year': 2020, 'state': 'MISSOURI', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1253014, 'totalvotes': 3025962},
-    {'year': 2020, 'state': 'MISSOURI', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 41205, 'totalvotes': 3025962},
-    {'year': 2020, 'state': 'MISSOURI', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 8283, 'totalvotes': 3025962},
-    {'year': 2020, 'state': 'MISSOURI', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 3919, 'totalvotes': 3025962},
-    {'year': 2020, 'state': 'MISSOURI', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 0, 'totalvotes': 3025962},
-    {'year': 2020, 'state': 'MISSOURI', 'candidate': 'WELLS, KASEY', 'party_detailed': 'NON-AFFILIATED', 'candidatevotes': 3, 'totalvotes': 3025962},
-    {'year': 2020, 'state': 'MISSOURI', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'BECOMING ONE NATION', 'candidatevotes': 74, 'totalvotes': 3025962},
-    {'year': 2020, 'state': 'MISSOURI', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 664, 'totalvotes': 3025962},
-    {'year': 2020, 'state': 'MISSOURI', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 64, 'totalvotes': 3025962},
-    {'year': 2020, 'state': 'MONTANA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 15252, 'totalvotes': 603674},
-    {'year': 2020, 'state': 'MONTANA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 343602, 'totalvotes': 603674},
-    {'year': 2020, 'state': 'MONTANA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 244786, 'totalvotes': 603674},
-    {'year': 2020, 'state': 'MONTANA', 'candidate': 'BELLAR, BARBARA', 'party_detailed': 'OTHER', 'candidatevotes': 2, 'totalvotes': 603674},
-    {'year': 2020, 'state': 'MONTANA', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'BECOMING ONE NATION', 'candidatevotes': 6, 'totalvotes': 603674},
-    {'year': 2020, 'state': 'MONTANA', 'candidate': 'CHARLES, MARK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 23, 'totalvotes': 603674},
-    {'year': 2020, 'state': 'MONTANA', 'candidate': 'HOEFLING, TOM', 'party_detailed': 'OTHER', 'candidatevotes': 3, 'totalvotes': 603674},
-    {'year': 2020, 'state': 'NEBRASKA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 556846, 'totalvotes': 956383},
-    {'year': 2020, 'state': 'NEBRASKA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 374583, 'totalvotes': 956383},
-    {'year': 2020, 'state': 'NEBRASKA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 20283, 'totalvotes': 956383},
-    {'year': 2020, 'state': 'NEBRASKA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 4671, 'totalvotes': 956383},
-    {'year': 2020, 'state': 'NEVADA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 14783, 'totalvotes': 1405376},
-    {'year': 2020, 'state': 'NEVADA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 669890, 'totalvotes': 1405376},
-    {'year': 2020, 'state': 'NEVADA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 703486, 'totalvotes': 1405376},
-    {'year': 2020, 'state': 'NEVADA', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'INDEPENDENT AMERICAN PARTY', 'candidatevotes': 3138, 'totalvotes': 1405376},
-    {'year': 2020, 'state': 'NEVADA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 14079, 'totalvotes': 1405376},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 13235, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 365654, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 424921, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'BUTTIGIEG, PETE', 'party_detailed': 'OTHER', 'candidatevotes': 47, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'CUOMO, ANDREW', 'party_detailed': 'OTHER', 'candidatevotes': 14, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'GABBARD, TULSI', 'party_detailed': 'OTHER', 'candidatevotes': 142, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 217, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'HUCKABEE, MIKE', 'party_detailed': 'OTHER', 'candidatevotes': 10, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'KASICH, JOHN', 'party_detailed': 'OTHER', 'candidatevotes': 67, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'KLOBUCHAR, AMY', 'party_detailed': 'OTHER', 'candidatevotes': 19, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'OBAMA, MICHELLE', 'party_detailed': 'OTHER', 'candidatevotes': 10, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'PAUL, RON', 'party_detailed': 'OTHER', 'candidatevotes': 13, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'PENCE, MIKE', 'party_detailed': 'OTHER', 'candidatevotes': 56, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'RICE, CONDOLEEZA', 'party_detailed': 'OTHER', 'candidatevotes': 12, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'ROMNEY, MITT', 'party_detailed': 'OTHER', 'candidatevotes': 170, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'SANDERS, BERNIE', 'party_detailed': 'OTHER', 'candidatevotes': 192, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'SHAHEEN, JEANNE', 'party_detailed': 'OTHER', 'candidatevotes': 14, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'SUNUNU, CHRIS', 'party_detailed': 'OTHER', 'candidatevotes': 46, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'SUPREME, VERMIN', 'party_detailed': 'OTHER', 'candidatevotes': 22, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'WELD, BILL', 'party_detailed': 'OTHER', 'candidatevotes': 23, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'WEST, KANYE', 'party_detailed': 'OTHER', 'candidatevotes': 82, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'YANG, ANDREW', 'party_detailed': 'OTHER', 'candidatevotes': 58, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW HAMPSHIRE', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1158, 'totalvotes': 806182},
-    {'year': 2020, 'state': 'NEW JERSEY', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1883274, 'totalvotes': 4549353},
-    {'year': 2020, 'state': 'NEW JERSEY', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2608335, 'totalvotes': 4549353},
-    {'year': 2020, 'state': 'NEW JERSEY', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 31677, 'totalvotes': 4549353},
-    {'year': 2020, 'state': 'NEW JERSEY', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 14202, 'totalvotes': 4549353},
-    {'year': 2020, 'state': 'NEW JERSEY', 'candidate': 'HAMMONS, BILL', 'party_detailed': 'UNITY PARTY', 'candidatevotes': 3255, 'totalvotes': 4549353},
-    {'year': 2020, 'state': 'NEW JERSEY', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 2954, 'totalvotes': 4549353},
-    {'year': 2020, 'state': 'NEW JERSEY', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 2928, 'totalvotes': 4549353},
-    {'year': 2020, 'state': 'NEW JERSEY', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'ALLIANCE', 'candidatevotes': 2728, 'totalvotes': 4549353},
-    {'year': 2020, 'state': 'NEW MEXICO', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 4426, 'totalvotes': 923965},
-    {'year': 2020, 'state': 'NEW MEXICO', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 12585, 'totalvotes': 923965},
-    {'year': 2020, 'state': 'NEW MEXICO', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 501614, 'totalvotes': 923965},
-    {'year': 2020, 'state': 'NEW MEXICO', 'candidate': 'TITTLE, SHEILA "SAMM"', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 1806, 'totalvotes': 923965},
-    {'year': 2020, 'state': 'NEW MEXICO', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 401894, 'totalvotes': 923965},
-    {'year': 2020, 'state': 'NEW MEXICO', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 1640, 'totalvotes': 923965},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 5230985, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 3244798, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 32753, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 60234, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 22587, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 805, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 376, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'WELLS, KASEY', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'MANIMAS, JOHN', 'party_detailed': 'OTHER', 'candidatevotes': 2, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'HOWARD, SHAWN W.', 'party_detailed': 'OTHER', 'candidatevotes': 6, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'COLLINS, PHIL', 'party_detailed': 'PROHIBITION PARTY', 'candidatevotes': 9, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'HODGES, PAUL', 'party_detailed': 'OTHER', 'candidatevotes': 13, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'BECOMING ONE NATION', 'candidatevotes': 155, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'ALLIANCE', 'candidatevotes': 20, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'KISHORE, JOSEPH', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 28, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'MARTIN, DAVID A.', 'party_detailed': 'OTHER', 'candidatevotes': 3, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'WEST, KANYE', 'party_detailed': 'THE BIRTHDAY PARTY', 'candidatevotes': 1897, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 43, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'BELLAR, BARBARA', 'party_detailed': 'OTHER', 'candidatevotes': 2, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'CHARLES, MARK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 98, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'HUNTER, DARIO', 'party_detailed': 'OTHER', 'candidatevotes': 8, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'MONTANYE, RICHARD CHARLES', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'BLANK VOTES', 'party_detailed': 'OTHER', 'candidatevotes': 43541, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NEW YORK', 'candidate': 'VOID', 'party_detailed': 'OTHER', 'candidatevotes': 23368, 'totalvotes': 8661735},
-    {'year': 2020, 'state': 'NORTH CAROLINA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 2758773, 'totalvotes': 5524802},
-    {'year': 2020, 'state': 'NORTH CAROLINA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2684292, 'totalvotes': 5524802},
-    {'year': 2020, 'state': 'NORTH CAROLINA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 48678, 'totalvotes': 5524802},
-    {'year': 2020, 'state': 'NORTH CAROLINA', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 12195, 'totalvotes': 5524802},
-    {'year': 2020, 'state': 'NORTH CAROLINA', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 7549, 'totalvotes': 5524802},
-    {'year': 2020, 'state': 'NORTH CAROLINA', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'BECOMING ONE NATION', 'candidatevotes': 119, 'totalvotes': 5524802},
-    {'year': 2020, 'state': 'NORTH CAROLINA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 13196, 'totalvotes': 5524802},
-    {'year': 2020, 'state': 'NORTH DAKOTA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 235595, 'totalvotes': 361819},
-    {'year': 2020, 'state': 'NORTH DAKOTA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 114902, 'totalvotes': 361819},
-    {'year': 2020, 'state': 'NORTH DAKOTA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 9393, 'totalvotes': 361819},
-    {'year': 2020, 'state': 'NORTH DAKOTA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1929, 'totalvotes': 361819},
-    {'year': 2020, 'state': 'OHIO', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 3154834, 'totalvotes': 5922202},
-    {'year': 2020, 'state': 'OHIO', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2679165, 'totalvotes': 5922202},
-    {'year': 2020, 'state': 'OHIO', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 67569, 'totalvotes': 5922202},
-    {'year': 2020, 'state': 'OHIO', 'candidate': 'BODDIE, R. PRESIDENT', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3, 'totalvotes': 5922202},
-    {'year': 2020, 'state': 'OHIO', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 1450, 'totalvotes': 5922202},
-    {'year': 2020, 'state': 'OHIO', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 18812, 'totalvotes': 5922202},
-    {'year': 2020, 'state': 'OHIO', 'candidate': 'HOEFLING, TOM', 'party_detailed': 'OTHER', 'candidatevotes': 114, 'totalvotes': 5922202},
-    {'year': 2020, 'state': 'OHIO', 'candidate': 'HUNTER, DARIO', 'party_detailed': 'OTHER', 'candidatevotes': 27, 'totalvotes': 5922202},
-    {'year': 2020, 'state': 'OHIO', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'BECOMING ONE NATION', 'candidatevotes': 212, 'totalvotes': 5922202},
-    {'year': 2020, 'state': 'OHIO', 'candidate': 'WELLS, KASEY', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 16, 'totalvotes': 5922202},
-    {'year': 2020, 'state': 'OKLAHOMA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1020280, 'totalvotes': 1560699},
-    {'year': 2020, 'state': 'OKLAHOMA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 503890, 'totalvotes': 1560699},
-    {'year': 2020, 'state': 'OKLAHOMA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 24731, 'totalvotes': 1560699},
-    {'year': 2020, 'state': 'OKLAHOMA', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 3654, 'totalvotes': 1560699},
-    {'year': 2020, 'state': 'OKLAHOMA', 'candidate': 'WEST, KANYE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 5597, 'totalvotes': 1560699},
-    {'year': 2020, 'state': 'OKLAHOMA', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2547, 'totalvotes': 1560699},
-    {'year': 2020, 'state': 'OREGON', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 958448, 'totalvotes': 2374321},
-    {'year': 2020, 'state': 'OREGON', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1340383, 'totalvotes': 2374321},
-    {'year': 2020, 'state': 'OREGON', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 41582, 'totalvotes': 2374321},
-    {'year': 2020, 'state': 'OREGON', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'PACIFIC GREEN', 'candidatevotes': 11831, 'totalvotes': 2374321},
-    {'year': 2020, 'state': 'OREGON', 'candidate': 'HUNTER, DARIO', 'party_detailed': 'PROGRESSIVE PARTY', 'candidatevotes': 4988, 'totalvotes': 2374321},
-    {'year': 2020, 'state': 'OREGON', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 17089, 'totalvotes': 2374321},
-    {'year': 2020, 'state': 'PENNSYLVANIA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 3377674, 'totalvotes': 6915283},
-    {'year': 2020, 'state': 'PENNSYLVANIA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 3458229, 'totalvotes': 6915283},
-    {'year': 2020, 'state': 'PENNSYLVANIA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 79380, 'totalvotes': 6915283},
-    {'year': 2020, 'state': 'RHODE ISLAND', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 307486, 'totalvotes': 516990},
-    {'year': 2020, 'state': 'RHODE ISLAND', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 199922, 'totalvotes': 516990},
-    {'year': 2020, 'state': 'RHODE ISLAND', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5053, 'totalvotes': 516990},
-    {'year': 2020, 'state': 'RHODE ISLAND', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 2759, 'totalvotes': 516990},
-    {'year': 2020, 'state': 'RHODE ISLAND', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'ALLIANCE', 'candidatevotes': 923, 'totalvotes': 516990},
-    {'year': 2020, 'state': 'RHODE ISLAND', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 847, 'totalvotes': 516990},
-    {'year': 2020, 'state': 'SOUTH CAROLINA', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 767, 'totalvotes': 2514096},
-    {'year': 2020, 'state': 'SOUTH CAROLINA', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 6907, 'totalvotes': 2514096},
-    {'year': 2020, 'state': 'SOUTH CAROLINA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1385103, 'totalvotes': 2514096},
-    {'year': 2020, 'state': 'SOUTH CAROLINA', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'ALLIANCE', 'candidatevotes': 1862, 'totalvotes': 2514096},
-    {'year': 2020, 'state': 'SOUTH CAROLINA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 27916, 'totalvotes': 2514096},
-    {'year': 2020, 'state': 'SOUTH CAROLINA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1091541, 'totalvotes': 2514096},
-    {'year': 2020, 'state': 'SOUTH DAKOTA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 261043, 'totalvotes': 422609},
-    {'year': 2020, 'state': 'SOUTH DAKOTA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 150471, 'totalvotes': 422609},
-    {'year': 2020, 'state': 'SOUTH DAKOTA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 11095, 'totalvotes': 422609},
-    {'year': 2020, 'state': 'TENNESSEE', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1852475, 'totalvotes': 3053851},
-    {'year': 2020, 'state': 'TENNESSEE', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1143711, 'totalvotes': 3053851},
-    {'year': 2020, 'state': 'TENNESSEE', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 5365, 'totalvotes': 3053851},
-    {'year': 2020, 'state': 'TENNESSEE', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1860, 'totalvotes': 3053851},
-    {'year': 2020, 'state': 'TENNESSEE', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 4545, 'totalvotes': 3053851},
-    {'year': 2020, 'state': 'TENNESSEE', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 29877, 'totalvotes': 3053851},
-    {'year': 2020, 'state': 'TENNESSEE', 'candidate': 'KENNEDY, ALYSON', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2576, 'totalvotes': 3053851},
-    {'year': 2020, 'state': 'TENNESSEE', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2301, 'totalvotes': 3053851},
-    {'year': 2020, 'state': 'TENNESSEE', 'candidate': 'WEST, KANYE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 10279, 'totalvotes': 3053851},
-    {'year': 2020, 'state': 'TENNESSEE', 'candidate': 'BODDIE, R. PRESIDENT', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1, 'totalvotes': 3053851},
-    {'year': 2020, 'state': 'TENNESSEE', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 762, 'totalvotes': 3053851},
-    {'year': 2020, 'state': 'TENNESSEE', 'candidate': 'HOEFLING, TOM', 'party_detailed': 'OTHER', 'candidatevotes': 31, 'totalvotes': 3053851},
-    {'year': 2020, 'state': 'TENNESSEE', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'BECOMING ONE NATION', 'candidatevotes': 68, 'totalvotes': 3053851},
-    {'year': 2020, 'state': 'TEXAS', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 5890347, 'totalvotes': 11315056},
-    {'year': 2020, 'state': 'TEXAS', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 5259126, 'totalvotes': 11315056},
-    {'year': 2020, 'state': 'TEXAS', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 126243, 'totalvotes': 11315056},
-    {'year': 2020, 'state': 'TEXAS', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 33396, 'totalvotes': 11315056},
-    {'year': 2020, 'state': 'TEXAS', 'candidate': 'BODDIE, R. PRESIDENT', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2012, 'totalvotes': 11315056},
-    {'year': 2020, 'state': 'TEXAS', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 2785, 'totalvotes': 11315056},
-    {'year': 2020, 'state': 'TEXAS', 'candidate': 'CELLA, TODD', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 205, 'totalvotes': 11315056},
-    {'year': 2020, 'state': 'TEXAS', 'candidate': 'CUELLAR, JESSE', 'party_detailed': 'OTHER', 'candidatevotes': 49, 'totalvotes': 11315056},
-    {'year': 2020, 'state': 'TEXAS', 'candidate': 'HOEFLING, TOM', 'party_detailed': 'OTHER', 'candidatevotes': 337, 'totalvotes': 11315056},
-    {'year': 2020, 'state': 'TEXAS', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 350, 'totalvotes': 11315056},
-    {'year': 2020, 'state': 'TEXAS', 'candidate': 'LOEB, ABRAM', 'party_detailed': 'OTHER', 'candidatevotes': 36, 'totalvotes': 11315056},
-    {'year': 2020, 'state': 'TEXAS', 'candidate': 'MORROW, ROBERT', 'party_detailed': 'OTHER', 'candidatevotes': 56, 'totalvotes': 11315056},
-    {'year': 2020, 'state': 'TEXAS', 'candidate': 'WELLS, KASEY', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 114, 'totalvotes': 11315056},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2623, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'WEST, KANYE', 'party_detailed': 'THE BIRTHDAY PARTY', 'candidatevotes': 7213, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 560282, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 5551, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 38447, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'MCHUGH, JOE', 'party_detailed': 'OTHER', 'candidatevotes': 2229, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 5053, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 1139, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 865140, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 368, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'HOEFLING, TOM', 'party_detailed': 'OTHER', 'candidatevotes': 51, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'BECOMING ONE NATION', 'candidatevotes': 186, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'FORBES, KATHERINE', 'party_detailed': 'OTHER', 'candidatevotes': 1, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'UTAH', 'candidate': 'BODDIE, R. PRESIDENT', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 6, 'totalvotes': 1488289},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 242820, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 112704, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 3608, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 1310, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'WEST, KANYE', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 1269, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'PAIGE, BROOKE H.', 'party_detailed': 'GRUMPY OLD PATRIOTS', 'candidatevotes': 1175, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'LAFONTAINE, CHRISTOPHER', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 856, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'DUNCAN, RICHARD', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 213, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY', 'candidatevotes': 209, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION', 'candidatevotes': 208, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'KENNEDY, ALYSON', 'party_detailed': 'SOCIALIST WORKERS', 'candidatevotes': 195, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'LIBERTY UNION', 'candidatevotes': 166, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'SWING, GARY', 'party_detailed': 'BOILING FROG', 'candidatevotes': 141, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'COLLINS, PHIL', 'party_detailed': 'PROHIBITION', 'candidatevotes': 137, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'MCCORMIC, KEITH', 'party_detailed': 'BULL MOOSE', 'candidatevotes': 126, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'UNAFFILIATED', 'candidatevotes': 100, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'SEGAL, JEROME M.', 'party_detailed': 'BREAD AND ROSES', 'candidatevotes': 65, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'HUBER, BLAKE', 'party_detailed': 'APPROVAL VOTING', 'candidatevotes': 54, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'KOPITKE, KYLE KENLEY', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 53, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'DE LA FUENTE, ROQUE ""ROCKY""', 'party_detailed': 'ALLIANCE', 'candidatevotes': 48, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1942, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'OVERVOTES', 'party_detailed': 'OTHER', 'candidatevotes': 278, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'BLANK VOTES', 'party_detailed': 'OTHER', 'candidatevotes': 3262, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VERMONT', 'candidate': 'SCALF, ZACHARY', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 29, 'totalvotes': 370968},
-    {'year': 2020, 'state': 'VIRGINIA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2413568, 'totalvotes': 4460524},
-    {'year': 2020, 'state': 'VIRGINIA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1962430, 'totalvotes': 4460524},
-    {'year': 2020, 'state': 'VIRGINIA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 64761, 'totalvotes': 4460524},
-    {'year': 2020, 'state': 'VIRGINIA', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 19765, 'totalvotes': 4460524},
-    {'year': 2020, 'state': 'WASHINGTON', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 2369612, 'totalvotes': 4087631},
-    {'year': 2020, 'state': 'WASHINGTON', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1584651, 'totalvotes': 4087631},
-    {'year': 2020, 'state': 'WASHINGTON', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 80500, 'totalvotes': 4087631},
-    {'year': 2020, 'state': 'WASHINGTON', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 18289, 'totalvotes': 4087631},
-    {'year': 2020, 'state': 'WASHINGTON', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 4840, 'totalvotes': 4087631},
-    {'year': 2020, 'state': 'WASHINGTON', 'candidate': 'KENNEDY, ALYSON', 'party_detailed': 'SOCIALIST WORKERS PARTY', 'candidatevotes': 2487, 'totalvotes': 4087631},
-    {'year': 2020, 'state': 'WASHINGTON', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 27252, 'totalvotes': 4087631},
-    {'year': 2020, 'state': 'WEST VIRGINIA', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 235984, 'totalvotes': 794652},
-    {'year': 2020, 'state': 'WEST VIRGINIA', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 545382, 'totalvotes': 794652},
-    {'year': 2020, 'state': 'WEST VIRGINIA', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 10687, 'totalvotes': 794652},
-    {'year': 2020, 'state': 'WEST VIRGINIA', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 2599, 'totalvotes': 794652},
-    {'year': 2020, 'state': 'WISCONSIN', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 1630866, 'totalvotes': 3298041},
-    {'year': 2020, 'state': 'WISCONSIN', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 1610184, 'totalvotes': 3298041},
-    {'year': 2020, 'state': 'WISCONSIN', 'candidate': 'BLANKENSHIP, DON', 'party_detailed': 'CONSTITUTION PARTY', 'candidatevotes': 5146, 'totalvotes': 3298041},
-    {'year': 2020, 'state': 'WISCONSIN', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 38491, 'totalvotes': 3298041},
-    {'year': 2020, 'state': 'WISCONSIN', 'candidate': 'CARROLL, BRIAN', 'party_detailed': 'AMERICAN SOLIDARITY PARTY', 'candidatevotes': 5259, 'totalvotes': 3298041},
-    {'year': 2020, 'state': 'WISCONSIN', 'candidate': 'WELLS, KASEY', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 25, 'totalvotes': 3298041},
-    {'year': 2020, 'state': 'WISCONSIN', 'candidate': 'SIMMONS, JADE', 'party_detailed': 'BECOMING ONE NATION', 'candidatevotes': 36, 'totalvotes': 3298041},
-    {'year': 2020, 'state': 'WISCONSIN', 'candidate': 'BODDIE, R. PRESIDENT', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 5, 'totalvotes': 3298041},
-    {'year': 2020, 'state': 'WISCONSIN', 'candidate': 'HAWKINS, HOWIE', 'party_detailed': 'GREEN', 'candidatevotes': 1089, 'totalvotes': 3298041},
-    {'year': 2020, 'state': 'WISCONSIN', 'candidate': 'LA RIVA, GLORIA ESTELLA', 'party_detailed': 'PARTY FOR SOCIALISM AND LIBERATION', 'candidatevotes': 110, 'totalvotes': 3298041},
-    {'year': 2020, 'state': 'WISCONSIN', 'candidate': 'WEST, KANYE', 'party_detailed': 'THE BIRTHDAY PARTY', 'candidatevotes': 411, 'totalvotes': 3298041},
-    {'year': 2020, 'state': 'WISCONSIN', 'candidate': 'CHARLES, MARK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 52, 'totalvotes': 3298041},
-    {'year': 2020, 'state': 'WISCONSIN', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 6367, 'totalvotes': 3298041},
-    {'year': 2020, 'state': 'WYOMING', 'candidate': 'BIDEN, JOSEPH R. JR', 'party_detailed': 'DEMOCRAT', 'candidatevotes': 73491, 'totalvotes': 278503},
-    {'year': 2020, 'state': 'WYOMING', 'candidate': 'TRUMP, DONALD J.', 'party_detailed': 'REPUBLICAN', 'candidatevotes': 193559, 'totalvotes': 278503},
-    {'year': 2020, 'state': 'WYOMING', 'candidate': 'JORGENSEN, JO', 'party_detailed': 'LIBERTARIAN', 'candidatevotes': 5768, 'totalvotes': 278503},
-    {'year': 2020, 'state': 'WYOMING', 'candidate': 'PIERCE, BROCK', 'party_detailed': 'INDEPENDENT', 'candidatevotes': 2208, 'totalvotes': 278503},
-    {'year': 2020, 'state': 'WYOMING', 'candidate': 'UNKNOWN CANDIDATE', 'party_detailed': 'OTHER', 'candidatevotes': 1739, 'totalvotes': 278503},
-    {'year': 2020, 'state': 'WYOMING', 'candidate': 'OVERVOTES', 'party_detailed': 'OTHER', 'candidatevotes': 279, 'totalvotes': 278503},
-    {'year': 2020, 'state': 'WYOMING', 'candidate': 'UNDERVOTES', 'party_detailed': 'OTHER', 'candidatevotes': 1459, 'totalvotes': 278503},
-]
@@ -0,0 +1,113 @@
+import array
+import csv
+import json
+import os
+import struct
+import sys
+from collections import defaultdict
+
+# Builds the compact columnar store read by election_store.py:
+#
+#   magic "ELEC" | version (uint16) | reserved (uint16) | header length (uint32)
+#   JSON header: interned string table, states, and the (state, year) -> row-range index
+#   columns (little-endian): candidate (uint16), party (uint16),
+#                            candidatevotes (uint32), totalvotes (uint32)
+#
+# Rows are grouped by (state, year) and sorted by votes descending, so every
+# lookup is a single slice. Candidate and party names are stored pre-formatted.
+
+MAGIC = b"ELEC"
+VERSION = 1
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CSV_PATH = os.path.join(HERE, "1976-2020-president.csv")
+STORE_PATH = os.path.join(HERE, "president_results.bin")
+
+MISSING = {"", "NA"}
+
+
+def reformat_name(name: str) -> str:
+    if "," in name:
+        last, first = name.split(",", 1)
+        return first.strip() + " " + last.strip()
+    return name.strip()
+
+
+def build_store(csv_path: str = CSV_PATH, store_path: str = STORE_PATH):
+    groups = defaultdict(list)
+    state_po = {}
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if row["candidatevotes"] in MISSING:
+                continue
+
+            state = row["state"].strip().upper()
+            state_po[state] = row["state_po"].strip().upper()
+
+            candidate = row["candidate"]
+            if candidate in MISSING:
+                candidate = "UNKNOWN CANDIDATE"
+            party = row["party_detailed"]
+            if party in MISSING:
+                party = "OTHER"
+
+            groups[(state, int(row["year"]))].append((
+                reformat_name(candidate.title()),
+                party.title(),
+                int(row["candidatevotes"]),
+                int(row["totalvotes"]) if row["totalvotes"] not in MISSING else 0,
+            ))
+
+    strings = []
+    string_codes = {}
+
+    def intern(s: str) -> int:
+        if s not in string_codes:
+            string_codes[s] = len(strings)
+            strings.append(s)
+        return string_codes[s]
+
+    states = sorted(state_po)
+    state_codes = {state: i for i, state in enumerate(states)}
+
+    candidate_col = array.array("H")
+    party_col = array.array("H")
+    votes_col = array.array("I")
+    total_col = array.array("I")
+    index = []
+
+    for state, year in sorted(groups):
+        rows = sorted(groups[(state, year)], key=lambda r: -r[2])
+        start = len(votes_col)
+        for candidate, party, votes, total in rows:
+            candidate_col.append(intern(candidate))
+            party_col.append(intern(party))
+            votes_col.append(votes)
+            total_col.append(total)
+        index.append([state_codes[state], year, start, len(votes_col)])
+
+    header = json.dumps({
+        "rows": len(votes_col),
+        "strings": strings,
+        "states": [[state, state_po[state]] for state in states],
+        "index": index,
+    }, separators=(",", ":")).encode("utf-8")
+
+    columns = [candidate_col, party_col, votes_col, total_col]
+    if sys.byteorder == "big":
+        for col in columns:
+            col.byteswap()
+
+    with open(store_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<HHI", VERSION, 0, len(header)))
+        f.write(header)
+        for col in columns:
+            f.write(col.tobytes())
+
+    print(f"✅ Wrote {len(votes_col)} rows ({len(index)} state/year groups) to {store_path}")
+
+
+if __name__ == "__main__":
+    build_store()
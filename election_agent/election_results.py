@@ -1,7 +1,7 @@
 from uagents import Model, Field
 import logging
-from election_data import data
-import math
+from election_store import store
+from tracing import traced
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -22,12 +22,7 @@ class ResultsResponse(Model):
     year: int
     results: list[CandidateResult]
 
-def reformat_name(name: str) -> str:
-    if "," in name:
-        last, first = name.split(",", 1)
-        return first.strip() + " " + last.strip()
-    return name.strip()
-
+@traced("results_lookup")
 async def get_results_from_state_yr(state: str, year: int) -> ResultsResponse:
     """
     Get election results for each candidate who received
@@ -42,38 +37,22 @@ async def get_results_from_state_yr(state: str, year: int) -> ResultsResponse:
     """
     try:
         logger.info(f"Looking up results for {state}, {year}")
-        norm_state = state.strip().upper()
-
-        filtered = [
-            row for row in data
-            if row["year"] == year and
-               row["state"].strip().upper() == norm_state and
-               row.get("candidatevotes") is not None and
-               not (isinstance(row["candidatevotes"], float) and math.isnan(row["candidatevotes"]))
-        ]
+        rows = store.lookup(state, year)
 
-        if not filtered:
+        if not rows:
             logger.warning(f"No results found for {state.title()} in {year}.")
             return ResultsResponse(state=state, year=year, results=[])
 
-        # Sort by votes descending
-        filtered.sort(key=lambda x: x["candidatevotes"], reverse=True)
-
-        results = []
-        for row in filtered:
-            candidate = reformat_name(row["candidate"].title())
-            party = row["party_detailed"].title()
-
-
-            candidatevotes = int(row["candidatevotes"])
-            totalvotes = int(row["totalvotes"]) if row.get("totalvotes") else 0
-
-            results.append(CandidateResult(
+        # Rows are stored pre-formatted and already sorted by votes descending
+        results = [
+            CandidateResult(
                 candidate=candidate,
                 party_detailed=party,
                 candidatevotes=candidatevotes,
                 totalvotes=totalvotes,
-            ))
+            )
+            for candidate, party, candidatevotes, totalvotes in rows
+        ]
 
         logger.info(f"Parsed {len(results)} results for {state.title()} in {year}")
         return ResultsResponse(state=state, year=year, results=results)
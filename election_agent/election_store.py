@@ -0,0 +1,79 @@
+import array
+import json
+import os
+import struct
+import sys
+
+# Reader for the columnar store written by election_data/build_store.py
+STORE_PATH = os.path.join(os.path.dirname(__file__), "election_data", "president_results.bin")
+
+MAGIC = b"ELEC"
+VERSION = 1
+
+
+class ElectionStore:
+    """
+    Array-backed election results. Rows for each (state, year) are contiguous
+    and already sorted by votes descending, so a lookup is one dict hit + slice.
+    """
+
+    def __init__(self, path: str = STORE_PATH):
+        with open(path, "rb") as f:
+            raw = f.read()
+
+        if raw[:4] != MAGIC:
+            raise ValueError(f"{path} is not an election store")
+        version, _, header_len = struct.unpack_from("<HHI", raw, 4)
+        if version != VERSION:
+            raise ValueError(f"Unsupported election store version {version}")
+
+        offset = 12
+        header = json.loads(raw[offset:offset + header_len])
+        offset += header_len
+
+        n = header["rows"]
+        self.strings: list[str] = header["strings"]
+        self.candidate = self._read_column(raw, "H", offset, n)
+        offset += n * self.candidate.itemsize
+        self.party = self._read_column(raw, "H", offset, n)
+        offset += n * self.party.itemsize
+        self.candidatevotes = self._read_column(raw, "I", offset, n)
+        offset += n * self.candidatevotes.itemsize
+        self.totalvotes = self._read_column(raw, "I", offset, n)
+
+        # state name -> postal code, e.g. "NEW YORK" -> "NY"
+        self.states: dict[str, str] = dict(header["states"])
+        state_names = [state for state, _ in header["states"]]
+        self.years: list[int] = sorted({year for _, year, _, _ in header["index"]})
+        self.index: dict[tuple[str, int], tuple[int, int]] = {
+            (state_names[s], year): (start, end)
+            for s, year, start, end in header["index"]
+        }
+
+    @staticmethod
+    def _read_column(raw: bytes, typecode: str, offset: int, n: int) -> array.array:
+        col = array.array(typecode)
+        size = {"H": 2, "I": 4}[typecode]
+        if col.itemsize != size:
+            raise RuntimeError(f"array typecode {typecode!r} is not {size} bytes on this platform")
+        col.frombytes(raw[offset:offset + n * size])
+        if sys.byteorder == "big":
+            col.byteswap()
+        return col
+
+    def lookup(self, state: str, year: int) -> list[tuple[str, str, int, int]]:
+        """
+        Returns (candidate, party_detailed, candidatevotes, totalvotes) rows
+        for the given state and year, sorted by votes descending.
+        """
+        span = self.index.get((state.strip().upper(), year))
+        if span is None:
+            return []
+        strings = self.strings
+        return [
+            (strings[self.candidate[i]], strings[self.party[i]], self.candidatevotes[i], self.totalvotes[i])
+            for i in range(*span)
+        ]
+
+
+store = ElectionStore()
@@ -0,0 +1,164 @@
+import difflib
+import os
+import re
+
+from election_store import store
+
+# Minimum difflib similarity for a misspelled state name to count as a match
+FUZZY_CUTOFF = float(os.getenv("GAZETTEER_FUZZY_CUTOFF", "0.85"))
+MIN_FUZZY_LENGTH = 5
+
+# Common alternative names, lowercased, mapped to the store's state names
+ALIASES = {
+    "washington dc": "DISTRICT OF COLUMBIA",
+    "washington d c": "DISTRICT OF COLUMBIA",
+    "d c": "DISTRICT OF COLUMBIA",
+    "dc": "DISTRICT OF COLUMBIA",
+    "the district": "DISTRICT OF COLUMBIA",
+    "washington state": "WASHINGTON",
+    "cali": "CALIFORNIA",
+    "socal": "CALIFORNIA",
+    "norcal": "CALIFORNIA",
+    "mass": "MASSACHUSETTS",
+    "jersey": "NEW JERSEY",
+    "nyc": "NEW YORK",
+    "philly": "PENNSYLVANIA",
+    "penn": "PENNSYLVANIA",
+    "carolina del norte": "NORTH CAROLINA",
+    "n carolina": "NORTH CAROLINA",
+    "s carolina": "SOUTH CAROLINA",
+    "n dakota": "NORTH DAKOTA",
+    "s dakota": "SOUTH DAKOTA",
+    "w virginia": "WEST VIRGINIA",
+    "the lone star state": "TEXAS",
+    "the sunshine state": "FLORIDA",
+    "the golden state": "CALIFORNIA",
+    "the empire state": "NEW YORK",
+}
+
+# Postal codes that are also common words or abbreviations ("OK", "HI",
+# "IN", "ME", "OR", "Ma", "Dr. ... MD"). They only count when the code alone
+# sits next to the year, as in "OK 2016" or "2016, OR".
+WORD_CODES = frozenset("AL CO DE GA HI ID IN LA MA MD ME MO MS MT NE OH OK OR PA".split())
+# Words after a state name that make it a place in (possibly) another state,
+# as in "Kansas City" (Missouri) or "Texas City"
+CITY_WORDS = frozenset({"city", "beach", "falls", "springs"})
+
+# "2016", or the short form "'16"
+YEAR_PATTERN = re.compile(r"(?<![\d'])(?:(19\d{2}|20\d{2})|'(\d{2}))(?!\d)")
+WORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z.']*")
+
+
+class Gazetteer:
+    """
+    Finds U.S. states and election years in free text without an LLM.
+
+    States are matched by full name and alias (longest phrase first, so
+    "West Virginia" is not read as "Virginia"), by postal code when it is
+    written in capitals, and by fuzzy match against full names for typos.
+    Only election years in the store are recognized.
+    """
+
+    def __init__(self, states: dict[str, str], years: list[int]):
+        self.years = set(years)
+        self.names = {name.lower(): name for name in states}
+        self.names.update({alias: name for alias, name in ALIASES.items() if name in states})
+        self.codes = {code: name for name, code in states.items()}
+        self.max_words = max(len(phrase.split()) for phrase in self.names)
+        self.full_names = {}
+        for name in states:
+            self.full_names.setdefault(len(name.split()), []).append(name.lower())
+
+    def _words(self, text: str) -> list[tuple[str, str]]:
+        # (original, normalized) pairs; "D.C." -> "d c", "Hawai'i" -> "hawaii"
+        words = []
+        for match in WORD_PATTERN.finditer(text):
+            original = match.group().strip(".'")
+            normalized = original.lower().replace("'", "")
+            for part in normalized.split("."):
+                if part:
+                    words.append((original, part))
+        return words
+
+    def _code_next_to_year(self, code: str, text: str) -> bool:
+        year = r"(?:\d{4}|'\d{2})"
+        return re.search(
+            rf"(?<![A-Za-z]){code}[\s,]*{year}(?!\d)|(?<![\d']){year}[\s,]*{code}(?![A-Za-z])", text
+        ) is not None
+
+    def find_states(self, text: str) -> set[str] | None:
+        """
+        States named in the text, or None if a state name is part of a
+        place name like "Kansas City", which may be in another state.
+        """
+        words = self._words(text)
+        normalized = [word for _, word in words]
+        # Postal codes like "IN", "OR" and "ME" are also English words, so they
+        # only count when capitalized, and in all-caps text or for WORD_CODES
+        # only right next to the year
+        all_caps = text.isupper()
+
+        found = set()
+        unmatched = []
+        i = 0
+        while i < len(words):
+            for size in range(min(self.max_words, len(words) - i), 0, -1):
+                phrase = " ".join(normalized[i:i + size])
+                if phrase in self.names:
+                    if i + size < len(words) and normalized[i + size] in CITY_WORDS:
+                        return None
+                    found.add(self.names[phrase])
+                    i += size
+                    break
+            else:
+                original = words[i][0].replace(".", "")
+                if original in self.codes and (
+                    not (all_caps or original in WORD_CODES) or self._code_next_to_year(original, text)
+                ):
+                    found.add(self.codes[original])
+                else:
+                    unmatched.append(i)
+                i += 1
+
+        if not found:
+            found = self._fuzzy_states(normalized, set(unmatched))
+        return found
+
+    def _fuzzy_states(self, normalized: list[str], candidates: set[int]) -> set[str]:
+        found = set()
+        for size, names in self.full_names.items():
+            for i in range(len(normalized) - size + 1):
+                if not all(j in candidates for j in range(i, i + size)):
+                    continue
+                phrase = " ".join(normalized[i:i + size])
+                if len(phrase) < MIN_FUZZY_LENGTH:
+                    continue
+                match = difflib.get_close_matches(phrase, names, n=1, cutoff=FUZZY_CUTOFF)
+                if match:
+                    found.add(self.names[match[0]])
+        return found
+
+    def find_years(self, text: str) -> set[int]:
+        years = set()
+        for full, short in YEAR_PATTERN.findall(text):
+            if full:
+                years.add(int(full))
+            else:
+                # '76-'99 are 1900s, '00-'29 are 2000s
+                years.add(int(short) + (1900 if int(short) >= 30 else 2000))
+        return years
+
+    def parse(self, text: str) -> tuple[str, int] | None:
+        """
+        (state name, year) if the text names exactly one state and one
+        election year, otherwise None so the caller can fall back to the LLM
+        extractor.
+        """
+        states = self.find_states(text)
+        years = self.find_years(text)
+        if not states or len(states) != 1 or len(years) != 1 or not years <= self.years:
+            return None
+        return states.pop(), years.pop()
+
+
+gazetteer = Gazetteer(store.states, store.years)
@@ -0,0 +1,147 @@
+# Generated from common/pending_requests.py by common/sync.py; edit that file, not this copy.
+import copy
+import logging
+import os
+import time
+from uuid import uuid4
+
+from uagents.storage import StorageAPI
+
+logger = logging.getLogger(__name__)
+
+# Pending requests are queued per session. Each prompt's output schema asks the
+# AI agent to echo the request id back in CORRELATION_FIELD, and the reply
+# resolves the request with that id, whatever order replies arrive in.
+CORRELATION_FIELD = "request_id"
+PENDING_KEY = lambda session: f"{session}:pending"
+# Sessions with queued requests, so the sweep doesn't scan all of storage
+PENDING_INDEX_KEY = "pending:sessions"
+
+# How long a user waits for the AI agent before getting a timeout reply
+PENDING_TIMEOUT = float(os.getenv("STRUCTURED_OUTPUT_TIMEOUT", "60"))
+# Timed-out requests stay queued this long, so a late reply is recognized
+# (and discarded) instead of being taken for another request's
+PENDING_TTL = float(os.getenv("STRUCTURED_OUTPUT_TTL", "600"))
+PENDING_SWEEP_INTERVAL = float(os.getenv("STRUCTURED_OUTPUT_SWEEP_INTERVAL", "5"))
+# In-flight extractions allowed per session
+PENDING_MAX_PER_SESSION = int(os.getenv("STRUCTURED_OUTPUT_MAX_PENDING", "8"))
+
+TIMEOUT_MESSAGE = "Sorry, that request timed out. Please try again."
+BUSY_MESSAGE = "You have too many requests in progress. Please wait for a reply and try again."
+
+
+def add_pending(storage: StorageAPI, session, sender: str, **data) -> str | None:
+    """
+    Queues a request for the session and returns its id, or None if the
+    session already has PENDING_MAX_PER_SESSION requests in flight. Extra
+    keyword arguments are kept with the request for the reply handler.
+    """
+    queue = storage.get(PENDING_KEY(session)) or []
+    if sum(not request["expired"] for request in queue) >= PENDING_MAX_PER_SESSION:
+        return None
+
+    now = time.time()
+    request_id = uuid4().hex
+    queue.append({
+        "id": request_id,
+        "sender": sender,
+        "created": now,
+        "deadline": now + PENDING_TIMEOUT,
+        "expired": False,
+        "data": data,
+    })
+    storage.set(PENDING_KEY(session), queue)
+
+    sessions = storage.get(PENDING_INDEX_KEY) or []
+    if str(session) not in sessions:
+        sessions.append(str(session))
+        storage.set(PENDING_INDEX_KEY, sessions)
+    return request_id
+
+
+def correlated_schema(schema: dict, request_id: str) -> dict:
+    """
+    Copy of an output schema with a required CORRELATION_FIELD that must be
+    request_id, so the AI agent echoes it back in its reply.
+    """
+    schema = copy.deepcopy(schema)
+    schema.setdefault("properties", {})[CORRELATION_FIELD] = {
+        "title": "Request Id",
+        "description": f"Always exactly {request_id}",
+        "type": "string",
+        "const": request_id,
+    }
+    schema["required"] = [*schema.get("required", []), CORRELATION_FIELD]
+    return schema
+
+
+def resolve_pending(storage: StorageAPI, session, request_id: str | None) -> dict | None:
+    """
+    Removes and returns the session's request with request_id, the id echoed
+    in the reply that just arrived. Returns None if the request is unknown or
+    already timed out (the user has had the timeout reply, so the late one is
+    dropped).
+
+    A reply without an id is only accepted if the session has exactly one
+    request queued and it is still waiting; otherwise it can't be told apart
+    from a late reply and is dropped. The returned request's "correlated" is
+    False in that case.
+    """
+    queue = storage.get(PENDING_KEY(session)) or []
+    if request_id is not None:
+        matches = [i for i, request in enumerate(queue) if request["id"] == request_id]
+    elif len(queue) == 1 and not queue[0]["expired"]:
+        matches = [0]
+    else:
+        matches = []
+    if not matches:
+        logger.warning(f"⚠️ Reply for session {session} matches no pending request (id: {request_id})")
+        return None
+
+    request = queue.pop(matches[0])
+    if queue:
+        storage.set(PENDING_KEY(session), queue)
+    else:
+        storage.remove(PENDING_KEY(session))
+
+    latency = time.time() - request["created"]
+    if request["expired"]:
+        logger.warning(f"⚠️ Dropping late reply for request {request['id']} after {latency:.1f}s")
+        return None
+    request["correlated"] = request_id is not None
+    logger.info(f"Resolved request {request['id']} in {latency:.1f}s")
+    return request
+
+
+def expire_pending(storage: StorageAPI, now: float | None = None) -> list[dict]:
+    """
+    Marks requests past their deadline as expired and returns them, so the
+    caller can send timeout replies. Expired requests older than PENDING_TTL
+    are removed along with sessions that have nothing left queued.
+    """
+    now = time.time() if now is None else now
+    sessions = storage.get(PENDING_INDEX_KEY) or []
+    live, expired = [], []
+    for session in sessions:
+        queue = storage.get(PENDING_KEY(session)) or []
+        kept, changed = [], False
+        for request in queue:
+            if not request["expired"] and now > request["deadline"]:
+                request["expired"] = True
+                expired.append(request)
+                changed = True
+            if request["expired"] and now > request["created"] + PENDING_TTL:
+                changed = True
+                continue
+            kept.append(request)
+
+        if kept:
+            live.append(session)
+            if changed:
+                storage.set(PENDING_KEY(session), kept)
+        elif queue:
+            storage.remove(PENDING_KEY(session))
+
+    if live != sessions:
+        storage.set(PENDING_INDEX_KEY, live)
+    return expired
@@ -1,5 +1,6 @@
-from uagents import Agent
+from uagents import Agent, Context
 from chat_proto import chat_proto, struct_output_client_proto
+from tracing import start_metrics_server, write_json
 
 # Create the Scorigami Agent
 scorigami_agent = Agent(
@@ -13,6 +14,16 @@ scorigami_agent = Agent(
 scorigami_agent.include(chat_proto)
 scorigami_agent.include(struct_output_client_proto)
 
+# Serve per-stage latency metrics when TRACING is enabled
+@scorigami_agent.on_event("startup")
+async def start_tracing(ctx: Context):
+    start_metrics_server()
+
+@scorigami_agent.on_event("shutdown")
+async def export_traces(ctx: Context):
+    if write_json():
+        ctx.logger.info("📈 Wrote trace summary")
+
 # Start the agent
 if __name__ == "__main__":
     scorigami_agent.run()
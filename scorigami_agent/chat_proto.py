@@ -1,4 +1,6 @@
 from datetime import datetime
+import re
+import time
 from uuid import uuid4
 from typing import Any
 
@@ -15,6 +17,19 @@ from uagents_core.contrib.protocols.chat import (
 )
 
 from scorigami import get_scorigami_from_score, scorigamiRequest, scorigamiResponse
+from extraction_cache import new_extraction_cache
+from tracing import record_span, span, traced
+from pending_requests import (
+    BUSY_MESSAGE,
+    CORRELATION_FIELD,
+    PENDING_SWEEP_INTERVAL,
+    PENDING_TIMEOUT,
+    TIMEOUT_MESSAGE,
+    add_pending,
+    correlated_schema,
+    expire_pending,
+    resolve_pending,
+)
 
 # AI Agent Address for structured output processing
 AI_AGENT_ADDRESS = 'agent1qtlpfshtlcxekgrfcpmv7m9zpajuwu7d5jfyachvpa4u3dkt6k0uwwp2lct'
@@ -54,6 +69,105 @@ def parse_latest_game(latest: str | None) -> tuple[str, str, str]:
     except Exception:
         return "", "", latest.strip()
 
+NUMBER_WORDS = {
+    word: value for value, word in enumerate(
+        "zero one two three four five six seven eight nine ten eleven twelve thirteen "
+        "fourteen fifteen sixteen seventeen eighteen nineteen".split()
+    )
+}
+TENS_WORDS = {
+    word: value * 10 for value, word in enumerate(
+        "twenty thirty forty fifty sixty seventy eighty ninety".split(), start=2
+    )
+}
+TENS_PATTERN = re.compile(
+    rf"\b({'|'.join(TENS_WORDS)})(?:[\s-]+({'|'.join(w for w, v in NUMBER_WORDS.items() if 0 < v < 10)}))?\b"
+)
+UNITS_PATTERN = re.compile(rf"\b({'|'.join(NUMBER_WORDS)})\b")
+# Two numbers joined by a dash, "to" or a colon, e.g. "28-14", "28 to 14", "11–8"
+SCORE_PATTERN = re.compile(r"(?<![\d.:-])(\d{1,3})\s*(?:-|(?<![a-z])to(?![a-z])|:)\s*(\d{1,3})(?![\d.:-])")
+# Phrasing around two numbers that makes them a range rather than a score,
+# e.g. "top 10 to 20", "between 3-7", "17 to 21 points", "10 to 20 games"
+RANGE_BEFORE = re.compile(
+    r"\b(?:from|between|top|first|last|range|ranging|about|around|roughly|approximately|"
+    r"weeks?|pages?|games|chapters?|ages?|years?)\s*$"
+)
+RANGE_AFTER = re.compile(
+    r"^\s*(?:%|percent\b|scores\b|games\b|times\b|points\b|pts\b|years\b|weeks\b|days\b|"
+    r"hours\b|minutes\b|seconds\b|yards\b|people\b|teams\b)"
+)
+DASHES = str.maketrans({"–": "-", "—": "-", "−": "-", "‒": "-"})
+
+extraction_cache = new_extraction_cache()
+
+ERROR_MESSAGE = "Sorry, I couldn't check the provided score. Please try again later."
+
+# How much traffic the local parser answers without the structured-output agent
+parse_stats = {"fast_path": 0, "fallback": 0}
+
+def extract_scores(text: str) -> tuple[int, int] | None:
+    """
+    Finds a final score in plain text without the structured-output agent.
+    Handles digits and number words joined by a dash, "to" or a colon.
+    Returns None unless exactly one score is found and it isn't phrased as
+    a range, so ambiguous prompts fall back to the agent.
+    """
+    text = text.lower().translate(DASHES)
+    text = TENS_PATTERN.sub(lambda m: str(TENS_WORDS[m[1]] + (NUMBER_WORDS[m[2]] if m[2] else 0)), text)
+    text = UNITS_PATTERN.sub(lambda m: str(NUMBER_WORDS[m[1]]), text)
+
+    matches = list(SCORE_PATTERN.finditer(text))
+    if len(matches) != 1:
+        return None
+    match = matches[0]
+    if RANGE_BEFORE.search(text[:match.start()]) or RANGE_AFTER.match(text[match.end():]):
+        return None
+    return int(match[1]), int(match[2])
+
+def record_parse(ctx: Context, fast_path: bool):
+    parse_stats["fast_path" if fast_path else "fallback"] += 1
+    total = parse_stats["fast_path"] + parse_stats["fallback"]
+    ctx.logger.info(
+        f"⚡ Local parser answered {parse_stats['fast_path']}/{total} "
+        f"({parse_stats['fast_path'] / total:.0%}) of prompts"
+    )
+
+async def build_score_reply(score1: int, score2: int, raw_prompt: str) -> str:
+    """
+    Validates two scores and formats the scorigami answer for them.
+    """
+    # Reject if both scores are 0 AND the original user message didn't contain anything that looks like a score
+    if score1 == 0 and score2 == 0:
+        if not any(keyword in raw_prompt for keyword in ["0", "zero"]):
+            return "I couldn't understand your message. Try giving an NFL final score."
+
+    score1_invalid = not isinstance(score1, int) or score1 < 0 or score1 >= 100
+    score2_invalid = not isinstance(score2, int) or score2 < 0 or score2 >= 100
+
+    if score1_invalid and score2_invalid:
+        return "You provided 0 valid scores! Please provide 2 positive integer scores less than 100."
+
+    elif score1_invalid or score2_invalid:
+        return "You only provided 1 valid score! Please provide 1 more positive integer score less than 100."
+
+    response: scorigamiResponse = await get_scorigami_from_score(score1, score2)
+
+    # Format the results
+    if not response.possible:
+        return f"The final score {response.score} has never occurred in NFL history because it is impossible!"
+
+    elif not response.occurred:
+        return f"The final score {response.score} is possible but has never occurred in NFL history!"
+
+    winner, loser, date = parse_latest_game(response.latest)
+    if score1 == score2:
+        latest_summary = f"This score most recently occurred when the {winner} tied the {loser} {response.score} on {date}."
+    else:
+        latest_summary = f"This score most recently occurred when the {winner} defeated the {loser} {response.score} on {date}."
+    if response.count == 1:
+        return f"The final score {response.score} has occurred {response.count} time in NFL history.\n{latest_summary}"
+    return f"The final score {response.score} has occurred {response.count} times throughout NFL history.\n{latest_summary}"
+
 def create_text_chat(text: str, end_session: bool = False) -> ChatMessage:
     content = [TextContent(type="text", text=text)]
     if end_session:
@@ -76,14 +190,41 @@ class StructuredOutputPrompt(Model):
 class StructuredOutputResponse(Model):
     output: dict[str, Any]
 
+async def process_output(
+    ctx: Context, sender: str, output: dict[str, Any], raw_prompt: str, cache_key: str | None = None
+):
+    """
+    Replies to the sender from a structured output, cached or fresh. Fresh
+    outputs that parse are cached under cache_key.
+    """
+    try:
+        # Parse the structured output to get the two scores
+        scorigami_request = scorigamiRequest.parse_obj(output)
+        score1 = scorigami_request.team1_score
+        score2 = scorigami_request.team2_score
+        if cache_key is not None and extraction_cache is not None:
+            extraction_cache.put(cache_key, output)
+
+        summary = await build_score_reply(score1, score2, raw_prompt)
+        await ctx.send(sender, create_text_chat(summary))
+
+    except Exception as err:
+        ctx.logger.error(err)
+        await ctx.send(
+            sender,
+            create_text_chat(ERROR_MESSAGE),
+        )
+        return
+
 @chat_proto.on_message(ChatMessage)
+@traced("handle_message")
 async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
     ctx.logger.info(f"Got a message from {sender}: {msg}")
-    ctx.storage.set(str(ctx.session), sender)
-    await ctx.send(
-        sender,
-        ChatAcknowledgement(timestamp=datetime.utcnow(), acknowledged_msg_id=msg.msg_id),
-    )
+    with span("ack"):
+        await ctx.send(
+            sender,
+            ChatAcknowledgement(timestamp=datetime.utcnow(), acknowledged_msg_id=msg.msg_id),
+        )
 
     for item in msg.content:
         if isinstance(item, StartSessionContent):
@@ -91,17 +232,54 @@ async def handle_message(ctx: Context, sender: str, msg: ChatMessage):
             continue
         elif isinstance(item, TextContent):
             ctx.logger.info(f"Got a message from {sender}: {item.text}")
-            ctx.storage.set(str(ctx.session) + ":raw_prompt", item.text.lower())
-            await ctx.send(
-                AI_AGENT_ADDRESS,
-                StructuredOutputPrompt(
-                    prompt=item.text, output_schema=scorigamiRequest.schema()
-                ),
+
+            # Fast path: answer plain scores locally, without the agent round trip
+            with span("local_parse"):
+                scores = extract_scores(item.text)
+            record_parse(ctx, scores is not None)
+            if scores is not None:
+                try:
+                    summary = await build_score_reply(*scores, item.text.lower())
+                except Exception as err:
+                    ctx.logger.error(err)
+                    summary = ERROR_MESSAGE
+                await ctx.send(sender, create_text_chat(summary))
+                continue
+
+            # Repeated prompt: reuse the structured output extracted last time
+            cache_key = None
+            if extraction_cache is not None:
+                cache_key = extraction_cache.key(item.text)
+                output = extraction_cache.get(cache_key)
+                if output is not None:
+                    ctx.logger.info(f"Extraction cache hit ({extraction_cache.stats()})")
+                    await process_output(ctx, sender, output, item.text.lower())
+                    continue
+
+            request_id = add_pending(
+                ctx.storage, ctx.session, sender, raw_prompt=item.text.lower(), cache_key=cache_key
             )
+            if request_id is None:
+                await ctx.send(sender, create_text_chat(BUSY_MESSAGE))
+                continue
+            ctx.logger.info(f"Queued request {request_id} for structured output")
+            with span("structured_output_send"):
+                await ctx.send(
+                    AI_AGENT_ADDRESS,
+                    StructuredOutputPrompt(
+                        prompt=item.text, output_schema=correlated_schema(scorigamiRequest.schema(), request_id)
+                    ),
+                )
 
         else:
             ctx.logger.info(f"Got unexpected content from {sender}")
 
+@struct_output_client_proto.on_interval(period=PENDING_SWEEP_INTERVAL)
+async def expire_pending_requests(ctx: Context):
+    for request in expire_pending(ctx.storage):
+        ctx.logger.warning(f"⏱️ Request {request['id']} timed out after {PENDING_TIMEOUT:.0f}s")
+        await ctx.send(request["sender"], create_text_chat(TIMEOUT_MESSAGE))
+
 @chat_proto.on_message(ChatAcknowledgement)
 async def handle_ack(ctx: Context, sender: str, msg: ChatAcknowledgement):
     ctx.logger.info(
@@ -109,82 +287,22 @@ async def handle_ack(ctx: Context, sender: str, msg: ChatAcknowledgement):
     )
 
 @struct_output_client_proto.on_message(StructuredOutputResponse)
+@traced("handle_structured_output")
 async def handle_structured_output_response(
     ctx: Context, sender: str, msg: StructuredOutputResponse
 ):
-    session_sender = ctx.storage.get(str(ctx.session))
-    if session_sender is None:
+    output = dict(msg.output)
+    request = resolve_pending(ctx.storage, ctx.session, output.pop(CORRELATION_FIELD, None))
+    if request is None:
         ctx.logger.error(
-            "Discarding message because no session sender found in storage"
+            "Discarding message because no pending request was found for this session"
         )
         return
+    session_sender = request["sender"]
+    # Only cache extractions known to belong to this request's prompt
+    cache_key = request["data"].get("cache_key") if request["correlated"] else None
+    record_span("structured_output_round_trip", time.time() - request["created"], ctx.session)
 
-    try:
-        # Parse the structured output to get state and year
-        scorigami_request = scorigamiRequest.parse_obj(msg.output)
-        score1 = scorigami_request.team1_score
-        score2 = scorigami_request.team2_score
-
-        # Reject if both scores are 0 AND the original user message didn't contain anything that looks like a score
-        raw_prompt = ctx.storage.get(str(ctx.session) + ":raw_prompt")
-        if score1 == 0 and score2 == 0:
-            if not any(keyword in raw_prompt for keyword in ["0", "zero"]):
-                await ctx.send(
-                    session_sender,
-                    create_text_chat("I couldn't understand your message. Try giving an NFL final score.")
-                )
-                return
-
-        score1_invalid = not isinstance(score1, int) or score1 < 0 or score1 >= 100
-        score2_invalid = not isinstance(score2, int) or score2 < 0 or score2 >= 100
-
-        if score1_invalid and score2_invalid:
-            await ctx.send(
-                session_sender,
-                create_text_chat(
-                    "You provided 0 valid scores! Please provide 2 positive integer scores less than 100."
-                ),
-            )
-            return
-
-        elif score1_invalid or score2_invalid:
-            await ctx.send(
-                session_sender,
-                create_text_chat(
-                    "You only provided 1 valid score! Please provide 1 more positive integer score less than 100."
-                ),
-            )
-            return
-
-        response: scorigamiResponse = await get_scorigami_from_score(score1, score2)
-
-        # Format the results
-        if not response.possible:
-            summary = f"The final score {response.score} has never occurred in NFL history because it is impossible!"
-
-        elif not response.occurred:
-            summary = f"The final score {response.score} is possible but has never occurred in NFL history!"
-
-        else:
-            winner, loser, date = parse_latest_game(response.latest)
-            if score1 == score2:
-                latest_summary = f"This score most recently occurred when the {winner} tied the {loser} {response.score} on {date}."
-            else:
-                latest_summary = f"This score most recently occurred when the {winner} defeated the {loser} {response.score} on {date}."
-            if response.count == 1:
-                summary = f"The final score {response.score} has occurred {response.count} time in NFL history.\n{latest_summary}"
-            else:
-                summary = f"The final score {response.score} has occurred {response.count} times throughout NFL history.\n{latest_summary}"
-
-
-        await ctx.send(session_sender, create_text_chat(summary))
-
-    except Exception as err:
-        ctx.logger.error(err)
-        await ctx.send(
-            session_sender,
-            create_text_chat(
-                "Sorry, I couldn't check the provided score. Please try again later."
-            ),
-        )
-        return
+    await process_output(
+        ctx, session_sender, output, request["data"]["raw_prompt"], cache_key
+    )
@@ -1,8 +1,30 @@
 from uagents import Model, Field
 import logging
-import pandas as pd
+import csv
+import os
 
-df = pd.read_csv("score_history.csv")
+from tracing import traced
+
+SCORE_HISTORY_PATH = os.path.join(os.path.dirname(__file__), "score_history.csv")
+
+IMPOSSIBLE_SCORES = frozenset({
+    "1-0", "1-1", "2-1", "3-1", "4-1", "5-1", "7-1"
+})
+
+def load_score_history(path: str = SCORE_HISTORY_PATH) -> dict[tuple[int, int], tuple[int, str]]:
+    """
+    Compiles score_history.csv into a dict keyed by (winner score, loser score)
+    holding (count, last game), so each lookup is O(1) and pandas isn't needed
+    on the serving path.
+    """
+    history = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            key = (int(row["PtsW"]), int(row["PtsL"]))
+            history[key] = (int(row["Count"]), row["Last Game"] or None)
+    return history
+
+score_history = load_score_history()
 
 class scorigamiRequest(Model):
     team1_score: int
@@ -15,6 +37,7 @@ class scorigamiResponse(Model):
     count: int | None
     latest: str | None
 
+@traced("scorigami_lookup")
 async def get_scorigami_from_score(team1_score: int, team2_score: int) -> scorigamiResponse:
     """
     From any positive integer final score, will return whether that score
@@ -28,10 +51,6 @@ async def get_scorigami_from_score(team1_score: int, team2_score: int) -> scorig
     Returns:
         scorigamiResponse object containing raw results
     """
-    IMPOSSIBLE_SCORES = {
-    "1-0", "1-1", "2-1", "3-1", "4-1", "5-1", "7-1"
-    }
-
     try:
         score1, score2 = sorted([team1_score, team2_score], reverse=True)
         score_str = f"{score1}-{score2}"
@@ -45,9 +64,9 @@ async def get_scorigami_from_score(team1_score: int, team2_score: int) -> scorig
                 latest=None
             )
 
-        row = df[df["Score"] == score_str]
+        entry = score_history.get((score1, score2))
 
-        if row.empty:
+        if entry is None:
             return scorigamiResponse(
                 score=score_str,
                 possible=True,
@@ -56,8 +75,7 @@ async def get_scorigami_from_score(team1_score: int, team2_score: int) -> scorig
                 latest=None
             )
         else:
-            count = int(row["Count"].values[0])
-            last_game = row["Last Game"].values[0]
+            count, last_game = entry
             return scorigamiResponse(
                 score=score_str,
                 possible=True,